@@ -62,10 +62,9 @@ async def main() -> None:
         days_rest = days_rest_before_game(synthetic, len(synthetic) - 1)
 
         # Compute Empirical Bayes priors from live data instead of using
-        # the baked STAT_PRIORS snapshot. ~2-4 minutes for ~300 game logs
-        # at this pacing; season is derived from today via
-        # get_season_from_date.
-        priors = await compute_priors_for_season(client, max_concurrency=2)
+        # the baked STAT_PRIORS snapshot: one league-wide game-log request;
+        # season is derived from today via get_season_from_date.
+        priors = await compute_priors_for_season(client)
 
         # Omitting `season=` lets project_player derive the season from
         # `game_date` via fastbreak.seasons.get_season_from_date — keeps
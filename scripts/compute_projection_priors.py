@@ -5,8 +5,8 @@ Usage:
 
 What it does:
     1. Calls ``fastbreak.projections.compute_priors_for_season`` to fetch
-       LeagueDashPlayerStats, identify qualifying players, and compute
-       between-/within-player variances per stat.
+       the league-wide player LeagueGameLog, identify qualifying players,
+       and compute between-/within-player variances per stat.
     2. Rewrites ``src/fastbreak/projections_priors.py`` with the real numbers.
 
 This is a one-shot tool — not imported anywhere else in the library.
@@ -128,9 +128,7 @@ def _write_priors_module(
 
 
 async def main() -> None:
-    # request_delay paces requests inside get_many() slots to avoid 429/timeouts
-    # when fetching hundreds of game logs back-to-back.
-    async with NBAClient(request_delay=1.0) as client:
+    async with NBAClient() as client:
         priors = await compute_priors_for_season(
             client,
             season=SEASON,
@@ -1,4 +1,10 @@
 from fastbreak._version import __version__, __version_tuple__
+from fastbreak.backtest import (
+    BacktestResult,
+    BacktestScore,
+    backtest_projections,
+    get_projection_backtest,
+)
 from fastbreak.betting import (
     american_to_decimal,
     american_to_prob,
@@ -63,8 +69,12 @@ from fastbreak.game_finder import (
     streak_games,
     summarize_record,
 )
+from fastbreak.game_log_store import (
+    GameLogStore,
+)
 from fastbreak.games import (
     GameFlowPoint,
+    action_elapsed_seconds,
     elapsed_game_seconds,
     game_flow,
     get_box_scores,
@@ -93,6 +103,18 @@ from fastbreak.hot_hand import (
     miller_sanjurjo_bias,
 )
 from fastbreak.league import League
+from fastbreak.league_bpm import (
+    LeagueBPM,
+    PlayerBPM,
+    compute_league_bpm,
+    get_league_bpm,
+)
+from fastbreak.league_win_shares import (
+    LeagueWinShares,
+    PlayerWinShares,
+    compute_league_win_shares,
+    get_league_win_shares,
+)
 from fastbreak.lineups import (
     get_league_lineup_ratings,
     get_league_lineups,
@@ -118,6 +140,7 @@ from fastbreak.metrics import (
     BPMResult,
     FourFactors,
     LeagueAverages,
+    ReferenceDistribution,
     assist_ratio,
     ast_pct,
     ast_to_tov,
@@ -175,6 +198,11 @@ from fastbreak.model_eval import (
     log_loss,
     roi,
 )
+from fastbreak.play_by_play_columns import (
+    PlayByPlayColumns,
+    elapsed_seconds_array,
+    get_play_by_play_columns,
+)
 from fastbreak.players import (
     get_career_game_logs,
     get_hustle_stats,
@@ -187,9 +215,17 @@ from fastbreak.players import (
     get_player_stats,
     search_players,
 )
+from fastbreak.possession_dataset import (
+    PossessionTable,
+    build_possession_dataset,
+    completed_game_ids,
+    load_possession_dataset,
+)
 from fastbreak.projections import (
     PlayerProjection,
     ProjectionStat,
+    SlateGame,
+    SlateProjections,
     StatProjection,
     adjust_for_home,
     adjust_for_opponent,
@@ -199,28 +235,49 @@ from fastbreak.projections import (
     normal_sf,
     poisson_sf,
     project_player,
+    project_slate,
 )
 from fastbreak.rapm import (
+    PAD_PLAYER_ID,
+    DesignMatrix,
+    IncrementalRAPM,
+    ODRAPMRating,
+    ODRAPMResult,
+    OffenseStint,
     RAPMRating,
     RAPMResult,
     Stint,
+    StintArrays,
+    build_design_arrays,
     build_design_matrix,
+    compute_od_rapm,
     compute_rapm,
     rapm_leaders,
 )
+from fastbreak.rapm_stints import (
+    GameStint,
+    game_stints,
+    get_rapm_stints,
+    iter_game_stints,
+)
 from fastbreak.rotations import (
     LineupStint,
     PlayerMinutes,
     PlayerStint,
     RotationSummary,
+    SeasonLineup,
+    SeasonRotations,
     SubstitutionEvent,
+    SubstitutionPattern,
     get_game_rotations,
     get_rotation_summary,
+    get_season_rotations,
     lineup_stints,
     minutes_distribution,
     player_stints,
     player_total_minutes,
     rotation_timeline,
+    season_rotations,
     stint_plus_minus,
 )
 from fastbreak.schedule import (
@@ -314,11 +371,14 @@ from fastbreak.tracking import (
 )
 from fastbreak.transition import (
     Classification,
+    PossessionArrays,
     TransitionAnalysis,
     TransitionEfficiency,
     TransitionPossession,
     TransitionSummary,
     Trigger,
+    action_points,
+    classify_possession_arrays,
     classify_possessions,
     get_transition_stats,
     transition_efficiency,
@@ -359,9 +419,12 @@ __all__ = [
     "COMPARISON_METRICS",
     "HIGHER_IS_WORSE",
     "NEUTRAL_METRICS",
+    "PAD_PLAYER_ID",
     "TEAMS",
     "WNBA_TEAMS",
     "BPMResult",
+    "BacktestResult",
+    "BacktestScore",
     "BaseClient",
     "CalibrationBin",
     "Classification",
@@ -371,27 +434,38 @@ __all__ = [
     "Conference",
     "ContextMeasure",
     "Date",
+    "DesignMatrix",
     "DistanceRange",
     "Division",
     "EdgeSummary",
     "FourFactors",
     "GameAverages",
     "GameFlowPoint",
+    "GameLogStore",
     "GameSegment",
+    "GameStint",
     "HotHandAnalysis",
     "HotHandResult",
     "ISODate",
+    "IncrementalRAPM",
     "League",
     "LeagueAverages",
+    "LeagueBPM",
     "LeagueID",
+    "LeagueWinShares",
     "LineupStint",
     "Location",
     "MeasureType",
     "NBAClient",
+    "ODRAPMRating",
+    "ODRAPMResult",
+    "OffenseStint",
     "Outcome",
     "PerMode",
     "Period",
+    "PlayByPlayColumns",
     "PlayType",
+    "PlayerBPM",
     "PlayerExperience",
     "PlayerMinutes",
     "PlayerOrTeam",
@@ -401,25 +475,35 @@ __all__ = [
     "PlayerSplitsProfile",
     "PlayerStint",
     "PlayerTrackingProfile",
+    "PlayerWinShares",
+    "PossessionArrays",
+    "PossessionTable",
     "ProjectionStat",
     "PtMeasureType",
     "RAPMRating",
     "RAPMResult",
     "Record",
+    "ReferenceDistribution",
     "RotationSummary",
     "Scope",
     "Season",
+    "SeasonLineup",
+    "SeasonRotations",
     "SeasonSegment",
     "SeasonType",
     "Section",
     "ShotClockRange",
     "ShotSequence",
+    "SlateGame",
+    "SlateProjections",
     "StarterBench",
     "StatCategoryAbbreviation",
     "StatProjection",
     "Stint",
+    "StintArrays",
     "StreakCounts",
     "SubstitutionEvent",
+    "SubstitutionPattern",
     "TeamID",
     "TeamInfo",
     "TeamSplitsProfile",
@@ -437,6 +521,8 @@ __all__ = [
     "ZoneStats",
     "__version__",
     "__version_tuple__",
+    "action_elapsed_seconds",
+    "action_points",
     "adjust_for_home",
     "adjust_for_opponent",
     "adjust_for_rest",
@@ -446,20 +532,28 @@ __all__ = [
     "assist_ratio",
     "ast_pct",
     "ast_to_tov",
+    "backtest_projections",
     "bet_ev",
     "blk_pct",
     "bpm",
     "brier_score",
     "build_clutch_profile",
     "build_compared_player",
+    "build_design_arrays",
     "build_design_matrix",
+    "build_possession_dataset",
     "calibration_curve",
+    "classify_possession_arrays",
     "classify_possessions",
     "closing_line_value",
     "clutch_score",
     "compare_players",
     "comparison_deltas",
     "comparison_edges",
+    "completed_game_ids",
+    "compute_league_bpm",
+    "compute_league_win_shares",
+    "compute_od_rapm",
     "compute_priors_for_season",
     "compute_rapm",
     "count_streaks",
@@ -472,6 +566,7 @@ __all__ = [
     "drtg",
     "effective_fg_pct",
     "elapsed_game_seconds",
+    "elapsed_seconds_array",
     "empirical_bayes_blend",
     "ewma",
     "expected_stat",
@@ -485,6 +580,7 @@ __all__ = [
     "game_dates_from_schedule",
     "game_flow",
     "game_score",
+    "game_stints",
     "get_box_scores",
     "get_box_scores_advanced",
     "get_box_scores_defensive",
@@ -503,18 +599,21 @@ __all__ = [
     "get_hot_hand_stats",
     "get_hustle_stats",
     "get_league_averages",
+    "get_league_bpm",
     "get_league_clutch_leaders",
     "get_league_leaders",
     "get_league_lineup_ratings",
     "get_league_lineups",
     "get_league_shot_zones",
     "get_league_team_clutch_leaders",
+    "get_league_win_shares",
     "get_lineup_efficiency",
     "get_lineup_net_ratings",
     "get_lineup_stats",
     "get_matchup_rollup",
     "get_on_off_splits",
     "get_play_by_play",
+    "get_play_by_play_columns",
     "get_player",
     "get_player_clutch_profile",
     "get_player_clutch_stats",
@@ -538,9 +637,12 @@ __all__ = [
     "get_player_team_performance_splits",
     "get_player_tracking_profile",
     "get_primary_defenders",
+    "get_projection_backtest",
+    "get_rapm_stints",
     "get_rotation_summary",
     "get_season_from_date",
     "get_season_matchups",
+    "get_season_rotations",
     "get_season_schedule",
     "get_shot_chart",
     "get_standings",
@@ -583,9 +685,11 @@ __all__ = [
     "is_double_double",
     "is_home_game",
     "is_triple_double",
+    "iter_game_stints",
     "kelly_fraction",
     "lineup_net_rating",
     "lineup_stints",
+    "load_possession_dataset",
     "log5",
     "log_loss",
     "magic_number",
@@ -611,6 +715,7 @@ __all__ = [
     "poisson_sf",
     "possessions",
     "project_player",
+    "project_slate",
     "prop_hit_rate",
     "pythagorean_win_pct",
     "rank_estimated_metrics",
@@ -630,6 +735,7 @@ __all__ = [
     "search_teams",
     "search_wnba_teams",
     "season_id_to_season",
+    "season_rotations",
     "season_start_year",
     "season_to_season_id",
     "shot_quality_vs_league",
@@ -0,0 +1,53 @@
+"""Period-length arithmetic shared by the play-by-play modules.
+
+:mod:`fastbreak.games` converts one action's clock at a time and
+:mod:`fastbreak.play_by_play_columns` converts whole columns; both turn
+"seconds remaining in a period" into "seconds since tip-off" the same way,
+so the period constants and that conversion live here.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from fastbreak.league import League
+
+REGULATION_PERIODS = 4  # Q1-Q4
+OT_PERIOD_SECONDS = 300  # 5 minutes (same for NBA and WNBA)
+
+
+def elapsed_from_remaining(remaining: float, period: int, league: League) -> float:
+    """Seconds since tip-off given seconds remaining in *period*."""
+    if period < 1:
+        return 0.0
+    quarter_seconds = league.quarter_seconds
+    if period <= REGULATION_PERIODS:
+        period_offset = (period - 1) * quarter_seconds
+        period_duration = quarter_seconds
+    else:
+        period_offset = (
+            REGULATION_PERIODS * quarter_seconds
+            + (period - REGULATION_PERIODS - 1) * OT_PERIOD_SECONDS
+        )
+        period_duration = OT_PERIOD_SECONDS
+    return period_offset + (period_duration - remaining)
+
+
+def elapsed_from_remaining_array(
+    period: np.ndarray, remaining: np.ndarray, league: League
+) -> np.ndarray:
+    """:func:`elapsed_from_remaining` over arrays; 0.0 where ``period < 1``."""
+    period = np.asarray(period, dtype=np.int64)
+    q = float(league.quarter_seconds)
+    regulation = period <= REGULATION_PERIODS
+    offset = np.where(
+        regulation,
+        (period - 1) * q,
+        REGULATION_PERIODS * q + (period - REGULATION_PERIODS - 1) * OT_PERIOD_SECONDS,
+    )
+    duration = np.where(regulation, q, float(OT_PERIOD_SECONDS))
+    out: np.ndarray = np.where(period < 1, 0.0, offset + (duration - remaining))
+    return out
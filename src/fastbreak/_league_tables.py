@@ -0,0 +1,51 @@
+"""Column helpers shared by the league-wide season-total modules.
+
+:mod:`fastbreak.league_bpm` and :mod:`fastbreak.league_win_shares` both turn
+dashboard / game-log rows into float columns and rescale team ``MIN`` totals
+the same way; the helpers live here so neither imports the other's privates.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike
+
+# A game is at most ~65 minutes long even with several overtimes, and five
+# players share at least 240 player-minutes of it.
+_PLAYER_MINUTES_PER_GAME = 100.0
+
+
+def column(rows: Sequence[Any], name: str) -> np.ndarray:
+    """Attribute ``name`` of every row as a float64 array."""
+    return np.array([getattr(r, name) for r in rows], dtype=np.float64)
+
+
+def div(num: ArrayLike, den: ArrayLike) -> np.ndarray:
+    """``num / den`` broadcast, NaN where ``den`` is zero."""
+    n, d = np.broadcast_arrays(
+        np.asarray(num, dtype=np.float64), np.asarray(den, dtype=np.float64)
+    )
+    out = np.full(d.shape, np.nan)
+    with np.errstate(over="ignore"):
+        np.divide(n, d, out=out, where=d != 0)
+    return out
+
+
+def team_game_minutes(minutes: np.ndarray, games: np.ndarray) -> np.ndarray:
+    """Team ``MIN`` totals as game minutes.
+
+    The dashboards report team minutes as game minutes (~48 per game), but
+    some payloads carry the sum of player-minutes (~240 per game); those are
+    detected from the per-game value and divided by 5.
+    """
+    per_game = div(minutes, games)
+    out: np.ndarray = np.where(
+        per_game > _PLAYER_MINUTES_PER_GAME, minutes / 5, minutes
+    )
+    return out
@@ -0,0 +1,203 @@
+"""Slate math shared by :mod:`fastbreak.projections` and :mod:`fastbreak.backtest`.
+
+``project_slate`` and the projection backtest both group league-wide game
+logs by player, build stat matrices and apply the rest/home/opponent
+adjustments column-wise; the helpers and their constants live here so
+neither module imports the other's privates.
+"""
+
+from __future__ import annotations
+
+import math
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+import numpy as np
+
+from fastbreak.projections_priors import STAT_PRIORS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from datetime import date
+
+    from fastbreak.models.league_game_log import GameLogEntry
+    from fastbreak.models.team_estimated_metrics import TeamEstimatedMetricsResponse
+    from fastbreak.projections_priors import StatPrior
+    from fastbreak.types import Season
+
+ProjectionStat = Literal["pts", "reb", "ast", "fg3m"]
+DistributionFamily = Literal["normal", "poisson"]
+
+STATS: Final[tuple[ProjectionStat, ...]] = ("pts", "reb", "ast", "fg3m")
+
+OPP_MAX_FRACTION: Final = 0.15
+REST_B2B_FRACTION: Final = -0.04
+REST_3PLUS_FRACTION: Final = 0.015
+HOME_FRACTION: Final = 0.02
+
+STAT_DISTRIBUTION: Final[Mapping[ProjectionStat, DistributionFamily]] = (
+    MappingProxyType(
+        {
+            "pts": "normal",
+            "reb": "normal",
+            "ast": "normal",
+            "fg3m": "poisson",
+        }
+    )
+)
+STDEV_FLOORS: Final[Mapping[ProjectionStat, float]] = MappingProxyType(
+    {
+        "pts": 3.0,
+        "reb": 1.5,
+        "ast": 1.5,
+        "fg3m": 0.8,
+    }
+)
+
+
+def group_by_player(
+    entries: Sequence[GameLogEntry], *, before: date | None = None
+) -> tuple[list[GameLogEntry], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Group league-wide game-log rows by player, newest game first.
+
+    Rows without a player ID (team-mode logs) and, when ``before`` is given,
+    rows on or after that date are dropped.
+
+    Returns:
+        ``(rows, order, day, starts, counts)``: ``rows[order]`` lists the kept
+        rows grouped by ascending player ID, ``day`` holds their dates, and
+        group ``g`` spans ``starts[g]`` to ``starts[g] + counts[g]``.
+    """
+    rows = [e for e in entries if e.player_id is not None]
+    pid = np.fromiter((e.player_id for e in rows), dtype=np.int64, count=len(rows))
+    day = np.array([e.game_date[:10] for e in rows], dtype="datetime64[D]")
+    keep = np.ones(len(rows), dtype=bool)
+    if before is not None:
+        keep = day < np.datetime64(before, "D")
+    # Newest-first within each player, matching PlayerGameLog ordering.
+    order = np.flatnonzero(keep)[np.lexsort((-day[keep].astype(np.int64), pid[keep]))]
+    _, starts, counts = np.unique(pid[order], return_index=True, return_counts=True)
+    return rows, order, day[order], starts, counts
+
+
+def stat_matrix(
+    rows: Sequence[Any], order: np.ndarray, stats: Sequence[str]
+) -> np.ndarray:
+    """``(len(order), len(stats))`` float matrix of ``rows[order]`` stat columns."""
+    return np.array(
+        [[getattr(rows[i], stat) for stat in stats] for i in order], dtype=float
+    ).reshape(len(order), len(stats))
+
+
+def resolve_season(season: Season | None, default: Season) -> Season:
+    """Resolve a caller-supplied ``season`` to a concrete value.
+
+    ``None`` means "use ``default``"; an empty (or otherwise falsy) string
+    is rejected so ``season = season or default`` cannot silently mask
+    invalid input. Mirrors the validate-at-public-boundary pattern.
+    """
+    if season is None:
+        return default
+    if not season:
+        msg = f"season must be a non-empty string or None, got {season!r}"
+        raise ValueError(msg)
+    return season
+
+
+def resolve_opponent_def_ratings(
+    team_resp: TeamEstimatedMetricsResponse, opponent_team_id: int
+) -> tuple[float, float]:
+    """Resolve the opponent's and the league-average defensive ratings.
+
+    Looks up ``opponent_team_id`` in the league-wide estimated-metrics
+    response, validates its defensive rating is present and finite, and
+    computes the league average over all teams with a valid rating.
+    Mirrors the validate-at-public-boundary pattern: a missing opponent or
+    a None/non-finite rating raises rather than silently degrading.
+
+    Returns:
+        A ``(opponent_def_rating, league_avg_def_rating)`` tuple.
+
+    Raises:
+        ValueError: If the opponent team is absent from the response, or
+            its ``e_def_rating`` is None or non-finite.
+    """
+    try:
+        opp = next(t for t in team_resp.teams if t.team_id == opponent_team_id)
+    except StopIteration as exc:
+        msg = f"Opponent team_id={opponent_team_id} not found in team estimated metrics"
+        raise ValueError(msg) from exc
+    if opp.e_def_rating is None or not math.isfinite(opp.e_def_rating):
+        msg = (
+            f"Opponent team_id={opponent_team_id} has invalid e_def_rating: "
+            f"{opp.e_def_rating!r}"
+        )
+        raise ValueError(msg)
+    # Filter both None and non-finite values: a single NaN/inf in the list
+    # would poison the mean and silently feed adjust_for_opponent with garbage.
+    valid = [
+        t.e_def_rating
+        for t in team_resp.teams
+        if t.e_def_rating is not None and math.isfinite(t.e_def_rating)
+    ]
+    league_avg_def = sum(valid) / len(valid) if valid else 0.0
+    return opp.e_def_rating, league_avg_def
+
+
+def resolve_stats_and_priors(
+    stats: Sequence[ProjectionStat],
+    priors: Mapping[ProjectionStat, StatPrior] | None,
+) -> Mapping[ProjectionStat, StatPrior]:
+    """Validate ``stats`` and ``priors``; return the priors to use.
+
+    Partial ``priors`` are rejected so baked and custom priors never mix.
+    """
+    bad_stats = [s for s in stats if s not in STATS]
+    if bad_stats:
+        msg = f"unsupported stats: {bad_stats!r}; supported = {list(STATS)}"
+        raise ValueError(msg)
+    if priors is None:
+        return STAT_PRIORS
+    missing = set(STATS) - priors.keys()
+    if missing:
+        msg = f"priors must contain all of {list(STATS)}; missing {sorted(missing)}"
+        raise ValueError(msg)
+    return priors
+
+
+def def_ratings(
+    team_resp: TeamEstimatedMetricsResponse, opponent_ids: Iterable[int]
+) -> tuple[dict[int, float], float]:
+    """Validated defensive ratings for ``opponent_ids`` plus the league average.
+
+    Each opponent goes through ``resolve_opponent_def_ratings``, so a slate
+    fails on exactly the inputs ``project_player`` would reject.
+    """
+    ratings: dict[int, float] = {}
+    league_avg = 0.0
+    for opp in opponent_ids:
+        ratings[opp], league_avg = resolve_opponent_def_ratings(team_resp, opp)
+    return ratings, league_avg
+
+
+def slate_adjustments(
+    blended: np.ndarray,
+    stats: Sequence[ProjectionStat],
+    *,
+    opp_fraction: np.ndarray,
+    days_rest: np.ndarray,
+    is_home: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Column-wise ``adjust_for_opponent`` / ``adjust_for_rest`` / ``adjust_for_home``."""
+    scoring = np.array([stat in ("pts", "fg3m") for stat in stats])
+    opp_delta = blended * opp_fraction[:, None] * scoring
+    rest_fraction = np.where(
+        days_rest == 0,
+        REST_B2B_FRACTION,
+        np.where(days_rest >= 3, REST_3PLUS_FRACTION, 0.0),  # noqa: PLR2004
+    )
+    # Assists are least affected by fatigue; scale down.
+    ast_scale = np.array([0.5 if stat == "ast" else 1.0 for stat in stats])
+    rest_delta = blended * rest_fraction[:, None] * ast_scale
+    home_delta = blended * np.where(is_home, HOME_FRACTION, -HOME_FRACTION)[:, None]
+    return opp_delta, rest_delta, home_delta
@@ -0,0 +1,437 @@
+"""Projection backtesting -- replay ``project_player`` over a past season.
+
+Every logged game is projected from only the games the player had played
+before it, then scored against what actually happened. Each player's history
+is indexed with prefix sums over their chronological game log, so the season,
+rolling-window and variance terms for any as-of date are O(1) differences
+instead of a re-scan of the log. Players are split into chunks that can be
+replayed across a process pool for multi-season logs.
+
+The projection math is the same as :func:`fastbreak.projections.project_player`
+(Empirical Bayes blend, rest/home/opponent adjustments, Normal/Poisson spread),
+with ``days_rest`` taken from the gap since the previous game. Over/under
+probabilities are computed against a line per (game, player, stat): the
+caller's, or by default a half-point line at the player's as-of season
+average, which has no pushes.
+
+Examples::
+
+    from fastbreak.backtest import backtest_projections
+
+    result = backtest_projections(log_resp.games, rolling_n=8)
+    for stat, score in result.scores().items():
+        print(stat, score.brier, score.log_loss)
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+from scipy.special import erfc, pdtrc
+
+from fastbreak._projection_core import (
+    OPP_MAX_FRACTION,
+    STAT_DISTRIBUTION,
+    STATS,
+    STDEV_FLOORS,
+    ProjectionStat,
+    def_ratings,
+    group_by_player,
+    resolve_season,
+    resolve_stats_and_priors,
+    slate_adjustments,
+    stat_matrix,
+)
+from fastbreak.model_eval import (
+    CalibrationBin,
+    brier_score,
+    calibration_curve,
+    log_loss,
+)
+from fastbreak.seasons import get_season_from_date
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from fastbreak.clients.nba import NBAClient
+    from fastbreak.models.league_game_log import GameLogEntry
+    from fastbreak.models.team_estimated_metrics import TeamEstimatedMetricsResponse
+    from fastbreak.projections_priors import StatPrior
+    from fastbreak.types import Season
+
+type LineKey = tuple[str, int, ProjectionStat]
+"""``(game_id, player_id, stat)`` key for caller-supplied lines."""
+
+
+@dataclass(frozen=True, slots=True)
+class BacktestScore:
+    """Forecast quality for one stat over every scored backtest row.
+
+    Attributes:
+        stat: The projected stat.
+        n: Rows scored (pushes, where the actual equals the line, are
+            excluded from the probability scores).
+        brier: Brier score of ``prob_over`` against the over outcome.
+        log_loss: Log loss of ``prob_over`` against the over outcome.
+        mean_absolute_error: Mean ``|actual - mean|`` of the point projection.
+        calibration: Reliability curve of ``prob_over``.
+    """
+
+    stat: ProjectionStat
+    n: int
+    brier: float
+    log_loss: float
+    mean_absolute_error: float
+    calibration: tuple[CalibrationBin, ...]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BacktestResult:
+    """Columnar backtest output, one row per projected (player, game).
+
+    Per-row fields are length-``n`` arrays; per-stat fields are
+    ``(n, len(stats))`` arrays whose columns follow ``stats``. Rows are
+    grouped by player ID and chronological within a player. ``history`` is
+    the number of earlier games the projection was built from.
+    """
+
+    stats: tuple[ProjectionStat, ...]
+    game_id: tuple[str, ...]
+    player_id: np.ndarray
+    game_date: np.ndarray
+    history: np.ndarray
+    actual: np.ndarray
+    mean: np.ndarray
+    stdev: np.ndarray
+    line: np.ndarray
+    prob_over: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.player_id)
+
+    def score(self, stat: ProjectionStat, *, n_bins: int = 10) -> BacktestScore:
+        """Score one stat's projections with :mod:`fastbreak.model_eval`.
+
+        Raises:
+            ValueError: If ``stat`` was not backtested, or no row could be
+                scored (every row was a push).
+        """
+        if stat not in self.stats:
+            msg = f"stat {stat!r} was not backtested; have {list(self.stats)}"
+            raise ValueError(msg)
+        j = self.stats.index(stat)
+        actual, line = self.actual[:, j], self.line[:, j]
+        decided = actual != line
+        probs = self.prob_over[decided, j].tolist()
+        outcomes = (actual[decided] > line[decided]).astype(int).tolist()
+        return BacktestScore(
+            stat=stat,
+            n=len(probs),
+            brier=brier_score(probs, outcomes),
+            log_loss=log_loss(probs, outcomes),
+            mean_absolute_error=float(np.mean(np.abs(actual - self.mean[:, j]))),
+            calibration=tuple(calibration_curve(probs, outcomes, n_bins=n_bins)),
+        )
+
+    def scores(self, *, n_bins: int = 10) -> dict[ProjectionStat, BacktestScore]:
+        """``score()`` for every backtested stat."""
+        return {stat: self.score(stat, n_bins=n_bins) for stat in self.stats}
+
+
+@dataclass(frozen=True, slots=True)
+class _ReplaySpec:
+    stats: tuple[ProjectionStat, ...]
+    rolling_n: int
+    min_history: int
+    tau_sq: np.ndarray
+    sigma_sq: np.ndarray
+
+
+type _Chunk = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _replay(chunk: _Chunk, spec: _ReplaySpec) -> tuple[np.ndarray, ...]:
+    """Project every row of a block of whole, chronological player groups.
+
+    Returns ``(rows, history, mean, stdev, season_mean)`` for the rows with
+    at least ``spec.min_history`` earlier games; ``rows`` indexes the block.
+    """
+    values, day, counts, opp_fraction, is_home = chunk
+    starts = np.cumsum(counts) - counts
+    first = np.repeat(starts, counts)
+    rows = np.flatnonzero(np.arange(len(values)) - first >= spec.min_history)
+    first = first[rows]
+    history = rows - first
+    lo = np.maximum(first, rows - spec.rolling_n)
+    k = (rows - lo)[:, None]
+
+    # Prefix sums: the sum of rows [a, b) of a player's log is csum[b] - csum[a].
+    zero = np.zeros((1, values.shape[1]))
+    csum = np.concatenate([zero, np.cumsum(values, axis=0)])
+    csq = np.concatenate([zero, np.cumsum(values**2, axis=0)])
+    season_mean = (csum[rows] - csum[first]) / history[:, None]
+    window_sum = csum[rows] - csum[lo]
+    rolling_mean = window_sum / k
+    variance = np.divide(
+        np.maximum(csq[rows] - csq[lo] - window_sum * rolling_mean, 0.0),
+        k - 1,
+        out=np.zeros_like(rolling_mean),
+        where=k >= 2,  # noqa: PLR2004 — sample variance needs >= 2
+    )
+
+    weight = spec.tau_sq / (spec.tau_sq + spec.sigma_sq / k)
+    blended = weight * rolling_mean + (1.0 - weight) * season_mean
+    days_rest = (day[rows] - day[rows - 1]).astype(np.int64) - 1
+    opp_delta, rest_delta, home_delta = slate_adjustments(
+        blended,
+        spec.stats,
+        opp_fraction=opp_fraction[rows],
+        days_rest=days_rest,
+        is_home=is_home[rows],
+    )
+    mean = np.maximum(0.0, blended + opp_delta + rest_delta + home_delta)
+    poisson = np.array([STAT_DISTRIBUTION[s] == "poisson" for s in spec.stats])
+    floors = np.array([STDEV_FLOORS[s] for s in spec.stats])
+    stdev = np.where(
+        poisson,
+        np.sqrt(np.maximum(mean, 1e-6)),
+        np.maximum(np.sqrt(variance), floors),
+    )
+    return rows, history, mean, stdev, season_mean
+
+
+def _replay_worker(args: tuple[_Chunk, _ReplaySpec]) -> tuple[np.ndarray, ...]:
+    return _replay(*args)
+
+
+def _chunks(arrays: _Chunk, n_chunks: int) -> list[tuple[int, _Chunk]]:
+    """Split whole player groups into ``n_chunks`` blocks of similar row count."""
+    values, day, counts, opp_fraction, is_home = arrays
+    ends = np.cumsum(counts)
+    cuts = np.searchsorted(ends, np.linspace(0, ends[-1], n_chunks + 1)[1:-1])
+    group_bounds = np.unique(np.concatenate([[0], cuts + 1, [len(counts)]]))
+    row_bounds = np.concatenate([[0], ends])[group_bounds]
+    return [
+        (
+            int(r0),
+            (
+                values[r0:r1],
+                day[r0:r1],
+                counts[g0:g1],
+                opp_fraction[r0:r1],
+                is_home[r0:r1],
+            ),
+        )
+        for g0, g1, r0, r1 in zip(
+            group_bounds[:-1],
+            group_bounds[1:],
+            row_bounds[:-1],
+            row_bounds[1:],
+            strict=True,
+        )
+        if g1 > g0
+    ]
+
+
+def _run_replay(
+    arrays: _Chunk, spec: _ReplaySpec, *, n_jobs: int
+) -> tuple[np.ndarray, ...]:
+    """Replay all groups, in-process or across ``n_jobs`` worker processes."""
+    if n_jobs == 1 or len(arrays[2]) < 2:  # noqa: PLR2004 — nothing to split
+        return _replay(arrays, spec)
+    chunks = _chunks(arrays, n_jobs * 4)
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        parts = list(pool.map(_replay_worker, [(c, spec) for _, c in chunks]))
+    offsets = [offset for offset, _ in chunks]
+    rows = np.concatenate([p[0] + off for p, off in zip(parts, offsets, strict=True)])
+    return (rows, *(np.concatenate([p[i] for p in parts]) for i in range(1, 5)))
+
+
+def _opponent_fractions(
+    rows: Sequence[GameLogEntry],
+    order: np.ndarray,
+    team_metrics: TeamEstimatedMetricsResponse | None,
+) -> np.ndarray:
+    """Clamped opponent-defense fraction per row (0 without metrics).
+
+    The opponent is the other team logged under the same ``game_id``.
+    """
+    if team_metrics is None:
+        return np.zeros(len(order))
+    teams: dict[str, set[int]] = {}
+    for e in rows:
+        teams.setdefault(e.game_id, set()).add(e.team_id)
+    opponents = [
+        next(iter(teams[rows[i].game_id] - {rows[i].team_id}), None) for i in order
+    ]
+    known = sorted({o for o in opponents if o is not None})
+    ratings, league_avg = def_ratings(team_metrics, known)
+    if league_avg == 0:
+        return np.zeros(len(order))
+    fractions = [
+        0.0 if o is None else (ratings[o] - league_avg) / league_avg for o in opponents
+    ]
+    return np.clip(fractions, -OPP_MAX_FRACTION, OPP_MAX_FRACTION)
+
+
+def _prob_over(
+    mean: np.ndarray,
+    stdev: np.ndarray,
+    line: np.ndarray,
+    stats: Sequence[ProjectionStat],
+) -> np.ndarray:
+    """Column-wise ``StatProjection.prob_over`` (``normal_sf`` / ``poisson_sf``)."""
+    normal = 0.5 * erfc((line - mean) / (stdev * np.sqrt(2.0)))
+    poisson = np.where(line < 0, 1.0, pdtrc(np.floor(np.maximum(line, 0)), mean))
+    is_poisson = np.array([STAT_DISTRIBUTION[s] == "poisson" for s in stats])
+    return np.clip(np.where(is_poisson, poisson, normal), 0.0, 1.0)
+
+
+def backtest_projections(  # noqa: PLR0913
+    entries: Sequence[GameLogEntry],
+    *,
+    team_metrics: TeamEstimatedMetricsResponse | None = None,
+    stats: Sequence[ProjectionStat] = STATS,
+    rolling_n: int = 10,
+    min_history: int = 5,
+    priors: Mapping[ProjectionStat, StatPrior] | None = None,
+    lines: Mapping[LineKey, float] | None = None,
+    n_jobs: int = 1,
+) -> BacktestResult:
+    """Replay projections over a league-wide player game log without look-ahead.
+
+    Args:
+        entries: League-wide ``LeagueGameLog`` rows in player mode, e.g. from
+            a cached ``LeagueGameLog(player_or_team="P")`` response.
+        team_metrics: Team estimated metrics for the opponent adjustment.
+            These are season-to-date figures, so passing end-of-season
+            metrics leaks future information into that one term. When
+            omitted, the opponent adjustment is zero.
+        stats: Stats to project (defaults to all four in ``STATS``).
+        rolling_n: Number of most-recent games for the rolling mean.
+        min_history: Earlier games a player needs before a game is projected.
+        priors: Optional full mapping of per-stat priors (see
+            ``project_player``). Baked priors are computed from a full season,
+            so pass priors from an earlier season for a strict backtest.
+        lines: Over/under lines keyed by ``(game_id, player_id, stat)``.
+            Rows without one use ``floor(as-of season mean) + 0.5``.
+        n_jobs: Worker processes for the replay (default: ``1``, in-process).
+            A season replays in well under a second, so a pool only pays
+            off for multi-season logs.
+
+    Returns:
+        A ``BacktestResult`` with projections, lines, over probabilities and
+        actuals; call ``scores()`` for Brier score, log loss and calibration.
+
+    Raises:
+        ValueError: If ``rolling_n`` or ``min_history`` is below 1, ``n_jobs``
+            is below 1, ``stats``/``priors`` are invalid, or an opponent has
+            no valid estimated defensive rating in ``team_metrics``.
+    """
+    if rolling_n < 1:
+        msg = f"rolling_n must be >= 1, got {rolling_n}"
+        raise ValueError(msg)
+    if min_history < 1:
+        msg = f"min_history must be >= 1, got {min_history}"
+        raise ValueError(msg)
+    if n_jobs < 1:
+        msg = f"n_jobs must be >= 1, got {n_jobs}"
+        raise ValueError(msg)
+    effective_priors = resolve_stats_and_priors(stats, priors)
+    stat_list = tuple(stats)
+
+    rows, order, day, starts, counts = group_by_player(entries)
+    # group_by_player is newest-first; the replay walks each player forward.
+    pos = np.arange(len(order)) - np.repeat(starts, counts)
+    chronological = np.repeat(starts + counts - 1, counts) - pos
+    order, day = order[chronological], day[chronological]
+    arrays: _Chunk = (
+        stat_matrix(rows, order, stat_list),
+        day,
+        counts,
+        _opponent_fractions(rows, order, team_metrics),
+        np.array(["vs." in rows[i].matchup for i in order], dtype=bool),
+    )
+    spec = _ReplaySpec(
+        stats=stat_list,
+        rolling_n=rolling_n,
+        min_history=min_history,
+        tau_sq=np.array([effective_priors[s].tau_sq for s in stat_list]),
+        sigma_sq=np.array([effective_priors[s].sigma_sq for s in stat_list]),
+    )
+    idx, history, mean, stdev, season_mean = _run_replay(arrays, spec, n_jobs=n_jobs)
+
+    selected = [rows[i] for i in order[idx]]
+    line = np.floor(season_mean) + 0.5
+    if lines:
+        for r, entry in enumerate(selected):
+            for j, stat in enumerate(stat_list):
+                custom = lines.get((entry.game_id, cast("int", entry.player_id), stat))
+                if custom is not None:
+                    line[r, j] = custom
+    return BacktestResult(
+        stats=stat_list,
+        game_id=tuple(e.game_id for e in selected),
+        player_id=np.array([e.player_id for e in selected], dtype=np.int64),
+        game_date=day[idx],
+        history=history,
+        actual=arrays[0][idx],
+        mean=mean,
+        stdev=stdev,
+        line=line,
+        prob_over=_prob_over(mean, stdev, line, stat_list),
+    )
+
+
+async def get_projection_backtest(  # noqa: PLR0913
+    client: NBAClient,
+    *,
+    season: Season | None = None,
+    team_metrics: TeamEstimatedMetricsResponse | None = None,
+    stats: Sequence[ProjectionStat] = STATS,
+    rolling_n: int = 10,
+    min_history: int = 5,
+    priors: Mapping[ProjectionStat, StatPrior] | None = None,
+    lines: Mapping[LineKey, float] | None = None,
+    n_jobs: int = 1,
+) -> BacktestResult:
+    """Fetch a season's player game log and run ``backtest_projections`` on it.
+
+    One ``LeagueGameLog`` request, the same one ``project_slate`` and
+    ``compute_priors_for_season`` make, so a caching client reuses it across
+    backtest iterations. The remaining arguments are those of
+    ``backtest_projections``.
+
+    Args:
+        client: NBA API client.
+        season: Season in ``YYYY-YY`` format (defaults to current).
+        team_metrics: See ``backtest_projections``.
+        stats: See ``backtest_projections``.
+        rolling_n: See ``backtest_projections``.
+        min_history: See ``backtest_projections``.
+        priors: See ``backtest_projections``.
+        lines: See ``backtest_projections``.
+        n_jobs: See ``backtest_projections``.
+
+    Returns:
+        The ``BacktestResult`` for the season.
+    """
+    from fastbreak.endpoints import LeagueGameLog  # noqa: PLC0415
+
+    season = resolve_season(season, get_season_from_date(league=client.league))
+    log_resp = await client.get(
+        LeagueGameLog(league_id=client.league_id, season=season, player_or_team="P")
+    )
+    return backtest_projections(
+        log_resp.games,
+        team_metrics=team_metrics,
+        stats=stats,
+        rolling_n=rolling_n,
+        min_history=min_history,
+        priors=priors,
+        lines=lines,
+        n_jobs=n_jobs,
+    )
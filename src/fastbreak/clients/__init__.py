@@ -1,5 +1,16 @@
 from fastbreak.clients.base import BaseClient
+from fastbreak.clients.cache import CacheBackend, SQLiteCacheBackend
 from fastbreak.clients.nba import NBAClient
+from fastbreak.clients.rate_limit import FileRateLimiter, LocalRateLimiter, RateLimiter
 from fastbreak.clients.wnba import WNBAClient
 
-__all__ = ["BaseClient", "NBAClient", "WNBAClient"]
+__all__ = [
+    "BaseClient",
+    "CacheBackend",
+    "FileRateLimiter",
+    "LocalRateLimiter",
+    "NBAClient",
+    "RateLimiter",
+    "SQLiteCacheBackend",
+    "WNBAClient",
+]
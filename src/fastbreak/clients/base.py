@@ -3,10 +3,12 @@
 import json
 import signal
 import ssl
+import time
 import uuid
 import warnings
 from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar, Self, cast
 
 import anyio
@@ -19,7 +21,7 @@ from aiohttp import (
     TCPConnector,
 )
 from anyio import AsyncContextManagerMixin, CancelScope, CapacityLimiter, Lock
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
 from pydantic import BaseModel, ValidationError
 from tenacity import (
     AsyncRetrying,
@@ -30,6 +32,8 @@ from tenacity import (
 )
 
 from fastbreak import __version__
+from fastbreak.clients.cache import CacheBackend
+from fastbreak.clients.rate_limit import RateLimiter
 from fastbreak.endpoints.base import Endpoint
 from fastbreak.league import League
 from fastbreak.logging import logger
@@ -41,11 +45,17 @@ if TYPE_CHECKING:
     from fastbreak.models import JSON
     from fastbreak.types import LeagueID
 
+HTTP_NOT_MODIFIED = 304
 HTTP_TOO_MANY_REQUESTS = 429
 HTTP_SERVER_ERROR_MIN = 500
 BATCH_PROGRESS_THRESHOLD = 10
 DEFAULT_CACHE_MAXSIZE = 256
 SESSION_CLOSE_TIMEOUT = 5.0
+DEFAULT_CIRCUIT_RESET_TIMEOUT = 30.0
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
 
 
 class CacheTypeMismatchError(Exception):
@@ -135,6 +145,200 @@ class _TypedResponseCache:
         return cast("float", self._cache.ttl)
 
 
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because its endpoint's circuit is open.
+
+    The circuit for an endpoint path opens after repeated server-side failures
+    and stays open for ``circuit_reset_timeout`` seconds, during which requests
+    to that path fail fast instead of spending retries on a broken endpoint.
+    """
+
+    def __init__(self, path: str, retry_in: float) -> None:
+        self.path = path
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit open for endpoint '{path}'; next probe allowed in {retry_in:.1f}s"
+        )
+
+
+class _Circuit:
+    """Mutable failure state for a single endpoint path."""
+
+    __slots__ = ("failures", "opened_at", "probe_in_flight", "state", "trips")
+
+    def __init__(self) -> None:
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.trips = 0
+
+
+class _TransferStats:
+    """Per-endpoint totals of response bytes and body processing time.
+
+    ``compressed_bytes`` is what crossed the wire (before ``gzip``/``br``
+    decoding); ``decompressed_bytes`` is the decoded body. aiohttp decompresses
+    while streaming, so decompression time is part of ``read_seconds``;
+    ``decode_seconds`` is JSON parsing alone.
+    """
+
+    _FIELDS = (
+        "requests",
+        "compressed_bytes",
+        "decompressed_bytes",
+        "read_seconds",
+        "decode_seconds",
+    )
+
+    def __init__(self) -> None:
+        self._totals: dict[str, list[float]] = {}
+
+    def record(
+        self,
+        key: str,
+        compressed: int,
+        decompressed: int,
+        read_seconds: float,
+        decode_seconds: float,
+    ) -> None:
+        """Add one response's measurements to ``key``'s totals."""
+        totals = self._totals.get(key)
+        if totals is None:
+            totals = self._totals[key] = [0.0] * len(self._FIELDS)
+        totals[0] += 1
+        totals[1] += compressed
+        totals[2] += decompressed
+        totals[3] += read_seconds
+        totals[4] += decode_seconds
+
+    def clear(self) -> None:
+        """Forget all recorded totals."""
+        self._totals.clear()
+
+    def info(self) -> dict[str, dict[str, float]]:
+        """Return a per-path snapshot; counts are ints, timings floats."""
+        return {
+            key: {
+                "requests": int(totals[0]),
+                "compressed_bytes": int(totals[1]),
+                "decompressed_bytes": int(totals[2]),
+                "read_seconds": totals[3],
+                "decode_seconds": totals[4],
+            }
+            for key, totals in self._totals.items()
+        }
+
+
+class _CircuitBreaker:
+    """Per-endpoint circuit breaker keyed by ``endpoint.path``.
+
+    A circuit is *closed* while requests succeed. After ``failure_threshold``
+    consecutive server-side failures it *opens* and every request to that path
+    raises :class:`CircuitOpenError` without touching the network. Once
+    ``reset_timeout`` seconds have elapsed the circuit goes *half-open* and
+    admits a single probe: success closes it, failure re-opens it for another
+    ``reset_timeout``. Other callers keep failing fast while the probe is in
+    flight.
+
+    All methods are synchronous with no await points, so state transitions are
+    atomic with respect to other tasks on the same event loop.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._circuits: dict[str, _Circuit] = {}
+
+    def _circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def before_request(self, key: str) -> None:
+        """Admit or refuse a request for ``key``.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe
+                already in flight.
+
+        """
+        circuit = self._circuits.get(key)
+        if circuit is None or circuit.state == CIRCUIT_CLOSED:
+            return
+        elapsed = time.monotonic() - circuit.opened_at
+        if circuit.state == CIRCUIT_OPEN and elapsed >= self.reset_timeout:
+            circuit.state = CIRCUIT_HALF_OPEN
+            circuit.probe_in_flight = True
+            return
+        if circuit.state == CIRCUIT_HALF_OPEN and not circuit.probe_in_flight:
+            circuit.probe_in_flight = True
+            return
+        raise CircuitOpenError(key, max(self.reset_timeout - elapsed, 0.0))
+
+    def record_success(self, key: str) -> None:
+        """Close the circuit for ``key`` and reset its failure count."""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            return
+        circuit.state = CIRCUIT_CLOSED
+        circuit.failures = 0
+        circuit.probe_in_flight = False
+
+    def record_failure(self, key: str) -> bool:
+        """Count a failure for ``key``; return True if this call tripped the circuit."""
+        circuit = self._circuit(key)
+        circuit.failures += 1
+        circuit.probe_in_flight = False
+        if circuit.state == CIRCUIT_HALF_OPEN or (
+            circuit.state == CIRCUIT_CLOSED
+            and circuit.failures >= self.failure_threshold
+        ):
+            circuit.state = CIRCUIT_OPEN
+            circuit.opened_at = time.monotonic()
+            circuit.trips += 1
+            return True
+        return False
+
+    def release(self, key: str) -> None:
+        """Release a half-open probe slot without recording an outcome.
+
+        Used when a probe is cancelled before the endpoint answered, so the
+        next caller can probe instead of the circuit staying stuck half-open.
+        """
+        circuit = self._circuits.get(key)
+        if circuit is not None:
+            circuit.probe_in_flight = False
+
+    def clear(self) -> None:
+        """Forget all circuit state."""
+        self._circuits.clear()
+
+    def info(self) -> dict[str, dict[str, str | int]]:
+        """Return a per-path snapshot of circuit state."""
+        return {
+            key: {
+                "state": circuit.state,
+                "failures": circuit.failures,
+                "trips": circuit.trips,
+            }
+            for key, circuit in self._circuits.items()
+        }
+
+
+def _is_circuit_failure(exc: BaseException) -> bool:
+    """Check if an exception indicates the endpoint itself is unhealthy.
+
+    Server errors, timeouts and connection errors count against the endpoint's
+    circuit. ``429`` does not: rate limiting is a property of the client's
+    overall request rate, not of one broken endpoint.
+    """
+    if isinstance(exc, ClientResponseError):
+        return exc.status >= HTTP_SERVER_ERROR_MIN
+    return isinstance(exc, (TimeoutError, OSError))
+
+
 def _is_retryable_error(exc: BaseException) -> bool:
     """Check if an exception should trigger a retry."""
     if isinstance(exc, ClientResponseError):
@@ -193,6 +397,47 @@ def _make_wait_with_retry_after(
     return wait_func
 
 
+@dataclass(frozen=True, slots=True)
+class _Validators:
+    """HTTP cache validators and the parsed body they describe."""
+
+    etag: str | None
+    last_modified: str | None
+    result: BaseModel
+
+    def request_headers(self) -> dict[str, str]:
+        """Conditional request headers that revalidate ``result``."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True, slots=True)
+class _FetchResult:
+    """Outcome of one HTTP attempt."""
+
+    data: "JSON"
+    etag: str | None
+    last_modified: str | None
+    not_modified: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class _RequestContext:
+    """Everything one attempt of ``get()`` needs, shared across retries."""
+
+    session: ClientSession
+    path: str
+    url: str
+    params: dict[str, str]
+    headers: dict[str, str]
+    log: "BoundLogger"
+    retry_after_state: _RetryAfterState
+
+
 class BaseClient(AsyncContextManagerMixin):
     """Async client for the NBA Stats API.
 
@@ -245,6 +490,11 @@ class BaseClient(AsyncContextManagerMixin):
         cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
         *,
         handle_signals: bool = True,
+        circuit_failure_threshold: int = 0,
+        circuit_reset_timeout: float = DEFAULT_CIRCUIT_RESET_TIMEOUT,
+        rate_limiter: RateLimiter | None = None,
+        cache_backend: CacheBackend | None = None,
+        revalidate: bool = False,
     ) -> None:
         """Initialize the API client.
 
@@ -265,6 +515,25 @@ class BaseClient(AsyncContextManagerMixin):
             cache_maxsize: Maximum number of cached responses (default: 256)
             handle_signals: Register SIGINT/SIGTERM handlers for graceful shutdown
                 (default: True). Set to False to manage signal handling yourself.
+            circuit_failure_threshold: Consecutive server-side failures (5xx,
+                timeouts, connection errors) on one endpoint path before its
+                circuit opens and further requests fail fast with
+                CircuitOpenError (0 = disabled, default)
+            circuit_reset_timeout: Seconds an open circuit waits before
+                admitting a single probe request (default: 30.0)
+            rate_limiter: Optional limiter awaited before every HTTP attempt,
+                including retries. Share one LocalRateLimiter between clients
+                in a process, or use FileRateLimiter to split one quota across
+                worker processes (default: None = unpaced)
+            cache_backend: Optional shared second-tier cache (e.g.
+                SQLiteCacheBackend) consulted after the in-memory cache and
+                written with each fresh response, so one process's fetch
+                serves every process using the same backend (default: None)
+            revalidate: Keep each response's ETag/Last-Modified validators and
+                parsed body after it leaves the cache, and refresh with
+                If-None-Match/If-Modified-Since; a 304 reuses the stored body
+                instead of downloading it again (default: False). Validators
+                are held for up to cache_maxsize endpoints.
 
         """
         if not hasattr(type(self), "league"):
@@ -290,6 +559,21 @@ class BaseClient(AsyncContextManagerMixin):
         if cache_ttl > 0:
             self._cache = _TypedResponseCache(maxsize=cache_maxsize, ttl=cache_ttl)
         self._cache_lock = Lock()
+        self._cache_backend = cache_backend
+        self._validators: LRUCache[str, _Validators] | None = None
+        if revalidate:
+            self._validators = LRUCache(maxsize=cache_maxsize)
+
+        # Per-endpoint circuit breaking
+        self._circuit_breaker: _CircuitBreaker | None = None
+        if circuit_failure_threshold > 0:
+            self._circuit_breaker = _CircuitBreaker(
+                failure_threshold=circuit_failure_threshold,
+                reset_timeout=circuit_reset_timeout,
+            )
+
+        self._rate_limiter = rate_limiter
+        self._transfer_stats = _TransferStats()
 
         self._handle_signals = handle_signals
 
@@ -321,9 +605,13 @@ class BaseClient(AsyncContextManagerMixin):
         return self._session
 
     async def close(self) -> None:
-        """Close the client session if we own it.
+        """Close the client session if we own it, and the cache backend.
 
-        Uses a timeout to prevent hanging on stuck connections.
+        Uses a timeout to prevent hanging on stuck connections. A
+        ``cache_backend`` with an ``aclose()`` method (e.g.
+        :class:`~fastbreak.clients.cache.SQLiteCacheBackend`) is closed too;
+        SQLite connections reopen on demand, so a backend shared with other
+        clients keeps working.
         """
         async with self._session_lock:
             if self._owns_session and self._session is not None:
@@ -344,6 +632,10 @@ class BaseClient(AsyncContextManagerMixin):
                     raise
                 finally:
                     self._session = None
+            if self._cache_backend is not None:
+                aclose = getattr(self._cache_backend, "aclose", None)
+                if aclose is not None:
+                    await aclose()
 
     def __del__(self) -> None:
         """Warn if client was not properly closed."""
@@ -419,32 +711,70 @@ class BaseClient(AsyncContextManagerMixin):
     async def _check_cache[T: BaseModel](
         self, endpoint: Endpoint[T], request_id: str
     ) -> tuple[str | None, T | None]:
-        """Check cache for a cached response.
+        """Check the in-memory cache, then the shared backend, for a response.
+
+        A shared-backend hit is re-validated through the endpoint's response
+        model and promoted into the in-memory cache.
 
         Returns:
             Tuple of (cache_key, cached_response). cache_key is None if caching
             is disabled. cached_response is None if not found in cache.
 
         """
-        if self._cache is None:
-            return None, None
+        if self._cache is None and self._cache_backend is None:
+            if self._validators is None:
+                return None, None
+            return self._make_cache_key(endpoint), None
 
         cache_key = self._make_cache_key(endpoint)
-        async with self._cache_lock:
-            cached = self._cache.get(cache_key, endpoint.response_model)
-        if cached is not None:
-            await logger.bind(request_id=request_id, endpoint=endpoint.path).adebug(
-                "cache_hit"
-            )
+        log = logger.bind(request_id=request_id, endpoint=endpoint.path)
+        cached: T | None = None
+        if self._cache is not None:
+            async with self._cache_lock:
+                cached = self._cache.get(cache_key, endpoint.response_model)
+            if cached is not None:
+                await log.adebug("cache_hit", tier="memory")
+                return cache_key, cached
+
+        if self._cache_backend is not None:
+            cached = await self._check_shared_cache(endpoint, cache_key, log)
+            if cached is not None:
+                await log.adebug("cache_hit", tier="shared")
+                await self._store_in_cache(cache_key, cached)
         return cache_key, cached
 
+    async def _check_shared_cache[T: BaseModel](
+        self, endpoint: Endpoint[T], cache_key: str, log: "BoundLogger"
+    ) -> T | None:
+        """Load and re-validate a payload from the shared cache backend."""
+        if self._cache_backend is None:
+            return None
+        payload = await self._cache_backend.get(cache_key)
+        if payload is None:
+            return None
+        try:
+            return endpoint.parse_response(json.loads(payload))
+        except (ValueError, ValidationError) as e:
+            # A payload written by an older model version (or a corrupt row) is
+            # treated as a miss so the fresh response overwrites it.
+            await log.awarning("shared_cache_invalid", error=str(e))
+            return None
+
     async def _store_in_cache[T: BaseModel](  # pyright: ignore[reportInvalidTypeVarUse]
-        self, cache_key: str | None, result: T
+        self, cache_key: str | None, result: T, data: "JSON | None" = None
     ) -> None:
-        """Store a response in the cache if caching is enabled."""
-        if self._cache is not None and cache_key is not None:
+        """Store a response in the cache if caching is enabled.
+
+        ``data`` is the raw JSON body; when given and a shared backend is
+        configured, it is written there too for other processes to reuse.
+        """
+        if cache_key is None:
+            return
+        if self._cache is not None:
             async with self._cache_lock:
                 self._cache.set(cache_key, result)
+        if self._cache_backend is not None and data is not None:
+            await self._cache_backend.set(cache_key, json.dumps(data).encode())
 
     async def get[T: BaseModel](
         self, endpoint: Endpoint[T], *, request_id: str | None = None
@@ -465,16 +795,25 @@ class BaseClient(AsyncContextManagerMixin):
         if cached is not None:
             return cached
 
+        validators = self._get_validators(cache_key, endpoint)
         session = await self._get_session()
         url = f"{self.BASE_URL}/{endpoint.path}"
         log = logger.bind(request_id=req_id, endpoint=endpoint.path)
+        ctx = _RequestContext(
+            session=session,
+            path=endpoint.path,
+            url=url,
+            params=endpoint.params(),
+            headers=validators.request_headers() if validators is not None else {},
+            log=log,
+            # Per-request retry state to avoid race conditions
+            retry_after_state=_RetryAfterState(),
+        )
 
-        # Create per-request retry state to avoid race conditions
-        retry_after_state = _RetryAfterState()
         retry = AsyncRetrying(
             stop=stop_after_attempt(self._max_retries + 1),
             wait=_make_wait_with_retry_after(
-                retry_after_state,
+                ctx.retry_after_state,
                 self._retry_wait_min,
                 self._retry_wait_max,
                 self._retry_after_max,
@@ -483,7 +822,6 @@ class BaseClient(AsyncContextManagerMixin):
             reraise=True,
         )
 
-        params = endpoint.params()
         async for attempt in retry:
             with attempt:
                 attempt_num = attempt.retry_state.attempt_number
@@ -491,25 +829,119 @@ class BaseClient(AsyncContextManagerMixin):
                     "request_attempt",
                     attempt=attempt_num,
                     url=url,
-                    params=params,
+                    params=ctx.params,
                 )
 
-                async with session.get(url, params=params) as resp:
-                    await self._handle_rate_limit(
-                        resp, log, attempt_num, retry_after_state
-                    )
-                    resp.raise_for_status()
-                    data = await resp.json()
+                fetched = await self._fetch(ctx, attempt_num)
 
-                    result = await self._parse_and_validate(endpoint, data, log)
-                    await log.adebug("request_success", attempt=attempt_num)
+                if fetched.not_modified and validators is not None:
+                    await log.adebug("request_not_modified", attempt=attempt_num)
+                    result = cast("T", validators.result)
                     await self._store_in_cache(cache_key, result)
                     return result
 
+                result = await self._parse_and_validate(endpoint, fetched.data, log)
+                await log.adebug("request_success", attempt=attempt_num)
+                self._remember_validators(cache_key, fetched, result)
+                await self._store_in_cache(cache_key, result, fetched.data)
+                return result
+
         # Unreachable due to reraise=True, but satisfies the type checker
         msg = "Retry loop exited unexpectedly"
         raise RuntimeError(msg)
 
+    async def _fetch(self, ctx: _RequestContext, attempt_num: int) -> _FetchResult:
+        """Perform one HTTP attempt and return its outcome.
+
+        Consults the circuit breaker (when enabled) before sending and records
+        the outcome afterwards. A circuit that is open raises
+        :class:`CircuitOpenError`, which is not retryable, so the retry loop
+        stops immediately instead of backing off against a broken endpoint.
+        """
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return await self._send(ctx, attempt_num)
+
+        breaker.before_request(ctx.path)
+        try:
+            fetched = await self._send(ctx, attempt_num)
+        except Exception as exc:
+            if not _is_circuit_failure(exc):
+                # A 4xx/429 says nothing about the endpoint's health: free a
+                # half-open probe slot without resetting the failure count.
+                breaker.release(ctx.path)
+            elif breaker.record_failure(ctx.path):
+                await ctx.log.awarning(
+                    "circuit_opened",
+                    path=ctx.path,
+                    error=type(exc).__name__,
+                    reset_timeout=breaker.reset_timeout,
+                )
+            raise
+        except BaseException:
+            breaker.release(ctx.path)
+            raise
+        breaker.record_success(ctx.path)
+        return fetched
+
+    async def _send(self, ctx: _RequestContext, attempt_num: int) -> _FetchResult:
+        """Issue the GET request and return the decoded body and validators."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        async with ctx.session.get(
+            ctx.url, params=ctx.params, headers=ctx.headers or None
+        ) as resp:
+            await self._handle_rate_limit(
+                resp, ctx.log, attempt_num, ctx.retry_after_state
+            )
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if resp.status == HTTP_NOT_MODIFIED and ctx.headers:
+                self._transfer_stats.record(ctx.path, 0, 0, 0.0, 0.0)
+                return _FetchResult(None, etag, last_modified, not_modified=True)
+            resp.raise_for_status()
+            # Read and decode separately so each is timed on its own; json()
+            # reuses the body buffered by read().
+            started = time.perf_counter()
+            body = await resp.read()
+            read_done = time.perf_counter()
+            data = cast("JSON", await resp.json())
+            decoded_bytes = len(body)
+            raw_bytes = getattr(resp.content, "total_raw_bytes", None)
+            self._transfer_stats.record(
+                ctx.path,
+                raw_bytes if isinstance(raw_bytes, int) else decoded_bytes,
+                decoded_bytes,
+                read_done - started,
+                time.perf_counter() - read_done,
+            )
+            return _FetchResult(data, etag, last_modified)
+
+    def _get_validators[T: BaseModel](
+        self, cache_key: str | None, endpoint: Endpoint[T]
+    ) -> "_Validators | None":
+        """Return stored validators for a conditional refresh, if any."""
+        if self._validators is None or cache_key is None:
+            return None
+        validators = self._validators.get(cache_key)
+        # Guard against a key reused for a different response type.
+        if validators is None or type(validators.result) is not endpoint.response_model:
+            return None
+        return validators
+
+    def _remember_validators(
+        self, cache_key: str | None, fetched: _FetchResult, result: BaseModel
+    ) -> None:
+        """Store ETag/Last-Modified and the parsed body for later revalidation."""
+        if self._validators is None or cache_key is None:
+            return
+        if fetched.etag is None and fetched.last_modified is None:
+            self._validators.pop(cache_key, None)
+            return
+        self._validators[cache_key] = _Validators(
+            etag=fetched.etag, last_modified=fetched.last_modified, result=result
+        )
+
     async def _handle_rate_limit(
         self,
         resp: "ClientResponse",
@@ -632,10 +1064,12 @@ class BaseClient(AsyncContextManagerMixin):
         return [results[i] for i in range(total)]
 
     async def clear_cache(self) -> None:
-        """Clear the response cache."""
+        """Clear the response cache, including any shared cache backend."""
         if self._cache is not None:
             async with self._cache_lock:
                 self._cache.clear()
+        if self._cache_backend is not None:
+            await self._cache_backend.clear()
 
     @property
     def cache_info(self) -> dict[str, int] | None:
@@ -652,3 +1086,41 @@ class BaseClient(AsyncContextManagerMixin):
             "maxsize": int(self._cache.maxsize),
             "ttl": int(self._cache.ttl),
         }
+
+    @property
+    def transfer_info(self) -> dict[str, dict[str, float]]:
+        """Return per-endpoint response size and processing-time totals.
+
+        Returns:
+            Mapping of endpoint path to a dict with 'requests',
+            'compressed_bytes' (on the wire), 'decompressed_bytes' (decoded
+            body), 'read_seconds' (body transfer including decompression) and
+            'decode_seconds' (JSON parsing). Cache hits are not counted; a
+            304 counts as a request with zero bytes.
+
+        """
+        return self._transfer_stats.info()
+
+    def reset_transfer_stats(self) -> None:
+        """Clear the totals reported by :attr:`transfer_info`."""
+        self._transfer_stats.clear()
+
+    def reset_circuits(self) -> None:
+        """Close every endpoint circuit and forget recorded failures."""
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.clear()
+
+    @property
+    def circuit_info(self) -> dict[str, dict[str, str | int]] | None:
+        """Return per-endpoint circuit breaker state, or None if disabled.
+
+        Returns:
+            Mapping of endpoint path to a dict with 'state' ('closed', 'open'
+            or 'half_open'), 'failures' (consecutive failures) and 'trips'
+            (times the circuit has opened), or None. Only paths that have
+            recorded a failure appear.
+
+        """
+        if self._circuit_breaker is None:
+            return None
+        return self._circuit_breaker.info()
@@ -0,0 +1,189 @@
+"""Shared response cache backends — one fetch serves every worker process.
+
+The in-memory cache enabled by ``cache_ttl`` is private to one process. A
+``cache_backend`` sits behind it as a second tier that stores the raw JSON
+payload of each response, keyed exactly like the in-memory cache, so any
+process pointed at the same backend can reuse it. Payloads are re-validated
+through the endpoint's response model on a hit, which keeps the backend free of
+pickled Pydantic objects and safe to share between library versions.
+
+:class:`SQLiteCacheBackend` is the bundled implementation: a WAL-mode SQLite
+file gives concurrent readers alongside one writer at a time across processes.
+Any object implementing :class:`CacheBackend` (Redis, memcached, ...) can be
+used instead.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+import anyio.to_thread
+
+if TYPE_CHECKING:
+    import os
+
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Async key/value store for serialized API responses.
+
+    A backend holding resources may also define ``async aclose()``; the
+    client awaits it from ``close()``.
+    """
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the payload stored under ``key``, or None if absent/expired."""
+        ...
+
+    async def set(self, key: str, payload: bytes) -> None:
+        """Store ``payload`` under ``key``, replacing any existing entry."""
+        ...
+
+    async def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+
+class SQLiteCacheBackend:
+    """Cross-process response cache backed by a WAL-mode SQLite file.
+
+    WAL journaling lets any number of processes read while one writes; writers
+    wait up to ``SQLITE_BUSY_TIMEOUT_MS`` for the lock rather than failing.
+    Blocking SQLite calls run in a worker thread so they never stall the event
+    loop, and each thread keeps its own connection. :meth:`close` closes every
+    connection opened so far; the backend stays usable afterwards and reopens
+    connections on demand, so a backend shared by several clients survives one
+    of them closing it.
+    """
+
+    def __init__(
+        self,
+        path: "str | os.PathLike[str]",
+        ttl: float,
+        *,
+        maxsize: int | None = None,
+    ) -> None:
+        """Initialize the backend, creating the database file if needed.
+
+        Args:
+            path: SQLite database file shared by all cooperating processes
+            ttl: Seconds each entry stays fresh
+            maxsize: Maximum number of entries; the soonest-to-expire entries
+                are evicted past this (default: None = unbounded)
+
+        """
+        if ttl <= 0:
+            msg = f"ttl must be positive, got {ttl}"
+            raise ValueError(msg)
+        if maxsize is not None and maxsize < 1:
+            msg = f"maxsize must be >= 1 when provided, got {maxsize}"
+            raise ValueError(msg)
+        self.path = Path(path)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            # Each connection is only used by the thread that opened it;
+            # check_same_thread=False lets close() run from any thread.
+            conn = sqlite3.connect(
+                self.path,
+                timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._lock:
+                self._connections.append(conn)
+                self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close every connection this backend has opened, in any thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    def _get(self, key: str) -> bytes | None:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT payload FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return None if row is None else bytes(row[0])
+
+    def _set(self, key: str, payload: bytes) -> None:
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, payload, now + self.ttl),
+            )
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            if self.maxsize is not None:
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY expires_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.maxsize,),
+                )
+
+    def _clear(self) -> None:
+        self._connect().execute("DELETE FROM responses")
+
+    def _size(self) -> int:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT COUNT(*) FROM responses WHERE expires_at > ?", (time.time(),)
+            )
+            .fetchone()
+        )
+        return int(row[0])
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the fresh payload stored under ``key``, or None."""
+        return await anyio.to_thread.run_sync(self._get, key)
+
+    async def set(self, key: str, payload: bytes) -> None:
+        """Store ``payload`` under ``key`` with a fresh TTL."""
+        await anyio.to_thread.run_sync(self._set, key, payload)
+
+    async def clear(self) -> None:
+        """Delete every entry (for all processes sharing the file)."""
+        await anyio.to_thread.run_sync(self._clear)
+
+    async def aclose(self) -> None:
+        """Close every connection (see :meth:`close`); called by ``client.close()``."""
+        await anyio.to_thread.run_sync(self.close)
+
+    def __len__(self) -> int:
+        return self._size()
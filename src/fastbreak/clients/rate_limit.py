@@ -0,0 +1,157 @@
+"""Rate limiters — pace outgoing requests against a shared API quota.
+
+A client consults its ``rate_limiter`` before every HTTP attempt (retries
+included). :class:`LocalRateLimiter` paces a single process;
+:class:`FileRateLimiter` coordinates every process on one host through a
+small lock-protected state file, so N workers share one quota instead of each
+pacing itself to the full quota and collectively tripping 429s.
+
+Both use GCRA (the generic cell rate algorithm): the limiter stores a single
+"theoretical arrival time" and each acquisition pushes it forward by
+``1 / rate`` seconds. ``burst`` requests may run back-to-back before pacing
+kicks in. Any object with an ``async acquire()`` method satisfies
+:class:`RateLimiter`, so other coordinators (Redis, a sidecar service, ...) can
+be plugged in without changes to the client.
+"""
+
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+import anyio
+import anyio.to_thread
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+_STATE_FORMAT = "<d"
+_STATE_SIZE = struct.calcsize(_STATE_FORMAT)
+
+
+@runtime_checkable
+class RateLimiter(Protocol):
+    """Anything a client can ``await`` before sending a request."""
+
+    async def acquire(self) -> None:
+        """Block until the caller may send one request."""
+        ...
+
+
+def _validate(rate: float, burst: int) -> float:
+    if not rate > 0:
+        msg = f"rate must be a positive number of requests per second, got {rate}"
+        raise ValueError(msg)
+    if burst < 1:
+        msg = f"burst must be >= 1, got {burst}"
+        raise ValueError(msg)
+    return 1.0 / rate
+
+
+def _gcra_reserve(
+    tat: float, now: float, interval: float, burst: int
+) -> tuple[float, float]:
+    """Reserve one slot; return ``(new_tat, wait_seconds)``.
+
+    ``tat`` is the stored theoretical arrival time. A slot is granted at
+    ``max(tat, now)``, less the ``burst - 1`` intervals of allowed slack.
+    """
+    start = max(tat, now)
+    wait = max(start - now - (burst - 1) * interval, 0.0)
+    return start + interval, wait
+
+
+class LocalRateLimiter:
+    """In-process GCRA limiter shared by every task that holds a reference.
+
+    Pass the same instance to several clients in one process to give them a
+    single combined budget.
+    """
+
+    def __init__(self, rate: float, *, burst: int = 1) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Requests allowed back-to-back before pacing (default: 1)
+
+        """
+        self.rate = rate
+        self.burst = burst
+        self._interval = _validate(rate, burst)
+        self._tat = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for this process's next request slot."""
+        # No await between read and write, so reservation is atomic per loop.
+        self._tat, wait = _gcra_reserve(
+            self._tat, time.monotonic(), self._interval, self.burst
+        )
+        if wait > 0:
+            await anyio.sleep(wait)
+
+
+class FileRateLimiter:
+    """Cross-process GCRA limiter coordinated through a locked state file.
+
+    Every process constructing a ``FileRateLimiter`` with the same ``path``
+    draws from the same budget. The file holds one 8-byte timestamp guarded by
+    an exclusive ``flock``; the lock is held only for the read-modify-write,
+    never while sleeping, so waiting workers do not block each other.
+
+    Timestamps are wall-clock (``time.time()``) because monotonic clocks are
+    not comparable across processes. Requires a POSIX platform.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], rate: float, *, burst: int = 1
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            path: State file shared by all cooperating processes (created on
+                first use)
+            rate: Sustained requests per second across all processes
+            burst: Requests allowed back-to-back before pacing (default: 1)
+
+        Raises:
+            NotImplementedError: On platforms without ``fcntl`` (Windows)
+
+        """
+        if fcntl is None:  # pragma: no cover - Windows
+            msg = "FileRateLimiter requires fcntl (POSIX only)"
+            raise NotImplementedError(msg)
+        self.path = Path(path)
+        self.rate = rate
+        self.burst = burst
+        self._interval = _validate(rate, burst)
+
+    def _reserve(self) -> tuple[float, float]:
+        """Reserve a slot under the file lock; return ``(new_tat, wait_seconds)``.
+
+        ``new_tat`` is the theoretical arrival time written back to the file,
+        one interval past the slot just granted.
+        """
+        # A fresh descriptor per call: flock excludes per open file description,
+        # so sharing one fd across worker threads would not serialize them.
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            raw = os.pread(fd, _STATE_SIZE, 0)
+            tat = (
+                struct.unpack(_STATE_FORMAT, raw)[0] if len(raw) == _STATE_SIZE else 0.0
+            )
+            new_tat, wait = _gcra_reserve(tat, time.time(), self._interval, self.burst)
+            os.pwrite(fd, struct.pack(_STATE_FORMAT, new_tat), 0)
+        finally:
+            os.close(fd)  # releases the lock
+        return new_tat, wait
+
+    async def acquire(self) -> None:
+        """Wait for the next host-wide request slot."""
+        _, wait = await anyio.to_thread.run_sync(self._reserve)
+        if wait > 0:
+            await anyio.sleep(wait)
@@ -0,0 +1,340 @@
+"""Columnar, date-indexed game-log store for point-in-time player features.
+
+:class:`GameLogStore` holds every player's game log as flat NumPy columns,
+sorted by player and date, with prefix sums per stat. A query is a batch of
+``(player_id, as_of_date)`` pairs; each is located with one binary search on
+a combined player/date key, and window sums, means and variances over the
+games *strictly before* the as-of date are O(1) differences of prefix sums.
+Features for every player on every date of a season therefore cost
+O(queries * log(games)) rather than re-slicing a list per query.
+
+The store is filled from league-wide ``LeagueGameLog`` rows (player mode) or
+per-player ``PlayerGameLog`` rows; see :meth:`GameLogStore.from_game_logs`.
+
+Examples::
+
+    store = GameLogStore.from_game_logs(log_resp.games)
+    pts_l10 = store.rolling_mean("pts", player_ids, dates, n=10)
+    rest = store.days_rest(player_ids, dates)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+from scipy.signal import lfilter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from datetime import date
+
+    from fastbreak.models.league_game_log import GameLogEntry
+    from fastbreak.models.player_game_log import PlayerGameLogEntry
+
+DEFAULT_STATS: Final = (
+    "pts",
+    "reb",
+    "ast",
+    "stl",
+    "blk",
+    "tov",
+    "fgm",
+    "fga",
+    "fg3m",
+    "fg3a",
+    "ftm",
+    "fta",
+    "oreb",
+    "dreb",
+    "pf",
+)
+
+type _Dates = date | str | np.datetime64 | Iterable[date | str | np.datetime64]
+type _Ids = int | Iterable[int]
+
+
+def _parse_game_date(value: str) -> np.datetime64:
+    """Parse ``LeagueGameLog`` ISO dates and ``PlayerGameLog`` "OCT 21, 2025" dates."""
+    if value[:4].isdigit():
+        return np.datetime64(value[:10], "D")
+    parsed = datetime.strptime(value.title(), "%b %d, %Y")  # noqa: DTZ007
+    return np.datetime64(parsed.date(), "D")
+
+
+class GameLogStore:
+    """Per-player game logs as sorted columns with a player/date index.
+
+    Every query method takes ``player_ids`` and ``dates`` (scalars or
+    equal-length sequences, broadcast against each other) and only ever
+    looks at games played *before* each date, so features computed for a
+    game day never include that day's game. Window arguments ``n`` select
+    the most recent ``n`` such games; ``n=None`` uses all of them.
+    """
+
+    def __init__(
+        self,
+        player_ids: Sequence[int] | np.ndarray,
+        game_dates: Sequence[date | str] | np.ndarray,
+        values: Mapping[str, Sequence[float] | np.ndarray],
+        *,
+        game_ids: Sequence[str] | None = None,
+    ) -> None:
+        """Build the store from parallel columns in any order.
+
+        Args:
+            player_ids: Player ID of each row.
+            game_dates: Date of each row (``date``, ISO string or
+                ``datetime64``).
+            values: Stat name to per-row values.
+            game_ids: Optional game ID of each row.
+
+        Raises:
+            ValueError: If the columns have different lengths, or a player
+                has two rows on the same date.
+        """
+        pid = np.asarray(player_ids, dtype=np.int64)
+        day = np.asarray(game_dates, dtype="datetime64[D]")
+        columns = {k: np.asarray(v, dtype=float) for k, v in values.items()}
+        lengths = {len(pid), len(day), *(len(v) for v in columns.values())}
+        if game_ids is not None:
+            lengths.add(len(game_ids))
+        if len(lengths) > 1:
+            msg = f"columns must have equal lengths, got {sorted(lengths)}"
+            raise ValueError(msg)
+
+        order = np.lexsort((day, pid))
+        pid, day = pid[order], day[order]
+        duplicate = (pid[1:] == pid[:-1]) & (day[1:] == day[:-1])
+        if duplicate.any():
+            i = int(np.flatnonzero(duplicate)[0])
+            msg = f"player_id={pid[i]} has more than one game on {day[i]}"
+            raise ValueError(msg)
+
+        self._player_ids, starts = np.unique(pid, return_index=True)
+        self._offsets = np.append(starts, len(pid))
+        self._group = np.repeat(np.arange(len(starts)), np.diff(self._offsets))
+        self._day = day
+        self._game_ids = (
+            None if game_ids is None else tuple(game_ids[i] for i in order.tolist())
+        )
+        self._values = {k: v[order] for k, v in columns.items()}
+        self._csum = {k: _prefix(v) for k, v in self._values.items()}
+        self._csq = {k: _prefix(v**2) for k, v in self._values.items()}
+        self._hits: dict[tuple[str, float], np.ndarray] = {}
+        self._ewma: dict[tuple[str, int], np.ndarray] = {}
+
+        # Combined sort key: rows are ordered by (group, day), so one
+        # searchsorted on ``group * span + day`` locates any (player, date).
+        days = day.astype(np.int64)
+        self._day0 = int(days.min()) if len(days) else 0
+        self._span = (int(days.max()) - self._day0 + 2) if len(days) else 1
+        self._key = self._group * self._span + (days - self._day0)
+
+    @classmethod
+    def from_game_logs(
+        cls,
+        entries: Iterable[GameLogEntry | PlayerGameLogEntry],
+        *,
+        stats: Sequence[str] = DEFAULT_STATS,
+    ) -> GameLogStore:
+        """Build a store from ``LeagueGameLog`` or ``PlayerGameLog`` rows.
+
+        Team-mode ``LeagueGameLog`` rows (no ``player_id``) are skipped, so a
+        store can be filled from several responses chained together.
+        """
+        rows = [e for e in entries if e.player_id is not None]
+        return cls(
+            np.array([e.player_id for e in rows], dtype=np.int64),
+            np.array([_parse_game_date(e.game_date) for e in rows], dtype="M8[D]"),
+            {stat: [getattr(e, stat) for e in rows] for stat in stats},
+            game_ids=[e.game_id for e in rows],
+        )
+
+    def __len__(self) -> int:
+        return len(self._day)
+
+    @property
+    def player_ids(self) -> np.ndarray:
+        """Sorted IDs of every player in the store."""
+        return self._player_ids
+
+    @property
+    def stats(self) -> tuple[str, ...]:
+        """Stat columns available to the feature methods."""
+        return tuple(self._values)
+
+    def _locate(self, player_ids: _Ids, dates: _Dates) -> tuple[np.ndarray, np.ndarray]:
+        """``(start, end)`` row bounds of each query's games before its date."""
+        pid, day = np.broadcast_arrays(
+            np.asarray(player_ids, dtype=np.int64),
+            np.asarray(dates, dtype="datetime64[D]"),
+        )
+        pid, day = pid.ravel(), day.ravel()
+        group = np.searchsorted(self._player_ids, pid)
+        group = np.minimum(group, max(len(self._player_ids) - 1, 0))
+        known = (
+            self._player_ids[group] == pid
+            if len(self._player_ids)
+            else np.zeros(len(pid), dtype=bool)
+        )
+        offset = np.clip(day.astype(np.int64) - self._day0, 0, self._span - 1)
+        end = np.searchsorted(self._key, group * self._span + offset)
+        start = self._offsets[group] if len(self._player_ids) else end
+        end = np.where(known, end, start)
+        return start, end
+
+    def _window(
+        self, player_ids: _Ids, dates: _Dates, n: int | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if n is not None and n < 1:
+            msg = f"n must be >= 1 or None, got {n}"
+            raise ValueError(msg)
+        start, end = self._locate(player_ids, dates)
+        if n is not None:
+            start = np.maximum(start, end - n)
+        return start, end
+
+    def _column(self, stat: str) -> str:
+        if stat not in self._values:
+            msg = f"unknown stat {stat!r}; store has {list(self._values)}"
+            raise ValueError(msg)
+        return stat
+
+    def n_games(
+        self, player_ids: _Ids, dates: _Dates, n: int | None = None
+    ) -> np.ndarray:
+        """Games available before each date (capped at ``n``)."""
+        start, end = self._window(player_ids, dates, n)
+        count: np.ndarray = end - start
+        return count
+
+    def last_n(self, stat: str, player_ids: _Ids, dates: _Dates, n: int) -> np.ndarray:
+        """The last ``n`` values before each date, newest first.
+
+        Returns:
+            A ``(queries, n)`` array, NaN-padded where fewer than ``n`` games
+            were played.
+        """
+        values = self._values[self._column(stat)]
+        start, end = self._window(player_ids, dates, n)
+        idx = end[:, None] - 1 - np.arange(n)
+        valid = idx >= start[:, None]
+        return np.where(valid, values[np.where(valid, idx, 0)], np.nan)
+
+    def last_n_game_ids(
+        self, player_id: int, as_of: date | str, n: int
+    ) -> tuple[str, ...]:
+        """Game IDs of one player's last ``n`` games before ``as_of``, newest first.
+
+        Raises:
+            ValueError: If the store was built without game IDs.
+        """
+        if self._game_ids is None:
+            msg = "store was built without game_ids"
+            raise ValueError(msg)
+        start, end = self._window(player_id, as_of, n)
+        return self._game_ids[int(start[0]) : int(end[0])][::-1]
+
+    def rolling_sum(
+        self, stat: str, player_ids: _Ids, dates: _Dates, n: int | None = None
+    ) -> np.ndarray:
+        """Sum of the last ``n`` games before each date (0 with no games)."""
+        csum = self._csum[self._column(stat)]
+        start, end = self._window(player_ids, dates, n)
+        total: np.ndarray = csum[end] - csum[start]
+        return total
+
+    def rolling_mean(
+        self, stat: str, player_ids: _Ids, dates: _Dates, n: int | None = None
+    ) -> np.ndarray:
+        """Mean of the last ``n`` games before each date (NaN with no games)."""
+        csum = self._csum[self._column(stat)]
+        start, end = self._window(player_ids, dates, n)
+        return _ratio(csum[end] - csum[start], end - start, minimum=1)
+
+    def rolling_var(
+        self, stat: str, player_ids: _Ids, dates: _Dates, n: int | None = None
+    ) -> np.ndarray:
+        """Sample variance of the last ``n`` games (NaN with fewer than two)."""
+        column = self._column(stat)
+        start, end = self._window(player_ids, dates, n)
+        count = end - start
+        total = self._csum[column][end] - self._csum[column][start]
+        squares = self._csq[column][end] - self._csq[column][start]
+        mean = np.nan_to_num(_ratio(total, count, minimum=1))
+        # Sample variance needs at least two games.
+        return _ratio(np.maximum(squares - total * mean, 0.0), count - 1, minimum=1)
+
+    def hit_rate(
+        self,
+        stat: str,
+        player_ids: _Ids,
+        dates: _Dates,
+        line: float,
+        n: int | None = None,
+    ) -> np.ndarray:
+        """Fraction of the last ``n`` games with ``stat >= line`` (NaN with none).
+
+        Same ``>=`` semantics as :func:`fastbreak.metrics.hit_rate_last_n`.
+        """
+        column = self._column(stat)
+        key = (column, float(line))
+        if key not in self._hits:
+            self._hits[key] = _prefix(self._values[column] >= line)
+        hits = self._hits[key]
+        start, end = self._window(player_ids, dates, n)
+        return _ratio(hits[end] - hits[start], end - start, minimum=1)
+
+    def ewma(self, stat: str, player_ids: _Ids, dates: _Dates, span: int) -> np.ndarray:
+        """EWMA through the last game before each date (NaN with no games).
+
+        Same recursion as :func:`fastbreak.metrics.ewma`
+        (``alpha = 2 / (span + 1)``, seeded with the player's first game).
+        """
+        if span < 1:
+            msg = f"span must be >= 1, got {span}"
+            raise ValueError(msg)
+        column = self._column(stat)
+        if (column, span) not in self._ewma:
+            self._ewma[column, span] = self._ewma_series(self._values[column], span)
+        series = self._ewma[column, span]
+        start, end = self._locate(player_ids, dates)
+        return np.where(end > start, series[np.maximum(end - 1, 0)], np.nan)
+
+    def _ewma_series(self, values: np.ndarray, span: int) -> np.ndarray:
+        """EWMA after every row, restarting at each player's first game."""
+        alpha = 2.0 / (span + 1)
+        out = np.empty_like(values)
+        for lo, hi in zip(self._offsets[:-1], self._offsets[1:], strict=True):
+            x = values[lo:hi]
+            out[lo:hi], _ = lfilter(
+                [alpha], [1.0, alpha - 1.0], x, zi=[(1.0 - alpha) * x[0]]
+            )
+        return out
+
+    def days_rest(self, player_ids: _Ids, dates: _Dates) -> np.ndarray:
+        """Days between each date and the player's previous game, minus one.
+
+        Matches :func:`fastbreak.schedule.days_rest_before_game` (0 for a
+        back-to-back); NaN when the player has no earlier game.
+        """
+        start, end = self._locate(player_ids, dates)
+        day = np.broadcast_to(
+            np.asarray(dates, dtype="datetime64[D]"), end.shape
+        ).ravel()
+        gap = (day - self._day[np.maximum(end - 1, 0)]).astype(float) - 1.0
+        return np.where(end > start, np.maximum(gap, 0.0), np.nan)
+
+
+def _ratio(num: np.ndarray, den: np.ndarray, *, minimum: int) -> np.ndarray:
+    """``num / den`` where ``den >= minimum``, NaN elsewhere."""
+    out = np.full(len(den), np.nan)
+    np.divide(num, den, out=out, where=den >= minimum)
+    return out
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+    """``out[i]`` is the sum of ``values[:i]`` (length ``len(values) + 1``)."""
+    return np.concatenate([[0.0], np.cumsum(values, dtype=float)])
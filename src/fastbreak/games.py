@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
+from fastbreak._game_clock import elapsed_from_remaining
 from fastbreak.league import League
 from fastbreak.logging import logger
+from fastbreak.models.play_by_play import parse_clock as _parse_clock
 from fastbreak.seasons import get_season_from_date
 from fastbreak.types import validate_iso_date
 
@@ -28,6 +31,7 @@ if TYPE_CHECKING:
     from fastbreak.models.box_score_traditional import BoxScoreTraditionalData
     from fastbreak.models.play_by_play import PlayByPlayAction
     from fastbreak.models.scoreboard_v3 import ScoreboardGame
+    from fastbreak.play_by_play_columns import PlayByPlayColumns
     from fastbreak.types import Date, ISODate, Season, SeasonType
 
 
@@ -375,19 +379,6 @@ class GameFlowPoint:
     description: str
 
 
-_CLOCK_RE = re.compile(r"PT(\d+)M([\d.]+)S")
-_REGULATION_PERIODS = 4  # Q1-Q4
-_OT_PERIOD_SECONDS = 300  # 5 minutes (same for NBA and WNBA)
-
-
-def _parse_clock(clock: str) -> float:
-    """Return remaining seconds in the current period from an ISO 8601 duration."""
-    m = _CLOCK_RE.match(clock)
-    if not m:
-        return 0.0
-    return int(m.group(1)) * 60 + float(m.group(2))
-
-
 def elapsed_game_seconds(
     clock: str, period: int, *, league: League = League.NBA
 ) -> float:
@@ -414,24 +405,32 @@ def elapsed_game_seconds(
         2880.0
 
     """
-    if period < 1:
-        return 0.0
-    remaining = _parse_clock(clock)
-    quarter_seconds = league.quarter_seconds
-    if period <= _REGULATION_PERIODS:
-        period_offset = (period - 1) * quarter_seconds
-        period_duration = quarter_seconds
-    else:
-        period_offset = (
-            _REGULATION_PERIODS * quarter_seconds
-            + (period - _REGULATION_PERIODS - 1) * _OT_PERIOD_SECONDS
-        )
-        period_duration = _OT_PERIOD_SECONDS
-    return period_offset + (period_duration - remaining)
+    return elapsed_from_remaining(_parse_clock(clock), period, league)
+
+
+def action_elapsed_seconds(
+    action: PlayByPlayAction, *, league: League = League.NBA
+) -> float:
+    """Return seconds elapsed since tip-off at a play-by-play action.
+
+    Same result as ``elapsed_game_seconds(action.clock, action.period)``,
+    but uses the clock the action parsed when it was built
+    (:attr:`~fastbreak.models.play_by_play.PlayByPlayAction.clock_seconds`),
+    so looping over a game's actions never re-parses a clock string.
+
+    Args:
+        action: A play-by-play action.
+        league: League configuration for quarter length (default: NBA).
+
+    Returns:
+        Total seconds elapsed since the start of the game.
+
+    """
+    return elapsed_from_remaining(action.clock_seconds, action.period, league)
 
 
 def game_flow(
-    actions: list[PlayByPlayAction],
+    actions: list[PlayByPlayAction] | PlayByPlayColumns,
     *,
     league: League = League.NBA,
 ) -> list[GameFlowPoint]:
@@ -449,7 +448,8 @@ def game_flow(
 
     Args:
         actions: List of PlayByPlayAction objects, e.g., from
-            :func:`get_play_by_play`.
+            :func:`get_play_by_play`, or a
+            :class:`~fastbreak.play_by_play_columns.PlayByPlayColumns`.
 
     Returns:
         List of :class:`GameFlowPoint` objects, one per scoring event,
@@ -470,6 +470,11 @@ def game_flow(
             print(f"Home {last.score_home} - Away {last.score_away}")
 
     """
+    from fastbreak.play_by_play_columns import PlayByPlayColumns  # noqa: PLC0415
+
+    if isinstance(actions, PlayByPlayColumns):
+        return _game_flow_columns(actions, league)
+
     result: list[GameFlowPoint] = []
     for action in actions:
         if not action.scoreHome or not action.scoreAway:
@@ -480,7 +485,7 @@ def game_flow(
         except ValueError:
             continue
 
-        elapsed = elapsed_game_seconds(action.clock, action.period, league=league)
+        elapsed = action_elapsed_seconds(action, league=league)
         result.append(
             GameFlowPoint(
                 period=action.period,
@@ -494,3 +499,52 @@ def game_flow(
         )
 
     return result
+
+
+def _column_scores(
+    cols: PlayByPlayColumns, codes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Integer scores and a validity mask for a coded score column."""
+    uniq, inv = np.unique(codes, return_inverse=True)
+    values = np.zeros(len(uniq), dtype=np.int64)
+    valid = np.zeros(len(uniq), dtype=bool)
+    for k, code in enumerate(uniq.tolist()):
+        text = cols.strings[code]
+        if not text:
+            continue
+        try:
+            values[k] = int(text)
+        except ValueError:
+            continue
+        valid[k] = True
+    return values[inv], valid[inv]
+
+
+def _game_flow_columns(cols: PlayByPlayColumns, league: League) -> list[GameFlowPoint]:
+    """:func:`game_flow` over columnar play-by-play."""
+    home, home_ok = _column_scores(cols, cols.score_home)
+    away, away_ok = _column_scores(cols, cols.score_away)
+    rows = np.flatnonzero(home_ok & away_ok)
+    elapsed = cols.elapsed_seconds(league)[rows].tolist()
+    home_scores = home[rows].tolist()
+    away_scores = away[rows].tolist()
+    return [
+        GameFlowPoint(
+            period=period,
+            clock=clock,
+            elapsed_seconds=t,
+            score_home=h,
+            score_away=a,
+            margin=h - a,
+            description=description,
+        )
+        for period, clock, t, h, a, description in zip(
+            cols.period[rows].tolist(),
+            cols.text(cols.clock[rows]),
+            elapsed,
+            home_scores,
+            away_scores,
+            cols.text(cols.description[rows]),
+            strict=True,
+        )
+    ]
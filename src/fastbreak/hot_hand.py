@@ -14,6 +14,10 @@ from dataclasses import dataclass, field
 from math import log2
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from fastbreak.play_by_play_columns import PlayByPlayColumns
+
 if TYPE_CHECKING:
     from fastbreak.clients.base import BaseClient
     from fastbreak.models.play_by_play import PlayByPlayAction
@@ -238,14 +242,19 @@ def hot_hand_result(
 
 
 def extract_shot_sequences(
-    actions: list[PlayByPlayAction],
+    actions: list[PlayByPlayAction] | PlayByPlayColumns,
 ) -> list[ShotSequence]:
     """Extract per-player sequential shot outcomes from play-by-play data.
 
     Walks the action list in order and records each field goal attempt
     (``isFieldGoal == 1``) as a make or miss for the shooting player.
-    Actions with ``teamId == 0`` (game events) are skipped.
+    Actions with ``teamId == 0`` (game events) are skipped.  A
+    :class:`~fastbreak.play_by_play_columns.PlayByPlayColumns` is handled
+    with array masks instead of a per-action loop.
     """
+    if isinstance(actions, PlayByPlayColumns):
+        return _shot_sequences_columns(actions)
+
     accumulators: dict[int, _PlayerAccumulator] = {}
 
     for action in actions:
@@ -277,6 +286,35 @@ def extract_shot_sequences(
     )
 
 
+def _shot_sequences_columns(cols: PlayByPlayColumns) -> list[ShotSequence]:
+    shots = np.flatnonzero((cols.team_id != 0) & (cols.is_field_goal == 1))
+    if not len(shots):
+        return []
+    pids = cols.person_id[shots]
+    made = cols.shot_result[shots] == cols.code(_SHOT_RESULT_MADE)
+    ids, first, inv = np.unique(pids, return_index=True, return_inverse=True)
+    # A stable sort by player keeps each player's shots in game order.
+    by_player = np.split(
+        made[np.argsort(inv, kind="stable")], np.cumsum(np.bincount(inv))[:-1]
+    )
+    first_rows = shots[first]
+    return [
+        ShotSequence(
+            player_id=pid,
+            player_name=name,
+            team_id=team_id,
+            shots=tuple(outcomes.tolist()),
+        )
+        for pid, name, team_id, outcomes in zip(
+            ids.tolist(),
+            cols.text(cols.player_name[first_rows]),
+            cols.team_id[first_rows].tolist(),
+            by_player,
+            strict=True,
+        )
+    ]
+
+
 def merge_sequences(
     game_sequences: list[list[ShotSequence]],
 ) -> list[ShotSequence]:
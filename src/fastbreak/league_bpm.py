@@ -0,0 +1,307 @@
+"""League-wide Box Plus/Minus and VORP with the roster team adjustment.
+
+:func:`fastbreak.metrics.bpm` returns *raw* BPM for one player; the team
+adjustment that makes a roster's minutes-weighted BPM add up to the team's
+efficiency differential needs every player on the roster at once.  This
+module computes it for the whole league in one pass from two season-total
+tables (``LeagueDashPlayerStats`` and ``LeagueDashTeamStats``, ``Totals``):
+
+1. Each player's on-court team possessions are the team's possessions times
+   ``MP / team_MP``, with team ``MIN`` in game minutes (player-minute totals
+   are rescaled); counting stats are scaled to per-100 and team shares (``pct_team_*``) to
+   "while on court", as BPM 2.0 expects.
+2. Raw BPM/OBPM come from :func:`fastbreak.metrics_array.bpm`.
+3. Per team, a constant is added to every player so that
+   ``sum(BPM * MP / team_MP) == team_rating_scale * team net rating``
+   (and likewise for OBPM against the team's offensive rating relative to
+   league average); DBPM is BPM - OBPM.
+4. VORP uses the adjusted BPM with ``poss_pct = MP / team_MP``.
+
+Team ratings come from the ``Base`` totals: possessions by Dean Oliver's
+estimate, net rating from ``PLUS_MINUS``.  They are not adjusted for
+strength of schedule.  A player traded mid-season appears once, with their
+combined totals, on their current team.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+from fastbreak import metrics_array
+from fastbreak._league_tables import column, div, team_game_minutes
+from fastbreak.metrics import BPMResult
+from fastbreak.seasons import get_season_from_date
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from fastbreak.clients.base import BaseClient
+    from fastbreak.models.league_dash_player_stats import (
+        LeagueDashPlayerStatsResponse,
+        LeagueDashPlayerStatsRow,
+    )
+    from fastbreak.models.league_dash_team_stats import (
+        LeagueDashTeamStatsResponse,
+        LeagueDashTeamStatsRow,
+    )
+    from fastbreak.types import Season, SeasonType
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerBPM:
+    """One player's team-adjusted BPM and VORP."""
+
+    player_id: int
+    player_name: str
+    team_id: int
+    minutes: float
+    bpm: BPMResult
+    vorp: float
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LeagueBPM:
+    """Columnar BPM/VORP for every player in a season, ordered by player ID.
+
+    Every field is a length-``n`` array (``player_name`` a tuple).
+    ``raw_bpm`` / ``raw_obpm`` are the unadjusted values from
+    :func:`fastbreak.metrics_array.bpm`; ``team_adjustment`` /
+    ``team_offensive_adjustment`` are the per-team constants added to them.
+    Players without minutes have NaN ratings and zero VORP weight.
+    """
+
+    player_id: np.ndarray
+    player_name: tuple[str, ...]
+    team_id: np.ndarray
+    minutes: np.ndarray
+    raw_bpm: np.ndarray
+    raw_obpm: np.ndarray
+    team_adjustment: np.ndarray
+    team_offensive_adjustment: np.ndarray
+    bpm: np.ndarray
+    obpm: np.ndarray
+    dbpm: np.ndarray
+    vorp: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.player_id)
+
+    def _row(self, i: int) -> PlayerBPM:
+        return PlayerBPM(
+            player_id=int(self.player_id[i]),
+            player_name=self.player_name[i],
+            team_id=int(self.team_id[i]),
+            minutes=float(self.minutes[i]),
+            bpm=BPMResult(
+                total=float(self.bpm[i]),
+                offensive=float(self.obpm[i]),
+                defensive=float(self.dbpm[i]),
+            ),
+            vorp=float(self.vorp[i]),
+        )
+
+    def player(self, player_id: int) -> PlayerBPM | None:
+        """The row for ``player_id``, or None."""
+        i = int(np.searchsorted(self.player_id, player_id))
+        if i == len(self) or self.player_id[i] != player_id:
+            return None
+        return self._row(i)
+
+    def to_player_bpm(self) -> list[PlayerBPM]:
+        """Every row as a :class:`PlayerBPM`."""
+        return [self._row(i) for i in range(len(self))]
+
+
+def compute_league_bpm(  # noqa: PLR0913
+    players: Sequence[LeagueDashPlayerStatsRow],
+    teams: Sequence[LeagueDashTeamStatsRow],
+    *,
+    positions: Mapping[int, float] | None = None,
+    team_rating_scale: float = 1.2,
+    replacement_level: float = -2.0,
+    season_games: int = 82,
+) -> LeagueBPM:
+    """Team-adjusted BPM, OBPM, DBPM and VORP for every player at once.
+
+    Args:
+        players: Season **totals** per player (``LeagueDashPlayerStats`` with
+            ``per_mode="Totals"``).
+        teams: Season **totals** per team (``LeagueDashTeamStats`` with
+            ``per_mode="Totals"``); every player's ``team_id`` must appear.
+        positions: Optional listed position (1=PG ... 5=C) per player ID,
+            used as the BPM position prior; missing players get 3.0.
+        team_rating_scale: Multiplier on the team's net (and relative
+            offensive) rating before it is spread over the roster. BPM 2.0
+            uses 1.2; pass 1.0 to make the roster sum exactly the team's
+            net rating.
+        replacement_level: Replacement-level BPM for VORP.
+        season_games: Regular-season length for VORP (82 NBA, 40 WNBA).
+
+    Returns:
+        A columnar :class:`LeagueBPM`, one row per player.
+
+    Raises:
+        ValueError: If a player's team is missing from ``teams`` or
+            ``season_games`` is not positive.
+    """
+    team_index = {t.team_id: i for i, t in enumerate(teams)}
+    order = sorted(range(len(players)), key=lambda i: players[i].player_id)
+    rows = [players[i] for i in order]
+    missing = {r.team_id for r in rows} - team_index.keys()
+    if missing:
+        msg = f"no team totals for team_id(s) {sorted(missing)}"
+        raise ValueError(msg)
+    idx = np.array([team_index[r.team_id] for r in rows], dtype=np.intp)
+
+    t_min = team_game_minutes(column(teams, "min"), column(teams, "gp"))
+    t_poss = metrics_array.possessions(
+        column(teams, "fga"),
+        column(teams, "oreb"),
+        column(teams, "tov"),
+        column(teams, "fta"),
+    )
+    t_pts = column(teams, "pts")
+
+    mp = column(rows, "min")
+    on_court = div(mp, t_min[idx])
+    on_poss = t_poss[idx] * on_court
+
+    def per_100(name: str) -> np.ndarray:
+        return div(100.0 * column(rows, name), on_poss)
+
+    def share(name: str) -> np.ndarray:
+        team_total = column(teams, name)[idx]
+        return div(column(rows, name), team_total * on_court)
+
+    listed = np.array(
+        [(positions or {}).get(r.player_id, 3.0) for r in rows], dtype=np.float64
+    )
+    raw = metrics_array.bpm(
+        per_100("pts"),
+        per_100("fg3m"),
+        per_100("ast"),
+        per_100("tov"),
+        per_100("oreb"),
+        per_100("dreb"),
+        per_100("stl"),
+        per_100("blk"),
+        per_100("pf"),
+        per_100("fga"),
+        per_100("fta"),
+        pct_team_trb=share("reb"),
+        pct_team_stl=share("stl"),
+        pct_team_pf=share("pf"),
+        pct_team_ast=share("ast"),
+        pct_team_blk=share("blk"),
+        pct_team_pts=share("pts"),
+        listed_position=listed,
+        mp=mp,
+    )
+
+    # Team MIN counts game minutes, so a full roster's on-court shares sum to 5.
+    weight = np.where(np.isnan(raw.total), 0.0, on_court)
+    n_teams = len(teams)
+    roster_total = np.bincount(
+        idx, weights=weight * np.nan_to_num(raw.total), minlength=n_teams
+    )
+    roster_off = np.bincount(
+        idx, weights=weight * np.nan_to_num(raw.offensive), minlength=n_teams
+    )
+    net_rating = div(100.0 * column(teams, "plus_minus"), t_poss)
+    lg_ortg = 100.0 * t_pts.sum() / t_poss.sum() if t_poss.sum() > 0 else np.nan
+    rel_ortg = div(100.0 * t_pts, t_poss) - lg_ortg
+    team_adj = (team_rating_scale * net_rating - roster_total) / 5.0
+    off_adj = (team_rating_scale * rel_ortg - roster_off) / 5.0
+
+    total = raw.total + team_adj[idx]
+    offensive = raw.offensive + off_adj[idx]
+    vorp = metrics_array.vorp(
+        total,
+        on_court,
+        column(teams, "gp")[idx],
+        replacement_level=replacement_level,
+        season_games=season_games,
+    )
+    return LeagueBPM(
+        player_id=np.array([r.player_id for r in rows], dtype=np.int64),
+        player_name=tuple(r.player_name for r in rows),
+        team_id=np.array([r.team_id for r in rows], dtype=np.int64),
+        minutes=mp,
+        raw_bpm=raw.total,
+        raw_obpm=raw.offensive,
+        team_adjustment=team_adj[idx],
+        team_offensive_adjustment=off_adj[idx],
+        bpm=total,
+        obpm=offensive,
+        dbpm=total - offensive,
+        vorp=vorp,
+    )
+
+
+async def get_league_bpm(  # noqa: PLR0913
+    client: BaseClient,
+    *,
+    season: Season | None = None,
+    season_type: SeasonType = "Regular Season",
+    positions: Mapping[int, float] | None = None,
+    team_rating_scale: float = 1.2,
+    replacement_level: float = -2.0,
+) -> LeagueBPM:
+    """Fetch season totals and compute team-adjusted BPM/VORP for the league.
+
+    Makes two requests (player and team ``Totals``) and hands them to
+    :func:`compute_league_bpm`; VORP is scaled to the client's league
+    season length.
+
+    Args:
+        client: NBA API client.
+        season: Season in YYYY-YY format (defaults to current).
+        season_type: "Regular Season", "Playoffs", etc.
+        positions: Optional listed position per player ID (see
+            :func:`compute_league_bpm`).
+        team_rating_scale: See :func:`compute_league_bpm`.
+        replacement_level: Replacement-level BPM for VORP.
+
+    Returns:
+        A columnar :class:`LeagueBPM`, one row per player.
+
+    Examples:
+        league = await get_league_bpm(client, season="2024-25")
+        jokic = league.player(203999)
+    """
+    from fastbreak.endpoints import (  # noqa: PLC0415
+        LeagueDashPlayerStats,
+        LeagueDashTeamStats,
+    )
+
+    season = season or get_season_from_date(league=client.league)
+    results: list[Any] = await client.get_many(
+        [
+            LeagueDashPlayerStats(
+                season=season,
+                season_type=season_type,
+                per_mode="Totals",
+                league_id=client.league_id,
+            ),
+            LeagueDashTeamStats(
+                season=season,
+                season_type=season_type,
+                per_mode="Totals",
+                league_id=client.league_id,
+            ),
+        ],
+        max_concurrency=2,
+    )
+    player_resp = cast("LeagueDashPlayerStatsResponse", results[0])
+    team_resp = cast("LeagueDashTeamStatsResponse", results[1])
+    return compute_league_bpm(
+        player_resp.players,
+        team_resp.teams,
+        positions=positions,
+        team_rating_scale=team_rating_scale,
+        replacement_level=replacement_level,
+        season_games=client.league.season_games,
+    )
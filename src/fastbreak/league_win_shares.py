@@ -0,0 +1,308 @@
+"""League-wide Win Shares (OWS, DWS, WS, WS/48) in one pass.
+
+:func:`fastbreak.metrics.offensive_win_shares` and
+:func:`fastbreak.metrics.defensive_win_shares` take one player plus the
+team, opponent and league context around them.  This module assembles that
+context for every player at once and runs the array versions from
+:mod:`fastbreak.metrics_array`:
+
+* player season totals from ``LeagueDashPlayerStats`` (``Totals``);
+* team and opponent season totals from the league-wide team
+  ``LeagueGameLog``: the two rows of each game are paired, so a team's
+  opponent totals are the game totals minus its own;
+* per-game :class:`~fastbreak.metrics.LeagueAverages` from
+  :func:`fastbreak.teams.get_league_averages`.  Per-game averages are the
+  right scale for season totals: marginal points per win is
+  ``0.32 * league points per game``.
+
+A player traded mid-season appears once, with their combined totals, in
+the defensive context of their current team.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+import anyio
+import numpy as np
+
+from fastbreak import metrics_array
+from fastbreak._league_tables import column, team_game_minutes
+from fastbreak.seasons import get_season_from_date
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from fastbreak.clients.base import BaseClient
+    from fastbreak.metrics import LeagueAverages
+    from fastbreak.models.league_dash_player_stats import (
+        LeagueDashPlayerStatsResponse,
+        LeagueDashPlayerStatsRow,
+    )
+    from fastbreak.models.league_game_log import GameLogEntry, LeagueGameLogResponse
+    from fastbreak.types import Season, SeasonType
+
+_TEAM_STATS = (
+    "min",
+    "fga",
+    "fgm",
+    "fta",
+    "ftm",
+    "tov",
+    "oreb",
+    "dreb",
+    "stl",
+    "blk",
+    "pf",
+    "pts",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerWinShares:
+    """One player's season Win Shares."""
+
+    player_id: int
+    player_name: str
+    team_id: int
+    minutes: float
+    ows: float
+    dws: float
+    ws: float
+    ws_per_48: float
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LeagueWinShares:
+    """Columnar Win Shares for every player in a season, ordered by player ID.
+
+    Every field is a length-``n`` array (``player_name`` a tuple).  Values
+    are NaN where the scalar functions return ``None`` (e.g. DWS for a
+    player without minutes).  ``ws_per_48`` is per ``game_minutes`` minutes
+    (WS/40 for the WNBA).
+    """
+
+    player_id: np.ndarray
+    player_name: tuple[str, ...]
+    team_id: np.ndarray
+    minutes: np.ndarray
+    ows: np.ndarray
+    dws: np.ndarray
+    ws: np.ndarray
+    ws_per_48: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.player_id)
+
+    def _row(self, i: int) -> PlayerWinShares:
+        return PlayerWinShares(
+            player_id=int(self.player_id[i]),
+            player_name=self.player_name[i],
+            team_id=int(self.team_id[i]),
+            minutes=float(self.minutes[i]),
+            ows=float(self.ows[i]),
+            dws=float(self.dws[i]),
+            ws=float(self.ws[i]),
+            ws_per_48=float(self.ws_per_48[i]),
+        )
+
+    def player(self, player_id: int) -> PlayerWinShares | None:
+        """The row for ``player_id``, or None."""
+        i = int(np.searchsorted(self.player_id, player_id))
+        if i == len(self) or self.player_id[i] != player_id:
+            return None
+        return self._row(i)
+
+    def to_player_win_shares(self) -> list[PlayerWinShares]:
+        """Every row as a :class:`PlayerWinShares`."""
+        return [self._row(i) for i in range(len(self))]
+
+
+def _team_and_opponent_totals(
+    team_games: Sequence[GameLogEntry],
+) -> tuple[dict[int, int], dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Season totals per team and for its opponents, from team game-log rows.
+
+    Returns ``(team_index, own, opp)``: ``own[stat]`` / ``opp[stat]`` are
+    arrays indexed by ``team_index[team_id]``; ``own["gp"]`` counts games.
+    Games without exactly two rows (e.g. a log fetched mid-game) are skipped.
+    """
+    _, game_inv, game_n = np.unique(
+        [g.game_id for g in team_games], return_inverse=True, return_counts=True
+    )
+    paired = game_n[game_inv] == 2  # noqa: PLR2004
+    rows = [g for g, ok in zip(team_games, paired.tolist(), strict=True) if ok]
+    game_inv = np.unique([g.game_id for g in rows], return_inverse=True)[1]
+    team_ids, team_inv = np.unique([g.team_id for g in rows], return_inverse=True)
+    n_teams = len(team_ids)
+
+    own: dict[str, np.ndarray] = {
+        "gp": np.bincount(team_inv, minlength=n_teams).astype(np.float64)
+    }
+    opp: dict[str, np.ndarray] = {}
+    for stat in _TEAM_STATS:
+        values = column(rows, stat)
+        game_total = np.bincount(game_inv, weights=values)
+        own[stat] = np.bincount(team_inv, weights=values, minlength=n_teams)
+        opp[stat] = np.bincount(
+            team_inv, weights=game_total[game_inv] - values, minlength=n_teams
+        )
+    team_index = {int(t): i for i, t in enumerate(team_ids.tolist())}
+    return team_index, own, opp
+
+
+def compute_league_win_shares(
+    players: Sequence[LeagueDashPlayerStatsRow],
+    team_games: Sequence[GameLogEntry],
+    lg: LeagueAverages,
+    *,
+    game_minutes: float = 48,
+) -> LeagueWinShares:
+    """OWS, DWS, WS and WS/48 for every player at once.
+
+    Args:
+        players: Season **totals** per player (``LeagueDashPlayerStats`` with
+            ``per_mode="Totals"``).
+        team_games: Team rows of the season's ``LeagueGameLog``
+            (``player_or_team="T"``); every player's ``team_id`` must appear.
+        lg: Per-game league averages (see
+            :func:`fastbreak.teams.get_league_averages`).
+        game_minutes: Regulation game length for ``ws_per_48`` (40 for WNBA).
+
+    Returns:
+        A columnar :class:`LeagueWinShares`, one row per player.
+
+    Raises:
+        ValueError: If a player's team has no games in ``team_games``.
+    """
+    team_index, own, opp = _team_and_opponent_totals(team_games)
+    rows = sorted(players, key=lambda r: r.player_id)
+    missing = {r.team_id for r in rows} - team_index.keys()
+    if missing:
+        msg = f"no team games for team_id(s) {sorted(missing)}"
+        raise ValueError(msg)
+    idx = np.array([team_index[r.team_id] for r in rows], dtype=np.intp)
+
+    mp = column(rows, "min")
+    team_mp = 5.0 * team_game_minutes(own["min"], own["gp"])
+
+    def team(stat: str) -> np.ndarray:
+        return own[stat][idx]
+
+    def opponent(stat: str) -> np.ndarray:
+        return opp[stat][idx]
+
+    ows = metrics_array.offensive_win_shares(
+        column(rows, "pts"),
+        column(rows, "fga"),
+        column(rows, "fta"),
+        column(rows, "tov"),
+        lg,
+    )
+    dws = metrics_array.defensive_win_shares(
+        column(rows, "stl"),
+        column(rows, "blk"),
+        column(rows, "dreb"),
+        mp,
+        column(rows, "pf"),
+        team_mp[idx],
+        team("blk"),
+        team("stl"),
+        team("dreb"),
+        team("pf"),
+        opponent("fga"),
+        opponent("fgm"),
+        opponent("fta"),
+        opponent("ftm"),
+        opponent("tov"),
+        opponent("oreb"),
+        opponent("pts"),
+        lg,
+    )
+    ws = metrics_array.win_shares(ows, dws)
+    return LeagueWinShares(
+        player_id=np.array([r.player_id for r in rows], dtype=np.int64),
+        player_name=tuple(r.player_name for r in rows),
+        team_id=np.array([r.team_id for r in rows], dtype=np.int64),
+        minutes=mp,
+        ows=ows,
+        dws=dws,
+        ws=ws,
+        ws_per_48=metrics_array.win_shares_per_48(ws, mp, game_minutes=game_minutes),
+    )
+
+
+async def get_league_win_shares(
+    client: BaseClient,
+    *,
+    season: Season | None = None,
+    season_type: SeasonType = "Regular Season",
+    lg: LeagueAverages | None = None,
+) -> LeagueWinShares:
+    """Fetch season data and compute Win Shares for every player.
+
+    Requests player ``Totals`` and the league-wide team game log together,
+    concurrently with :func:`fastbreak.teams.get_league_averages` for the
+    same ``season_type`` unless ``lg`` is given (pass it to reuse averages
+    across runs).
+
+    Args:
+        client: NBA API client.
+        season: Season in YYYY-YY format (defaults to current).
+        season_type: "Regular Season", "Playoffs", etc.; the league averages
+            are computed for the same season type.
+        lg: Per-game league averages; fetched when omitted.
+
+    Returns:
+        A columnar :class:`LeagueWinShares`, one row per player.
+
+    Examples:
+        league = await get_league_win_shares(client, season="2024-25")
+        top = np.argsort(league.ws)[::-1][:10]
+    """
+    from fastbreak.endpoints import LeagueDashPlayerStats, LeagueGameLog  # noqa: PLC0415
+    from fastbreak.teams import get_league_averages  # noqa: PLC0415
+
+    season = season or get_season_from_date(league=client.league)
+    averages: list[LeagueAverages] = [] if lg is None else [lg]
+    results: list[Any] = []
+
+    async def fetch_averages() -> None:
+        averages.append(
+            await get_league_averages(client, season, season_type=season_type)
+        )
+
+    async def fetch_tables() -> None:
+        results.extend(
+            await client.get_many(
+                [
+                    LeagueDashPlayerStats(
+                        season=season,
+                        season_type=season_type,
+                        per_mode="Totals",
+                        league_id=client.league_id,
+                    ),
+                    LeagueGameLog(
+                        league_id=client.league_id,
+                        season=season,
+                        season_type=season_type,
+                        player_or_team="T",
+                    ),
+                ],
+                max_concurrency=2,
+            )
+        )
+
+    async with anyio.create_task_group() as tg:
+        if not averages:
+            tg.start_soon(fetch_averages)
+        tg.start_soon(fetch_tables)
+    player_resp = cast("LeagueDashPlayerStatsResponse", results[0])
+    log_resp = cast("LeagueGameLogResponse", results[1])
+    return compute_league_win_shares(
+        player_resp.players,
+        log_resp.games,
+        averages[0],
+        game_minutes=client.league.game_minutes,
+    )
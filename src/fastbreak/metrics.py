@@ -23,10 +23,12 @@ Examples::
 """
 
 import bisect
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field, fields
 from math import erf, pow as fpow, sqrt as fsqrt
 
+import numpy as np
+
 
 @dataclass(frozen=True, slots=True)
 class LeagueAverages:
@@ -781,7 +783,8 @@ def bpm(  # noqa: PLR0913, PLR0917
     The returned values do **not** include the team adjustment constant --
     that requires the full roster and is applied externally so the
     minutes-weighted team total equals the team's adjusted efficiency
-    differential.
+    differential.  :func:`fastbreak.league_bpm.compute_league_bpm` applies
+    it for a whole league from season totals.
 
     Args:
         pts:             Points per 100 team possessions.
@@ -1969,3 +1972,136 @@ def hit_rate_last_n(
     if not recent:
         return None
     return sum(1 for v in recent if v >= line) / len(recent)
+
+
+# ---------------------------------------------------------------------------
+# Prebuilt reference distributions
+# ---------------------------------------------------------------------------
+
+
+class ReferenceDistribution:
+    """A reference sample sorted once for repeated distribution queries.
+
+    :func:`percentile_rank`, :func:`stat_floor`, :func:`stat_ceiling`,
+    :func:`stat_median`, :func:`expected_stat` and :func:`prop_hit_rate`
+    filter and sort their input on every call.  When the same distribution
+    is queried many times — ranking every player in the league against the
+    league-wide distribution of each stat — build it once here instead.
+    Every method returns exactly what the matching function returns for the
+    same sample; lookups are binary searches on a sorted NumPy array.
+
+    ``None`` and ``NaN`` entries are excluded from the sample.
+
+    Examples::
+
+        league_pts = ReferenceDistribution(p.pts for p in dash.players)
+        league_pts.percentile_rank(25.0)           # same as percentile_rank(25.0, ...)
+        league_pts.percentile_ranks(player_pts)    # one call for the whole league
+        league_pts.floor(), league_pts.ceiling()   # P10, P90
+    """
+
+    __slots__ = ("_sorted",)
+
+    def __init__(self, values: Iterable[float | None] | np.ndarray) -> None:
+        """Build the distribution from a sample (``None`` entries are skipped)."""
+        if isinstance(values, np.ndarray):
+            arr = values.astype(np.float64, copy=False).ravel()
+        else:
+            arr = np.fromiter((v for v in values if v is not None), dtype=np.float64)
+        arr = np.sort(arr[~np.isnan(arr)])
+        arr.flags.writeable = False
+        self._sorted = arr
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    @property
+    def values(self) -> np.ndarray:
+        """The sample, sorted ascending (read-only)."""
+        return self._sorted
+
+    def percentile(self, p: float) -> float | None:
+        """Linear-interpolation *p*-th percentile, or ``None`` for an empty sample.
+
+        Raises:
+            ValueError: When *p* is outside [0.0, 100.0].
+        """
+        if not (0.0 <= p <= 100.0):  # noqa: PLR2004
+            msg = f"percentile must be in [0.0, 100.0], got {p}"
+            raise ValueError(msg)
+        if len(self._sorted) == 0:
+            return None
+        return self._at(p)
+
+    def _at(self, p: float) -> float:
+        """:func:`_percentile` on the (non-empty) sorted sample."""
+        s = self._sorted
+        n = len(s)
+        if n == 1:
+            return float(s[0])
+        idx = (p / 100.0) * (n - 1)
+        lo = int(idx)
+        hi = min(lo + 1, n - 1)
+        return float(s[lo]) + (idx - lo) * (float(s[hi]) - float(s[lo]))
+
+    def floor(self, percentile: float = 10.0) -> float | None:
+        """Same as :func:`stat_floor` on the sample."""
+        return self.percentile(percentile)
+
+    def ceiling(self, percentile: float = 90.0) -> float | None:
+        """Same as :func:`stat_ceiling` on the sample."""
+        return self.percentile(percentile)
+
+    def median(self) -> float | None:
+        """Same as :func:`stat_median` on the sample."""
+        return self.percentile(50.0)
+
+    def expected(self) -> float | None:
+        """Same as :func:`expected_stat` on the sample (PERT of P10/P50/P90)."""
+        if len(self._sorted) == 0:
+            return None
+        return (self._at(10.0) + 4.0 * self._at(50.0) + self._at(90.0)) / 6.0
+
+    def hit_rate(self, line: float) -> float | None:
+        """Same as :func:`prop_hit_rate` on the sample (``>=`` counts as a hit)."""
+        n = len(self._sorted)
+        if n == 0:
+            return None
+        below = int(np.searchsorted(self._sorted, line, side="left"))
+        return (n - below) / n
+
+    def percentile_rank(self, value: float) -> float | None:
+        """Same as :func:`percentile_rank` against the sample."""
+        if len(self._sorted) == 0:
+            return None
+        return float(self.percentile_ranks(np.array([value], dtype=np.float64))[0])
+
+    def percentile_ranks(self, values: Iterable[float] | np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`percentile_rank` for many query values.
+
+        Returns a float array the shape of *values*, all ``NaN`` when the
+        sample is empty.  ``NaN`` queries rank as ``NaN``.
+        """
+        q = np.asarray(
+            values if isinstance(values, np.ndarray) else list(values),
+            dtype=np.float64,
+        )
+        s = self._sorted
+        n = len(s)
+        out = np.full(q.shape, np.nan)
+        if n == 0:
+            return out
+        if n == 1:
+            out[q >= s[0]] = 100.0
+            out[q < s[0]] = 0.0
+            return out
+        # Same precedence as percentile_rank: at or below the minimum wins.
+        out[q >= s[-1]] = 100.0
+        out[q <= s[0]] = 0.0
+        inside = (q > s[0]) & (q < s[-1])
+        v = q[inside]
+        lo = np.searchsorted(s, v, side="right") - 1
+        # Strictly inside the range, s[lo] <= v < s[lo + 1], so span > 0.
+        frac = (v - s[lo]) / (s[lo + 1] - s[lo])
+        out[inside] = (lo + frac) / (n - 1) * 100.0
+        return out
@@ -0,0 +1,934 @@
+"""NumPy-batched counterparts of the formulas in :mod:`fastbreak.metrics`.
+
+Every function mirrors the scalar function of the same name but accepts
+array-likes (NumPy arrays, pandas/polars columns, lists or plain scalars),
+broadcasts them together like a ufunc, and returns a ``float64`` array.
+Where the scalar version returns ``None`` (zero denominator, no minutes,
+degenerate league averages) the array version returns ``NaN`` for that
+element, so a whole league dash is computed in one call instead of a
+Python loop with a function call per row.
+
+``LeagueAverages`` arguments stay scalar: they describe the whole league,
+not one row.  The rolling-window functions at the end of the module roll
+along the last axis, so a NaN-padded ``(players, games)`` matrix is
+processed in one call.
+
+Examples::
+
+    from fastbreak import metrics_array as ma
+
+    ts = ma.true_shooting(df["pts"], df["fga"], df["fta"])   # ndarray, NaN for 0 FGA/FTA
+    usg = ma.usage_pct(df["fga"], df["fta"], df["tov"], df["min"],
+                       df["team_fga"], df["team_fta"], df["team_tov"], df["team_min"])
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.special import erf
+
+from fastbreak.metrics import _percentile
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from fastbreak.metrics import LeagueAverages
+
+_DOUBLE_DIGIT_THRESHOLD: int = 10
+
+
+@dataclass(frozen=True, slots=True)
+class FourFactorsArrays:
+    """Column-wise :class:`~fastbreak.metrics.FourFactors` (NaN where undefined)."""
+
+    efg_pct: np.ndarray
+    tov_pct: np.ndarray
+    oreb_pct: np.ndarray
+    ftr: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class BPMArrays:
+    """Column-wise :class:`~fastbreak.metrics.BPMResult` (NaN where ``mp <= 0``)."""
+
+    total: np.ndarray
+    offensive: np.ndarray
+    defensive: np.ndarray
+
+
+def _f(values: ArrayLike) -> NDArray[np.float64]:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _div(
+    num: ArrayLike, den: ArrayLike, *, valid: np.ndarray | None = None
+) -> NDArray[np.float64]:
+    """``num / den`` broadcast, NaN where ``valid`` is False (default ``den != 0``)."""
+    n, d = np.broadcast_arrays(_f(num), _f(den))
+    mask = d != 0 if valid is None else np.broadcast_to(valid, d.shape)
+    out = np.full(d.shape, np.nan)
+    with np.errstate(over="ignore"):
+        np.divide(n, d, out=out, where=mask)
+    return out
+
+
+def _mask(values: np.ndarray, valid: np.ndarray | bool) -> np.ndarray:  # noqa: FBT001
+    """Replace elements of ``values`` where ``valid`` is False with NaN."""
+    out: np.ndarray = np.where(valid, values, np.nan)
+    return out
+
+
+# ── Shooting and rates ───────────────────────────────────────────────────────
+
+
+def true_shooting(pts: ArrayLike, fga: ArrayLike, fta: ArrayLike) -> np.ndarray:
+    """TS% = pts / (2 * (FGA + 0.44 * FTA)); NaN when FGA and FTA are both zero."""
+    return _div(pts, 2 * (_f(fga) + 0.44 * _f(fta)))
+
+
+def effective_fg_pct(fgm: ArrayLike, fg3m: ArrayLike, fga: ArrayLike) -> np.ndarray:
+    """eFG% = (FGM + 0.5 * FG3M) / FGA; NaN when FGA is zero."""
+    return _div(_f(fgm) + 0.5 * _f(fg3m), fga)
+
+
+def free_throw_rate(fta: ArrayLike, fga: ArrayLike) -> np.ndarray:
+    """FTr = FTA / FGA; NaN when FGA is zero."""
+    return _div(fta, fga)
+
+
+def three_point_rate(fg3a: ArrayLike, fga: ArrayLike) -> np.ndarray:
+    """3PAr = FG3A / FGA; NaN when FGA is zero."""
+    return _div(fg3a, fga)
+
+
+def tov_pct(fga: ArrayLike, fta: ArrayLike, tov: ArrayLike) -> np.ndarray:
+    """TOV% = TOV / (FGA + 0.44 * FTA + TOV) as a 0-1 fraction; NaN with no activity."""
+    return _div(tov, _f(fga) + 0.44 * _f(fta) + _f(tov))
+
+
+def four_factors(  # noqa: PLR0913, PLR0917
+    fgm: ArrayLike,
+    fg3m: ArrayLike,
+    fga: ArrayLike,
+    tov: ArrayLike,
+    fta: ArrayLike,
+    oreb: ArrayLike,
+    opp_dreb: ArrayLike,
+) -> FourFactorsArrays:
+    """Dean Oliver's Four Factors for many team performances at once."""
+    oreb_arr = _f(oreb)
+    total_reb = oreb_arr + _f(opp_dreb)
+    return FourFactorsArrays(
+        efg_pct=effective_fg_pct(fgm, fg3m, fga),
+        tov_pct=tov_pct(fga, fta, tov),
+        oreb_pct=_div(oreb_arr, total_reb, valid=total_reb > 0),
+        ftr=free_throw_rate(fta, fga),
+    )
+
+
+def ast_to_tov(ast: ArrayLike, tov: ArrayLike) -> np.ndarray:
+    """AST / TOV; NaN when turnovers are zero."""
+    return _div(ast, tov)
+
+
+def assist_ratio(
+    ast: ArrayLike, fga: ArrayLike, fta: ArrayLike, tov: ArrayLike
+) -> np.ndarray:
+    """AST / (FGA + 0.44*FTA + AST + TOV) * 100; NaN with no offensive plays."""
+    return _div(ast, _f(fga) + 0.44 * _f(fta) + _f(ast) + _f(tov)) * 100
+
+
+def game_score(  # noqa: PLR0913, PLR0917
+    pts: ArrayLike,
+    fgm: ArrayLike,
+    fga: ArrayLike,
+    ftm: ArrayLike,
+    fta: ArrayLike,
+    oreb: ArrayLike,
+    dreb: ArrayLike,
+    stl: ArrayLike,
+    ast: ArrayLike,
+    blk: ArrayLike,
+    pf: ArrayLike,
+    tov: ArrayLike,
+) -> np.ndarray:
+    """Hollinger's Game Score for every row (never NaN for finite inputs)."""
+    return (
+        _f(pts)
+        + 0.4 * _f(fgm)
+        - 0.7 * _f(fga)
+        - 0.4 * (_f(fta) - _f(ftm))
+        + 0.7 * _f(oreb)
+        + 0.3 * _f(dreb)
+        + _f(stl)
+        + 0.7 * _f(ast)
+        + 0.7 * _f(blk)
+        - 0.4 * _f(pf)
+        - _f(tov)
+    )
+
+
+def nba_efficiency(  # noqa: PLR0913, PLR0917
+    pts: ArrayLike,
+    reb: ArrayLike,
+    ast: ArrayLike,
+    stl: ArrayLike,
+    blk: ArrayLike,
+    tov: ArrayLike,
+    fgm: ArrayLike,
+    fga: ArrayLike,
+    ftm: ArrayLike,
+    fta: ArrayLike,
+) -> np.ndarray:
+    """NBA.com EFF = PTS + REB + AST + STL + BLK - TOV - missed FG - missed FT."""
+    return (
+        _f(pts)
+        + _f(reb)
+        + _f(ast)
+        + _f(stl)
+        + _f(blk)
+        - _f(tov)
+        - (_f(fga) - _f(fgm))
+        - (_f(fta) - _f(ftm))
+    )
+
+
+def per_36(stat: ArrayLike, minutes: ArrayLike) -> np.ndarray:
+    """stat * 36 / minutes; NaN when minutes are zero."""
+    return _div(_f(stat) * 36, minutes)
+
+
+def per_48(stat: ArrayLike, minutes: ArrayLike) -> np.ndarray:
+    """stat * 48 / minutes; NaN when minutes are zero."""
+    return _div(_f(stat) * 48, minutes)
+
+
+def per_40(stat: ArrayLike, minutes: ArrayLike) -> np.ndarray:
+    """stat * 40 / minutes; NaN when minutes are zero."""
+    return _div(_f(stat) * 40, minutes)
+
+
+def per_100(stat: ArrayLike, poss: ArrayLike) -> np.ndarray:
+    """stat * 100 / poss; NaN when possessions are zero."""
+    return _div(_f(stat) * 100, poss)
+
+
+def _double_digit_categories(
+    pts: ArrayLike, reb: ArrayLike, ast: ArrayLike, stl: ArrayLike, blk: ArrayLike
+) -> np.ndarray:
+    cats = np.broadcast_arrays(*(_f(c) for c in (pts, reb, ast, stl, blk)))
+    count: np.ndarray = (np.stack(cats) >= _DOUBLE_DIGIT_THRESHOLD).sum(axis=0)
+    return count
+
+
+def is_double_double(
+    pts: ArrayLike, reb: ArrayLike, ast: ArrayLike, stl: ArrayLike, blk: ArrayLike
+) -> np.ndarray:
+    """Boolean array: at least two of the five counting categories reach 10+."""
+    out: np.ndarray = _double_digit_categories(pts, reb, ast, stl, blk) >= 2  # noqa: PLR2004
+    return out
+
+
+def is_triple_double(
+    pts: ArrayLike, reb: ArrayLike, ast: ArrayLike, stl: ArrayLike, blk: ArrayLike
+) -> np.ndarray:
+    """Boolean array: at least three of the five counting categories reach 10+."""
+    out: np.ndarray = _double_digit_categories(pts, reb, ast, stl, blk) >= 3  # noqa: PLR2004
+    return out
+
+
+# ── On-floor impact ──────────────────────────────────────────────────────────
+
+
+def usage_pct(  # noqa: PLR0913, PLR0917
+    fga: ArrayLike,
+    fta: ArrayLike,
+    tov: ArrayLike,
+    mp: ArrayLike,
+    team_fga: ArrayLike,
+    team_fta: ArrayLike,
+    team_tov: ArrayLike,
+    team_mp: ArrayLike,
+) -> np.ndarray:
+    """Usage%; NaN when player minutes or team possessions are zero."""
+    team_poss = _f(team_fga) + 0.44 * _f(team_fta) + _f(team_tov)
+    player_poss = _f(fga) + 0.44 * _f(fta) + _f(tov)
+    return _div(player_poss * (_f(team_mp) / 5), _f(mp) * team_poss)
+
+
+def ast_pct(
+    ast: ArrayLike,
+    fgm: ArrayLike,
+    mp: ArrayLike,
+    team_fgm: ArrayLike,
+    team_mp: ArrayLike,
+) -> np.ndarray:
+    """AST%; NaN when minutes are zero or the teammate-FGM denominator is <= 0."""
+    mp_arr, team_mp_arr = _f(mp), _f(team_mp)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        denominator = (mp_arr / (team_mp_arr / 5)) * _f(team_fgm) - _f(fgm)
+    valid = (team_mp_arr != 0) & (mp_arr != 0) & (denominator > 0)
+    return _div(ast, denominator, valid=valid)
+
+
+def _possession_pct(
+    stat: ArrayLike, mp: ArrayLike, team_mp: ArrayLike, opportunity: np.ndarray
+) -> np.ndarray:
+    return _div(_f(stat) * (_f(team_mp) / 5), _f(mp) * opportunity)
+
+
+def oreb_pct(
+    oreb: ArrayLike,
+    mp: ArrayLike,
+    team_oreb: ArrayLike,
+    opp_dreb: ArrayLike,
+    team_mp: ArrayLike,
+) -> np.ndarray:
+    """OREB%; NaN when player minutes or available rebounds are zero."""
+    return _possession_pct(oreb, mp, team_mp, _f(team_oreb) + _f(opp_dreb))
+
+
+def dreb_pct(
+    dreb: ArrayLike,
+    mp: ArrayLike,
+    team_dreb: ArrayLike,
+    opp_oreb: ArrayLike,
+    team_mp: ArrayLike,
+) -> np.ndarray:
+    """DREB%; NaN when player minutes or available rebounds are zero."""
+    return _possession_pct(dreb, mp, team_mp, _f(team_dreb) + _f(opp_oreb))
+
+
+def stl_pct(
+    stl: ArrayLike, mp: ArrayLike, team_mp: ArrayLike, opp_poss: ArrayLike
+) -> np.ndarray:
+    """STL%; NaN when player minutes or opponent possessions are zero."""
+    return _possession_pct(stl, mp, team_mp, _f(opp_poss))
+
+
+def blk_pct(
+    blk: ArrayLike, mp: ArrayLike, team_mp: ArrayLike, opp_fg2a: ArrayLike
+) -> np.ndarray:
+    """BLK%; NaN when player minutes or opponent 2-point attempts are zero."""
+    return _possession_pct(blk, mp, team_mp, _f(opp_fg2a))
+
+
+# ── PER ──────────────────────────────────────────────────────────────────────
+
+
+def pace_adjusted_per(  # noqa: PLR0913, PLR0917
+    fgm: ArrayLike,
+    fga: ArrayLike,
+    fg3m: ArrayLike,
+    ftm: ArrayLike,
+    fta: ArrayLike,
+    oreb: ArrayLike,
+    treb: ArrayLike,
+    ast: ArrayLike,
+    stl: ArrayLike,
+    blk: ArrayLike,
+    pf: ArrayLike,
+    tov: ArrayLike,
+    mp: ArrayLike,
+    team_ast: ArrayLike,
+    team_fgm: ArrayLike,
+    team_pace: ArrayLike,
+    lg: LeagueAverages,
+) -> np.ndarray:
+    """Pace-adjusted PER; NaN when ``mp``, ``team_fgm`` or ``team_pace`` is zero."""
+    fgm_a, fga_a, ftm_a, fta_a = _f(fgm), _f(fga), _f(ftm), _f(fta)
+    oreb_a, mp_a, team_fgm_a, team_pace_a = (
+        _f(oreb),
+        _f(mp),
+        _f(team_fgm),
+        _f(team_pace),
+    )
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        team_ast_ratio = _f(team_ast) / team_fgm_a
+        uper = (1 / mp_a) * (
+            _f(fg3m)
+            + (2 / 3) * _f(ast)
+            + (2 - lg.factor * team_ast_ratio) * fgm_a
+            + ftm_a * 0.5 * (1 + (1 - team_ast_ratio) + (2 / 3) * team_ast_ratio)
+            - lg.vop * _f(tov)
+            - lg.vop * lg.drb_pct * (fga_a - fgm_a)
+            - lg.vop * 0.44 * (0.44 + 0.56 * lg.drb_pct) * (fta_a - ftm_a)
+            + lg.vop * (1 - lg.drb_pct) * (_f(treb) - oreb_a)
+            + lg.vop * lg.drb_pct * oreb_a
+            + lg.vop * _f(stl)
+            + lg.vop * lg.drb_pct * _f(blk)
+            - _f(pf) * (lg.lg_ftm / lg.lg_pf - 0.44 * (lg.lg_fta / lg.lg_pf) * lg.vop)
+        )
+        aper = (lg.lg_pace / team_pace_a) * uper
+    return _mask(aper, (mp_a != 0) & (team_fgm_a != 0) & (team_pace_a != 0))
+
+
+def per(aper: ArrayLike, lg_aper: ArrayLike) -> np.ndarray:
+    """PER = aPER * (15 / lg_aPER); NaN when ``lg_aper`` is zero."""
+    return _f(aper) * _div(15.0, lg_aper)
+
+
+# ── BPM / VORP ───────────────────────────────────────────────────────────────
+
+
+def bpm(  # noqa: PLR0913, PLR0917
+    pts: ArrayLike,
+    fg3m: ArrayLike,
+    ast: ArrayLike,
+    tov: ArrayLike,
+    orb: ArrayLike,
+    drb: ArrayLike,
+    stl: ArrayLike,
+    blk: ArrayLike,
+    pf: ArrayLike,
+    fga: ArrayLike,
+    fta: ArrayLike,
+    *,
+    pct_team_trb: ArrayLike,
+    pct_team_stl: ArrayLike,
+    pct_team_pf: ArrayLike,
+    pct_team_ast: ArrayLike,
+    pct_team_blk: ArrayLike,
+    pct_team_pts: ArrayLike,
+    listed_position: ArrayLike = 3.0,
+    mp: ArrayLike = 500.0,
+) -> BPMArrays:
+    """Raw BPM 2.0 for many players at once; NaN where ``mp <= 0``.
+
+    Same inputs and scale as :func:`fastbreak.metrics.bpm` (per-100 counting
+    stats, 0-1 team shares); see that function for the model description.
+    """
+    mp_a, pct_ast = _f(mp), _f(pct_team_ast)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        raw_pos = (
+            2.130
+            + 8.668 * _f(pct_team_trb)
+            - 2.486 * _f(pct_team_stl)
+            + 0.992 * _f(pct_team_pf)
+            - 3.536 * pct_ast
+            + 1.667 * _f(pct_team_blk)
+        )
+        position = np.clip(
+            (raw_pos * mp_a + _f(listed_position) * 50.0) / (mp_a + 50.0), 1.0, 5.0
+        )
+        raw_role = 6.00 - 6.642 * pct_ast - 8.544 * _f(pct_team_pts)
+        role = np.clip((raw_role * mp_a + 4.0 * 50.0) / (mp_a + 50.0), 1.0, 5.0)
+
+    pos_w = (position - 1.0) / 4.0
+    role_w = (role - 1.0) / 4.0
+
+    def _pos(c1: float, c5: float) -> np.ndarray:
+        return c1 + pos_w * (c5 - c1)
+
+    def _role(c1: float, c5: float) -> np.ndarray:
+        return c1 + role_w * (c5 - c1)
+
+    pos_factor = np.maximum(0.0, 3.0 - position) / 2.0
+    role_const_bpm = -2.774 + role_w * 5.548
+    role_const_obpm = -0.860 + role_w * 1.720
+
+    pts_a, fg3m_a, ast_a, tov_a = _f(pts), _f(fg3m), _f(ast), _f(tov)
+    orb_a, drb_a, stl_a, blk_a = _f(orb), _f(drb), _f(stl), _f(blk)
+    pf_a, fga_a, fta_a = _f(pf), _f(fga), _f(fta)
+
+    raw_total = (
+        0.860 * pts_a
+        + 0.389 * fg3m_a
+        + _pos(0.580, 1.034) * ast_a
+        - 0.964 * tov_a
+        + _pos(0.613, 0.181) * orb_a
+        + _pos(0.116, 0.181) * drb_a
+        + _pos(1.369, 1.008) * stl_a
+        + _pos(1.327, 0.703) * blk_a
+        - 0.367 * pf_a
+        + _role(-0.560, -0.780) * fga_a
+        + _role(-0.246, -0.343) * fta_a
+        + -0.818 * pos_factor
+        + role_const_bpm
+    )
+    raw_obpm = (
+        0.605 * pts_a
+        + 0.477 * fg3m_a
+        + 0.476 * ast_a
+        + _pos(-0.579, -0.882) * tov_a
+        + _pos(0.606, 0.422) * orb_a
+        + _pos(-0.112, 0.103) * drb_a
+        + _pos(0.177, 0.294) * stl_a
+        + _pos(0.725, 0.097) * blk_a
+        - 0.439 * pf_a
+        + _role(-0.330, -0.472) * fga_a
+        + _role(-0.145, -0.208) * fta_a
+        + -1.698 * pos_factor
+        + role_const_obpm
+    )
+    played = mp_a > 0
+    total = _mask(raw_total, played)
+    offensive = _mask(raw_obpm, played)
+    return BPMArrays(total=total, offensive=offensive, defensive=total - offensive)
+
+
+def vorp(
+    bpm_total: ArrayLike,
+    poss_pct: ArrayLike,
+    games: ArrayLike,
+    *,
+    replacement_level: float = -2.0,
+    season_games: int = 82,
+) -> np.ndarray:
+    """VORP = (BPM - replacement_level) * poss_pct * (games / season_games).
+
+    Raises:
+        ValueError: If ``season_games`` is not positive.
+    """
+    if season_games <= 0:
+        msg = f"season_games must be > 0, got {season_games}"
+        raise ValueError(msg)
+    return (
+        (_f(bpm_total) - replacement_level) * _f(poss_pct) * (_f(games) / season_games)
+    )
+
+
+# ── Differences ──────────────────────────────────────────────────────────────
+
+
+def stat_delta(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """``a - b`` element-wise; NaN (the array form of ``None``) propagates."""
+    return _f(a) - _f(b)
+
+
+def relative_ts(player_ts: ArrayLike, lg: LeagueAverages) -> np.ndarray:
+    """Player TS% minus league-average TS%."""
+    return _f(player_ts) - lg.ts
+
+
+def relative_efg(player_efg: ArrayLike, lg: LeagueAverages) -> np.ndarray:
+    """Player eFG% minus league-average eFG%."""
+    return _f(player_efg) - lg.efg
+
+
+# ── Possessions and team ratings ─────────────────────────────────────────────
+
+
+def possessions(
+    fga: ArrayLike, oreb: ArrayLike, tov: ArrayLike, fta: ArrayLike
+) -> np.ndarray:
+    """Dean Oliver's possession estimate: FGA - OREB + TOV + 0.44 * FTA."""
+    return _f(fga) - _f(oreb) + _f(tov) + 0.44 * _f(fta)
+
+
+def possessions_general(  # noqa: PLR0913, PLR0917
+    fgm: ArrayLike,
+    fga: ArrayLike,
+    ftm: ArrayLike,
+    fta: ArrayLike,
+    oreb: ArrayLike,
+    dreb_opp: ArrayLike,
+    tov: ArrayLike,
+    alpha: ArrayLike = 1.0,
+    lam: ArrayLike = 0.44,
+) -> np.ndarray:
+    """Kubatko et al. (2007) general possession formula, Eq. 1."""
+    fgm_a, ftm_a, alpha_a, lam_a = _f(fgm), _f(ftm), _f(alpha), _f(lam)
+    made = fgm_a + lam_a * ftm_a
+    missed = alpha_a * ((_f(fga) - fgm_a) + lam_a * (_f(fta) - ftm_a) - _f(oreb))
+    opp_dreb = (1 - alpha_a) * _f(dreb_opp)
+    return made + missed + opp_dreb + _f(tov)
+
+
+def plays(fga: ArrayLike, fta: ArrayLike, tov: ArrayLike) -> np.ndarray:
+    """Plays = FGA + 0.44 * FTA + TOV."""
+    return _f(fga) + 0.44 * _f(fta) + _f(tov)
+
+
+def ortg(
+    pts: ArrayLike, fga: ArrayLike, oreb: ArrayLike, tov: ArrayLike, fta: ArrayLike
+) -> np.ndarray:
+    """Points per 100 possessions; NaN when possessions are zero."""
+    return _div(pts, possessions(fga, oreb, tov, fta)) * 100
+
+
+def drtg(
+    opp_pts: ArrayLike,
+    opp_fga: ArrayLike,
+    opp_oreb: ArrayLike,
+    opp_tov: ArrayLike,
+    opp_fta: ArrayLike,
+) -> np.ndarray:
+    """Opponent points per 100 opponent possessions; NaN with no possessions."""
+    return _div(opp_pts, possessions(opp_fga, opp_oreb, opp_tov, opp_fta)) * 100
+
+
+def net_rtg(ortg_val: ArrayLike, drtg_val: ArrayLike) -> np.ndarray:
+    """ORTG minus DRTG; NaN propagates."""
+    return stat_delta(ortg_val, drtg_val)
+
+
+def floor_pct(pts: ArrayLike, poss: ArrayLike) -> np.ndarray:
+    """Points per possession; NaN when possessions are zero."""
+    return _div(pts, poss)
+
+
+def play_pct(pts: ArrayLike, total_plays: ArrayLike) -> np.ndarray:
+    """Points per play; NaN when plays are zero."""
+    return _div(pts, total_plays)
+
+
+# ── Win metrics ──────────────────────────────────────────────────────────────
+
+
+def offensive_win_shares(
+    pts: ArrayLike,
+    fga: ArrayLike,
+    fta: ArrayLike,
+    tov: ArrayLike,
+    lg: LeagueAverages,
+) -> np.ndarray:
+    """Offensive Win Shares; all NaN when ``lg.lg_pts`` is zero."""
+    player_poss = 0.96 * (_f(fga) + _f(tov) + 0.44 * _f(fta))
+    marginal_offense = _f(pts) - 0.92 * lg.vop * player_poss
+    return _div(marginal_offense, 0.32 * lg.lg_pts)
+
+
+def pythagorean_win_pct(
+    pts: ArrayLike, opp_pts: ArrayLike, exp: ArrayLike = 13.91
+) -> np.ndarray:
+    """pts^exp / (pts^exp + opp_pts^exp); NaN for negative or all-zero inputs."""
+    pts_a, opp_a, exp_a = _f(pts), _f(opp_pts), _f(exp)
+    with np.errstate(invalid="ignore"):
+        pts_exp = np.power(pts_a, exp_a)
+        opp_exp = np.power(opp_a, exp_a)
+    denominator = pts_exp + opp_exp
+    valid = (pts_a >= 0) & (opp_a >= 0) & (denominator != 0)
+    return _div(pts_exp, denominator, valid=valid)
+
+
+def bell_curve_win_pct(
+    ppg: ArrayLike, opp_ppg: ArrayLike, std_net_pts: ArrayLike
+) -> np.ndarray:
+    """Phi((PPG - OPP_PPG) / std_net_pts); NaN when ``std_net_pts`` is not positive."""
+    std = _f(std_net_pts)
+    z = _div(_f(ppg) - _f(opp_ppg), std, valid=std > 0)
+    out: np.ndarray = 0.5 * (1.0 + erf(z / np.sqrt(2.0)))
+    return out
+
+
+def defensive_win_shares(  # noqa: PLR0913, PLR0917
+    stl: ArrayLike,
+    blk: ArrayLike,
+    dreb: ArrayLike,
+    mp: ArrayLike,
+    pf: ArrayLike,
+    team_mp: ArrayLike,
+    team_blk: ArrayLike,
+    team_stl: ArrayLike,
+    team_dreb: ArrayLike,
+    team_pf: ArrayLike,
+    opp_fga: ArrayLike,
+    opp_fgm: ArrayLike,
+    opp_fta: ArrayLike,
+    opp_ftm: ArrayLike,
+    opp_tov: ArrayLike,
+    opp_oreb: ArrayLike,
+    opp_pts: ArrayLike,
+    lg: LeagueAverages,
+) -> np.ndarray:
+    """Stops-based Defensive Win Shares; NaN wherever the scalar returns ``None``.
+
+    Same formula and clamping as :func:`fastbreak.metrics.defensive_win_shares`.
+    """
+    mp_a, team_mp_a, team_dreb_a, team_pf_a = (
+        _f(mp),
+        _f(team_mp),
+        _f(team_dreb),
+        _f(team_pf),
+    )
+    opp_fga_a, opp_fgm_a, opp_fta_a = _f(opp_fga), _f(opp_fgm), _f(opp_fta)
+    opp_oreb_a, opp_pts_a = _f(opp_oreb), _f(opp_pts)
+    opp_poss = possessions(opp_fga_a, opp_oreb_a, opp_tov, opp_fta_a)
+
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        reb = opp_oreb_a + team_dreb_a
+        dor_pct = np.where(reb > 0, opp_oreb_a / reb, 0.0)
+        dfg_pct = np.where(opp_fga_a > 0, opp_fgm_a / opp_fga_a, 0.0)
+
+        fmwt_num = dfg_pct * (1 - dor_pct)
+        fmwt_den = fmwt_num + (1 - dfg_pct) * dor_pct
+        fmwt = np.where(fmwt_den > 0, fmwt_num / fmwt_den, 0.0)
+
+        stop_factor = 1 - 1.07 * dor_pct
+        stops1 = _f(stl) + _f(blk) * fmwt * stop_factor + _f(dreb) * (1 - fmwt)
+
+        rate_a = (
+            ((opp_fga_a - opp_fgm_a - _f(team_blk)) / team_mp_a) * fmwt * stop_factor
+        )
+        rate_b = (_f(opp_tov) - _f(team_stl)) / team_mp_a
+        ft_pct = np.where(opp_fta_a > 0, _f(opp_ftm) / opp_fta_a, 0.0)
+        pf_stops = np.where(
+            team_pf_a > 0,
+            (_f(pf) / team_pf_a) * 0.4 * opp_fta_a * (1 - ft_pct) ** 2,
+            0.0,
+        )
+        stops2 = (rate_a + rate_b) * mp_a + pf_stops
+
+        stop_pct = np.clip((stops1 + stops2) * team_mp_a / (opp_poss * mp_a), 0.0, 1.0)
+
+        sc_poss_denom = opp_fgm_a + opp_fta_a * (1 - (1 - ft_pct) ** 2) * 0.4
+        d_pts_per_sc_poss = opp_pts_a / sc_poss_denom
+
+        team_drtg = opp_pts_a / opp_poss * 100
+        player_drtg = team_drtg + 0.2 * (
+            100 * d_pts_per_sc_poss * (1 - stop_pct) - team_drtg
+        )
+        marg_def = (mp_a / team_mp_a) * opp_poss * (1.08 * lg.vop - player_drtg / 100)
+
+    valid = (
+        (mp_a != 0)
+        & (team_mp_a != 0)
+        & (opp_poss != 0)
+        & (sc_poss_denom != 0)
+        & (lg.lg_pts != 0)
+    )
+    return _div(marg_def, 0.32 * lg.lg_pts, valid=valid)
+
+
+def win_shares(ows: ArrayLike, dws: ArrayLike) -> np.ndarray:
+    """WS = OWS + DWS; NaN when either component is NaN."""
+    return _f(ows) + _f(dws)
+
+
+def win_shares_per_48(
+    ws: ArrayLike, mp: ArrayLike, *, game_minutes: float = 48
+) -> np.ndarray:
+    """WS * game_minutes / MP; NaN when ``ws`` is NaN or ``mp`` is zero."""
+    return _div(_f(ws) * game_minutes, mp)
+
+
+# ── Rolling windows ──────────────────────────────────────────────────────────
+#
+# Series run along the last axis, so a (players, games) matrix padded with NaN
+# rolls every player at once.  NaN plays the part of ``None`` in the scalar
+# functions: positions before the first full window, and windows containing a
+# NaN, are NaN.
+
+
+def _check_window(window: int) -> None:
+    if window < 1:
+        msg = f"window must be >= 1, got {window}"
+        raise ValueError(msg)
+
+
+def _check_percentile(percentile: float) -> None:
+    if not (0.0 <= percentile <= 100.0):  # noqa: PLR2004
+        msg = f"percentile must be in [0.0, 100.0], got {percentile}"
+        raise ValueError(msg)
+
+
+def _blocks(values: np.ndarray, window: int) -> np.ndarray:
+    """Split the last axis into blocks of ``window``, edge-padding the last block.
+
+    Padding never enters a window; repeating the final value just keeps it
+    from skewing the last block's centering in :func:`_window_m2`.
+    """
+    n = values.shape[-1]
+    padded = np.empty((*values.shape[:-1], -(-n // window) * window), values.dtype)
+    padded[..., :n] = values
+    padded[..., n:] = values[..., -1:]
+    return padded.reshape(*values.shape[:-1], -1, window)
+
+
+def _window_bounds(n: int, window: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Start, end and block-aligned flag of each full trailing window."""
+    ends = np.arange(window - 1, n)
+    starts = ends - window + 1
+    return starts, ends, starts % window == 0
+
+
+# Every full window is the suffix of one block of ``window`` values followed
+# by the prefix of the next (van Herk / Gil-Werman), so per-block forward and
+# reverse scans give each window's sum — and, with Chan et al.'s pairwise
+# update, its variance — in O(n) with rounding bounded by two blocks rather
+# than by the length of the series.
+
+
+def _window_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of each full trailing window along the last axis (length ``n - window + 1``)."""
+    b = _blocks(values, window)
+    flat = (*values.shape[:-1], -1)
+    prefix = np.cumsum(b, axis=-1).reshape(flat)
+    suffix = np.cumsum(b[..., ::-1], axis=-1)[..., ::-1].reshape(flat)
+    starts, ends, aligned = _window_bounds(values.shape[-1], window)
+    out: np.ndarray = suffix[..., starts] + np.where(aligned, 0, prefix[..., ends])
+    return out
+
+
+def _window_m2(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of squared deviations from the mean of each full trailing window."""
+    b = _blocks(values, window)
+    flat = (*values.shape[:-1], -1)
+    center = b.mean(axis=-1, keepdims=True)
+    d = b - center
+    k = np.arange(1, window + 1, dtype=np.float64)
+
+    # Part means are kept as offsets from their block's center so the
+    # difference between the two parts' means is not rounded at the scale
+    # of the values themselves.
+    p1, p2 = np.cumsum(d, axis=-1), np.cumsum(d * d, axis=-1)
+    pre_off = (p1 / k).reshape(flat)
+    pre_m2 = (p2 - p1 * p1 / k).reshape(flat)
+    r = d[..., ::-1]
+    s1 = np.cumsum(r, axis=-1)[..., ::-1]
+    s2 = np.cumsum(r * r, axis=-1)[..., ::-1]
+    suf_off = (s1 / k[::-1]).reshape(flat)
+    suf_m2 = (s2 - s1 * s1 / k[::-1]).reshape(flat)
+    centers = np.broadcast_to(center, b.shape).reshape(flat)
+
+    starts, ends, aligned = _window_bounds(values.shape[-1], window)
+    n_a = window - starts % window
+    n_b = window - n_a
+    delta = (centers[..., ends] - centers[..., starts]) + (
+        pre_off[..., ends] - suf_off[..., starts]
+    )
+    joined = pre_m2[..., ends] + delta * delta * (n_a * n_b / window)
+    out: np.ndarray = suf_m2[..., starts] + np.where(aligned, 0.0, joined)
+    return out
+
+
+def _rolling(
+    values: ArrayLike, window: int
+) -> tuple[NDArray[np.float64], np.ndarray, np.ndarray]:
+    """Return ``(x, missing, complete)`` for a rolling computation.
+
+    ``complete`` holds, for each trailing full window, whether it has no NaN;
+    it is empty when the series is shorter than the window.
+    """
+    _check_window(window)
+    x = _f(values)
+    missing = np.isnan(x)
+    if x.shape[-1] < window:
+        return x, missing, np.zeros((*x.shape[:-1], 0), dtype=bool)
+    return x, missing, _window_sum(missing.astype(np.int64), window) == 0
+
+
+def _place(
+    x: np.ndarray, window: int, complete: np.ndarray, tail: np.ndarray
+) -> np.ndarray:
+    """Lay per-window results into a NaN array the shape of ``x``."""
+    out = np.full(x.shape, np.nan)
+    out[..., window - 1 :] = np.where(complete, tail, np.nan)
+    return out
+
+
+def rolling_avg(values: ArrayLike, window: int) -> np.ndarray:
+    """Sliding-window mean; array form of :func:`fastbreak.metrics.rolling_avg`.
+
+    Runs in O(n) via per-block prefix and suffix sums.
+
+    Raises:
+        ValueError: When *window* is less than 1.
+    """
+    x, missing, complete = _rolling(values, window)
+    if complete.shape[-1] == 0:
+        return np.full(x.shape, np.nan)
+    sums = _window_sum(np.where(missing, 0.0, x), window)
+    return _place(x, window, complete, sums / window)
+
+
+def rolling_var(values: ArrayLike, window: int) -> np.ndarray:
+    """Sliding-window population variance in O(n).
+
+    Each window is split at a block boundary into two parts whose counts,
+    means and squared-deviation sums are combined with Chan et al.'s
+    pairwise (parallel Welford) update.  Rounding is bounded by the values
+    in two blocks, so a constant window has zero variance (to rounding) and
+    accuracy does not degrade along long series or at large offsets.
+
+    Raises:
+        ValueError: When *window* is less than 1.
+    """
+    x, missing, complete = _rolling(values, window)
+    if complete.shape[-1] == 0:
+        return np.full(x.shape, np.nan)
+    m2 = _window_m2(np.where(missing, 0.0, x), window)
+    return _place(x, window, complete, np.maximum(m2, 0.0) / window)
+
+
+def rolling_consistency(values: ArrayLike, window: int) -> np.ndarray:
+    """Sliding-window population std dev in O(n).
+
+    Array form of :func:`fastbreak.metrics.rolling_consistency`.
+
+    Raises:
+        ValueError: When *window* is less than 1.
+    """
+    out: np.ndarray = np.sqrt(rolling_var(values, window))
+    return out
+
+
+def rolling_hit_rate(values: ArrayLike, window: int, line: float) -> np.ndarray:
+    """Share of each window's games at or above *line* (``>=`` is a hit), in O(n).
+
+    Raises:
+        ValueError: When *window* is less than 1.
+    """
+    x, missing, complete = _rolling(values, window)
+    if complete.shape[-1] == 0:
+        return np.full(x.shape, np.nan)
+    hits = _window_sum((~missing & (x >= line)).astype(np.int64), window)
+    return _place(x, window, complete, hits / window)
+
+
+def rolling_percentile(values: ArrayLike, window: int, percentile: float) -> np.ndarray:
+    """Sliding-window linear-interpolation percentile (NumPy's default method).
+
+    Each series keeps its current window in a sorted list, so a step is one
+    binary-search insert and one delete instead of re-sorting the window.
+    A NaN empties the window; values resume once ``window`` consecutive
+    games have been seen again.
+
+    Raises:
+        ValueError: When *window* is less than 1 or *percentile* is outside
+            [0.0, 100.0].
+    """
+    _check_window(window)
+    _check_percentile(percentile)
+    x = _f(values)
+    rows = x.reshape(math.prod(x.shape[:-1]), x.shape[-1])
+    out = np.full(rows.shape, np.nan)
+    for r, row in enumerate(rows.tolist()):
+        current: list[float] = []
+        start = 0
+        for i, v in enumerate(row):
+            if math.isnan(v):
+                current.clear()
+                start = i + 1
+                continue
+            bisect.insort(current, v)
+            if i - start >= window:
+                del current[bisect.bisect_left(current, row[i - window])]
+            if len(current) == window:
+                out[r, i] = _percentile(current, percentile)
+    return out.reshape(x.shape)
+
+
+def rolling_floor(
+    values: ArrayLike, window: int, percentile: float = 10.0
+) -> np.ndarray:
+    """Rolling :func:`fastbreak.metrics.stat_floor` (default P10) over each window."""
+    return rolling_percentile(values, window, percentile)
+
+
+def rolling_median(values: ArrayLike, window: int) -> np.ndarray:
+    """Rolling :func:`fastbreak.metrics.stat_median` over each window."""
+    return rolling_percentile(values, window, 50.0)
+
+
+def rolling_ceiling(
+    values: ArrayLike, window: int, percentile: float = 90.0
+) -> np.ndarray:
+    """Rolling :func:`fastbreak.metrics.stat_ceiling` (default P90) over each window."""
+    return rolling_percentile(values, window, percentile)
@@ -8,9 +8,15 @@ from fastbreak.models.common.result_set import named_result_sets_validator
 
 
 class GameLogEntry(PandasMixin, PolarsMixin, BaseModel):
-    """A single game log entry from the league game log."""
+    """A single game log entry from the league game log.
+
+    ``player_id`` and ``player_name`` are only populated for player logs
+    (``player_or_team="P"``).
+    """
 
     season_id: str = Field(alias="SEASON_ID")
+    player_id: int | None = Field(default=None, alias="PLAYER_ID")
+    player_name: str | None = Field(default=None, alias="PLAYER_NAME")
     team_id: int = Field(alias="TEAM_ID")
     team_abbreviation: str = Field(alias="TEAM_ABBREVIATION")
     team_name: str = Field(alias="TEAM_NAME")
@@ -1,15 +1,49 @@
+import re
+from functools import lru_cache
+
 from pydantic import BaseModel
 
 from fastbreak.models.common.dataframe import PandasMixin, PolarsMixin
 from fastbreak.models.common.meta import Meta
 from fastbreak.models.common.response import FrozenResponse
 
+_CLOCK_RE = re.compile(r"PT(\d+)M([\d.]+)S")
+_FIXED_CLOCK_LEN = len("PT12M00.00S")
+
+
+@lru_cache(maxsize=4096)
+def parse_clock(clock: str) -> float:
+    """Return remaining seconds in the period from an ISO 8601 ``clock``.
+
+    The API sends the fixed ``PTmmMss.ssS`` layout, which is sliced
+    directly; anything else falls back to a regex, and unparseable clocks
+    are 0.0.  A period has only a few thousand distinct clock strings, so
+    results are cached.
+    """
+    if (
+        len(clock) == _FIXED_CLOCK_LEN
+        and clock.startswith("PT")
+        and clock[4] == "M"
+        and clock[7] == "."
+        and clock[10] == "S"
+        and clock[2:4].isdigit()
+        and clock[5:7].isdigit()
+        and clock[8:10].isdigit()
+    ):
+        return int(clock[2:4]) * 60 + float(clock[5:10])
+    m = _CLOCK_RE.match(clock)
+    if not m:
+        return 0.0
+    return int(m.group(1)) * 60 + float(m.group(2))
+
 
 class PlayByPlayAction(PandasMixin, PolarsMixin, BaseModel):
     """A single play-by-play action in a game.
 
     Represents events like shots, turnovers, fouls, substitutions, etc.
     Court coordinates (xLegacy, yLegacy) are provided for shot attempts.
+    ``clock_seconds`` is ``clock`` parsed on access; :func:`parse_clock` caches
+    by clock string, so it always matches ``clock`` and costs a cache lookup.
     """
 
     actionNumber: int
@@ -36,6 +70,11 @@ class PlayByPlayAction(PandasMixin, PolarsMixin, BaseModel):
     shotValue: int
     actionId: int
 
+    @property
+    def clock_seconds(self) -> float:
+        """Seconds remaining in the period."""
+        return parse_clock(self.clock)
+
 
 class PlayByPlayGame(PandasMixin, PolarsMixin, BaseModel):
     """Play-by-play data for a single game."""
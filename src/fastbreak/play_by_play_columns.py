@@ -0,0 +1,346 @@
+"""Columnar play-by-play: one NumPy array per field instead of one model per action.
+
+A season of :class:`~fastbreak.models.play_by_play.PlayByPlayAction` models
+is ~600k Pydantic objects with 23 fields each, most of them short strings
+repeated thousands of times.  :class:`PlayByPlayColumns` stores the same
+data as fixed-width numeric arrays; every string field is an ``int32`` code
+into one interned table (``strings``), so ``"Made Shot"`` or a player's
+name is stored once per container rather than once per action.
+
+Each action's clock is parsed once per distinct clock string and kept as
+``clock_seconds``; ``elapsed`` holds seconds since tip-off for the
+container's league.  Games are contiguous row ranges (``offsets``), so
+:meth:`PlayByPlayColumns.game` returns a single-game container whose arrays
+are views into the parent's: no data is copied.
+
+:func:`fastbreak.games.game_flow`,
+:func:`fastbreak.hot_hand.extract_shot_sequences` and
+:func:`fastbreak.transition.classify_possessions` accept a
+:class:`PlayByPlayColumns` wherever they accept a list of actions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from fastbreak._game_clock import elapsed_from_remaining_array
+from fastbreak.league import League
+from fastbreak.models.play_by_play import PlayByPlayAction, parse_clock
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+    from fastbreak.clients.base import BaseClient
+    from fastbreak.models.play_by_play import PlayByPlayResponse
+
+_DEFAULT_BATCH_SIZE = 10
+
+# (playbyplayv3 key, column name, dtype); dtype None marks a string column.
+_COLUMNS: tuple[tuple[str, str, type[np.generic] | None], ...] = (
+    ("actionNumber", "action_number", np.int32),
+    ("clock", "clock", None),
+    ("period", "period", np.int16),
+    ("teamId", "team_id", np.int64),
+    ("teamTricode", "team_tricode", None),
+    ("personId", "person_id", np.int64),
+    ("playerName", "player_name", None),
+    ("playerNameI", "player_name_i", None),
+    ("xLegacy", "x_legacy", np.int16),
+    ("yLegacy", "y_legacy", np.int16),
+    ("shotDistance", "shot_distance", np.int16),
+    ("shotResult", "shot_result", None),
+    ("isFieldGoal", "is_field_goal", np.int8),
+    ("scoreHome", "score_home", None),
+    ("scoreAway", "score_away", None),
+    ("pointsTotal", "points_total", np.int16),
+    ("location", "location", None),
+    ("description", "description", None),
+    ("actionType", "action_type", None),
+    ("subType", "sub_type", None),
+    ("videoAvailable", "video_available", np.int8),
+    ("shotValue", "shot_value", np.int8),
+    ("actionId", "action_id", np.int32),
+)
+
+
+def elapsed_seconds_array(
+    period: np.ndarray, clock_seconds: np.ndarray, *, league: League = League.NBA
+) -> np.ndarray:
+    """Vectorized :func:`fastbreak.games.elapsed_game_seconds`.
+
+    Args:
+        period: Period numbers (1-4 regulation, 5+ overtime).
+        clock_seconds: Seconds remaining in each period.
+        league: League configuration for quarter length (default: NBA).
+
+    Returns:
+        Seconds elapsed since tip-off; 0.0 where ``period < 1``.
+    """
+    return elapsed_from_remaining_array(period, clock_seconds, league)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PlayByPlayColumns:
+    """Play-by-play actions for one or more games, stored column by column.
+
+    Numeric fields mirror :class:`~fastbreak.models.play_by_play.PlayByPlayAction`
+    in snake_case.  String fields (``clock``, ``team_tricode``,
+    ``player_name``, ``player_name_i``, ``shot_result``, ``score_home``,
+    ``score_away``, ``location``, ``description``, ``action_type``,
+    ``sub_type``) are ``int32`` codes into ``strings``; use :meth:`code` /
+    :meth:`codes_where` to build masks and :meth:`text` to decode.
+
+    Game ``g`` (``game_ids[g]``) is rows ``offsets[g]:offsets[g + 1]`` in the
+    order the API returned them.
+    """
+
+    game_ids: tuple[str, ...]
+    offsets: np.ndarray
+    strings: tuple[str, ...]
+    league: League
+    action_number: np.ndarray
+    clock: np.ndarray
+    period: np.ndarray
+    team_id: np.ndarray
+    team_tricode: np.ndarray
+    person_id: np.ndarray
+    player_name: np.ndarray
+    player_name_i: np.ndarray
+    x_legacy: np.ndarray
+    y_legacy: np.ndarray
+    shot_distance: np.ndarray
+    shot_result: np.ndarray
+    is_field_goal: np.ndarray
+    score_home: np.ndarray
+    score_away: np.ndarray
+    points_total: np.ndarray
+    location: np.ndarray
+    description: np.ndarray
+    action_type: np.ndarray
+    sub_type: np.ndarray
+    video_available: np.ndarray
+    shot_value: np.ndarray
+    action_id: np.ndarray
+    clock_seconds: np.ndarray
+    elapsed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.action_number)
+
+    @classmethod
+    def from_json(
+        cls,
+        payloads: Iterable[Mapping[str, Any]],
+        *,
+        league: League = League.NBA,
+    ) -> PlayByPlayColumns:
+        """Build from raw ``playbyplayv3`` response bodies, one per game.
+
+        Actions are read straight from ``payload["game"]["actions"]``
+        without building a model per action.
+        """
+        builder = _ColumnBuilder()
+        for payload in payloads:
+            game = payload["game"]
+            builder.add_game(game["gameId"], game["actions"])
+        return builder.build(league)
+
+    @classmethod
+    def from_actions(
+        cls,
+        game_id: str,
+        actions: Sequence[PlayByPlayAction],
+        *,
+        league: League = League.NBA,
+    ) -> PlayByPlayColumns:
+        """Build a single-game container from parsed actions."""
+        builder = _ColumnBuilder()
+        builder.add_game(game_id, [a.__dict__ for a in actions])
+        return builder.build(league)
+
+    @property
+    def n_games(self) -> int:
+        """Number of games in the container."""
+        return len(self.game_ids)
+
+    def game(self, game: str | int) -> PlayByPlayColumns:
+        """One game's rows, by game ID or index, as views into these arrays.
+
+        Raises:
+            KeyError: If a game ID is not in the container.
+        """
+        if isinstance(game, str):
+            try:
+                g = self.game_ids.index(game)
+            except ValueError:
+                raise KeyError(game) from None
+        else:
+            g = range(self.n_games)[game]
+        lo, hi = int(self.offsets[g]), int(self.offsets[g + 1])
+        rows = slice(lo, hi)
+        fields: dict[str, Any] = {
+            name: getattr(self, name)[rows] for _, name, _ in _COLUMNS
+        }
+        return replace(
+            self,
+            game_ids=(self.game_ids[g],),
+            offsets=np.array([0, hi - lo], dtype=np.int64),
+            clock_seconds=self.clock_seconds[rows],
+            elapsed=self.elapsed[rows],
+            **fields,
+        )
+
+    def games(self) -> Iterator[PlayByPlayColumns]:
+        """Each game in order, as from :meth:`game`."""
+        for g in range(self.n_games):
+            yield self.game(g)
+
+    def code(self, value: str) -> int:
+        """The code of *value* in ``strings``, or -1 if it never occurs."""
+        try:
+            return self.strings.index(value)
+        except ValueError:
+            return -1
+
+    def codes_where(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Codes of every interned string matching *predicate*.
+
+        Use with :func:`numpy.isin`, e.g. case-insensitive matching::
+
+            turnover = np.isin(
+                cols.action_type, cols.codes_where(lambda s: s.lower() == "turnover")
+            )
+        """
+        return np.array(
+            [i for i, s in enumerate(self.strings) if predicate(s)], dtype=np.int32
+        )
+
+    def text(self, codes: np.ndarray) -> list[str]:
+        """Decode an array of string codes."""
+        strings = self.strings
+        return [strings[c] for c in codes.tolist()]
+
+    def elapsed_seconds(self, league: League | None = None) -> np.ndarray:
+        """Seconds since tip-off per action; precomputed for ``self.league``."""
+        if league is None or league == self.league:
+            return self.elapsed
+        return elapsed_seconds_array(self.period, self.clock_seconds, league=league)
+
+    def action(self, i: int) -> PlayByPlayAction:
+        """Row *i* as a :class:`~fastbreak.models.play_by_play.PlayByPlayAction`."""
+        strings = self.strings
+        values: dict[str, Any] = {}
+        for key, name, dtype in _COLUMNS:
+            value = getattr(self, name)[i]
+            values[key] = strings[value] if dtype is None else int(value)
+        return PlayByPlayAction.model_construct(**values)
+
+    def to_actions(self) -> list[PlayByPlayAction]:
+        """Every row as a model (materializes the whole container)."""
+        return [self.action(i) for i in range(len(self))]
+
+
+class _ColumnBuilder:
+    """Accumulates games into per-column chunks with one shared string table."""
+
+    __slots__ = ("_chunks", "_game_ids", "_index", "_lengths")
+
+    def __init__(self) -> None:
+        self._game_ids: list[str] = []
+        self._lengths: list[int] = []
+        self._index: dict[str, int] = {}
+        self._chunks: dict[str, list[np.ndarray]] = {
+            name: [] for _, name, _ in _COLUMNS
+        }
+
+    def add_game(self, game_id: str, actions: Sequence[Mapping[str, Any]]) -> None:
+        index = self._index
+        for key, name, dtype in _COLUMNS:
+            if dtype is None:
+                codes = [index.setdefault(a[key], len(index)) for a in actions]
+                column = np.array(codes, dtype=np.int32)
+            else:
+                column = np.array([a[key] for a in actions], dtype=dtype)
+            self._chunks[name].append(column)
+        self._game_ids.append(game_id)
+        self._lengths.append(len(actions))
+
+    def build(self, league: League) -> PlayByPlayColumns:
+        columns = {
+            name: np.concatenate(chunks)
+            if chunks
+            else np.empty(0, dtype=dtype or np.int32)
+            for (_, name, dtype), chunks in zip(
+                _COLUMNS, self._chunks.values(), strict=True
+            )
+        }
+        strings = tuple(self._index)
+        # Parse each distinct clock string once.
+        clock_codes, clock_inv = np.unique(columns["clock"], return_inverse=True)
+        parsed = np.array(
+            [parse_clock(strings[c]) for c in clock_codes.tolist()], dtype=np.float64
+        )
+        clock_seconds = parsed[clock_inv].reshape(-1)
+        offsets = np.zeros(len(self._lengths) + 1, dtype=np.int64)
+        np.cumsum(self._lengths, out=offsets[1:])
+        return PlayByPlayColumns(
+            game_ids=tuple(self._game_ids),
+            offsets=offsets,
+            strings=strings,
+            league=league,
+            clock_seconds=clock_seconds,
+            elapsed=elapsed_seconds_array(
+                columns["period"], clock_seconds, league=league
+            ),
+            **columns,
+        )
+
+
+async def get_play_by_play_columns(
+    client: BaseClient,
+    game_ids: Sequence[str],
+    *,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    max_concurrency: int | None = None,
+) -> PlayByPlayColumns:
+    """Fetch play-by-play for many games into one columnar container.
+
+    Games are fetched ``batch_size`` at a time with
+    :meth:`~fastbreak.clients.base.BaseClient.get_many`; each batch's
+    response models are converted to columns and released before the next
+    batch is requested, so at most one batch of models is alive at once.
+
+    Args:
+        client: NBA API client
+        game_ids: Games to fetch, in the order they should be stored
+        batch_size: Games fetched concurrently per batch (default: 10)
+        max_concurrency: Passed through to ``get_many``
+
+    Returns:
+        A :class:`PlayByPlayColumns` with elapsed time for ``client.league``.
+
+    Examples:
+        ids = await get_game_ids(client, "2024-25")
+        season = await get_play_by_play_columns(client, ids)
+        for game in season.games():
+            flow = game_flow(game)
+
+    """
+    from fastbreak.endpoints import PlayByPlay  # noqa: PLC0415
+
+    if batch_size < 1:
+        msg = f"batch_size must be >= 1, got {batch_size}"
+        raise ValueError(msg)
+
+    builder = _ColumnBuilder()
+    for lo in range(0, len(game_ids), batch_size):
+        batch = game_ids[lo : lo + batch_size]
+        responses: list[PlayByPlayResponse] = await client.get_many(
+            [PlayByPlay(game_id=g) for g in batch], max_concurrency=max_concurrency
+        )
+        for game_id, response in zip(batch, responses, strict=True):
+            builder.add_game(game_id, [a.__dict__ for a in response.game.actions])
+    return builder.build(client.league)
@@ -0,0 +1,279 @@
+"""Season-scale possession tables, built incrementally on disk.
+
+:func:`build_possession_dataset` fetches play-by-play for a season's games in
+``get_many`` batches, classifies each batch with
+:func:`fastbreak.transition.classify_possession_arrays` and writes one
+possession-level ``.npz`` part file per batch into a directory.  Only one
+batch of play-by-play is in memory at a time and no
+:class:`~fastbreak.transition.TransitionPossession` (with its ``actions``) is
+ever built.
+
+Every part also records the game IDs it covers, so an interrupted build
+resumes after the last completed batch: games already on disk are skipped.
+A part is written to a temporary file and renamed into place, so a crash
+never leaves a truncated part behind.
+
+Examples::
+
+    await build_possession_dataset(client, "pbp-2024-25", season="2024-25")
+    table = load_possession_dataset("pbp-2024-25")
+    efficiency = table.team_efficiency()
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Final
+
+import anyio.to_thread
+import numpy as np
+
+from fastbreak.games import get_game_ids
+from fastbreak.play_by_play_columns import get_play_by_play_columns
+from fastbreak.transition import (
+    TRANSITION_WINDOW,
+    PossessionArrays,
+    TransitionEfficiency,
+    TransitionSummary,
+    Trigger,
+    classify_possession_arrays,
+)
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Sequence
+
+    from fastbreak.clients.base import BaseClient
+    from fastbreak.play_by_play_columns import PlayByPlayColumns
+    from fastbreak.types import Season, SeasonType
+
+_DEFAULT_BATCH_SIZE = 10
+_PART_GLOB = "part-*.npz"
+
+POSSESSION_COLUMNS: Final = {
+    "game_id": np.str_,
+    "team_id": np.int64,
+    "period": np.int64,
+    "game_clock": np.float64,
+    "elapsed": np.float64,
+    "is_transition": np.bool_,
+    "trigger": np.int8,
+    "points_scored": np.int64,
+}
+"""Column name to dtype of every possession table and part file."""
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PossessionTable:
+    """One row per possession, for any number of games.
+
+    ``game_id`` is a string array; the other columns mean the same as on
+    :class:`~fastbreak.transition.PossessionArrays` (``game_clock`` and
+    ``period`` locate the possession start, ``trigger`` holds codes into
+    :attr:`TRIGGERS`).
+    """
+
+    TRIGGERS: ClassVar[tuple[Trigger, ...]] = PossessionArrays.TRIGGERS
+
+    game_id: np.ndarray
+    team_id: np.ndarray
+    period: np.ndarray
+    game_clock: np.ndarray
+    elapsed: np.ndarray
+    is_transition: np.ndarray
+    trigger: np.ndarray
+    points_scored: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.team_id)
+
+    @classmethod
+    def from_arrays(
+        cls, cols: PlayByPlayColumns, arrays: PossessionArrays
+    ) -> PossessionTable:
+        """The table for possessions classified from *cols*."""
+        return cls(
+            game_id=np.array(cols.game_ids, dtype=np.str_)[arrays.game_index],
+            team_id=arrays.team_id.astype(np.int64),
+            period=arrays.period.astype(np.int64),
+            game_clock=arrays.game_clock,
+            elapsed=arrays.elapsed,
+            is_transition=arrays.is_transition,
+            trigger=arrays.trigger,
+            points_scored=arrays.points_scored,
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence[PossessionTable]) -> PossessionTable:
+        """Stack *tables* row-wise, in order."""
+        if not tables:
+            return cls(
+                **{
+                    name: np.array([], dtype=dtype)
+                    for name, dtype in POSSESSION_COLUMNS.items()
+                }
+            )
+        return cls(
+            **{
+                name: np.concatenate([getattr(t, name) for t in tables])
+                for name in POSSESSION_COLUMNS
+            }
+        )
+
+    def _by_team(self) -> tuple[list[int], list[tuple[int, int, int, int]]]:
+        """Team IDs and ``(possessions, transition, points, transition_points)``."""
+        team_ids, team = np.unique(self.team_id, return_inverse=True)
+        n = len(team_ids)
+        trans = self.is_transition.astype(np.float64)
+        points = self.points_scored.astype(np.float64)
+        counts = np.stack(
+            [
+                np.bincount(team, minlength=n),
+                np.bincount(team, weights=trans, minlength=n),
+                np.bincount(team, weights=points, minlength=n),
+                np.bincount(team, weights=trans * points, minlength=n),
+            ],
+            axis=1,
+        ).astype(np.int64)
+        return team_ids.tolist(), [tuple(row) for row in counts.tolist()]
+
+    def team_frequency(self) -> dict[int, TransitionSummary]:
+        """Transition vs half-court frequency per team, keyed by team ID."""
+        team_ids, counts = self._by_team()
+        return {
+            team_id: TransitionSummary(
+                total_possessions=n,
+                transition_possessions=t,
+                halfcourt_possessions=n - t,
+                transition_pct=t / n,
+                halfcourt_pct=(n - t) / n,
+            )
+            for team_id, (n, t, _, _) in zip(team_ids, counts, strict=True)
+        }
+
+    def team_efficiency(self) -> dict[int, TransitionEfficiency]:
+        """Points per possession by possession type per team, keyed by team ID."""
+        team_ids, counts = self._by_team()
+        out: dict[int, TransitionEfficiency] = {}
+        for team_id, (n, t, pts, t_pts) in zip(team_ids, counts, strict=True):
+            half, half_pts = n - t, pts - t_pts
+            out[team_id] = TransitionEfficiency(
+                transition_ppp=t_pts / t if t > 0 else None,
+                halfcourt_ppp=half_pts / half if half > 0 else None,
+                transition_points=t_pts,
+                halfcourt_points=half_pts,
+                transition_possessions=t,
+                halfcourt_possessions=half,
+            )
+        return out
+
+
+def _parts(directory: Path) -> list[Path]:
+    return sorted(directory.glob(_PART_GLOB))
+
+
+def completed_game_ids(path: str | os.PathLike[str]) -> set[str]:
+    """Game IDs already written to the dataset at *path* (empty if absent)."""
+    done: set[str] = set()
+    for part in _parts(Path(path)):
+        with np.load(part) as data:
+            done.update(data["games"].tolist())
+    return done
+
+
+def load_possession_dataset(path: str | os.PathLike[str]) -> PossessionTable:
+    """Read every part of the dataset at *path* into one table, in build order."""
+    tables = []
+    for part in _parts(Path(path)):
+        with np.load(part) as data:
+            tables.append(
+                PossessionTable(**{name: data[name] for name in POSSESSION_COLUMNS})
+            )
+    return PossessionTable.concat(tables)
+
+
+def _open_dataset(directory: Path) -> tuple[set[str], int]:
+    """Create *directory* if needed; return its completed games and next part index."""
+    directory.mkdir(parents=True, exist_ok=True)
+    parts = _parts(directory)
+    next_index = int(parts[-1].stem.removeprefix("part-")) + 1 if parts else 0
+    return completed_game_ids(directory), next_index
+
+
+def _write_part(
+    directory: Path, index: int, games: Sequence[str], table: PossessionTable
+) -> None:
+    """Write one part atomically: a temporary file renamed into place."""
+    final = directory / f"part-{index:05d}.npz"
+    tmp = directory / f".{final.name}.tmp"
+    with tmp.open("wb") as f:
+        np.savez(
+            f,
+            games=np.array(games, dtype=np.str_),
+            **{name: getattr(table, name) for name in POSSESSION_COLUMNS},
+        )
+    tmp.replace(final)
+
+
+async def build_possession_dataset(  # noqa: PLR0913
+    client: BaseClient,
+    path: str | os.PathLike[str],
+    season: Season | None = None,
+    *,
+    season_type: SeasonType = "Regular Season",
+    game_ids: Sequence[str] | None = None,
+    transition_window: float = TRANSITION_WINDOW,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    max_concurrency: int | None = None,
+) -> list[str]:
+    """Classify every possession of a season and write them to *path*.
+
+    Games are fetched ``batch_size`` at a time with
+    :func:`~fastbreak.play_by_play_columns.get_play_by_play_columns`,
+    classified with :func:`~fastbreak.transition.classify_possession_arrays`
+    and appended as one part file per batch.  Games already in the dataset
+    are skipped, so calling this again after an interruption (or later in
+    the season) only fetches what is missing.
+
+    Args:
+        client: NBA API client
+        path: Dataset directory (created if needed)
+        season: Season in YYYY-YY format (defaults to current season)
+        season_type: "Regular Season", "Playoffs", etc.
+        game_ids: Games to include instead of every game from
+            :func:`~fastbreak.games.get_game_ids`
+        transition_window: Seconds threshold for transition classification
+            (default ``8.0``)
+        batch_size: Games fetched and written per part (default: 10)
+        max_concurrency: Passed through to ``get_many``
+
+    Returns:
+        The game IDs written by this call, in order.
+
+    Examples:
+        await build_possession_dataset(client, "pbp-2024-25", season="2024-25")
+        table = load_possession_dataset("pbp-2024-25")
+        pct = {t: s.transition_pct for t, s in table.team_frequency().items()}
+
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be >= 1, got {batch_size}"
+        raise ValueError(msg)
+
+    directory = Path(path)
+    if game_ids is None:
+        game_ids = await get_game_ids(client, season, season_type=season_type)
+    done, index = await anyio.to_thread.run_sync(_open_dataset, directory)
+    todo = [g for g in dict.fromkeys(game_ids) if g not in done]
+
+    for lo in range(0, len(todo), batch_size):
+        batch = todo[lo : lo + batch_size]
+        cols = await get_play_by_play_columns(
+            client, batch, batch_size=batch_size, max_concurrency=max_concurrency
+        )
+        arrays = classify_possession_arrays(cols, transition_window=transition_window)
+        table = PossessionTable.from_arrays(cols, arrays)
+        await anyio.to_thread.run_sync(_write_part, directory, index, batch, table)
+        index += 1
+    return todo
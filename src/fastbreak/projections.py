@@ -8,19 +8,40 @@ Uses heuristic Empirical Bayes shrinkage — no ML training, no scipy dependency
 from __future__ import annotations
 
 import math
-import statistics
+import warnings
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, Final, Literal, cast
-
-from fastbreak.projections_priors import STAT_PRIORS, StatPrior
+from typing import TYPE_CHECKING, Any, Final, cast
+
+import numpy as np
+
+from fastbreak._projection_core import (
+    HOME_FRACTION,
+    OPP_MAX_FRACTION,
+    REST_3PLUS_FRACTION,
+    REST_B2B_FRACTION,
+    STAT_DISTRIBUTION,
+    STATS as STATS,  # noqa: PLC0414
+    STDEV_FLOORS,
+    DistributionFamily as DistributionFamily,  # noqa: PLC0414
+    ProjectionStat as ProjectionStat,  # noqa: PLC0414
+    def_ratings,
+    group_by_player,
+    resolve_opponent_def_ratings,
+    resolve_season,
+    resolve_stats_and_priors,
+    slate_adjustments,
+    stat_matrix,
+)
+from fastbreak.projections_priors import StatPrior
 from fastbreak.seasons import get_season_from_date
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Collection, Mapping, Sequence
     from datetime import date
 
     from fastbreak.clients.nba import NBAClient
+    from fastbreak.models.league_game_log import GameLogEntry, LeagueGameLogResponse
     from fastbreak.models.player_game_log import (
         PlayerGameLogEntry,
         PlayerGameLogResponse,
@@ -28,11 +49,6 @@ if TYPE_CHECKING:
     from fastbreak.models.team_estimated_metrics import TeamEstimatedMetricsResponse
     from fastbreak.types import Season
 
-ProjectionStat = Literal["pts", "reb", "ast", "fg3m"]
-DistributionFamily = Literal["normal", "poisson"]
-
-STATS: Final[tuple[ProjectionStat, ...]] = ("pts", "reb", "ast", "fg3m")
-
 
 @dataclass(frozen=True, slots=True)
 class StatProjection:
@@ -266,12 +282,6 @@ def poisson_sf(*, line: float, lam: float) -> float:
     return max(0.0, min(1.0, 1.0 - cdf))
 
 
-_OPP_MAX_FRACTION: Final = 0.15
-_REST_B2B_FRACTION: Final = -0.04
-_REST_3PLUS_FRACTION: Final = 0.015
-_HOME_FRACTION: Final = 0.02
-
-
 def _clamp(value: float, lo: float, hi: float) -> float:
     # Reject NaN/inf explicitly: CPython's min/max do not preserve NaN
     # (e.g. min(0.15, NaN) returns 0.15), so a naive clamp would silently
@@ -313,7 +323,7 @@ def adjust_for_opponent(
         return 0.0
     # opp_def_rating HIGHER than league avg = worse defense = positive delta.
     raw_fraction = (opp_def_rating - league_avg_def_rating) / league_avg_def_rating
-    fraction = _clamp(raw_fraction, -_OPP_MAX_FRACTION, _OPP_MAX_FRACTION)
+    fraction = _clamp(raw_fraction, -OPP_MAX_FRACTION, OPP_MAX_FRACTION)
     return blended_mean * fraction
 
 
@@ -348,9 +358,9 @@ def adjust_for_rest(
         msg = f"days_rest must be >= 0 or None, got {days_rest}"
         raise ValueError(msg)
     if days_rest == 0:
-        fraction = _REST_B2B_FRACTION
+        fraction = REST_B2B_FRACTION
     elif days_rest >= 3:  # noqa: PLR2004 — 3+ days rest is the recovery threshold
-        fraction = _REST_3PLUS_FRACTION
+        fraction = REST_3PLUS_FRACTION
     else:
         fraction = 0.0
     # Assists are least affected by fatigue; scale down.
@@ -366,27 +376,7 @@ def adjust_for_home(
     # `stat` is reserved for future per-stat scaling; for v1 every stat gets the same bonus.
     del stat
     sign = 1.0 if is_home else -1.0
-    return blended_mean * _HOME_FRACTION * sign
-
-
-_STAT_DISTRIBUTION: Final[Mapping[ProjectionStat, DistributionFamily]] = (
-    MappingProxyType(
-        {
-            "pts": "normal",
-            "reb": "normal",
-            "ast": "normal",
-            "fg3m": "poisson",
-        }
-    )
-)
-_STDEV_FLOORS: Final[Mapping[ProjectionStat, float]] = MappingProxyType(
-    {
-        "pts": 3.0,
-        "reb": 1.5,
-        "ast": 1.5,
-        "fg3m": 0.8,
-    }
-)
+    return blended_mean * HOME_FRACTION * sign
 
 
 def _mean(values: Sequence[float]) -> float:
@@ -400,6 +390,69 @@ def _variance(values: Sequence[float]) -> float:
     return sum((v - m) ** 2 for v in values) / (len(values) - 1)
 
 
+def _window_moments(
+    values: np.ndarray, starts: np.ndarray, counts: np.ndarray, rolling_n: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-group season mean, rolling mean, rolling variance and window size.
+
+    ``values`` holds contiguous newest-first groups beginning at ``starts``;
+    the rolling window is each group's first ``rolling_n`` rows.
+    """
+    n_stats = values.shape[1]
+    if not len(starts):
+        empty = np.zeros((0, n_stats))
+        return empty, empty, empty, np.zeros(0, dtype=np.int64)
+    pos = np.arange(len(values)) - np.repeat(starts, counts)
+    recent = (pos < rolling_n)[:, None]
+    k = np.minimum(counts, rolling_n)
+    season_mean = np.add.reduceat(values, starts, axis=0) / counts[:, None]
+    rolling_mean = np.add.reduceat(values * recent, starts, axis=0) / k[:, None]
+    sq_dev = ((values - np.repeat(rolling_mean, counts, axis=0)) ** 2) * recent
+    variance = np.divide(
+        np.add.reduceat(sq_dev, starts, axis=0),
+        (k - 1)[:, None],
+        out=np.zeros((len(starts), n_stats)),
+        where=(k >= 2)[:, None],  # noqa: PLR2004 — sample variance needs >= 2
+    )
+    return season_mean, rolling_mean, variance, k
+
+
+def _priors_from_groups(
+    values: np.ndarray,
+    starts: np.ndarray,
+    counts: np.ndarray,
+    *,
+    season: Season,
+) -> Mapping[ProjectionStat, StatPrior]:
+    """Empirical Bayes priors from per-player groups of ``STATS`` columns.
+
+    ``values`` is ``(games, len(STATS))`` with each player's games contiguous
+    from ``starts``; see ``_compute_priors_from_logs`` for the pool rules.
+    """
+    qualifying = counts >= 2  # noqa: PLR2004 — sample variance needs >= 2
+    n_players = int(qualifying.sum())
+    n_games = int(counts[qualifying].sum())
+    if n_players < 10:  # noqa: PLR2004 — pool floor
+        # Every stat shares one pool, so the first stat is the one that fails.
+        msg = f"insufficient pool for {STATS[0]!r}: {n_players} players (need >= 10)"
+        raise ValueError(msg)
+    # Each player's whole log is one window: its mean and sample variance.
+    means, _, variances, _ = _window_moments(values, starts, counts, int(counts.max()))
+    means, variances = means[qualifying], variances[qualifying]
+    result: dict[ProjectionStat, StatPrior] = {}
+    for j, stat in enumerate(STATS):
+        # StatPrior.__post_init__ validates finite/positive variance and
+        # non-empty season; let it raise rather than duplicating the check.
+        result[stat] = StatPrior(
+            tau_sq=float(np.var(means[:, j], ddof=1)),
+            sigma_sq=float(np.mean(variances[:, j])),
+            season=season,
+            n_players=n_players,
+            n_games=n_games,
+        )
+    return MappingProxyType(result)
+
+
 def _compute_priors_from_logs(
     logs: Mapping[int, Sequence[PlayerGameLogEntry]],
     *,
@@ -408,55 +461,57 @@ def _compute_priors_from_logs(
     """Pure function: derive Empirical Bayes priors from per-player game logs.
 
     Separated from ``compute_priors_for_season`` so the script and tests can
-    exercise the math without making real API calls.
+    exercise the math without making real API calls. Players with fewer than
+    two games are skipped; τ² is the sample variance of per-player means and
+    σ² the mean of per-player sample variances.
 
     Raises:
         ValueError: If any stat's qualifying-player pool has fewer than 10
             entries (variance estimates would be too noisy).
     """
-    result: dict[ProjectionStat, StatPrior] = {}
-    for stat in STATS:
-        per_player_means: list[float] = []
-        per_player_variances: list[float] = []
-        total_games = 0
-        for games in logs.values():
-            if len(games) < 2:  # noqa: PLR2004 — sample variance needs >= 2
-                continue
-            values = [float(getattr(g, stat)) for g in games]
-            per_player_means.append(statistics.fmean(values))
-            per_player_variances.append(statistics.variance(values))
-            total_games += len(values)
-        if len(per_player_means) < 10:  # noqa: PLR2004 — pool floor
-            msg = (
-                f"insufficient pool for {stat!r}: "
-                f"{len(per_player_means)} players (need >= 10)"
-            )
-            raise ValueError(msg)
-        # StatPrior.__post_init__ validates finite/positive variance and
-        # non-empty season; let it raise rather than duplicating the check.
-        result[stat] = StatPrior(
-            tau_sq=statistics.variance(per_player_means),
-            sigma_sq=statistics.fmean(per_player_variances),
-            season=season,
-            n_players=len(per_player_means),
-            n_games=total_games,
-        )
-    return MappingProxyType(result)
+    games = [g for player_games in logs.values() for g in player_games]
+    counts = np.fromiter(map(len, logs.values()), dtype=np.int64, count=len(logs))
+    nonempty = counts > 0
+    starts = (np.cumsum(counts) - counts)[nonempty]
+    values = stat_matrix(games, np.arange(len(games)), STATS)
+    return _priors_from_groups(values, starts, counts[nonempty], season=season)
 
 
-def _resolve_season(season: Season | None, default: Season) -> Season:
-    """Resolve a caller-supplied ``season`` to a concrete value.
+def _compute_priors_from_league_log(
+    entries: Sequence[GameLogEntry],
+    *,
+    season: Season,
+    min_games: int,
+    min_minutes: float,
+) -> Mapping[ProjectionStat, StatPrior]:
+    """Pure function: Empirical Bayes priors from a league-wide player game log.
+
+    Players qualify with at least ``min_games`` logged games averaging at
+    least ``min_minutes`` minutes, the same thresholds
+    ``compute_priors_for_season`` applies.
 
-    ``None`` means "use ``default``"; an empty (or otherwise falsy) string
-    is rejected so ``season = season or default`` cannot silently mask
-    invalid input. Mirrors the validate-at-public-boundary pattern.
+    Raises:
+        ValueError: If fewer than 10 players qualify, or as
+            ``_compute_priors_from_logs``.
     """
-    if season is None:
-        return default
-    if not season:
-        msg = f"season must be a non-empty string or None, got {season!r}"
+    rows, order, _, starts, counts = group_by_player(entries)
+    minutes = np.array([rows[i].min for i in order], dtype=float)
+    avg_minutes = (
+        np.add.reduceat(minutes, starts) / counts if len(starts) else np.zeros(0)
+    )
+    eligible = (counts >= min_games) & (avg_minutes >= min_minutes)
+    n_eligible = int(eligible.sum())
+    if n_eligible < 10:  # noqa: PLR2004 — same floor as the inner pool check
+        msg = (
+            f"insufficient eligible players for season {season}: "
+            f"{n_eligible} (need >= 10 with gp>={min_games}, min>={min_minutes})"
+        )
         raise ValueError(msg)
-    return season
+    keep = order[np.repeat(eligible, counts)]
+    counts = counts[eligible]
+    starts = np.cumsum(counts) - counts
+    values = stat_matrix(rows, keep, STATS)
+    return _priors_from_groups(values, starts, counts, season=season)
 
 
 async def compute_priors_for_season(
@@ -465,19 +520,19 @@ async def compute_priors_for_season(
     season: Season | None = None,
     min_games: int = 30,
     min_minutes: float = 15.0,
-    max_concurrency: int = 3,
+    max_concurrency: int | None = None,
 ) -> Mapping[ProjectionStat, StatPrior]:
     """Compute Empirical Bayes priors from live NBA Stats data.
 
-    Identifies qualifying players from ``LeagueDashPlayerStats`` (filtered
-    by ``min_games`` and ``min_minutes``), then concurrently fetches each
-    player's ``PlayerGameLog`` to compute per-stat between-player and
-    within-player variances.
+    Fetches the season's league-wide player ``LeagueGameLog`` in a single
+    request, keeps players with at least ``min_games`` games averaging at
+    least ``min_minutes`` minutes, and computes per-stat between-player and
+    within-player variances with a columnar group-by.
 
-    Long-running (~1-3 min for ~300 players); intended for callers that
-    need fresh priors mid-season without re-running the regeneration
-    script. For the common case, the baked ``STAT_PRIORS`` from
-    ``fastbreak.projections_priors`` is faster and identical in shape.
+    The request is the same one ``project_slate`` makes, so on a client with
+    ``cache_ttl`` or a ``cache_backend`` computing priors and projecting a
+    slate share one download. For the common case, the baked
+    ``STAT_PRIORS`` from ``fastbreak.projections_priors`` needs no request.
 
     Args:
         client: NBA API client.
@@ -485,8 +540,8 @@ async def compute_priors_for_season(
             Defaults to the current season via ``get_season_from_date``.
         min_games: Minimum games played for a player to qualify.
         min_minutes: Minimum per-game minutes for a player to qualify.
-        max_concurrency: Concurrent in-flight requests for the per-player
-            game-log fetch. Lower values are more rate-limit-friendly.
+        max_concurrency: Deprecated and ignored; the priors now come from
+            one request. Passing it emits a ``DeprecationWarning``.
 
     Returns:
         An immutable ``Mapping[ProjectionStat, StatPrior]`` with one
@@ -494,9 +549,9 @@ async def compute_priors_for_season(
 
     Raises:
         ValueError: If ``min_games < 1``, ``min_minutes`` is negative or
-            non-finite, ``max_concurrency < 1``, ``season`` is an empty
-            string, fewer than 10 players qualify, any stat's pool is too
-            small, or the computed priors fail ``StatPrior``'s validation.
+            non-finite, ``season`` is an empty string, fewer than 10 players
+            qualify, any stat's pool is too small, or the computed priors
+            fail ``StatPrior``'s validation.
     """
     if min_games < 1:
         msg = f"min_games must be >= 1, got {min_games}"
@@ -507,35 +562,25 @@ async def compute_priors_for_season(
     if not math.isfinite(min_minutes) or min_minutes < 0:
         msg = f"min_minutes must be a finite non-negative number, got {min_minutes!r}"
         raise ValueError(msg)
-    if max_concurrency < 1:
-        # `client.get_many` does `concurrency = max_concurrency or 3`, so
-        # passing 0 silently falls back to 3 instead of erroring.
-        msg = f"max_concurrency must be >= 1, got {max_concurrency}"
-        raise ValueError(msg)
-    season = _resolve_season(season, get_season_from_date(league=client.league))
-    from fastbreak.endpoints import (  # noqa: PLC0415
-        LeagueDashPlayerStats,
-        PlayerGameLog,
-    )
-
-    league_resp = await client.get(LeagueDashPlayerStats(season=season))
-    eligible = [
-        p.player_id
-        for p in league_resp.players
-        if p.gp >= min_games and p.min >= min_minutes
-    ]
-    if len(eligible) < 10:  # noqa: PLR2004 — same floor as the inner pool check
-        msg = (
-            f"insufficient eligible players for season {season}: "
-            f"{len(eligible)} (need >= 10 with gp>={min_games}, min>={min_minutes})"
+    if max_concurrency is not None:
+        warnings.warn(
+            "compute_priors_for_season(max_concurrency=...) is ignored: priors "
+            "come from a single request. The parameter will be removed.",
+            DeprecationWarning,
+            stacklevel=2,
         )
-        raise ValueError(msg)
-    log_endpoints = [PlayerGameLog(player_id=pid, season=season) for pid in eligible]
-    log_responses = await client.get_many(
-        log_endpoints, max_concurrency=max_concurrency
+    season = resolve_season(season, get_season_from_date(league=client.league))
+    from fastbreak.endpoints import LeagueGameLog  # noqa: PLC0415
+
+    log_resp = await client.get(
+        LeagueGameLog(league_id=client.league_id, season=season, player_or_team="P")
+    )
+    return _compute_priors_from_league_log(
+        log_resp.games,
+        season=season,
+        min_games=min_games,
+        min_minutes=min_minutes,
     )
-    logs = {pid: resp.games for pid, resp in zip(eligible, log_responses, strict=True)}
-    return _compute_priors_from_logs(logs, season=season)
 
 
 def _build_stat_projection(  # noqa: PLR0913
@@ -579,13 +624,13 @@ def _build_stat_projection(  # noqa: PLR0913
     home_delta = adjust_for_home(blended_mean=blended, stat=stat, is_home=is_home)
     # Floor at 0 to avoid negative projections.
     mean = max(0.0, blended + opp_delta + rest_delta + home_delta)
-    distribution = _STAT_DISTRIBUTION[stat]
+    distribution = STAT_DISTRIBUTION[stat]
     if distribution == "poisson":
         # Poisson: variance = lambda.
         stdev = math.sqrt(max(mean, 1e-6))
     else:
         # Residual variance of recent games, floored to prevent over-confidence.
-        stdev = max(math.sqrt(_variance(recent)), _STDEV_FLOORS[stat])
+        stdev = max(math.sqrt(_variance(recent)), STDEV_FLOORS[stat])
     return StatProjection(
         stat=stat,
         mean=mean,
@@ -598,47 +643,6 @@ def _build_stat_projection(  # noqa: PLR0913
     )
 
 
-def _resolve_opponent_def_ratings(
-    team_resp: TeamEstimatedMetricsResponse, opponent_team_id: int
-) -> tuple[float, float]:
-    """Resolve the opponent's and the league-average defensive ratings.
-
-    Looks up ``opponent_team_id`` in the league-wide estimated-metrics
-    response, validates its defensive rating is present and finite, and
-    computes the league average over all teams with a valid rating.
-    Mirrors the validate-at-public-boundary pattern: a missing opponent or
-    a None/non-finite rating raises rather than silently degrading.
-
-    Returns:
-        A ``(opponent_def_rating, league_avg_def_rating)`` tuple.
-
-    Raises:
-        ValueError: If the opponent team is absent from the response, or
-            its ``e_def_rating`` is None or non-finite.
-    """
-    try:
-        opp = next(t for t in team_resp.teams if t.team_id == opponent_team_id)
-    except StopIteration as exc:
-        msg = f"Opponent team_id={opponent_team_id} not found in team estimated metrics"
-        raise ValueError(msg) from exc
-    if opp.e_def_rating is None or not math.isfinite(opp.e_def_rating):
-        msg = (
-            f"Opponent team_id={opponent_team_id} has invalid e_def_rating: "
-            f"{opp.e_def_rating!r}"
-        )
-        raise ValueError(msg)
-    # Filter both None and non-finite values: a single NaN/inf in the list
-    # would poison _mean and silently feed adjust_for_opponent with garbage.
-    league_avg_def = _mean(
-        [
-            t.e_def_rating
-            for t in team_resp.teams
-            if t.e_def_rating is not None and math.isfinite(t.e_def_rating)
-        ]
-    )
-    return opp.e_def_rating, league_avg_def
-
-
 async def project_player(  # noqa: PLR0913
     client: NBAClient,
     *,
@@ -700,21 +704,10 @@ async def project_player(  # noqa: PLR0913
     if days_rest is not None and days_rest < 0:
         msg = f"days_rest must be >= 0 or None, got {days_rest}"
         raise ValueError(msg)
-    bad_stats = [s for s in stats if s not in STATS]
-    if bad_stats:
-        msg = f"unsupported stats: {bad_stats!r}; supported = {list(STATS)}"
-        raise ValueError(msg)
-    if priors is not None:
-        missing = set(STATS) - priors.keys()
-        if missing:
-            msg = f"priors must contain all of {list(STATS)}; missing {sorted(missing)}"
-            raise ValueError(msg)
-    effective_priors: Mapping[ProjectionStat, StatPrior] = (
-        priors if priors is not None else STAT_PRIORS
-    )
+    effective_priors = resolve_stats_and_priors(stats, priors)
     from fastbreak.endpoints import PlayerGameLog, TeamEstimatedMetrics  # noqa: PLC0415
 
-    season = _resolve_season(
+    season = resolve_season(
         season, get_season_from_date(game_date, league=client.league)
     )
     results: list[Any] = await client.get_many(
@@ -729,7 +722,7 @@ async def project_player(  # noqa: PLR0913
     if not log_resp.games:
         msg = f"No games found for player_id={player_id} in season {season}"
         raise ValueError(msg)
-    opp_def_rating, league_avg_def = _resolve_opponent_def_ratings(
+    opp_def_rating, league_avg_def = resolve_opponent_def_ratings(
         team_resp, opponent_team_id
     )
     projections: dict[ProjectionStat, StatProjection] = {
@@ -753,3 +746,278 @@ async def project_player(  # noqa: PLR0913
         is_home=is_home,
         stats=projections,
     )
+
+
+# ---------- slate projections ----------
+
+
+@dataclass(frozen=True, slots=True)
+class SlateGame:
+    """One game on a slate: both teams are projected against each other."""
+
+    home_team_id: int
+    away_team_id: int
+    game_date: date
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SlateProjections:
+    """Columnar projections for every player on a slate, one row per player.
+
+    Per-player fields are length-``n`` arrays. Per-stat fields are
+    ``(n, len(stats))`` arrays whose columns follow ``stats``; the
+    ``*_adjustment`` arrays hold the same additive deltas as
+    ``StatProjection.adjustments``. ``days_rest`` is derived from each
+    player's most recent game: the whole days between it and ``game_date``.
+    """
+
+    stats: tuple[ProjectionStat, ...]
+    player_id: np.ndarray
+    player_name: tuple[str, ...]
+    team_id: np.ndarray
+    opponent_team_id: np.ndarray
+    is_home: np.ndarray
+    game_date: np.ndarray
+    days_rest: np.ndarray
+    rolling_n: np.ndarray
+    season_mean: np.ndarray
+    rolling_mean: np.ndarray
+    mean: np.ndarray
+    stdev: np.ndarray
+    opponent_adjustment: np.ndarray
+    rest_adjustment: np.ndarray
+    home_adjustment: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.player_id)
+
+    def _row(self, i: int) -> PlayerProjection:
+        projections: dict[ProjectionStat, StatProjection] = {
+            stat: StatProjection(
+                stat=stat,
+                mean=float(self.mean[i, j]),
+                stdev=float(self.stdev[i, j]),
+                distribution=STAT_DISTRIBUTION[stat],
+                rolling_n=int(self.rolling_n[i]),
+                season_mean=float(self.season_mean[i, j]),
+                rolling_mean=float(self.rolling_mean[i, j]),
+                adjustments={
+                    "opponent": float(self.opponent_adjustment[i, j]),
+                    "rest": float(self.rest_adjustment[i, j]),
+                    "home": float(self.home_adjustment[i, j]),
+                },
+            )
+            for j, stat in enumerate(self.stats)
+        }
+        return PlayerProjection(
+            player_id=int(self.player_id[i]),
+            player_name=self.player_name[i],
+            opponent_team_id=int(self.opponent_team_id[i]),
+            game_date=self.game_date[i].astype(object),
+            is_home=bool(self.is_home[i]),
+            stats=projections,
+        )
+
+    def player(self, player_id: int) -> PlayerProjection | None:
+        """The row for ``player_id`` as a ``PlayerProjection``, or None."""
+        i = int(np.searchsorted(self.player_id, player_id))
+        if i == len(self) or self.player_id[i] != player_id:
+            return None
+        return self._row(i)
+
+    def to_player_projections(self) -> list[PlayerProjection]:
+        """Every row as a ``PlayerProjection`` (same values as ``project_player``)."""
+        return [self._row(i) for i in range(len(self))]
+
+
+def _slate_team_context(
+    games: Sequence[SlateGame],
+) -> dict[int, tuple[int, bool, date]]:
+    """Map each slate team to ``(opponent_team_id, is_home, game_date)``."""
+    context: dict[int, tuple[int, bool, date]] = {}
+    for g in games:
+        for team, opp, home in (
+            (g.home_team_id, g.away_team_id, True),
+            (g.away_team_id, g.home_team_id, False),
+        ):
+            if team in context:
+                msg = f"team_id={team} appears in more than one slate game"
+                raise ValueError(msg)
+            context[team] = (opp, home, g.game_date)
+    return context
+
+
+def _project_slate_from_logs(  # noqa: PLR0913
+    entries: Sequence[GameLogEntry],
+    team_resp: TeamEstimatedMetricsResponse,
+    games: Sequence[SlateGame],
+    *,
+    rolling_n: int,
+    stats: Sequence[ProjectionStat],
+    priors: Mapping[ProjectionStat, StatPrior],
+    player_ids: Collection[int] | None = None,
+) -> SlateProjections:
+    """Pure function: project every slate player from league-wide game logs.
+
+    Logs are cut off before the earliest slate date. A player belongs to the
+    team of their most recent logged game. All arithmetic mirrors
+    ``_build_stat_projection``, applied to whole columns at once.
+    """
+    context = _slate_team_context(games)
+    rows, order, day, starts, counts = group_by_player(
+        entries, before=min(g.game_date for g in games)
+    )
+    pid = np.array([rows[i].player_id for i in order], dtype=np.int64)
+    newest_team = np.array([rows[order[s]].team_id for s in starts], dtype=np.int64)
+
+    on_slate = np.isin(newest_team, list(context))
+    if player_ids is not None:
+        on_slate &= np.isin(pid[starts], list(player_ids))
+    row_mask = np.repeat(on_slate, counts)
+    order, pid, day = order[row_mask], pid[row_mask], day[row_mask]
+    starts, counts, newest_team = (
+        np.cumsum(counts[on_slate]) - counts[on_slate],
+        counts[on_slate],
+        newest_team[on_slate],
+    )
+    n = len(starts)
+
+    stat_list = list(stats)
+    values = stat_matrix(rows, order, stat_list)
+    season_mean, rolling_mean, variance, k = _window_moments(
+        values, starts, counts, rolling_n
+    )
+
+    tau_sq = np.array([priors[stat].tau_sq for stat in stat_list])
+    sigma_sq = np.array([priors[stat].sigma_sq for stat in stat_list])
+    weight = tau_sq / (tau_sq + sigma_sq / k[:, None])
+    blended = weight * rolling_mean + (1.0 - weight) * season_mean
+
+    opponent = np.array([context[t][0] for t in newest_team.tolist()], dtype=np.int64)
+    is_home = np.array([context[t][1] for t in newest_team.tolist()], dtype=bool)
+    game_date = np.array(
+        [context[t][2] for t in newest_team.tolist()], dtype="datetime64[D]"
+    )
+    ratings, league_avg = def_ratings(team_resp, sorted(set(opponent.tolist())))
+
+    if league_avg == 0:
+        opp_fraction = np.zeros(n)
+    else:
+        opp_def = np.array([ratings[o] for o in opponent.tolist()], dtype=float)
+        opp_fraction = np.clip(
+            (opp_def - league_avg) / league_avg, -OPP_MAX_FRACTION, OPP_MAX_FRACTION
+        )
+    days_rest = (game_date - day[starts]).astype(np.int64) - 1
+    opp_delta, rest_delta, home_delta = slate_adjustments(
+        blended,
+        stat_list,
+        opp_fraction=opp_fraction,
+        days_rest=days_rest,
+        is_home=is_home,
+    )
+
+    mean = np.maximum(0.0, blended + opp_delta + rest_delta + home_delta)
+    poisson = np.array([STAT_DISTRIBUTION[stat] == "poisson" for stat in stat_list])
+    floors = np.array([STDEV_FLOORS[stat] for stat in stat_list])
+    stdev = np.where(
+        poisson,
+        np.sqrt(np.maximum(mean, 1e-6)),
+        np.maximum(np.sqrt(variance), floors),
+    )
+    return SlateProjections(
+        stats=tuple(stat_list),
+        player_id=pid[starts],
+        player_name=tuple(
+            rows[order[s]].player_name or str(pid[s]) for s in starts.tolist()
+        ),
+        team_id=newest_team,
+        opponent_team_id=opponent,
+        is_home=is_home,
+        game_date=game_date,
+        days_rest=days_rest,
+        rolling_n=k,
+        season_mean=season_mean,
+        rolling_mean=rolling_mean,
+        mean=mean,
+        stdev=stdev,
+        opponent_adjustment=opp_delta,
+        rest_adjustment=rest_delta,
+        home_adjustment=home_delta,
+    )
+
+
+async def project_slate(  # noqa: PLR0913
+    client: NBAClient,
+    games: Sequence[SlateGame],
+    *,
+    season: Season | None = None,
+    rolling_n: int = 10,
+    stats: Sequence[ProjectionStat] = STATS,
+    priors: Mapping[ProjectionStat, StatPrior] | None = None,
+    player_ids: Collection[int] | None = None,
+) -> SlateProjections:
+    """Project every player on a slate of games with two API requests.
+
+    Fetches one league-wide player ``LeagueGameLog`` and one
+    ``TeamEstimatedMetrics`` for the season, then computes every player's
+    projection column-wise. Values match ``project_player`` for the same
+    player, opponent and rest, with two differences in what is inferred:
+    each player's team is the team of their most recent game, and
+    ``days_rest`` is the gap since that game rather than a caller argument.
+    Only games played before the earliest slate date are used.
+
+    Args:
+        client: NBA API client.
+        games: Games on the slate; a team may appear in only one.
+        season: Season in YYYY-YY format. Defaults to the season containing
+            the earliest slate date.
+        rolling_n: Number of most-recent games for the rolling mean.
+        stats: Stats to project (defaults to all four in ``STATS``).
+        priors: Optional full mapping of per-stat priors (see
+            ``project_player``).
+        player_ids: Restrict the result to these players (default: every
+            player whose team is on the slate).
+
+    Returns:
+        A columnar ``SlateProjections``, one row per player, ordered by
+        player ID.
+
+    Raises:
+        ValueError: If ``games`` is empty, ``rolling_n < 1``, a team appears
+            twice, ``stats``/``priors`` are invalid, or an opponent is
+            missing / has an invalid estimated defensive rating.
+    """
+    if not games:
+        msg = "games must be non-empty"
+        raise ValueError(msg)
+    if rolling_n < 1:
+        msg = f"rolling_n must be >= 1, got {rolling_n}"
+        raise ValueError(msg)
+    effective_priors = resolve_stats_and_priors(stats, priors)
+    _slate_team_context(games)  # reject duplicate teams before any request
+    from fastbreak.endpoints import LeagueGameLog, TeamEstimatedMetrics  # noqa: PLC0415
+
+    first_date = min(g.game_date for g in games)
+    season = resolve_season(
+        season, get_season_from_date(first_date, league=client.league)
+    )
+    results: list[Any] = await client.get_many(
+        [
+            LeagueGameLog(
+                league_id=client.league_id, season=season, player_or_team="P"
+            ),
+            TeamEstimatedMetrics(season=season),
+        ],
+        max_concurrency=2,
+    )
+    log_resp = cast("LeagueGameLogResponse", results[0])
+    team_resp = cast("TeamEstimatedMetricsResponse", results[1])
+    return _project_slate_from_logs(
+        log_resp.games,
+        team_resp,
+        games,
+        rolling_n=rolling_n,
+        stats=stats,
+        priors=effective_priors,
+        player_ids=player_ids,
+    )
@@ -3,14 +3,28 @@
 Pure solver: callers supply stints (the +1 side, the -1 side, possessions and
 score margin); this module builds a sparse player x stint design matrix and
 solves a possession-weighted ridge regression.
+
+Stints may be given as :class:`Stint` objects or, for large multi-season
+fits, as a columnar :class:`StintArrays` (padded player-id matrices), which is
+turned into the design matrix without a per-stint Python loop.
+
+:class:`IncrementalRAPM` keeps the normal-equation statistics instead of the
+stints, so nightly updates fold in new games and re-solve from the last
+answer rather than refitting a season from scratch.
 """
 
 import math
-from collections.abc import Sequence
-from dataclasses import dataclass
+import os
+import warnings
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
 
 import numpy as np
-from scipy.sparse import csr_matrix
+from scipy.sparse import coo_matrix, csr_matrix, identity
+from scipy.sparse.linalg import LinearOperator, cg
 from sklearn.linear_model import Ridge, RidgeCV
 
 
@@ -30,39 +44,124 @@ class Stint:
     point_diff: int
 
 
-def build_design_matrix(
-    stints: Sequence[Stint],
-) -> tuple[csr_matrix, np.ndarray, np.ndarray, list[int]]:
-    """Return ``(X, y, sample_weight, player_ids)`` for the ridge solve."""
-    player_ids = sorted(
-        {pid for s in stints for pid in (*s.home_player_ids, *s.away_player_ids)}
+PAD_PLAYER_ID = -1
+"""Filler for unused slots in :class:`StintArrays` player-id matrices."""
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class StintArrays:
+    """Columnar stints: one row per stint.
+
+    ``home_player_ids`` / ``away_player_ids`` are ``(n, k)`` integer matrices
+    (``+1`` and ``-1`` sides), padded with :data:`PAD_PLAYER_ID` where a stint
+    lists fewer than ``k`` players; ``possessions`` and ``point_diff`` are
+    length-``n`` vectors with the same meaning as on :class:`Stint`.
+    """
+
+    home_player_ids: np.ndarray
+    away_player_ids: np.ndarray
+    possessions: np.ndarray
+    point_diff: np.ndarray
+
+    def __post_init__(self) -> None:
+        n = len(self.possessions)
+        for name in ("home_player_ids", "away_player_ids"):
+            ids = getattr(self, name)
+            if ids.ndim != 2 or ids.shape[0] != n:  # noqa: PLR2004
+                msg = f"{name} must be a 2-D array with {n} rows, got shape {ids.shape}"
+                raise ValueError(msg)
+        if self.point_diff.shape != (n,):
+            msg = f"point_diff must have shape ({n},), got {self.point_diff.shape}"
+            raise ValueError(msg)
+
+    def __len__(self) -> int:
+        return len(self.possessions)
+
+    @classmethod
+    def from_stints(cls, stints: Sequence[Stint]) -> "StintArrays":
+        """Pack :class:`Stint` objects into padded arrays."""
+        n = len(stints)
+        k_home = max((len(s.home_player_ids) for s in stints), default=0)
+        k_away = max((len(s.away_player_ids) for s in stints), default=0)
+        home = np.full((n, k_home), PAD_PLAYER_ID, dtype=np.int64)
+        away = np.full((n, k_away), PAD_PLAYER_ID, dtype=np.int64)
+        for r, s in enumerate(stints):
+            home[r, : len(s.home_player_ids)] = s.home_player_ids
+            away[r, : len(s.away_player_ids)] = s.away_player_ids
+        return cls(
+            home_player_ids=home,
+            away_player_ids=away,
+            possessions=np.fromiter(
+                (s.possessions for s in stints), dtype=float, count=n
+            ),
+            point_diff=np.array([s.point_diff for s in stints]),
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DesignMatrix:
+    """Ridge inputs plus per-player accounting, aligned to ``player_ids``."""
+
+    x: csr_matrix
+    y: np.ndarray
+    sample_weight: np.ndarray
+    player_ids: list[int]
+    stint_counts: np.ndarray
+    player_possessions: np.ndarray
+
+
+def build_design_arrays(stints: StintArrays) -> DesignMatrix:
+    """Vectorized design-matrix construction from columnar stints.
+
+    Produces exactly the matrix, targets and weights of
+    :func:`build_design_matrix`, along with each player's stint count and
+    possessions, in a handful of array passes.
+    """
+    n = len(stints)
+    ids = np.hstack([stints.home_player_ids, stints.away_player_ids]).astype(
+        np.int64, copy=False
     )
-    col = {pid: i for i, pid in enumerate(player_ids)}
-
-    rows: list[int] = []
-    cols: list[int] = []
-    vals: list[float] = []
-    y = np.empty(len(stints), dtype=float)
-    w = np.empty(len(stints), dtype=float)
-
-    for r, s in enumerate(stints):
-        for pid in s.home_player_ids:
-            rows.append(r)
-            cols.append(col[pid])
-            vals.append(1.0)
-        for pid in s.away_player_ids:
-            rows.append(r)
-            cols.append(col[pid])
-            vals.append(-1.0)
-        y[r] = s.point_diff / s.possessions * 100.0
-        w[r] = s.possessions
+    signs = np.concatenate(
+        [
+            np.ones(stints.home_player_ids.shape[1]),
+            -np.ones(stints.away_player_ids.shape[1]),
+        ]
+    )
+    mask = ids != PAD_PLAYER_ID
+    present = ids[mask]  # row-major: stint by stint, home then away
+    player_ids = np.unique(present)
+    cols = np.searchsorted(player_ids, present)
 
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(mask.sum(axis=1), out=indptr[1:])
     x = csr_matrix(
-        (vals, (rows, cols)),
-        shape=(len(stints), len(player_ids)),
+        (np.broadcast_to(signs, ids.shape)[mask], cols, indptr),
+        shape=(n, len(player_ids)),
         dtype=float,
     )
-    return x, y, w, player_ids
+    # Canonical form (sorted indices, duplicates summed), as the COO path gives.
+    x.sum_duplicates()
+
+    possessions = np.asarray(stints.possessions, dtype=float)
+    entry_poss = np.broadcast_to(possessions[:, None], ids.shape)[mask]
+    return DesignMatrix(
+        x=x,
+        y=stints.point_diff / possessions * 100.0,
+        sample_weight=possessions.copy(),
+        player_ids=player_ids.tolist(),
+        stint_counts=np.bincount(cols, minlength=len(player_ids)),
+        player_possessions=np.bincount(
+            cols, weights=entry_poss, minlength=len(player_ids)
+        ),
+    )
+
+
+def build_design_matrix(
+    stints: Sequence[Stint],
+) -> tuple[csr_matrix, np.ndarray, np.ndarray, list[int]]:
+    """Return ``(X, y, sample_weight, player_ids)`` for the ridge solve."""
+    design = build_design_arrays(StintArrays.from_stints(stints))
+    return design.x, design.y, design.sample_weight, design.player_ids
 
 
 @dataclass(frozen=True, slots=True)
@@ -75,54 +174,126 @@ class RAPMRating:
     possessions: float
 
 
+def _id_index(
+    ratings: "Sequence[RAPMRating | ODRAPMRating]",
+) -> dict[int, int]:
+    return {r.player_id: i for i, r in enumerate(ratings)}
+
+
 @dataclass(frozen=True, slots=True)
 class RAPMResult:
-    """Result of a RAPM solve."""
+    """Result of a RAPM solve.
+
+    Lookup indexes are built once on construction: ``rating_for`` is a dict
+    hit, and :func:`rapm_leaders` finds its possession threshold by binary
+    search instead of scanning every rating.
+    """
 
     ratings: tuple[RAPMRating, ...]
     alpha: float
     intercept: float
     n_stints: int
     n_players: int
+    _index: dict[int, int] = field(init=False, repr=False, compare=False)
+    _rapm: np.ndarray = field(init=False, repr=False, compare=False)
+    _rank: np.ndarray = field(init=False, repr=False, compare=False)
+    _by_possessions: np.ndarray = field(init=False, repr=False, compare=False)
+    _sorted_possessions: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        n = len(self.ratings)
+        rapm = np.fromiter((r.rapm for r in self.ratings), dtype=float, count=n)
+        poss = np.fromiter((r.possessions for r in self.ratings), dtype=float, count=n)
+        # rank[i] is rating i's position in a stable best-first sort by rapm.
+        rank = np.empty(n, dtype=np.int64)
+        rank[np.argsort(-rapm, kind="stable")] = np.arange(n)
+        by_poss = np.argsort(poss, kind="stable")
+        object.__setattr__(self, "_index", _id_index(self.ratings))
+        object.__setattr__(self, "_rapm", rapm)
+        object.__setattr__(self, "_rank", rank)
+        object.__setattr__(self, "_by_possessions", by_poss)
+        object.__setattr__(self, "_sorted_possessions", poss[by_poss])
 
     def rating_for(self, player_id: int) -> RAPMRating | None:
-        for r in self.ratings:
-            if r.player_id == player_id:
-                return r
-        return None
+        i = self._index.get(player_id)
+        return None if i is None else self.ratings[i]
 
+    def ratings_for(self, player_ids: Iterable[int]) -> np.ndarray:
+        """RAPM for each id as a float array; NaN where a player is unrated."""
+        idx = np.fromiter(
+            (self._index.get(pid, -1) for pid in player_ids), dtype=np.int64
+        )
+        out = np.full(len(idx), np.nan)
+        found = idx >= 0
+        out[found] = self._rapm[idx[found]]
+        return out
+
+    def leaders(
+        self, top_n: int = 10, min_possessions: float = 0.0
+    ) -> list[RAPMRating]:
+        """Best ``top_n`` ratings among players with enough possessions."""
+        if top_n <= 0:
+            return []
+        start = int(
+            np.searchsorted(self._sorted_possessions, min_possessions, side="left")
+        )
+        eligible = self._by_possessions[start:]
+        if top_n < len(eligible):
+            ranks = self._rank[eligible]
+            eligible = eligible[np.argpartition(ranks, top_n)[:top_n]]
+        eligible = eligible[np.argsort(self._rank[eligible])]
+        return [self.ratings[i] for i in eligible.tolist()]
+
+
+def _ratings(
+    player_ids: Sequence[int],
+    coef: np.ndarray,
+    stint_counts: np.ndarray,
+    possessions: np.ndarray,
+) -> tuple[RAPMRating, ...]:
+    """Per-player ratings, best first."""
+    counts = stint_counts.tolist()
+    poss = possessions.tolist()
+    return tuple(
+        sorted(
+            (
+                RAPMRating(
+                    player_id=pid,
+                    rapm=float(coef[i]),
+                    stint_count=int(counts[i]),
+                    possessions=float(poss[i]),
+                )
+                for i, pid in enumerate(player_ids)
+            ),
+            key=lambda r: r.rapm,
+            reverse=True,
+        )
+    )
 
-def _validate_stints(stints: Sequence[Stint]) -> None:
-    for i, s in enumerate(stints):
-        if not math.isfinite(s.possessions):
-            msg = f"stint {i} has non-finite possessions ({s.possessions}); must be finite"
-            raise ValueError(msg)
-        if s.possessions <= 0:
-            msg = (
-                f"stint {i} has non-positive possessions ({s.possessions}); must be > 0"
-            )
-            raise ValueError(msg)
-        if not math.isfinite(float(s.point_diff)):
-            msg = (
-                f"stint {i} has non-finite point_diff ({s.point_diff}); must be finite"
-            )
+
+def _validate_columns(
+    possessions: np.ndarray, values: np.ndarray, value_name: str
+) -> None:
+    poss = np.asarray(possessions, dtype=float)
+    vals = np.asarray(values, dtype=float)
+    checks = (
+        (~np.isfinite(poss), "non-finite possessions", "must be finite", poss),
+        (poss <= 0, "non-positive possessions", "must be > 0", poss),
+        (~np.isfinite(vals), f"non-finite {value_name}", "must be finite", vals),
+    )
+    for bad, what, rule, column in checks:
+        if bad.any():
+            i = int(np.argmax(bad))
+            msg = f"stint {i} has {what} ({column[i]}); {rule}"
             raise ValueError(msg)
 
 
-def _player_accounting(
-    stints: Sequence[Stint], player_ids: list[int]
-) -> tuple[dict[int, int], dict[int, float]]:
-    counts = dict.fromkeys(player_ids, 0)
-    poss = dict.fromkeys(player_ids, 0.0)
-    for s in stints:
-        for pid in (*s.home_player_ids, *s.away_player_ids):
-            counts[pid] += 1
-            poss[pid] += s.possessions
-    return counts, poss
+def _validate_stints(stints: StintArrays) -> None:
+    _validate_columns(stints.possessions, stints.point_diff, "point_diff")
 
 
 def compute_rapm(
-    stints: Sequence[Stint],
+    stints: Sequence[Stint] | StintArrays,
     *,
     lambda_: float = 3000.0,
     alphas: Sequence[float] | None = None,
@@ -138,15 +309,17 @@ def compute_rapm(
         msg = f"lambda_ must be a non-negative finite number, got {lambda_}"
         raise ValueError(msg)
 
-    if not stints:
+    if len(stints) == 0:
         return RAPMResult(
             ratings=(), alpha=lambda_, intercept=0.0, n_stints=0, n_players=0
         )
 
+    if not isinstance(stints, StintArrays):
+        stints = StintArrays.from_stints(stints)
     _validate_stints(stints)
 
-    x, y, w, player_ids = build_design_matrix(stints)
-    counts, poss = _player_accounting(stints, player_ids)
+    design = build_design_arrays(stints)
+    x, y, w, player_ids = design.x, design.y, design.sample_weight, design.player_ids
 
     if alphas is not None:
         cv_model = RidgeCV(alphas=list(alphas), fit_intercept=False)
@@ -161,14 +334,437 @@ def compute_rapm(
         coef = np.asarray(model.coef_, dtype=float)
         intercept = float(np.asarray(model.intercept_))
 
+    return RAPMResult(
+        ratings=_ratings(
+            player_ids, coef, design.stint_counts, design.player_possessions
+        ),
+        alpha=float(alpha_used),
+        intercept=intercept,
+        n_stints=len(stints),
+        n_players=len(player_ids),
+    )
+
+
+class IncrementalRAPM:
+    """RAPM kept as running sufficient statistics for cheap updates.
+
+    Instead of refitting from raw stints, the engine accumulates
+    ``XᵀWX`` (sparse, players x players) and ``XᵀWy``; adding a day of stints
+    only touches the players in it. :meth:`solve` minimizes
+
+        ``Σ w·(y - xβ)² + λ·‖β - β₀‖²``
+
+    with preconditioned conjugate gradient, warm-started from the previous
+    solution, where ``β₀`` are optional per-player priors (e.g. last season's
+    RAPM or a box-score estimate; unlisted players shrink to 0). With no
+    priors this is the same objective as :func:`compute_rapm`. ``rtol`` is the
+    solver's relative residual tolerance.
+    """
+
+    def __init__(
+        self,
+        *,
+        lambda_: float = 3000.0,
+        priors: Mapping[int, float] | None = None,
+        rtol: float = 1e-10,
+    ) -> None:
+        if not math.isfinite(lambda_) or lambda_ < 0:
+            msg = f"lambda_ must be a non-negative finite number, got {lambda_}"
+            raise ValueError(msg)
+        self.lambda_ = lambda_
+        self.rtol = rtol
+        self._priors: dict[int, float] = dict(priors or {})
+        self._index: dict[int, int] = {}
+        self._player_ids: list[int] = []
+        self._gram = csr_matrix((0, 0))
+        self._xtwy = np.zeros(0)
+        self._stint_counts = np.zeros(0, dtype=np.int64)
+        self._possessions = np.zeros(0)
+        self._coef = np.zeros(0)
+        self._n_stints = 0
+
+    @property
+    def n_stints(self) -> int:
+        return self._n_stints
+
+    @property
+    def n_players(self) -> int:
+        return len(self._player_ids)
+
+    def set_priors(self, priors: Mapping[int, float]) -> None:
+        """Replace the prior means used by the next :meth:`solve`."""
+        self._priors = dict(priors)
+
+    def _columns(self, player_ids: Sequence[int]) -> np.ndarray:
+        for pid in player_ids:
+            if pid not in self._index:
+                self._index[pid] = len(self._player_ids)
+                self._player_ids.append(pid)
+        return np.fromiter(
+            (self._index[pid] for pid in player_ids),
+            dtype=np.int64,
+            count=len(player_ids),
+        )
+
+    def _grow(self, n: int) -> None:
+        old = len(self._xtwy)
+        if n == old:
+            return
+        self._gram.resize((n, n))
+        pad = n - old
+        self._xtwy = np.concatenate([self._xtwy, np.zeros(pad)])
+        self._stint_counts = np.concatenate(
+            [self._stint_counts, np.zeros(pad, dtype=np.int64)]
+        )
+        self._possessions = np.concatenate([self._possessions, np.zeros(pad)])
+
+    def add_stints(self, stints: Sequence[Stint] | StintArrays) -> None:
+        """Fold new stints into the sufficient statistics."""
+        if len(stints) == 0:
+            return
+        if not isinstance(stints, StintArrays):
+            stints = StintArrays.from_stints(stints)
+        _validate_stints(stints)
+
+        design = build_design_arrays(stints)
+        cols = self._columns(design.player_ids)
+        n = self.n_players
+        self._grow(n)
+
+        xtw = design.x.T.multiply(design.sample_weight).tocsr()
+        gram = (xtw @ design.x).tocoo()
+        self._gram = (
+            self._gram
+            + coo_matrix(
+                (gram.data, (cols[gram.row], cols[gram.col])), shape=(n, n)
+            ).tocsr()
+        ).tocsr()
+        self._xtwy[cols] += xtw @ design.y
+        self._stint_counts[cols] += design.stint_counts
+        self._possessions[cols] += design.player_possessions
+        self._n_stints += len(stints)
+
+    def decay(self, factor: float) -> None:
+        """Down-weight everything seen so far (e.g. a prior season) by ``factor``."""
+        if not 0 < factor <= 1:
+            msg = f"factor must be in (0, 1], got {factor}"
+            raise ValueError(msg)
+        self._gram = self._gram * factor
+        self._xtwy *= factor
+
+    def solve(self, *, maxiter: int | None = None) -> RAPMResult:
+        """Re-solve for all players, starting from the previous solution."""
+        n = self.n_players
+        if n == 0:
+            return RAPMResult(
+                ratings=(), alpha=self.lambda_, intercept=0.0, n_stints=0, n_players=0
+            )
+        prior = np.fromiter(
+            (self._priors.get(pid, 0.0) for pid in self._player_ids),
+            dtype=float,
+            count=n,
+        )
+        a = (self._gram + self.lambda_ * identity(n, format="csr")).tocsr()
+        b = self._xtwy + self.lambda_ * prior
+        diag = a.diagonal()
+        inv_diag = np.divide(1.0, diag, out=np.ones_like(diag), where=diag > 0)
+        preconditioner = LinearOperator((n, n), matvec=lambda v: inv_diag * v)
+        # Players new since the last solve start at their prior.
+        x0 = prior.copy()
+        x0[: len(self._coef)] = self._coef
+        coef, info = cg(a, b, x0=x0, rtol=self.rtol, maxiter=maxiter, M=preconditioner)
+        if info > 0:
+            warnings.warn(
+                f"RAPM conjugate gradient did not converge in {info} iterations",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        self._coef = np.asarray(coef, dtype=float)
+        return RAPMResult(
+            ratings=_ratings(
+                self._player_ids, self._coef, self._stint_counts, self._possessions
+            ),
+            alpha=self.lambda_,
+            intercept=0.0,
+            n_stints=self._n_stints,
+            n_players=n,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class OffenseStint:
+    """One side's possessions in a stint, for offense/defense RAPM.
+
+    ``points`` were scored by ``offense_player_ids`` against
+    ``defense_player_ids`` over ``possessions`` (> 0) offensive possessions.
+    """
+
+    offense_player_ids: tuple[int, ...]
+    defense_player_ids: tuple[int, ...]
+    possessions: float
+    points: int
+
+
+@dataclass(frozen=True, slots=True)
+class ODRAPMRating:
+    """A player's offensive, defensive and net RAPM (points per 100).
+
+    Positive is good for all three: ``drapm`` is points *prevented* per 100
+    defensive possessions, and ``rapm == orapm + drapm``. The ``*_ci`` fields
+    are bootstrap percentile intervals, or None without bootstrapping.
+    """
+
+    player_id: int
+    orapm: float
+    drapm: float
+    rapm: float
+    offensive_possessions: float
+    defensive_possessions: float
+    orapm_ci: tuple[float, float] | None = None
+    drapm_ci: tuple[float, float] | None = None
+    rapm_ci: tuple[float, float] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ODRAPMResult:
+    """Result of an offense/defense RAPM solve; ``intercept`` is league pts/100."""
+
+    ratings: tuple[ODRAPMRating, ...]
+    alpha: float
+    intercept: float
+    n_stints: int
+    n_players: int
+    n_bootstrap: int = 0
+    confidence: float | None = None
+
+    _index: dict[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_index", _id_index(self.ratings))
+
+    def rating_for(self, player_id: int) -> ODRAPMRating | None:
+        i = self._index.get(player_id)
+        return None if i is None else self.ratings[i]
+
+
+def _pack_ids(rows: Sequence[tuple[int, ...]]) -> np.ndarray:
+    ids = np.full((len(rows), max(map(len, rows), default=0)), PAD_PLAYER_ID)
+    for r, row in enumerate(rows):
+        ids[r, : len(row)] = row
+    return ids
+
+
+def _build_od_design(
+    stints: Sequence[OffenseStint],
+) -> tuple[csr_matrix, np.ndarray, np.ndarray, list[int], np.ndarray]:
+    """Return ``(X, y, w, player_ids, possessions)`` with 2P columns.
+
+    Column ``j`` is player ``j`` on offense and ``P + j`` the same player on
+    defense; ``possessions`` is ``(2, P)``: offensive then defensive.
+    """
+    n = len(stints)
+    off = _pack_ids([s.offense_player_ids for s in stints])
+    dfn = _pack_ids([s.defense_player_ids for s in stints])
+    ids = np.hstack([off, dfn])
+    mask = ids != PAD_PLAYER_ID
+    present = ids[mask]
+    player_ids = np.unique(present)
+    p = len(player_ids)
+    is_defense = np.broadcast_to(np.arange(ids.shape[1]) >= off.shape[1], ids.shape)
+    cols = np.searchsorted(player_ids, present) + p * is_defense[mask]
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(mask.sum(axis=1), out=indptr[1:])
+    x = csr_matrix((np.ones(len(cols)), cols, indptr), shape=(n, 2 * p))
+    x.sum_duplicates()
+
+    possessions = np.fromiter((s.possessions for s in stints), dtype=float, count=n)
+    points = np.fromiter((s.points for s in stints), dtype=float, count=n)
+    _validate_columns(possessions, points, "points")
+    entry_poss = np.broadcast_to(possessions[:, None], ids.shape)[mask]
+    player_poss = np.bincount(cols, weights=entry_poss, minlength=2 * p)
+    return (
+        x,
+        points / possessions * 100.0,
+        possessions,
+        player_ids.tolist(),
+        player_poss.reshape(2, p),
+    )
+
+
+def _fit_ridge(
+    x: csr_matrix, y: np.ndarray, w: np.ndarray, lambda_: float
+) -> tuple[np.ndarray, float]:
+    model = Ridge(alpha=lambda_, fit_intercept=True)
+    model.fit(x, y, sample_weight=w)
+    return np.asarray(model.coef_, dtype=float), float(np.asarray(model.intercept_))
+
+
+def _bootstrap_coef(
+    x: csr_matrix,
+    y: np.ndarray,
+    w: np.ndarray,
+    lambda_: float,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Refit on a with-replacement resample of stints, encoded as weights."""
+    n = len(y)
+    draws = np.random.default_rng(seed).integers(0, n, n)
+    return _fit_ridge(x, y, w * np.bincount(draws, minlength=n), lambda_)[0]
+
+
+type _SharedSpec = tuple[str, tuple[int, ...], str]
+
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_bootstrap_worker(
+    specs: dict[str, _SharedSpec], shape: tuple[int, int], lambda_: float
+) -> None:
+    """Attach to the parent's shared design matrix (no copy) once per worker."""
+    blocks = [SharedMemory(name=name) for name, _, _ in specs.values()]
+    arrays = {
+        key: np.ndarray(spec_shape, dtype=dtype, buffer=block.buf)
+        for (key, (_, spec_shape, dtype)), block in zip(
+            specs.items(), blocks, strict=True
+        )
+    }
+    _WORKER_STATE.update(
+        blocks=blocks,
+        x=csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=shape,
+            copy=False,
+        ),
+        y=arrays["y"],
+        w=arrays["w"],
+        lambda_=lambda_,
+    )
+
+
+def _bootstrap_worker(seed: np.random.SeedSequence) -> np.ndarray:
+    state = _WORKER_STATE
+    return _bootstrap_coef(state["x"], state["y"], state["w"], state["lambda_"], seed)
+
+
+def _run_bootstrap(  # noqa: PLR0913
+    x: csr_matrix,
+    y: np.ndarray,
+    w: np.ndarray,
+    lambda_: float,
+    *,
+    seeds: Sequence[np.random.SeedSequence],
+    n_jobs: int,
+) -> np.ndarray:
+    """Return a ``(len(seeds), n_columns)`` array of bootstrap coefficients."""
+    if n_jobs == 1:
+        return np.array([_bootstrap_coef(x, y, w, lambda_, s) for s in seeds])
+
+    arrays = {
+        "data": x.data,
+        "indices": x.indices,
+        "indptr": x.indptr,
+        "y": y,
+        "w": w,
+    }
+    blocks: list[SharedMemory] = []
+    try:
+        specs: dict[str, _SharedSpec] = {}
+        for key, arr in arrays.items():
+            block = SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks.append(block)
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf)[...] = arr
+            specs[key] = (block.name, arr.shape, arr.dtype.str)
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_bootstrap_worker,
+            initargs=(specs, x.shape, lambda_),
+        ) as pool:
+            chunksize = max(1, len(seeds) // (n_jobs * 4))
+            return np.array(
+                list(pool.map(_bootstrap_worker, seeds, chunksize=chunksize))
+            )
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def compute_od_rapm(  # noqa: PLR0913
+    stints: Sequence[OffenseStint],
+    *,
+    lambda_: float = 3000.0,
+    n_bootstrap: int = 0,
+    confidence: float = 0.95,
+    n_jobs: int | None = None,
+    seed: int | None = None,
+) -> ODRAPMResult:
+    """Estimate offensive and defensive RAPM, optionally with bootstrap CIs.
+
+    Each player gets an offense and a defense column; each stint side is one
+    observation of points per 100 possessions, weighted by possessions, with
+    an unpenalized intercept for league-average efficiency.
+
+    ``n_bootstrap`` refits resample stints with replacement. They run across
+    ``n_jobs`` worker processes (default: one per CPU; ``1`` runs in-process)
+    that read the design matrix from shared memory rather than each receiving
+    a pickled copy. ``seed`` makes the intervals reproducible.
+    """
+    if not math.isfinite(lambda_) or lambda_ < 0:
+        msg = f"lambda_ must be a non-negative finite number, got {lambda_}"
+        raise ValueError(msg)
+    if n_bootstrap < 0:
+        msg = f"n_bootstrap must be >= 0, got {n_bootstrap}"
+        raise ValueError(msg)
+    if not 0 < confidence < 1:
+        msg = f"confidence must be in (0, 1), got {confidence}"
+        raise ValueError(msg)
+    if n_jobs is not None and n_jobs < 1:
+        msg = f"n_jobs must be >= 1 when provided, got {n_jobs}"
+        raise ValueError(msg)
+
+    if len(stints) == 0:
+        return ODRAPMResult(
+            ratings=(), alpha=lambda_, intercept=0.0, n_stints=0, n_players=0
+        )
+
+    x, y, w, player_ids, poss = _build_od_design(stints)
+    coef, intercept = _fit_ridge(x, y, w, lambda_)
+    p = len(player_ids)
+
+    def split(c: np.ndarray) -> np.ndarray:
+        """Stack ``(orapm, drapm, rapm)`` along a new leading axis."""
+        orapm, drapm = c[..., :p], -c[..., p:]
+        return np.stack([orapm, drapm, orapm + drapm])
+
+    point = split(coef)
+    bounds: np.ndarray | None = None
+    if n_bootstrap:
+        seeds = np.random.SeedSequence(seed).spawn(n_bootstrap)
+        jobs = min(n_jobs or os.cpu_count() or 1, n_bootstrap)
+        samples = _run_bootstrap(x, y, w, lambda_, seeds=seeds, n_jobs=jobs)
+        tail = (1.0 - confidence) / 2
+        # (3, B, p) samples -> (2, 3, p) lower/upper bounds
+        bounds = np.quantile(split(samples), [tail, 1.0 - tail], axis=1)
+
+    def ci(kind: int, i: int) -> tuple[float, float] | None:
+        if bounds is None:
+            return None
+        return float(bounds[0, kind, i]), float(bounds[1, kind, i])
+
     ratings = tuple(
         sorted(
             (
-                RAPMRating(
+                ODRAPMRating(
                     player_id=pid,
-                    rapm=float(coef[i]),
-                    stint_count=counts[pid],
-                    possessions=poss[pid],
+                    orapm=float(point[0, i]),
+                    drapm=float(point[1, i]),
+                    rapm=float(point[2, i]),
+                    offensive_possessions=float(poss[0, i]),
+                    defensive_possessions=float(poss[1, i]),
+                    orapm_ci=ci(0, i),
+                    drapm_ci=ci(1, i),
+                    rapm_ci=ci(2, i),
                 )
                 for i, pid in enumerate(player_ids)
             ),
@@ -176,12 +772,14 @@ def compute_rapm(
             reverse=True,
         )
     )
-    return RAPMResult(
+    return ODRAPMResult(
         ratings=ratings,
-        alpha=float(alpha_used),
+        alpha=lambda_,
         intercept=intercept,
         n_stints=len(stints),
-        n_players=len(player_ids),
+        n_players=p,
+        n_bootstrap=n_bootstrap,
+        confidence=confidence if n_bootstrap else None,
     )
 
 
@@ -192,6 +790,4 @@ def rapm_leaders(
     min_possessions: float = 0.0,
 ) -> list[RAPMRating]:
     """Top-``top_n`` ratings by RAPM, filtered to ``possessions >= min_possessions``."""
-    eligible = [r for r in result.ratings if r.possessions >= min_possessions]
-    eligible.sort(key=lambda r: r.rapm, reverse=True)
-    return eligible[: max(top_n, 0)]
+    return result.leaders(top_n, min_possessions)
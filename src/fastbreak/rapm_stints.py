@@ -0,0 +1,315 @@
+"""RAPM stint extraction -- rotations + play-by-play into :class:`Stint` rows.
+
+Each game's home and away lineup stints (from :mod:`fastbreak.rotations`) are
+intersected into intervals where all ten players are constant. Possessions
+(from :func:`fastbreak.transition.classify_possessions`) and points are then
+credited to the interval on court when they happen.
+
+An event exactly on an interval boundary belongs to the interval that *ends*
+there (``(start, end]``): a basket followed by a timeout and substitutions at
+the same clock is credited to the lineup that scored. The one exception is an
+event at the very start of a period, which belongs to the interval that starts
+there. A possession is credited where it ends (its last action), so its
+points and its count land on the same lineup.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from fastbreak.games import action_elapsed_seconds, elapsed_game_seconds
+from fastbreak.league import League
+from fastbreak.rapm import OffenseStint, Stint, StintArrays
+from fastbreak.rotations import lineup_stints
+from fastbreak.transition import action_points, classify_possessions
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from fastbreak.clients.base import BaseClient
+    from fastbreak.endpoints.base import Endpoint
+    from fastbreak.models.game_rotation import GameRotationResponse
+    from fastbreak.models.play_by_play import PlayByPlayAction
+    from fastbreak.rotations import LineupStint
+
+_PERIOD_END_CLOCK = "PT00M00.00S"
+_DEFAULT_BATCH_SIZE = 10
+
+
+@dataclass(frozen=True, slots=True)
+class GameStint:
+    """One interval of a game with both five-man units constant.
+
+    Attributes:
+        game_id: NBA game ID string.
+        home_team_id: Home team ID.
+        away_team_id: Away team ID.
+        home_player_ids: Sorted home player IDs on court.
+        away_player_ids: Sorted away player IDs on court.
+        start: Seconds since tip-off when the interval begins.
+        end: Seconds since tip-off when the interval ends.
+        home_possessions: Possessions the home team ended in the interval.
+        away_possessions: Possessions the away team ended in the interval.
+        home_points: Points scored by the home team in the interval.
+        away_points: Points scored by the away team in the interval.
+    """
+
+    game_id: str
+    home_team_id: int
+    away_team_id: int
+    home_player_ids: tuple[int, ...]
+    away_player_ids: tuple[int, ...]
+    start: float
+    end: float
+    home_possessions: int
+    away_possessions: int
+    home_points: int
+    away_points: int
+
+    @property
+    def possessions(self) -> float:
+        """Per-team possessions: the mean of both sides' counts."""
+        return (self.home_possessions + self.away_possessions) / 2
+
+    @property
+    def point_diff(self) -> int:
+        """Home points minus away points."""
+        return self.home_points - self.away_points
+
+    def to_stint(self) -> Stint:
+        """Convert to a solver :class:`Stint` (home is the ``+1`` side)."""
+        return Stint(
+            home_player_ids=self.home_player_ids,
+            away_player_ids=self.away_player_ids,
+            possessions=self.possessions,
+            point_diff=self.point_diff,
+        )
+
+    def offense_stints(self) -> tuple[OffenseStint, ...]:
+        """Split into per-side :class:`OffenseStint` rows for O/D RAPM.
+
+        Sides that ended no possessions in the interval are omitted.
+        """
+        sides = (
+            (
+                self.home_player_ids,
+                self.away_player_ids,
+                self.home_possessions,
+                self.home_points,
+            ),
+            (
+                self.away_player_ids,
+                self.home_player_ids,
+                self.away_possessions,
+                self.away_points,
+            ),
+        )
+        return tuple(
+            OffenseStint(
+                offense_player_ids=offense,
+                defense_player_ids=defense,
+                possessions=float(possessions),
+                points=points,
+            )
+            for offense, defense, possessions, points in sides
+            if possessions > 0
+        )
+
+
+type _Span = tuple[LineupStint, LineupStint, float, float]
+
+
+def _intersect_lineups(
+    home: Sequence[LineupStint], away: Sequence[LineupStint]
+) -> list[_Span]:
+    """Merge two sorted, non-overlapping lineup lists into overlapping spans."""
+    spans: list[_Span] = []
+    i = j = 0
+    while i < len(home) and j < len(away):
+        h, a = home[i], away[j]
+        start = max(h.in_time, a.in_time)
+        end = min(h.out_time, a.out_time)
+        if start < end:
+            spans.append((h, a, start, end))
+        if h.out_time <= a.out_time:
+            i += 1
+        else:
+            j += 1
+    return spans
+
+
+class _SpanIndex:
+    """Map play-by-play actions to the span on court when they happened."""
+
+    def __init__(self, spans: Sequence[_Span], league: League) -> None:
+        self._starts = [start for _, _, start, _ in spans]
+        self._ends = [end for _, _, _, end in spans]
+        self._league = league
+        self._period_starts: dict[int, float] = {}
+
+    def _period_start(self, period: int) -> float:
+        if period not in self._period_starts:
+            self._period_starts[period] = elapsed_game_seconds(
+                _PERIOD_END_CLOCK, period - 1, league=self._league
+            )
+        return self._period_starts[period]
+
+    def locate(self, action: PlayByPlayAction) -> int | None:
+        """Index of the span containing *action*, or None outside coverage."""
+        t = action_elapsed_seconds(action, league=self._league)
+        if t == self._period_start(action.period):
+            idx = bisect_right(self._ends, t)
+        else:
+            idx = bisect_left(self._ends, t)
+        if idx == len(self._ends) or self._starts[idx] > t:
+            return None
+        return idx
+
+
+def _tally(
+    spans: Sequence[_Span],
+    actions: Sequence[PlayByPlayAction],
+    side: dict[int, int],
+    league: League,
+) -> list[list[int]]:
+    """Return ``[home_poss, away_poss, home_pts, away_pts]`` for each span."""
+    index = _SpanIndex(spans, league)
+    tallies = [[0, 0, 0, 0] for _ in spans]
+    for poss in classify_possessions(list(actions), league=league):
+        for action in poss.actions:
+            points = action_points(action)
+            if points and action.teamId in side:
+                idx = index.locate(action)
+                if idx is not None:
+                    tallies[idx][2 + side[action.teamId]] += points
+        if poss.team_id in side:
+            idx = index.locate(poss.actions[-1])
+            if idx is not None:
+                tallies[idx][side[poss.team_id]] += 1
+    return tallies
+
+
+def game_stints(
+    rotation: GameRotationResponse,
+    actions: Sequence[PlayByPlayAction],
+    *,
+    league: League = League.NBA,
+) -> list[GameStint]:
+    """Build RAPM stints for one game.
+
+    Args:
+        rotation: Game rotation response, e.g. from
+            :func:`~fastbreak.rotations.get_game_rotations`.
+        actions: Play-by-play actions for the same game, e.g. from
+            :func:`~fastbreak.games.get_play_by_play`.
+        league: League configuration for period lengths (default: NBA).
+
+    Returns:
+        Chronological :class:`GameStint` objects, including intervals in
+        which no possession ended. Returns an empty list if either team has
+        no rotation entries.
+
+    """
+    if not rotation.home_team or not rotation.away_team:
+        return []
+    game_id = rotation.home_team[0].game_id
+    home_team_id = rotation.home_team[0].team_id
+    away_team_id = rotation.away_team[0].team_id
+
+    spans = _intersect_lineups(
+        lineup_stints(rotation.home_team), lineup_stints(rotation.away_team)
+    )
+    tallies = _tally(spans, actions, {home_team_id: 0, away_team_id: 1}, league)
+    return [
+        GameStint(
+            game_id=game_id,
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            home_player_ids=tuple(sorted(h.player_ids)),
+            away_player_ids=tuple(sorted(a.player_ids)),
+            start=start,
+            end=end,
+            home_possessions=home_poss,
+            away_possessions=away_poss,
+            home_points=home_pts,
+            away_points=away_pts,
+        )
+        for (h, a, start, end), (home_poss, away_poss, home_pts, away_pts) in zip(
+            spans, tallies, strict=True
+        )
+    ]
+
+
+async def iter_game_stints(
+    client: BaseClient,
+    game_ids: Sequence[str],
+    *,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    max_concurrency: int | None = None,
+) -> AsyncIterator[GameStint]:
+    """Stream stints for many games, fetching rotations and play-by-play.
+
+    Games are fetched ``batch_size`` at a time with
+    :meth:`~fastbreak.clients.base.BaseClient.get_many`; a batch's
+    play-by-play is released once its stints are yielded, so memory stays
+    bounded by one batch regardless of how many games are requested.
+
+    Args:
+        client: NBA API client
+        game_ids: Game ID strings, processed in order
+        batch_size: Games fetched concurrently per batch (default: 10)
+        max_concurrency: Passed through to ``get_many``
+
+    Yields:
+        :class:`GameStint` objects, game by game in input order
+
+    Examples:
+        async for stint in iter_game_stints(client, ids):
+            print(stint.game_id, stint.point_diff)
+
+    """
+    from fastbreak.endpoints import GameRotation, PlayByPlay  # noqa: PLC0415
+
+    if batch_size < 1:
+        msg = f"batch_size must be >= 1, got {batch_size}"
+        raise ValueError(msg)
+
+    for lo in range(0, len(game_ids), batch_size):
+        batch = game_ids[lo : lo + batch_size]
+        endpoints: list[Endpoint[Any]] = [GameRotation(game_id=g) for g in batch]
+        endpoints += [PlayByPlay(game_id=g) for g in batch]
+        responses = await client.get_many(endpoints, max_concurrency=max_concurrency)
+        rotations, pbps = responses[: len(batch)], responses[len(batch) :]
+        del responses
+        for rotation, pbp in zip(rotations, pbps, strict=True):
+            for stint in game_stints(rotation, pbp.game.actions, league=client.league):
+                yield stint
+
+
+async def get_rapm_stints(
+    client: BaseClient,
+    game_ids: Sequence[str],
+    *,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    max_concurrency: int | None = None,
+) -> StintArrays:
+    """Fetch games and return solver-ready stints for :func:`compute_rapm`.
+
+    Intervals in which no possession ended are dropped, since the solver
+    weights and normalizes by possessions.
+
+    Examples:
+        ids = await get_game_ids(client, "2024-25")
+        result = compute_rapm(await get_rapm_stints(client, ids))
+
+    """
+    stints = [
+        stint.to_stint()
+        async for stint in iter_game_stints(
+            client, game_ids, batch_size=batch_size, max_concurrency=max_concurrency
+        )
+        if stint.possessions > 0
+    ]
+    return StintArrays.from_stints(stints)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -9,10 +10,11 @@ from typing import TYPE_CHECKING
 from fastbreak.league import League
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
     from fastbreak.clients.base import BaseClient
     from fastbreak.models.game_rotation import GameRotationResponse, RotationEntry
+    from fastbreak.types import Season, SeasonType
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -21,6 +23,7 @@ if TYPE_CHECKING:
 _REGULATION_PERIODS = 4
 _OT_PERIOD_SECONDS = 300
 _TIME_DIVISOR = 10  # API returns tenths of seconds
+_DEFAULT_BATCH_SIZE = 10
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +94,45 @@ class RotationSummary:
     total_game_minutes: float
 
 
+@dataclass(frozen=True, slots=True)
+class SeasonLineup:
+    """One lineup's court time aggregated over a season."""
+
+    player_ids: frozenset[int]
+    player_names: tuple[str, ...]
+    minutes: float
+    stint_count: int
+    games: int
+
+
+@dataclass(frozen=True, slots=True)
+class SubstitutionPattern:
+    """How often one player replaced another over a season."""
+
+    player_in_id: int
+    player_in_name: str
+    player_out_id: int
+    player_out_name: str
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class SeasonRotations:
+    """A team's rotations aggregated over many games.
+
+    ``player_minutes`` sums each game's :func:`player_total_minutes` (so
+    ``total_pt_diff`` is the season :func:`stint_plus_minus`); ``lineups``
+    sums each game's :func:`lineup_stints`.  Both are sorted by minutes
+    descending, ``substitutions`` by count descending.
+    """
+
+    team_id: int
+    game_ids: tuple[str, ...]
+    lineups: tuple[SeasonLineup, ...]
+    player_minutes: tuple[PlayerMinutes, ...]
+    substitutions: tuple[SubstitutionPattern, ...]
+
+
 # ---------------------------------------------------------------------------
 # Period helper
 # ---------------------------------------------------------------------------
@@ -197,23 +239,42 @@ def _sweep_segments(
     entries: Sequence[RotationEntry],
     sorted_boundaries: list[float],
 ) -> list[_RawSegment]:
-    """Sweep consecutive boundary pairs and return raw lineup segments."""
+    """Sweep consecutive boundary pairs and return raw lineup segments.
+
+    An entry covers ``[t_start, t_end]`` exactly when
+    ``in_time_real <= t_start < out_time_real`` (every in/out time is a
+    boundary), so the on-court set is kept incrementally from time-sorted
+    enter/exit events instead of re-checking every entry per segment.
+    Names are built once per player and shared by all segments.
+    """
+    names: dict[int, str] = {}
+    events: list[tuple[float, int, int]] = []
+    for e in entries:
+        names[e.person_id] = f"{e.player_first} {e.player_last}"
+        if e.in_time_real < e.out_time_real:
+            events.append((e.in_time_real, 1, e.person_id))
+            events.append((e.out_time_real, -1, e.person_id))
+    events.sort(key=lambda ev: ev[0])
+
     raw: list[_RawSegment] = []
-    for i in range(len(sorted_boundaries) - 1):
-        t_start = sorted_boundaries[i]
-        t_end = sorted_boundaries[i + 1]
+    active: dict[int, int] = defaultdict(int)
+    on_court: frozenset[int] = frozenset()
+    k = 0
+    for t_start, t_end in itertools.pairwise(sorted_boundaries):
         if t_start == t_end:
             continue
-
-        player_ids: set[int] = set()
-        player_names: dict[int, str] = {}
-        for e in entries:
-            if e.in_time_real <= t_start and e.out_time_real >= t_end:
-                player_ids.add(e.person_id)
-                player_names[e.person_id] = f"{e.player_first} {e.player_last}"
-
-        if player_ids:
-            raw.append((frozenset(player_ids), player_names, t_start, t_end))
+        changed = False
+        while k < len(events) and events[k][0] <= t_start:
+            _, delta, pid = events[k]
+            active[pid] += delta
+            if active[pid] == 0:
+                del active[pid]
+            changed = True
+            k += 1
+        if changed:
+            on_court = frozenset(active)
+        if on_court:
+            raw.append((on_court, names, t_start, t_end))
     return raw
 
 
@@ -222,7 +283,8 @@ def lineup_stints(entries: Sequence[RotationEntry]) -> list[LineupStint]:
 
     Collects all time boundaries, sweeps consecutive pairs, determines
     which players are on court in each interval ``[t_start, t_end]``,
-    then merges consecutive segments with identical player sets.
+    then merges consecutive segments with identical player sets.  Linear
+    in the number of entries after sorting.
     """
     if not entries:
         return []
@@ -325,6 +387,163 @@ def rotation_timeline(
     return events
 
 
+# ---------------------------------------------------------------------------
+# Season aggregation
+# ---------------------------------------------------------------------------
+
+
+def _team_entries(
+    response: GameRotationResponse, team_id: int
+) -> list[RotationEntry] | None:
+    """The rotation entries for *team_id*, or None if it did not play."""
+    if response.home_team and response.home_team[0].team_id == team_id:
+        return list(response.home_team)
+    if response.away_team and response.away_team[0].team_id == team_id:
+        return list(response.away_team)
+    return None
+
+
+class _SeasonAccumulator:
+    """Running season totals, fed one game at a time.
+
+    Players are interned to small integers on first sight, so a lineup is
+    keyed by an ``int`` bitmask of its players rather than a frozenset of
+    IDs, and each name is stored once.  Only these totals are kept; a
+    game's entries can be dropped as soon as :meth:`add` returns.
+    """
+
+    __slots__ = (
+        "_game_ids",
+        "_index",
+        "_league",
+        "_lineups",
+        "_names",
+        "_player_ids",
+        "_players",
+        "_subs",
+        "_team_id",
+    )
+
+    def __init__(self, team_id: int, league: League) -> None:
+        self._team_id = team_id
+        self._league = league
+        self._game_ids: list[str] = []
+        self._index: dict[int, int] = {}
+        self._player_ids: list[int] = []
+        self._names: list[str] = []
+        # per player: [minutes, stints, points, pt_diff]
+        self._players: list[list[float]] = []
+        # per lineup bitmask: [minutes, stints, games, last game number]
+        self._lineups: dict[int, list[float]] = {}
+        self._subs: dict[tuple[int, int], int] = defaultdict(int)
+
+    def _intern(self, player_id: int, name: str) -> int:
+        i = self._index.get(player_id)
+        if i is None:
+            i = self._index[player_id] = len(self._player_ids)
+            self._player_ids.append(player_id)
+            self._names.append(name)
+            self._players.append([0.0, 0, 0, 0.0])
+        return i
+
+    def add(self, response: GameRotationResponse) -> None:
+        entries = _team_entries(response, self._team_id)
+        if not entries:
+            return
+        self._game_ids.append(entries[0].game_id)
+        game = len(self._game_ids)
+
+        for m in player_total_minutes(entries):
+            totals = self._players[self._intern(m.player_id, m.player_name)]
+            totals[0] += m.total_minutes
+            totals[1] += m.stint_count
+            totals[2] += m.total_points
+            totals[3] += m.total_pt_diff
+
+        for stint in lineup_stints(entries):
+            key = 0
+            for pid in stint.player_ids:
+                key |= 1 << self._index[pid]
+            agg = self._lineups.setdefault(key, [0.0, 0, 0, 0])
+            agg[0] += stint.duration_minutes
+            agg[1] += 1
+            if agg[3] != game:
+                agg[2] += 1
+                agg[3] = game
+
+        for ev in rotation_timeline(entries, league=self._league):
+            if ev.player_in_id is not None and ev.player_out_id is not None:
+                self._subs[
+                    self._index[ev.player_in_id], self._index[ev.player_out_id]
+                ] += 1
+
+    def _members(self, key: int) -> list[int]:
+        return [i for i in range(key.bit_length()) if key >> i & 1]
+
+    def result(self) -> SeasonRotations:
+        ids, names = self._player_ids, self._names
+        lineups = [
+            SeasonLineup(
+                player_ids=frozenset(ids[i] for i in members),
+                player_names=tuple(sorted(names[i] for i in members)),
+                minutes=agg[0],
+                stint_count=int(agg[1]),
+                games=int(agg[2]),
+            )
+            for key, agg in self._lineups.items()
+            for members in (self._members(key),)
+        ]
+        players = [
+            PlayerMinutes(
+                player_id=ids[i],
+                player_name=names[i],
+                total_minutes=minutes,
+                stint_count=int(count),
+                avg_stint_minutes=minutes / count,
+                total_points=int(points),
+                total_pt_diff=pt_diff,
+            )
+            for i, (minutes, count, points, pt_diff) in enumerate(self._players)
+        ]
+        subs = [
+            SubstitutionPattern(
+                player_in_id=ids[i],
+                player_in_name=names[i],
+                player_out_id=ids[o],
+                player_out_name=names[o],
+                count=count,
+            )
+            for (i, o), count in self._subs.items()
+        ]
+        return SeasonRotations(
+            team_id=self._team_id,
+            game_ids=tuple(self._game_ids),
+            lineups=tuple(sorted(lineups, key=lambda x: x.minutes, reverse=True)),
+            player_minutes=tuple(
+                sorted(players, key=lambda m: m.total_minutes, reverse=True)
+            ),
+            substitutions=tuple(sorted(subs, key=lambda x: x.count, reverse=True)),
+        )
+
+
+def season_rotations(
+    responses: Iterable[GameRotationResponse],
+    *,
+    team_id: int,
+    league: League = League.NBA,
+) -> SeasonRotations:
+    """Aggregate one team's rotations over many games.
+
+    *responses* is consumed one game at a time, so a generator keeps only
+    the running totals in memory.  Games in which *team_id* has no
+    rotation entries are skipped (and left out of ``game_ids``).
+    """
+    acc = _SeasonAccumulator(team_id, league)
+    for response in responses:
+        acc.add(response)
+    return acc.result()
+
+
 # ---------------------------------------------------------------------------
 # Async fetchers
 # ---------------------------------------------------------------------------
@@ -353,12 +572,7 @@ async def get_rotation_summary(
     """
     response = await get_game_rotations(client, game_id)
 
-    entries: list[RotationEntry] | None = None
-    if response.home_team and response.home_team[0].team_id == team_id:
-        entries = list(response.home_team)
-    elif response.away_team and response.away_team[0].team_id == team_id:
-        entries = list(response.away_team)
-
+    entries = _team_entries(response, team_id)
     if entries is None:
         msg = f"team_id {team_id} not found in game {game_id} rotations"
         raise ValueError(msg)
@@ -376,3 +590,53 @@ async def get_rotation_summary(
         substitution_events=tuple(rotation_timeline(entries, league=client.league)),
         total_game_minutes=total_min,
     )
+
+
+async def get_season_rotations(  # noqa: PLR0913
+    client: BaseClient,
+    team_id: int,
+    season: Season | None = None,
+    *,
+    season_type: SeasonType = "Regular Season",
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    max_concurrency: int | None = None,
+) -> SeasonRotations:
+    """Fetch every game's rotations for a team and aggregate the season.
+
+    Game IDs come from :func:`fastbreak.games.get_game_ids`; rotations are
+    fetched ``batch_size`` games at a time with
+    :meth:`~fastbreak.clients.base.BaseClient.get_many` and folded into the
+    running totals, so memory holds one batch of entries at most.
+
+    Args:
+        client: NBA API client
+        team_id: Team whose rotations are aggregated
+        season: Season in YYYY-YY format (defaults to current season)
+        season_type: "Regular Season", "Playoffs", etc.
+        batch_size: Games fetched concurrently per batch (default: 10)
+        max_concurrency: Passed through to ``get_many``
+
+    Examples:
+        season = await get_season_rotations(client, 1610612738, "2024-25")
+        top = season.lineups[0]   # most-used lineup
+
+    """
+    from fastbreak.endpoints.game_rotation import GameRotation  # noqa: PLC0415
+    from fastbreak.games import get_game_ids  # noqa: PLC0415
+
+    if batch_size < 1:
+        msg = f"batch_size must be >= 1, got {batch_size}"
+        raise ValueError(msg)
+
+    game_ids = await get_game_ids(
+        client, season, season_type=season_type, team_id=team_id
+    )
+    acc = _SeasonAccumulator(team_id, client.league)
+    for lo in range(0, len(game_ids), batch_size):
+        batch = game_ids[lo : lo + batch_size]
+        responses = await client.get_many(
+            [GameRotation(game_id=g) for g in batch], max_concurrency=max_concurrency
+        )
+        for response in responses:
+            acc.add(response)
+    return acc.result()
@@ -710,6 +710,8 @@ async def get_lineup_net_ratings(
 async def get_league_averages(
     client: BaseClient,
     season: Season | None = None,
+    *,
+    season_type: SeasonType = "Regular Season",
 ) -> LeagueAverages:
     """Return league-average stats for use with metrics functions.
 
@@ -720,6 +722,7 @@ async def get_league_averages(
     Args:
         client: NBA API client
         season: Season in YYYY-YY format (defaults to current season)
+        season_type: "Regular Season", "Playoffs", etc.
 
     Returns:
         LeagueAverages dataclass populated with current-season averages
@@ -730,7 +733,9 @@ async def get_league_averages(
         rel = relative_ts(ts, lg)
     """
     season = season or get_season_from_date(league=client.league)
-    rows = await get_team_stats(client, season=season, per_mode="PerGame")
+    rows = await get_team_stats(
+        client, season=season, season_type=season_type, per_mode="PerGame"
+    )
 
     if not rows:
         msg = "No team stats returned — cannot compute league averages"
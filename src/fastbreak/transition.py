@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal
 
-from fastbreak.games import elapsed_game_seconds
+import numpy as np
+
+from fastbreak.games import action_elapsed_seconds, elapsed_game_seconds
 from fastbreak.league import League
+from fastbreak.play_by_play_columns import PlayByPlayColumns, elapsed_seconds_array
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -15,7 +18,9 @@ if TYPE_CHECKING:
     from fastbreak.clients.base import BaseClient
     from fastbreak.models.play_by_play import PlayByPlayAction
 
-_TRANSITION_WINDOW = 8.0
+TRANSITION_WINDOW = 8.0
+"""Default seconds from possession change to first FGA for a transition possession."""
+
 _PERIOD_END_CLOCK = "PT00M00.00S"
 
 type Classification = Literal["transition", "halfcourt"]
@@ -67,6 +72,83 @@ class TransitionPossession:
     points_scored: int
 
 
+_TRIGGERS: tuple[Trigger, ...] = (
+    "made_fg",
+    "made_ft",
+    "turnover",
+    "defensive_rebound",
+    "start_of_period",
+)
+_MADE_FG, _MADE_FT, _TURNOVER, _DEFENSIVE_REBOUND, _START_OF_PERIOD = range(5)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PossessionArrays:
+    """Columnar possessions from :func:`classify_possession_arrays`.
+
+    One row per possession, in game order.  ``start_row`` / ``stop_row``
+    index the :class:`~fastbreak.play_by_play_columns.PlayByPlayColumns` the
+    possessions came from (rows with ``team_id == 0`` inside that range are
+    not part of the possession); ``game_index`` indexes its ``game_ids``.
+    ``trigger`` holds codes into :attr:`TRIGGERS`; the other columns mean
+    the same as on :class:`TransitionPossession`.
+    """
+
+    TRIGGERS: ClassVar[tuple[Trigger, ...]] = _TRIGGERS
+
+    game_index: np.ndarray
+    start_row: np.ndarray
+    stop_row: np.ndarray
+    team_id: np.ndarray
+    period: np.ndarray
+    game_clock: np.ndarray
+    elapsed: np.ndarray
+    is_transition: np.ndarray
+    trigger: np.ndarray
+    points_scored: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.team_id)
+
+    def to_possessions(self, cols: PlayByPlayColumns) -> list[TransitionPossession]:
+        """Materialize :class:`TransitionPossession` objects, actions included."""
+        live = cols.team_id != 0
+        return [
+            TransitionPossession(
+                team_id=team_id,
+                period=period,
+                game_clock=game_clock,
+                elapsed=elapsed,
+                classification="transition" if transition else "halfcourt",
+                trigger=_TRIGGERS[trigger],
+                actions=tuple(cols.action(i) for i in range(start, stop) if live[i]),
+                points_scored=points,
+            )
+            for (
+                start,
+                stop,
+                team_id,
+                period,
+                game_clock,
+                elapsed,
+                transition,
+                trigger,
+                points,
+            ) in zip(
+                self.start_row.tolist(),
+                self.stop_row.tolist(),
+                self.team_id.tolist(),
+                self.period.tolist(),
+                self.game_clock.tolist(),
+                self.elapsed.tolist(),
+                self.is_transition.tolist(),
+                self.trigger.tolist(),
+                self.points_scored.tolist(),
+                strict=True,
+            )
+        ]
+
+
 @dataclass(frozen=True, slots=True)
 class TransitionSummary:
     """Frequency breakdown of transition vs half-court possessions."""
@@ -123,7 +205,7 @@ def _finalize_possession(
     first_fga_elapsed: float | None = None
     for a in state.actions:
         if a.isFieldGoal == 1:
-            first_fga_elapsed = elapsed_game_seconds(a.clock, a.period, league=league)
+            first_fga_elapsed = action_elapsed_seconds(a, league=league)
             break
 
     classification: Classification
@@ -134,7 +216,7 @@ def _finalize_possession(
         elapsed = 0.0
         classification = "halfcourt"
 
-    points = sum(_action_points(a) for a in state.actions)
+    points = sum(action_points(a) for a in state.actions)
 
     return TransitionPossession(
         team_id=state.team_id,
@@ -160,12 +242,19 @@ def _is_made_ft(action: PlayByPlayAction) -> bool:
     # FT is worth exactly 1 point regardless of the "N of M" / technical subtype.
     if action.actionType.lower() != "free throw":
         return False
-    desc = action.description
+    return _is_made_ft_description(action.description)
+
+
+def _is_made_ft_description(desc: str) -> bool:
     return "(" in desc and "PTS)" in desc and not desc.lstrip().startswith("MISS")
 
 
-def _action_points(action: PlayByPlayAction) -> int:
-    """Points scored by a single action (made FG worth shotValue, made FT worth 1)."""
+def action_points(action: PlayByPlayAction) -> int:
+    """Points scored by a single action (made FG worth shotValue, made FT worth 1).
+
+    Free throws carry no ``shotResult`` on live playbyplayv3, so a made FT is
+    read from its description (``"... (N PTS)"``, not starting ``"MISS "``).
+    """
     if _is_made_fg(action):
         return action.shotValue
     if _is_made_ft(action):
@@ -240,15 +329,15 @@ def _end_possession(  # noqa: PLR0913, PLR0917
     _flush(state, possessions, transition_window, league)
     return _PossessionState(
         period=state.period,
-        start_elapsed=elapsed_game_seconds(action.clock, action.period, league=league),
+        start_elapsed=action_elapsed_seconds(action, league=league),
         trigger=trigger,
     )
 
 
 def classify_possessions(
-    actions: list[PlayByPlayAction],
+    actions: list[PlayByPlayAction] | PlayByPlayColumns,
     *,
-    transition_window: float = _TRANSITION_WINDOW,
+    transition_window: float = TRANSITION_WINDOW,
     league: League = League.NBA,
 ) -> list[TransitionPossession]:
     """Classify possessions as transition or halfcourt based on play-by-play timing.
@@ -276,7 +365,10 @@ def classify_possessions(
 
     Args:
         actions: Play-by-play actions, typically from
-            :func:`~fastbreak.games.get_play_by_play`.
+            :func:`~fastbreak.games.get_play_by_play`, or a
+            :class:`~fastbreak.play_by_play_columns.PlayByPlayColumns`
+            (classified by :func:`classify_possession_arrays`, game by game;
+            only each possession's ``actions`` are built as models).
         transition_window: Seconds threshold for transition classification
             (default ``8.0``).
 
@@ -285,6 +377,10 @@ def classify_possessions(
         possession.
 
     """
+    if isinstance(actions, PlayByPlayColumns):
+        return classify_possession_arrays(
+            actions, transition_window=transition_window, league=league
+        ).to_possessions(actions)
     if not actions:
         return []
 
@@ -303,9 +399,7 @@ def classify_possessions(
             state = _PossessionState(
                 period=action.period,
                 team_id=action.teamId,
-                start_elapsed=elapsed_game_seconds(
-                    action.clock, action.period, league=league
-                ),
+                start_elapsed=action_elapsed_seconds(action, league=league),
                 trigger="start_of_period",
             )
 
@@ -329,9 +423,7 @@ def classify_possessions(
             state = _PossessionState(
                 period=state.period,
                 team_id=action.teamId,
-                start_elapsed=elapsed_game_seconds(
-                    action.clock, action.period, league=league
-                ),
+                start_elapsed=action_elapsed_seconds(action, league=league),
                 trigger="defensive_rebound",
                 actions=[action],
             )
@@ -346,6 +438,152 @@ def classify_possessions(
     return possessions
 
 
+def _string_mask(
+    cols: PlayByPlayColumns, codes: np.ndarray, predicate: Callable[[str], bool]
+) -> np.ndarray:
+    """Evaluate *predicate* once per distinct string in a coded column."""
+    uniq, inv = np.unique(codes, return_inverse=True)
+    hits = np.array([predicate(cols.strings[c]) for c in uniq.tolist()], dtype=bool)
+    return hits[inv].reshape(-1)
+
+
+def _action_masks(
+    cols: PlayByPlayColumns, rows: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-action masks for *rows*: ``(ender, ender_trigger, rebound, points)``.
+
+    ``rebound`` marks non-offensive rebounds that do not also end the
+    possession, i.e. the candidates for a defensive-rebound change.
+    """
+    action_type = cols.action_type[rows]
+    sub_type = cols.sub_type[rows]
+    made_fg = (cols.is_field_goal[rows] == 1) & (
+        cols.shot_result[rows] == cols.code("Made")
+    )
+    made_ft = _string_mask(
+        cols, action_type, lambda s: s.lower() == "free throw"
+    ) & _string_mask(cols, cols.description[rows], _is_made_ft_description)
+    final_ft = made_ft & _string_mask(
+        cols, sub_type, lambda s: _FINAL_FT_SUBTYPE.match(s) is not None
+    )
+    turnover = _string_mask(cols, action_type, lambda s: s.lower() == "turnover")
+    ender = made_fg | final_ft | turnover
+    ender_trigger = np.select(
+        [made_fg, final_ft], [_MADE_FG, _MADE_FT], default=_TURNOVER
+    )
+    rebound = (
+        _string_mask(cols, action_type, lambda s: s.lower() == "rebound")
+        & _string_mask(cols, sub_type, lambda s: s.lower() != "offensive")
+        & ~ender
+    )
+    points = np.select([made_fg, made_ft], [cols.shot_value[rows], 1], default=0)
+
+    return ender, ender_trigger, rebound, points
+
+
+def classify_possession_arrays(
+    cols: PlayByPlayColumns,
+    *,
+    transition_window: float = TRANSITION_WINDOW,
+    league: League | None = None,
+) -> PossessionArrays:
+    """Vectorized :func:`classify_possessions` over columnar play-by-play.
+
+    Produces the same possessions as the state machine, without building
+    an object per action:
+
+    * made FGs, made final FTs and turnovers are boolean masks, with string
+      tests run once per distinct string rather than once per action;
+    * possessions split at period changes and after each possession-ending
+      action.  Within such a run, the team holding the ball before a
+      non-offensive rebound is the team of the previous rebound (or of the
+      run's first action), so defensive rebounds are a shifted comparison;
+    * the first FGA, points and start time per possession come from
+      segment reductions over the possession index.
+
+    Each game in *cols* is classified independently.
+
+    Args:
+        cols: Play-by-play columns for one or more games.
+        transition_window: Seconds threshold for transition classification
+            (default ``8.0``).
+        league: League for quarter lengths; defaults to ``cols.league``.
+
+    Returns:
+        A columnar :class:`PossessionArrays`.
+
+    """
+    elapsed_all = cols.elapsed_seconds(league)
+    rows = np.flatnonzero(cols.team_id != 0)
+    game = np.repeat(np.arange(cols.n_games), np.diff(cols.offsets))[rows]
+    team = cols.team_id[rows]
+    period = cols.period[rows].astype(np.int64)
+    elapsed = elapsed_all[rows]
+
+    ender, ender_trigger, rebound, points = _action_masks(cols, rows)
+
+    n = len(rows)
+    new_game = np.ones(n, dtype=bool)
+    new_game[1:] = game[1:] != game[:-1]
+    prev_period = np.zeros(n, dtype=np.int64)
+    prev_period[1:] = period[:-1]
+    period_change = period != np.where(new_game, 0, prev_period)
+    after_ender = np.zeros(n, dtype=bool)
+    after_ender[1:] = ender[:-1] & ~new_game[1:]
+    run_start = new_game | period_change | after_ender
+
+    # A rebound that is not itself a possession ender is defensive when its
+    # team differs from the previous rebound's (or the run's first action's).
+    ref = np.flatnonzero(run_start | rebound)
+    defensive = np.zeros(n, dtype=bool)
+    if len(ref) > 1:
+        changed = team[ref[1:]] != team[ref[:-1]]
+        defensive[ref[1:]] = changed & rebound[ref[1:]] & ~run_start[ref[1:]]
+
+    start = run_start | defensive
+    first = np.flatnonzero(start)
+    possession = np.cumsum(start) - 1
+    n_poss = len(first)
+    last = np.append(first, n)[1:] - 1
+
+    trigger = np.full(n_poss, _START_OF_PERIOD, dtype=np.int8)
+    start_elapsed = np.where(period_change[first], elapsed[first], 0.0)
+    from_ender = after_ender[first] & ~period_change[first]
+    trigger[from_ender] = ender_trigger[first[from_ender] - 1]
+    start_elapsed[from_ender] = elapsed[first[from_ender] - 1]
+    from_rebound = defensive[first]
+    trigger[from_rebound] = _DEFENSIVE_REBOUND
+    start_elapsed[from_rebound] = elapsed[first[from_rebound]]
+
+    fga = np.flatnonzero(cols.is_field_goal[rows] == 1)
+    fga_poss, fga_first = np.unique(possession[fga], return_index=True)
+    has_fga = np.zeros(n_poss, dtype=bool)
+    has_fga[fga_poss] = True
+    to_fga = np.zeros(n_poss, dtype=np.float64)
+    to_fga[fga_poss] = elapsed[fga[fga_first]] - start_elapsed[fga_poss]
+
+    poss_period = period[first]
+    period_end = elapsed_seconds_array(
+        poss_period,
+        np.zeros(n_poss),
+        league=cols.league if league is None else league,
+    )
+    return PossessionArrays(
+        game_index=game[first],
+        start_row=rows[first],
+        stop_row=rows[last] + 1,
+        team_id=team[first],
+        period=poss_period,
+        game_clock=period_end - start_elapsed,
+        elapsed=to_fga,
+        is_transition=has_fga & (to_fga <= transition_window),
+        trigger=trigger,
+        points_scored=np.bincount(possession, weights=points, minlength=n_poss).astype(
+            np.int64
+        ),
+    )
+
+
 def transition_frequency(
     possessions: list[TransitionPossession],
 ) -> TransitionSummary:
@@ -410,7 +648,7 @@ async def get_transition_stats(
     client: BaseClient,
     game_id: str,
     *,
-    transition_window: float = _TRANSITION_WINDOW,
+    transition_window: float = TRANSITION_WINDOW,
 ) -> TransitionAnalysis:
     """Fetch play-by-play and return a full transition analysis for one game.
 
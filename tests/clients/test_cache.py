@@ -0,0 +1,232 @@
+"""Tests for fastbreak.clients.cache (shared response cache backends)."""
+
+import json
+import multiprocessing
+import sqlite3
+
+import pytest
+from pytest_mock import MockerFixture
+
+from fastbreak.clients import CacheBackend, SQLiteCacheBackend
+from fastbreak.endpoints import PlayByPlay
+from fastbreak.models import PlayByPlayResponse
+
+
+@pytest.fixture
+def mock_play_by_play_response(sample_action_data):
+    """Minimal play-by-play payload with a single action."""
+    return {
+        "meta": {"version": 1, "request": "", "time": "2026-01-15T12:10:24.1024Z"},
+        "game": {
+            "gameId": "0022500571",
+            "videoAvailable": 1,
+            "actions": [sample_action_data],
+        },
+    }
+
+
+class TestSQLiteCacheBackend:
+    def test_satisfies_protocol(self, tmp_path):
+        assert isinstance(SQLiteCacheBackend(tmp_path / "c.db", ttl=60), CacheBackend)
+
+    @pytest.mark.parametrize("ttl", [0, -5])
+    def test_rejects_nonpositive_ttl(self, tmp_path, ttl):
+        with pytest.raises(ValueError, match="ttl must be positive"):
+            SQLiteCacheBackend(tmp_path / "c.db", ttl=ttl)
+
+    def test_rejects_zero_maxsize(self, tmp_path):
+        with pytest.raises(ValueError, match="maxsize must be"):
+            SQLiteCacheBackend(tmp_path / "c.db", ttl=60, maxsize=0)
+
+    def test_uses_wal_journal(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        mode = backend._connect().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    async def test_roundtrip(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        assert await backend.get("k") is None
+        await backend.set("k", b"payload")
+        assert await backend.get("k") == b"payload"
+        assert len(backend) == 1
+
+    async def test_set_replaces(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        await backend.set("k", b"old")
+        await backend.set("k", b"new")
+        assert await backend.get("k") == b"new"
+        assert len(backend) == 1
+
+    async def test_expired_entries_are_misses(self, tmp_path, mocker: MockerFixture):
+        clock = mocker.patch("fastbreak.clients.cache.time.time", return_value=1000.0)
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=10)
+        await backend.set("k", b"v")
+        clock.return_value = 1010.0
+        assert await backend.get("k") is None
+        assert len(backend) == 0
+
+    async def test_maxsize_evicts_oldest(self, tmp_path, mocker: MockerFixture):
+        clock = mocker.patch("fastbreak.clients.cache.time.time", return_value=1000.0)
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60, maxsize=2)
+        for i, key in enumerate(("a", "b", "c")):
+            clock.return_value = 1000.0 + i
+            await backend.set(key, key.encode())
+        assert await backend.get("a") is None
+        assert await backend.get("b") == b"b"
+        assert await backend.get("c") == b"c"
+
+    async def test_clear(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        await backend.set("k", b"v")
+        await backend.clear()
+        assert len(backend) == 0
+
+    async def test_instances_share_file(self, tmp_path):
+        """A second backend on the same file (another worker) sees the entry."""
+        writer = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        reader = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        await writer.set("k", b"v")
+        assert await reader.get("k") == b"v"
+
+    async def test_close_closes_every_thread_connection(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        await backend.set("k", b"v")
+        assert await backend.get("k") == b"v"
+        connections = list(backend._connections)
+        assert len(connections) >= 2  # __init__ thread + worker thread(s)
+
+        await backend.aclose()
+
+        assert backend._connections == []
+        for conn in connections:
+            with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+                conn.execute("SELECT 1")
+
+    async def test_reopens_after_close(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        await backend.set("k", b"v")
+        backend.close()
+        assert await backend.get("k") == b"v"
+        assert len(backend) == 1
+
+    def test_concurrent_process_writers(self, tmp_path):
+        """Several processes writing at once never lose or corrupt entries."""
+        path = str(tmp_path / "c.db")
+        SQLiteCacheBackend(path, ttl=60)
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=_write_many, args=(path, w)) for w in range(4)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=60)
+            assert p.exitcode == 0
+
+        backend = SQLiteCacheBackend(path, ttl=60)
+        assert len(backend) == 4 * 25
+        assert backend._get("w3:k24") == b"3-24"
+
+
+def _write_many(path: str, worker: int) -> None:
+    backend = SQLiteCacheBackend(path, ttl=60)
+    for i in range(25):
+        backend._set(f"w{worker}:k{i}", f"{worker}-{i}".encode())
+
+
+class TestClientSharedCache:
+    async def test_fresh_response_written_to_backend(
+        self, tmp_path, make_mock_client, mock_play_by_play_response
+    ):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        client, _ = make_mock_client(
+            json_data=mock_play_by_play_response, cache_backend=backend
+        )
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        await client.get(endpoint)
+
+        stored = await backend.get(client._make_cache_key(endpoint))
+        assert json.loads(stored) == mock_play_by_play_response
+
+    async def test_backend_hit_skips_network(
+        self, tmp_path, make_mock_client, mock_play_by_play_response
+    ):
+        """A payload written by another process serves this client."""
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        client, mock_session = make_mock_client(
+            json_data=None, cache_ttl=60, cache_backend=backend
+        )
+        endpoint = PlayByPlay(game_id="0022500571")
+        await backend.set(
+            client._make_cache_key(endpoint),
+            json.dumps(mock_play_by_play_response).encode(),
+        )
+
+        result = await client.get(endpoint)
+
+        assert isinstance(result, PlayByPlayResponse)
+        assert result.game.gameId == "0022500571"
+        mock_session.get.assert_not_called()
+        # Promoted into the in-memory tier
+        assert client.cache_info["size"] == 1
+
+    async def test_backend_without_memory_cache(
+        self, tmp_path, make_mock_client, mock_play_by_play_response
+    ):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        client, mock_session = make_mock_client(
+            json_data=mock_play_by_play_response, cache_backend=backend
+        )
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        await client.get(endpoint)
+        await client.get(endpoint)
+
+        assert mock_session.get.call_count == 1
+        assert client.cache_info is None
+
+    async def test_invalid_payload_is_a_miss(
+        self, tmp_path, make_mock_client, mock_play_by_play_response
+    ):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        client, mock_session = make_mock_client(
+            json_data=mock_play_by_play_response, cache_backend=backend
+        )
+        endpoint = PlayByPlay(game_id="0022500571")
+        key = client._make_cache_key(endpoint)
+        await backend.set(key, b"{not json")
+
+        result = await client.get(endpoint)
+
+        assert result.game.gameId == "0022500571"
+        assert mock_session.get.call_count == 1
+        assert json.loads(await backend.get(key)) == mock_play_by_play_response
+
+    async def test_clear_cache_clears_backend(self, tmp_path, make_mock_client):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        client, _ = make_mock_client(cache_backend=backend)
+        await backend.set("k", b"v")
+
+        await client.clear_cache()
+
+        assert len(backend) == 0
+
+    async def test_client_close_closes_backend(
+        self, tmp_path, make_mock_client, mocker: MockerFixture
+    ):
+        backend = SQLiteCacheBackend(tmp_path / "c.db", ttl=60)
+        aclose = mocker.spy(backend, "aclose")
+        client, _ = make_mock_client(cache_backend=backend)
+
+        await client.close()
+
+        aclose.assert_awaited_once()
+        assert backend._connections == []
+
+    async def test_client_close_without_backend_aclose(
+        self, make_mock_client, mocker: MockerFixture
+    ):
+        """Backends implementing only the protocol methods are left alone."""
+        backend = mocker.create_autospec(CacheBackend, instance=True)
+        client, _ = make_mock_client(cache_backend=backend)
+
+        await client.close()
@@ -9,7 +9,7 @@ from pydantic import ValidationError
 from pytest_mock import MockerFixture
 from tenacity import RetryCallState
 
-from fastbreak.clients.base import BaseClient
+from fastbreak.clients.base import BaseClient, CircuitOpenError, _CircuitBreaker
 from fastbreak.clients.nba import (
     BATCH_PROGRESS_THRESHOLD,
     HTTP_SERVER_ERROR_MIN,
@@ -909,6 +909,255 @@ class TestNBAClientRetry:
         assert client._retry_wait_max == 30.0
 
 
+class TestCircuitBreaker:
+    """Tests for the per-endpoint _CircuitBreaker state machine."""
+
+    def test_unknown_key_is_closed(self):
+        """A path with no recorded failures admits requests."""
+        breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+        breaker.before_request("playbyplayv3")
+        assert breaker.info() == {}
+
+    def test_opens_after_threshold(self):
+        """Consecutive failures at the threshold open the circuit."""
+        breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+        assert breaker.record_failure("a") is False
+        assert breaker.record_failure("a") is True
+        assert breaker.info()["a"] == {"state": "open", "failures": 2, "trips": 1}
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request("a")
+        assert exc_info.value.path == "a"
+        assert 0.0 < exc_info.value.retry_in <= 30.0
+
+    def test_circuits_are_independent_per_key(self):
+        """An open circuit on one path does not affect other paths."""
+        breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+        breaker.record_failure("broken")
+        breaker.before_request("healthy")
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("broken")
+
+    def test_success_resets_failure_count(self):
+        """A success between failures prevents the circuit from opening."""
+        breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+        breaker.record_failure("a")
+        breaker.record_success("a")
+        assert breaker.record_failure("a") is False
+        assert breaker.info()["a"]["state"] == "closed"
+
+    def test_half_open_admits_single_probe(self, mocker: MockerFixture):
+        """After the reset timeout exactly one probe is admitted."""
+        clock = mocker.patch("fastbreak.clients.base.time.monotonic", return_value=0.0)
+        breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+        breaker.record_failure("a")
+
+        clock.return_value = 10.0
+        breaker.before_request("a")
+        assert breaker.info()["a"]["state"] == "half_open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("a")
+
+    def test_half_open_success_closes(self, mocker: MockerFixture):
+        """A successful probe closes the circuit."""
+        clock = mocker.patch("fastbreak.clients.base.time.monotonic", return_value=0.0)
+        breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+        breaker.record_failure("a")
+        clock.return_value = 11.0
+        breaker.before_request("a")
+        breaker.record_success("a")
+        assert breaker.info()["a"] == {"state": "closed", "failures": 0, "trips": 1}
+        breaker.before_request("a")
+
+    def test_half_open_failure_reopens(self, mocker: MockerFixture):
+        """A failed probe re-opens the circuit for another reset timeout."""
+        clock = mocker.patch("fastbreak.clients.base.time.monotonic", return_value=0.0)
+        breaker = _CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+        for _ in range(3):
+            breaker.record_failure("a")
+        clock.return_value = 10.0
+        breaker.before_request("a")
+        assert breaker.record_failure("a") is True
+        assert breaker.info()["a"]["trips"] == 2
+        clock.return_value = 15.0
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("a")
+
+    def test_release_frees_probe_slot(self, mocker: MockerFixture):
+        """A released probe lets the next caller probe."""
+        clock = mocker.patch("fastbreak.clients.base.time.monotonic", return_value=0.0)
+        breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+        breaker.record_failure("a")
+        clock.return_value = 10.0
+        breaker.before_request("a")
+        breaker.release("a")
+        breaker.before_request("a")
+
+
+class TestNBAClientCircuitBreaker:
+    """Tests for circuit breaking wired into NBAClient.get()."""
+
+    def test_disabled_by_default(self):
+        """Circuit breaking is off unless a threshold is configured."""
+        client = NBAClient()
+        assert client._circuit_breaker is None
+        assert client.circuit_info is None
+
+    def test_enabled_with_threshold(self):
+        """A positive threshold enables the breaker with the given timeout."""
+        client = NBAClient(circuit_failure_threshold=3, circuit_reset_timeout=5.0)
+        assert client._circuit_breaker is not None
+        assert client._circuit_breaker.failure_threshold == 3
+        assert client._circuit_breaker.reset_timeout == 5.0
+        assert client.circuit_info == {}
+
+    async def test_open_circuit_fails_fast(
+        self, make_client_response_error, mocker: MockerFixture
+    ):
+        """Once open, requests raise CircuitOpenError without hitting the network."""
+        error = make_client_response_error(500)
+        mock_response = _make_mock_response(mocker, status=500, raise_error=error)
+        mock_session = mocker.MagicMock(spec=ClientSession)
+        mock_session.get = mocker.MagicMock(return_value=mock_response)
+
+        client = NBAClient(
+            session=mock_session,
+            max_retries=5,
+            retry_wait_min=0.01,
+            retry_wait_max=0.02,
+            circuit_failure_threshold=2,
+        )
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        # Two failed attempts trip the circuit; the third attempt is refused
+        # and stops the retry loop instead of burning the remaining retries.
+        with pytest.raises(CircuitOpenError):
+            await client.get(endpoint)
+        assert mock_session.get.call_count == 2
+        assert client.circuit_info == {
+            "playbyplayv3": {"state": "open", "failures": 2, "trips": 1}
+        }
+
+        with pytest.raises(CircuitOpenError):
+            await client.get(endpoint)
+        assert mock_session.get.call_count == 2
+
+    async def test_rate_limit_does_not_trip_circuit(
+        self, make_client_response_error, mocker: MockerFixture
+    ):
+        """429 responses are a rate problem, not an endpoint failure."""
+        error = make_client_response_error(429)
+        mock_response = _make_mock_response(mocker, status=429, raise_error=error)
+        mock_session = mocker.MagicMock(spec=ClientSession)
+        mock_session.get = mocker.MagicMock(return_value=mock_response)
+
+        client = NBAClient(
+            session=mock_session,
+            max_retries=2,
+            retry_wait_min=0.01,
+            retry_wait_max=0.02,
+            circuit_failure_threshold=1,
+        )
+
+        with pytest.raises(ClientResponseError):
+            await client.get(PlayByPlay(game_id="0022500571"))
+        assert mock_session.get.call_count == 3
+        assert client.circuit_info == {}
+
+    async def test_rate_limit_does_not_reset_failure_count(
+        self, make_client_response_error, mocker: MockerFixture
+    ):
+        """A 429 between server errors leaves the failure count intact."""
+        statuses = iter([503, 429, 503])
+
+        def side_effect(*args, **kwargs):
+            status = next(statuses)
+            error = make_client_response_error(status)
+            return _make_mock_response(mocker, status=status, raise_error=error)
+
+        mock_session = mocker.MagicMock(spec=ClientSession)
+        mock_session.get = mocker.MagicMock(side_effect=side_effect)
+        client = NBAClient(
+            session=mock_session,
+            max_retries=5,
+            retry_wait_min=0.01,
+            retry_wait_max=0.02,
+            circuit_failure_threshold=2,
+        )
+
+        with pytest.raises(CircuitOpenError):
+            await client.get(PlayByPlay(game_id="0022500571"))
+        assert mock_session.get.call_count == 3
+        assert client.circuit_info == {
+            "playbyplayv3": {"state": "open", "failures": 2, "trips": 1}
+        }
+
+    async def test_rate_limited_probe_keeps_circuit_half_open(
+        self, make_client_response_error, mocker: MockerFixture
+    ):
+        """A 429 on the half-open probe neither closes nor re-opens the circuit."""
+        error = make_client_response_error(429)
+        mock_response = _make_mock_response(mocker, status=429, raise_error=error)
+        mock_session = mocker.MagicMock(spec=ClientSession)
+        mock_session.get = mocker.MagicMock(return_value=mock_response)
+        client = NBAClient(
+            session=mock_session,
+            max_retries=0,
+            circuit_failure_threshold=1,
+            circuit_reset_timeout=10.0,
+        )
+        breaker = client._circuit_breaker
+        breaker.record_failure("playbyplayv3")
+        breaker._circuits["playbyplayv3"].opened_at -= 10.0
+
+        with pytest.raises(ClientResponseError):
+            await client.get(PlayByPlay(game_id="0022500571"))
+
+        assert client.circuit_info == {
+            "playbyplayv3": {"state": "half_open", "failures": 1, "trips": 1}
+        }
+        # The probe slot was released, so the next caller may probe again.
+        breaker.before_request("playbyplayv3")
+
+    async def test_success_closes_circuit(
+        self,
+        mock_play_by_play_response,
+        make_client_response_error,
+        mocker: MockerFixture,
+    ):
+        """A success after failures resets the endpoint's failure count."""
+        call_count = 0
+
+        def side_effect(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                error = make_client_response_error(503)
+                return _make_mock_response(mocker, status=503, raise_error=error)
+            return _make_mock_response(mocker, json_data=mock_play_by_play_response)
+
+        mock_session = mocker.MagicMock(spec=ClientSession)
+        mock_session.get = mocker.MagicMock(side_effect=side_effect)
+        client = NBAClient(
+            session=mock_session,
+            retry_wait_min=0.01,
+            retry_wait_max=0.02,
+            circuit_failure_threshold=2,
+        )
+
+        result = await client.get(PlayByPlay(game_id="0022500571"))
+
+        assert isinstance(result, PlayByPlayResponse)
+        assert client.circuit_info["playbyplayv3"]["state"] == "closed"
+        assert client.circuit_info["playbyplayv3"]["failures"] == 0
+
+    def test_reset_circuits(self):
+        """reset_circuits() closes every circuit."""
+        client = NBAClient(circuit_failure_threshold=1)
+        client._circuit_breaker.record_failure("playbyplayv3")
+        client.reset_circuits()
+        assert client.circuit_info == {}
+
+
 class TestNBAClientGetMany:
     """Tests for the get_many batch fetch method."""
 
@@ -1338,6 +1587,185 @@ class TestNBAClientCaching:
         assert key1 != key2  # Different params = different key
 
 
+class TestNBAClientRevalidation:
+    """Tests for ETag/Last-Modified conditional refreshes."""
+
+    @staticmethod
+    def _client(mocker, responses, **kwargs):
+        mock_session = mocker.MagicMock(spec=ClientSession)
+        mock_session.get = mocker.MagicMock(side_effect=responses)
+        return NBAClient(session=mock_session, revalidate=True, **kwargs), mock_session
+
+    def test_disabled_by_default(self):
+        assert NBAClient()._validators is None
+
+    async def test_first_request_is_unconditional(
+        self, mock_play_by_play_response, mocker: MockerFixture
+    ):
+        ok = _make_mock_response(
+            mocker, json_data=mock_play_by_play_response, headers={"ETag": '"v1"'}
+        )
+        client, mock_session = self._client(mocker, [ok])
+
+        await client.get(PlayByPlay(game_id="0022500571"))
+
+        assert mock_session.get.call_args.kwargs["headers"] is None
+
+    async def test_304_reuses_stored_body(
+        self, mock_play_by_play_response, mocker: MockerFixture
+    ):
+        """A 304 returns the previously parsed body without reading a new one."""
+        ok = _make_mock_response(
+            mocker, json_data=mock_play_by_play_response, headers={"ETag": '"v1"'}
+        )
+        not_modified = _make_mock_response(mocker, status=304)
+        client, mock_session = self._client(mocker, [ok, not_modified])
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        first = await client.get(endpoint)
+        second = await client.get(endpoint)
+
+        assert second is first
+        assert mock_session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        not_modified.json.assert_not_called()
+
+    async def test_last_modified_sent_as_if_modified_since(
+        self, mock_play_by_play_response, mocker: MockerFixture
+    ):
+        stamp = "Wed, 15 Jan 2026 12:00:00 GMT"
+        ok = _make_mock_response(
+            mocker,
+            json_data=mock_play_by_play_response,
+            headers={"ETag": '"v1"', "Last-Modified": stamp},
+        )
+        not_modified = _make_mock_response(mocker, status=304)
+        client, mock_session = self._client(mocker, [ok, not_modified])
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        await client.get(endpoint)
+        await client.get(endpoint)
+
+        assert mock_session.get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": stamp,
+        }
+
+    async def test_200_replaces_validators(
+        self, mock_play_by_play_response, mocker: MockerFixture
+    ):
+        v1 = _make_mock_response(
+            mocker, json_data=mock_play_by_play_response, headers={"ETag": '"v1"'}
+        )
+        v2 = _make_mock_response(
+            mocker, json_data=mock_play_by_play_response, headers={"ETag": '"v2"'}
+        )
+        not_modified = _make_mock_response(mocker, status=304)
+        client, mock_session = self._client(mocker, [v1, v2, not_modified])
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        await client.get(endpoint)
+        second = await client.get(endpoint)
+        third = await client.get(endpoint)
+
+        assert third is second
+        assert mock_session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v2"'}
+
+    async def test_no_validators_means_no_conditional_request(
+        self, mock_play_by_play_response, mocker: MockerFixture
+    ):
+        responses = [
+            _make_mock_response(mocker, json_data=mock_play_by_play_response)
+            for _ in range(2)
+        ]
+        client, mock_session = self._client(mocker, responses)
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        await client.get(endpoint)
+        await client.get(endpoint)
+
+        assert mock_session.get.call_args.kwargs["headers"] is None
+        assert len(client._validators) == 0
+
+    async def test_304_refreshes_memory_cache(
+        self, mock_play_by_play_response, mocker: MockerFixture
+    ):
+        ok = _make_mock_response(
+            mocker, json_data=mock_play_by_play_response, headers={"ETag": '"v1"'}
+        )
+        not_modified = _make_mock_response(mocker, status=304)
+        client, mock_session = self._client(mocker, [ok, not_modified], cache_ttl=60)
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        await client.get(endpoint)
+        await client.clear_cache()  # simulate TTL expiry
+        await client.get(endpoint)
+        await client.get(endpoint)  # served from memory again
+
+        assert mock_session.get.call_count == 2
+        assert client.cache_info["size"] == 1
+
+
+class TestNBAClientTransferStats:
+    """Tests for per-endpoint response size and timing accounting."""
+
+    def test_empty_by_default(self):
+        assert NBAClient().transfer_info == {}
+
+    async def test_records_compressed_and_decompressed_bytes(
+        self, mock_play_by_play_response, make_mock_client
+    ):
+        client, mock_session = make_mock_client(json_data=mock_play_by_play_response)
+        response = mock_session.get.return_value
+        response.read.return_value = b"x" * 4000
+        response.content.total_raw_bytes = 900
+
+        await client.get(PlayByPlay(game_id="0022500571"))
+        await client.get(PlayByPlay(game_id="0022500572"))
+
+        info = client.transfer_info["playbyplayv3"]
+        assert info["requests"] == 2
+        assert info["compressed_bytes"] == 1800
+        assert info["decompressed_bytes"] == 8000
+        assert info["read_seconds"] >= 0.0
+        assert info["decode_seconds"] >= 0.0
+
+    async def test_falls_back_to_decoded_size_without_raw_count(
+        self, mock_play_by_play_response, make_mock_client
+    ):
+        """Without a raw byte count (older aiohttp) both sizes are the body size."""
+        client, mock_session = make_mock_client(json_data=mock_play_by_play_response)
+        response = mock_session.get.return_value
+        response.read.return_value = b"x" * 123
+        response.content = object()
+
+        await client.get(PlayByPlay(game_id="0022500571"))
+
+        info = client.transfer_info["playbyplayv3"]
+        assert info["compressed_bytes"] == 123
+        assert info["decompressed_bytes"] == 123
+
+    async def test_cache_hits_not_counted(
+        self, mock_play_by_play_response, make_mock_client
+    ):
+        client, _ = make_mock_client(json_data=mock_play_by_play_response, cache_ttl=60)
+        endpoint = PlayByPlay(game_id="0022500571")
+
+        await client.get(endpoint)
+        await client.get(endpoint)
+
+        assert client.transfer_info["playbyplayv3"]["requests"] == 1
+
+    async def test_reset_transfer_stats(
+        self, mock_play_by_play_response, make_mock_client
+    ):
+        client, _ = make_mock_client(json_data=mock_play_by_play_response)
+        await client.get(PlayByPlay(game_id="0022500571"))
+
+        client.reset_transfer_stats()
+
+        assert client.transfer_info == {}
+
+
 class TestNBAClientCorrelationId:
     """Tests for correlation ID / request tracing functionality."""
 
@@ -0,0 +1,149 @@
+"""Tests for fastbreak.clients.rate_limit."""
+
+import multiprocessing
+import struct
+import time
+
+import pytest
+from aiohttp import ClientResponseError, ClientSession
+from pytest_mock import MockerFixture
+
+from fastbreak.clients import FileRateLimiter, LocalRateLimiter, NBAClient, RateLimiter
+from fastbreak.clients.rate_limit import _gcra_reserve
+from fastbreak.endpoints import PlayByPlay
+
+
+class TestGcraReserve:
+    """Tests for the GCRA reservation arithmetic."""
+
+    def test_idle_limiter_grants_immediately(self):
+        new_tat, wait = _gcra_reserve(tat=0.0, now=100.0, interval=0.5, burst=1)
+        assert wait == 0.0
+        assert new_tat == pytest.approx(100.5)
+
+    def test_back_to_back_requests_are_spaced(self):
+        tat, _ = _gcra_reserve(tat=0.0, now=100.0, interval=0.5, burst=1)
+        tat, wait = _gcra_reserve(tat=tat, now=100.0, interval=0.5, burst=1)
+        assert wait == pytest.approx(0.5)
+        assert tat == pytest.approx(101.0)
+
+    def test_burst_allows_slack(self):
+        tat = 0.0
+        waits = []
+        for _ in range(4):
+            tat, wait = _gcra_reserve(tat=tat, now=100.0, interval=1.0, burst=3)
+            waits.append(wait)
+        assert waits == [0.0, 0.0, 0.0, pytest.approx(1.0)]
+
+
+class TestValidation:
+    @pytest.mark.parametrize("cls", [LocalRateLimiter, FileRateLimiter])
+    @pytest.mark.parametrize("rate", [0, -1.0, float("nan")])
+    def test_rejects_nonpositive_rate(self, cls, rate, tmp_path):
+        args = (rate,) if cls is LocalRateLimiter else (tmp_path / "rl", rate)
+        with pytest.raises(ValueError, match="rate must be"):
+            cls(*args)
+
+    def test_rejects_zero_burst(self):
+        with pytest.raises(ValueError, match="burst must be"):
+            LocalRateLimiter(5.0, burst=0)
+
+
+class TestLocalRateLimiter:
+    def test_satisfies_protocol(self):
+        assert isinstance(LocalRateLimiter(1.0), RateLimiter)
+
+    async def test_paces_sequential_acquires(self, mocker: MockerFixture):
+        mocker.patch("fastbreak.clients.rate_limit.time.monotonic", return_value=10.0)
+        sleep = mocker.patch("fastbreak.clients.rate_limit.anyio.sleep")
+        limiter = LocalRateLimiter(4.0)
+
+        for _ in range(3):
+            await limiter.acquire()
+
+        waits = [c.args[0] for c in sleep.call_args_list]
+        assert waits == [pytest.approx(0.25), pytest.approx(0.5)]
+
+
+def _hammer(path: str, n: int, out: "multiprocessing.Queue[list[float]]") -> None:
+    limiter = FileRateLimiter(path, rate=1000.0)
+    out.put([limiter._reserve()[0] for _ in range(n)])
+
+
+class TestFileRateLimiter:
+    def test_satisfies_protocol(self, tmp_path):
+        assert isinstance(FileRateLimiter(tmp_path / "rl", 1.0), RateLimiter)
+
+    def test_state_persists_in_file(self, tmp_path):
+        path = tmp_path / "rl"
+        new_tat, _ = FileRateLimiter(path, rate=2.0)._reserve()
+        (tat,) = struct.unpack("<d", path.read_bytes())
+        assert tat == new_tat
+        assert tat == pytest.approx(time.time() + 0.5, abs=0.1)
+
+    def test_instances_share_budget(self, tmp_path):
+        """Two limiters on one file behave like one (simulates two workers)."""
+        path = tmp_path / "rl"
+        a = FileRateLimiter(path, rate=1.0)
+        b = FileRateLimiter(path, rate=1.0)
+        assert a._reserve()[1] == 0.0
+        assert b._reserve()[1] == pytest.approx(1.0, abs=0.05)
+        assert a._reserve()[1] == pytest.approx(2.0, abs=0.05)
+
+    def test_processes_never_share_a_slot(self, tmp_path):
+        """Slots reserved from concurrent processes are all distinct and spaced."""
+        path = str(tmp_path / "rl")
+        ctx = multiprocessing.get_context("fork")
+        out = ctx.Queue()
+        procs = [ctx.Process(target=_hammer, args=(path, 25, out)) for _ in range(3)]
+        for p in procs:
+            p.start()
+        tats = sorted(t for _ in procs for t in out.get(timeout=30))
+        for p in procs:
+            p.join()
+
+        # Each reservation advances the shared TAT by at least one 1ms interval,
+        # so the reserved slots are unique and spaced regardless of scheduling.
+        assert len(tats) == len(set(tats)) == 75
+        gaps = [b - a for a, b in zip(tats, tats[1:])]
+        # epoch-sized floats resolve to ~2.4e-7s, so allow a few ulps of rounding
+        assert min(gaps) >= 1 / 1000.0 - 1e-6
+
+    async def test_acquire_sleeps_for_reserved_wait(self, tmp_path, mocker):
+        sleep = mocker.patch("fastbreak.clients.rate_limit.anyio.sleep")
+        limiter = FileRateLimiter(tmp_path / "rl", rate=1.0)
+        await limiter.acquire()
+        await limiter.acquire()
+        sleep.assert_awaited_once()
+        assert sleep.call_args.args[0] == pytest.approx(1.0, abs=0.05)
+
+
+class TestClientRateLimiter:
+    async def test_client_acquires_before_each_attempt(
+        self, mocker: MockerFixture, make_client_response_error
+    ):
+        """The limiter is consulted for the first attempt and every retry."""
+        from tests.clients.test_nba import _make_mock_response
+
+        error = make_client_response_error(500)
+        mock_session = mocker.MagicMock(spec=ClientSession)
+        mock_session.get = mocker.MagicMock(
+            return_value=_make_mock_response(mocker, status=500, raise_error=error)
+        )
+        limiter = mocker.MagicMock()
+        limiter.acquire = mocker.AsyncMock()
+
+        client = NBAClient(
+            session=mock_session,
+            max_retries=2,
+            retry_wait_min=0.01,
+            retry_wait_max=0.02,
+            rate_limiter=limiter,
+        )
+        with pytest.raises(ClientResponseError):
+            await client.get(PlayByPlay(game_id="0022500571"))
+
+        assert limiter.acquire.await_count == 3
+
+    def test_no_limiter_by_default(self):
+        assert NBAClient()._rate_limiter is None
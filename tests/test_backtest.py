@@ -0,0 +1,275 @@
+"""Tests for fastbreak.backtest (projection replay and scoring)."""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from fastbreak._projection_core import resolve_opponent_def_ratings
+from fastbreak.backtest import BacktestResult, backtest_projections
+from fastbreak.model_eval import brier_score
+from fastbreak.projections import STATS, _build_stat_projection
+from fastbreak.projections_priors import STAT_PRIORS
+
+TEAMS = (1610612701, 1610612702, 1610612703, 1610612704)
+
+
+def _season(seed: int = 0, n_dates: int = 30) -> list[SimpleNamespace]:
+    """P-mode rows: four teams play in pairs every 1-3 days, bench DNPs."""
+    rng = random.Random(seed)
+    rows = []
+    day = date(2025, 10, 21)
+    for d in range(n_dates):
+        day += timedelta(days=rng.randint(1, 3))
+        order = rng.sample(TEAMS, 4)
+        for g, (home, away) in enumerate(((order[0], order[1]), (order[2], order[3]))):
+            game_id = f"00225{d:03d}{g:02d}"
+            for team, opp, sep in ((home, away, "vs."), (away, home, "@")):
+                for slot in range(3):
+                    if slot and rng.random() < 0.15:
+                        continue
+                    rows.append(
+                        SimpleNamespace(
+                            player_id=team % 100 * 10 + slot,
+                            team_id=team,
+                            game_id=game_id,
+                            game_date=f"{day.isoformat()}T00:00:00",
+                            matchup=f"T{team % 100} {sep} T{opp % 100}",
+                            pts=rng.randint(0, 35),
+                            reb=rng.randint(0, 14),
+                            ast=rng.randint(0, 10),
+                            fg3m=rng.randint(0, 6),
+                        )
+                    )
+    rng.shuffle(rows)
+    return rows
+
+
+def _teams() -> SimpleNamespace:
+    ratings = dict(zip(TEAMS, (106.0, 121.0, 112.0, 115.0), strict=True))
+    return SimpleNamespace(
+        teams=[SimpleNamespace(team_id=t, e_def_rating=r) for t, r in ratings.items()]
+    )
+
+
+def _expected(rows, result: BacktestResult, i: int, *, rolling_n: int, teams=None):
+    """Project row ``i`` with ``_build_stat_projection`` from its prior games."""
+    pid, game_id = int(result.player_id[i]), result.game_id[i]
+    mine = sorted(
+        (r for r in rows if r.player_id == pid), key=lambda r: r.game_date, reverse=True
+    )
+    idx = next(n for n, r in enumerate(mine) if r.game_id == game_id)
+    current, prior = mine[idx], mine[idx + 1 :]
+    days_rest = (
+        date.fromisoformat(current.game_date[:10])
+        - date.fromisoformat(prior[0].game_date[:10])
+    ).days - 1
+    opp_def = league_avg = 110.0
+    if teams is not None:
+        (opp,) = {r.team_id for r in rows if r.game_id == game_id} - {current.team_id}
+        opp_def, league_avg = resolve_opponent_def_ratings(teams, opp)
+    return (
+        current,
+        prior,
+        {
+            stat: _build_stat_projection(
+                stat,
+                prior,
+                rolling_n=rolling_n,
+                opp_def_rating=opp_def,
+                league_avg_def_rating=league_avg,
+                days_rest=days_rest,
+                is_home="vs." in current.matchup,
+                priors=STAT_PRIORS,
+            )
+            for stat in STATS
+        },
+    )
+
+
+class TestBacktestProjections:
+    @pytest.mark.parametrize("seed", [0, 1])
+    @pytest.mark.parametrize("with_teams", [False, True])
+    def test_matches_project_player_math(self, seed, with_teams):
+        rows = _season(seed)
+        teams = _teams() if with_teams else None
+        result = backtest_projections(
+            rows, team_metrics=teams, rolling_n=4, min_history=2, n_jobs=1
+        )
+
+        assert len(result) > 0
+        for i in range(len(result)):
+            current, prior, expected = _expected(
+                rows, result, i, rolling_n=4, teams=teams
+            )
+            assert result.history[i] == len(prior)
+            for j, stat in enumerate(STATS):
+                proj = expected[stat]
+                assert result.actual[i, j] == getattr(current, stat)
+                assert result.mean[i, j] == pytest.approx(proj.mean)
+                assert result.stdev[i, j] == pytest.approx(proj.stdev)
+                assert result.prob_over[i, j] == pytest.approx(
+                    proj.prob_over(result.line[i, j]), abs=1e-9
+                )
+
+    def test_no_look_ahead(self):
+        rows = _season()
+        last_day = max(r.game_date for r in rows)
+        base = backtest_projections(rows, n_jobs=1)
+        for r in rows:
+            if r.game_date == last_day:
+                r.pts += 50
+
+        changed = backtest_projections(rows, n_jobs=1)
+
+        np.testing.assert_array_equal(base.mean, changed.mean)
+        later = base.game_date == np.datetime64(last_day[:10])
+        assert (changed.actual[later, 0] == base.actual[later, 0] + 50).all()
+
+    def test_min_history(self):
+        rows = _season()
+        result = backtest_projections(rows, min_history=7, n_jobs=1)
+        assert result.history.min() == 7
+        per_player = {}
+        for r in rows:
+            per_player[r.player_id] = per_player.get(r.player_id, 0) + 1
+        assert len(result) == sum(max(0, n - 7) for n in per_player.values())
+
+    def test_default_line_is_half_point_over_season_mean(self):
+        result = backtest_projections(_season(), stats=("pts",), n_jobs=1)
+        assert ((result.line * 2) % 2 == 1).all()
+        assert (result.line != result.actual).all()
+
+    def test_custom_lines(self):
+        rows = _season()
+        base = backtest_projections(rows, n_jobs=1)
+        key = (base.game_id[0], int(base.player_id[0]), "reb")
+
+        result = backtest_projections(rows, lines={key: 99.5}, n_jobs=1)
+
+        assert result.line[0, 1] == 99.5
+        assert result.prob_over[0, 1] < 1e-6
+        np.testing.assert_array_equal(result.line[1:], base.line[1:])
+
+    def test_process_pool_matches_serial(self):
+        rows = _season(n_dates=40)
+        serial = backtest_projections(rows, team_metrics=_teams(), n_jobs=1)
+        pooled = backtest_projections(rows, team_metrics=_teams(), n_jobs=2)
+
+        assert pooled.game_id == serial.game_id
+        np.testing.assert_array_equal(pooled.player_id, serial.player_id)
+        np.testing.assert_allclose(pooled.mean, serial.mean)
+        np.testing.assert_allclose(pooled.prob_over, serial.prob_over)
+
+    def test_rows_without_player_id_are_ignored(self):
+        rows = _season()
+        team_row = SimpleNamespace(**{**vars(rows[0]), "player_id": None})
+        base = backtest_projections(rows, n_jobs=1)
+        assert len(backtest_projections([*rows, team_row], n_jobs=1)) == len(base)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"rolling_n": 0}, "rolling_n must be"),
+            ({"min_history": 0}, "min_history must be"),
+            ({"n_jobs": 0}, "n_jobs must be"),
+            ({"stats": ("blk",)}, "unsupported stat"),
+        ],
+    )
+    def test_validation(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            backtest_projections(_season(), **kwargs)
+
+    def test_missing_opponent_rating(self):
+        teams = _teams()
+        teams.teams[1].e_def_rating = None
+        with pytest.raises(ValueError, match="invalid e_def_rating"):
+            backtest_projections(_season(), team_metrics=teams, n_jobs=1)
+
+
+class TestScore:
+    def test_score_uses_model_eval(self):
+        result = backtest_projections(_season(), n_jobs=1)
+        score = result.score("pts")
+
+        outcomes = (result.actual[:, 0] > result.line[:, 0]).astype(int).tolist()
+        assert score.n == len(result)
+        assert score.brier == pytest.approx(
+            brier_score(result.prob_over[:, 0].tolist(), outcomes)
+        )
+        assert score.mean_absolute_error == pytest.approx(
+            np.abs(result.actual[:, 0] - result.mean[:, 0]).mean()
+        )
+        assert sum(b.count for b in score.calibration) == score.n
+
+    def test_pushes_are_excluded(self):
+        rows = _season()
+        base = backtest_projections(rows, stats=("pts",), n_jobs=1)
+        key = (base.game_id[0], int(base.player_id[0]), "pts")
+        result = backtest_projections(
+            rows, stats=("pts",), lines={key: float(base.actual[0, 0])}, n_jobs=1
+        )
+        assert result.score("pts").n == len(result) - 1
+
+    def test_scores_every_stat(self):
+        result = backtest_projections(_season(), stats=("pts", "ast"), n_jobs=1)
+        assert list(result.scores()) == ["pts", "ast"]
+        with pytest.raises(ValueError, match="was not backtested"):
+            result.score("reb")
+
+
+class TestGetProjectionBacktest:
+    async def test_single_league_game_log_request(self, mocker: MockerFixture):
+        from fastbreak.backtest import get_projection_backtest
+        from fastbreak.clients.nba import NBAClient
+        from fastbreak.endpoints import LeagueGameLog
+
+        client = NBAClient(session=mocker.MagicMock())
+        response = mocker.MagicMock()
+        response.games = _season()
+        client.get = mocker.AsyncMock(return_value=response)
+
+        result = await get_projection_backtest(client, season="2025-26", n_jobs=1)
+
+        assert isinstance(result, BacktestResult)
+        (endpoint,) = client.get.call_args.args
+        assert isinstance(endpoint, LeagueGameLog)
+        assert endpoint.player_or_team == "P"
+        assert endpoint.season == "2025-26"
+
+    async def test_forwards_backtest_arguments(self, mocker: MockerFixture):
+        from fastbreak.backtest import get_projection_backtest
+        from fastbreak.clients.nba import NBAClient
+
+        client = NBAClient(session=mocker.MagicMock())
+        response = mocker.MagicMock()
+        response.games = _season()
+        client.get = mocker.AsyncMock(return_value=response)
+        backtest = mocker.patch("fastbreak.backtest.backtest_projections")
+        lines = {("0022500001", 1, "pts"): 20.5}
+
+        await get_projection_backtest(
+            client,
+            season="2025-26",
+            stats=("pts",),
+            rolling_n=8,
+            min_history=3,
+            lines=lines,
+            n_jobs=2,
+        )
+
+        backtest.assert_called_once_with(
+            response.games,
+            team_metrics=None,
+            stats=("pts",),
+            rolling_n=8,
+            min_history=3,
+            priors=None,
+            lines=lines,
+            n_jobs=2,
+        )
@@ -0,0 +1,206 @@
+"""Tests for fastbreak.game_log_store (as-of-date columnar game logs)."""
+
+from __future__ import annotations
+
+import math
+import random
+import statistics
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from fastbreak.game_log_store import GameLogStore
+from fastbreak.metrics import ewma, hit_rate_last_n
+from fastbreak.schedule import days_rest_before_game
+
+START = date(2025, 10, 21)
+
+
+def _logs(seed: int) -> dict[int, list[tuple[date, float]]]:
+    """Chronological ``(date, pts)`` logs for a handful of players."""
+    rng = random.Random(seed)
+    logs = {}
+    for pid in rng.sample(range(1, 100), 6):
+        day = START + timedelta(days=rng.randint(0, 5))
+        games = []
+        for _ in range(rng.randint(0, 25)):
+            games.append((day, float(rng.randint(0, 40))))
+            day += timedelta(days=rng.randint(1, 4))
+        logs[pid] = games
+    return logs
+
+
+def _store(logs: dict[int, list[tuple[date, float]]]) -> GameLogStore:
+    rows = [(pid, d, v) for pid, games in logs.items() for d, v in games]
+    random.Random(0).shuffle(rows)
+    return GameLogStore(
+        [r[0] for r in rows],
+        [r[1] for r in rows],
+        {"pts": [r[2] for r in rows]},
+        game_ids=[f"{r[0]}-{r[1]}" for r in rows],
+    )
+
+
+def _queries(logs):
+    """Every known player on every date in the span, plus an unknown player."""
+    pids = [*logs, 12345]
+    days = [START + timedelta(days=k) for k in range(0, 110, 3)]
+    return [(p, d) for p in pids for d in days]
+
+
+def _before(logs, pid, day, n=None):
+    values = [v for d, v in logs.get(pid, []) if d < day]
+    return values if n is None else values[-n:]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+class TestAgainstListSlicing:
+    def test_windows(self, seed):
+        logs = _logs(seed)
+        store = _store(logs)
+        queries = _queries(logs)
+        pids, days = zip(*queries, strict=True)
+
+        for n in (None, 1, 3, 10):
+            count = store.n_games(pids, days, n)
+            total = store.rolling_sum("pts", pids, days, n)
+            mean = store.rolling_mean("pts", pids, days, n)
+            var = store.rolling_var("pts", pids, days, n)
+            hits = store.hit_rate("pts", pids, days, 20.0, n)
+            for i, (pid, day) in enumerate(queries):
+                window = _before(logs, pid, day, n)
+                assert count[i] == len(window)
+                assert total[i] == pytest.approx(sum(window))
+                if window:
+                    assert mean[i] == pytest.approx(statistics.fmean(window))
+                    assert hits[i] == pytest.approx(
+                        hit_rate_last_n(window, 20.0, n=len(window))
+                    )
+                else:
+                    assert math.isnan(mean[i])
+                    assert math.isnan(hits[i])
+                if len(window) >= 2:
+                    assert var[i] == pytest.approx(statistics.variance(window))
+                else:
+                    assert math.isnan(var[i])
+
+    def test_last_n(self, seed):
+        logs = _logs(seed)
+        store = _store(logs)
+        queries = _queries(logs)
+        pids, days = zip(*queries, strict=True)
+
+        last = store.last_n("pts", pids, days, 4)
+
+        assert last.shape == (len(queries), 4)
+        for i, (pid, day) in enumerate(queries):
+            window = _before(logs, pid, day, 4)[::-1]
+            expected = window + [math.nan] * (4 - len(window))
+            np.testing.assert_array_equal(last[i], expected)
+
+    def test_ewma(self, seed):
+        logs = _logs(seed)
+        store = _store(logs)
+        queries = _queries(logs)
+        pids, days = zip(*queries, strict=True)
+
+        got = store.ewma("pts", pids, days, span=5)
+
+        for i, (pid, day) in enumerate(queries):
+            window = _before(logs, pid, day)
+            if window:
+                assert got[i] == pytest.approx(ewma(window, span=5)[-1])
+            else:
+                assert math.isnan(got[i])
+
+    def test_days_rest(self, seed):
+        logs = _logs(seed)
+        store = _store(logs)
+        queries = _queries(logs)
+        pids, days = zip(*queries, strict=True)
+
+        got = store.days_rest(pids, days)
+
+        for i, (pid, day) in enumerate(queries):
+            prior = [d for d, _ in logs.get(pid, []) if d < day]
+            if prior:
+                assert got[i] == days_rest_before_game([*prior, day], len(prior))
+            else:
+                assert math.isnan(got[i])
+
+
+class TestGameLogStore:
+    def test_scalar_query_broadcasts(self):
+        store = _store({7: [(START, 10.0), (START + timedelta(days=2), 20.0)]})
+        assert store.rolling_mean("pts", 7, START + timedelta(days=3)).tolist() == [
+            15.0
+        ]
+        many = store.rolling_mean(
+            "pts", 7, [START, START + timedelta(days=1), "2025-10-30"]
+        )
+        assert np.isnan(many[0])
+        assert many[1:].tolist() == [10.0, 15.0]
+
+    def test_same_day_game_is_excluded(self):
+        store = _store({7: [(START, 10.0), (START + timedelta(days=1), 30.0)]})
+        assert store.rolling_mean("pts", 7, START + timedelta(days=1)).tolist() == [
+            10.0
+        ]
+
+    def test_last_n_game_ids(self):
+        logs = {7: [(START + timedelta(days=k), float(k)) for k in range(5)]}
+        store = _store(logs)
+        assert store.last_n_game_ids(7, START + timedelta(days=4), 2) == (
+            f"7-{START + timedelta(days=3)}",
+            f"7-{START + timedelta(days=2)}",
+        )
+
+    def test_from_game_logs(self):
+        rows = [
+            SimpleNamespace(
+                player_id=1, game_id="g2", game_date="2025-10-24T00:00:00", pts=30
+            ),
+            SimpleNamespace(
+                player_id=1, game_id="g1", game_date="OCT 22, 2025", pts=10
+            ),
+            SimpleNamespace(
+                player_id=None, game_id="g1", game_date="2025-10-22T00:00:00", pts=99
+            ),
+        ]
+        store = GameLogStore.from_game_logs(rows, stats=("pts",))
+
+        assert len(store) == 2
+        assert store.stats == ("pts",)
+        assert store.player_ids.tolist() == [1]
+        assert store.last_n("pts", 1, "2025-10-25", 2).tolist() == [[30.0, 10.0]]
+        assert store.last_n_game_ids(1, "2025-10-25", 5) == ("g2", "g1")
+
+    def test_empty_store(self):
+        store = GameLogStore([], [], {"pts": []})
+        assert len(store) == 0
+        assert store.n_games([1, 2], START).tolist() == [0, 0]
+        assert np.isnan(store.rolling_mean("pts", 1, START)).all()
+
+    def test_rejects_mismatched_columns(self):
+        with pytest.raises(ValueError, match="equal lengths"):
+            GameLogStore([1, 2], [START], {"pts": [1.0, 2.0]})
+
+    def test_rejects_duplicate_player_date(self):
+        with pytest.raises(ValueError, match="more than one game"):
+            GameLogStore([1, 1], [START, START], {"pts": [1.0, 2.0]})
+
+    def test_rejects_unknown_stat_and_bad_window(self):
+        store = _store(_logs(0))
+        with pytest.raises(ValueError, match="unknown stat"):
+            store.rolling_mean("blk", 1, START)
+        with pytest.raises(ValueError, match="n must be"):
+            store.rolling_mean("pts", 1, START, n=0)
+        with pytest.raises(ValueError, match="span must be"):
+            store.ewma("pts", 1, START, span=0)
+
+    def test_last_n_game_ids_requires_ids(self):
+        store = GameLogStore([1], [START], {"pts": [1.0]})
+        with pytest.raises(ValueError, match="without game_ids"):
+            store.last_n_game_ids(1, START, 1)
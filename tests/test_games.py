@@ -8,6 +8,7 @@ from pytest_mock import MockerFixture
 from fastbreak.clients.nba import NBAClient
 from fastbreak.league import League
 from fastbreak.games import (
+    action_elapsed_seconds,
     elapsed_game_seconds,
     get_box_scores,
     get_game_ids,
@@ -539,6 +540,65 @@ class TestParseClock:
 
         assert _parse_clock("PT05M00.00S") == pytest.approx(300.0)
 
+    def test_non_fixed_layout_falls_back_to_regex(self) -> None:
+        """Clocks outside the PTmmMss.ssS layout still parse (PT4M3S → 243)."""
+        from fastbreak.games import _parse_clock
+
+        assert _parse_clock("PT4M3S") == pytest.approx(243.0)
+        assert _parse_clock("PT1M30.5S") == pytest.approx(90.5)
+        assert _parse_clock("PT0aM00.00S") == pytest.approx(0.0)
+
+
+class TestActionClockSeconds:
+    """PlayByPlayAction.clock_seconds parses its current clock."""
+
+    def test_clock_seconds_parsed(self) -> None:
+        """clock_seconds holds the remaining seconds of the action's clock."""
+        assert _make_action(clock="PT04M32.50S").clock_seconds == pytest.approx(272.5)
+
+    def test_model_construct_parses_clock(self) -> None:
+        """Unvalidated construction still populates clock_seconds."""
+        action = PlayByPlayAction.model_construct(clock="PT01M00.00S")
+        assert action.clock_seconds == pytest.approx(60.0)
+
+    def test_model_copy_update_reparses_clock(self) -> None:
+        """A copy with a new clock reports the new clock's seconds."""
+        action = _make_action(clock="PT04M32.50S")
+        copy = action.model_copy(update={"clock": "PT01M00.00S"})
+        assert copy.clock_seconds == pytest.approx(60.0)
+        assert action.clock_seconds == pytest.approx(272.5)
+
+    def test_assignment_reparses_clock(self) -> None:
+        """Reassigning clock updates clock_seconds."""
+        action = _make_action(clock="PT04M32.50S")
+        action.clock = "PT00M05.00S"
+        assert action.clock_seconds == pytest.approx(5.0)
+
+    def test_not_in_model_dump(self) -> None:
+        """The parsed clock is not added to serialized output."""
+        assert "clock_seconds" not in _make_action().model_dump()
+
+    @pytest.mark.parametrize("league", [League.NBA, League.WNBA])
+    @pytest.mark.parametrize(
+        ("clock", "period"),
+        [
+            ("PT12M00.00S", 1),
+            ("PT04M32.00S", 3),
+            ("PT00M00.00S", 4),
+            ("PT02M30.00S", 6),
+            ("INVALID", 2),
+            ("PT05M00.00S", 0),
+        ],
+    )
+    def test_action_elapsed_matches_elapsed_game_seconds(
+        self, clock: str, period: int, league: League
+    ) -> None:
+        """action_elapsed_seconds agrees with elapsed_game_seconds."""
+        action = _make_action(clock=clock, period=period)
+        assert action_elapsed_seconds(action, league=league) == (
+            elapsed_game_seconds(clock, period, league=league)
+        )
+
 
 class TestGameFlow:
     """Tests for the pure game_flow() score-line computation function."""
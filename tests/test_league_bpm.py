@@ -0,0 +1,237 @@
+"""Tests for fastbreak.league_bpm (league-wide team-adjusted BPM/VORP)."""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import anyio
+import numpy as np
+import pytest
+
+from fastbreak import metrics
+from fastbreak.clients.nba import NBAClient
+from fastbreak.league_bpm import LeagueBPM, compute_league_bpm, get_league_bpm
+
+_STATS = ("pts", "fg3m", "ast", "tov", "oreb", "dreb", "stl", "blk", "pf", "fga", "fta")
+
+
+def _player(player_id, team_id, minutes, **stats):
+    base = dict.fromkeys(_STATS, 0.0)
+    base.update(stats)
+    return SimpleNamespace(
+        player_id=player_id,
+        player_name=f"Player {player_id}",
+        team_id=team_id,
+        min=minutes,
+        reb=base["oreb"] + base["dreb"],
+        **base,
+    )
+
+
+def _team(team_id, roster, *, plus_minus, gp=82):
+    totals = {s: sum(getattr(p, s) for p in roster) for s in (*_STATS, "reb")}
+    return SimpleNamespace(
+        team_id=team_id,
+        gp=gp,
+        min=sum(p.min for p in roster) / 5,
+        plus_minus=plus_minus,
+        **totals,
+    )
+
+
+def _roster(team_id, seed):
+    rng = np.random.default_rng(seed)
+    roster = []
+    for k in range(8):
+        minutes = float(rng.integers(400, 2800))
+        scale = minutes / 36
+        roster.append(
+            _player(
+                team_id * 100 + k,
+                team_id,
+                minutes,
+                pts=float(rng.integers(8, 28)) * scale,
+                fg3m=float(rng.integers(0, 4)) * scale,
+                ast=float(rng.integers(1, 9)) * scale,
+                tov=float(rng.integers(1, 4)) * scale,
+                oreb=float(rng.integers(0, 4)) * scale,
+                dreb=float(rng.integers(2, 9)) * scale,
+                stl=float(rng.integers(0, 3)) * scale,
+                blk=float(rng.integers(0, 3)) * scale,
+                pf=float(rng.integers(1, 5)) * scale,
+                fga=float(rng.integers(6, 22)) * scale,
+                fta=float(rng.integers(1, 8)) * scale,
+            )
+        )
+    return roster
+
+
+@pytest.fixture
+def league():
+    rosters = {1: _roster(1, 0), 2: _roster(2, 1), 3: _roster(3, 2)}
+    teams = [
+        _team(1, rosters[1], plus_minus=400.0),
+        _team(2, rosters[2], plus_minus=-150.0),
+        _team(3, rosters[3], plus_minus=-250.0),
+    ]
+    players = [p for roster in rosters.values() for p in roster]
+    return players, teams
+
+
+def _team_poss(team):
+    return metrics.possessions(team.fga, team.oreb, team.tov, team.fta)
+
+
+class TestComputeLeagueBPM:
+    def test_raw_matches_scalar_bpm(self, league):
+        players, teams = league
+        result = compute_league_bpm(players, teams, positions={101: 5.0})
+
+        team = teams[0]
+        p = next(p for p in players if p.player_id == 101)
+        on_court = p.min / team.min
+        on_poss = _team_poss(team) * on_court
+
+        def per_100(s):
+            return 100 * getattr(p, s) / on_poss
+
+        def share(s):
+            return getattr(p, s) / (getattr(team, s) * on_court)
+
+        expected = metrics.bpm(
+            *(per_100(s) for s in _STATS),
+            pct_team_trb=share("reb"),
+            pct_team_stl=share("stl"),
+            pct_team_pf=share("pf"),
+            pct_team_ast=share("ast"),
+            pct_team_blk=share("blk"),
+            pct_team_pts=share("pts"),
+            listed_position=5.0,
+            mp=p.min,
+        )
+        i = int(np.searchsorted(result.player_id, 101))
+        assert result.raw_bpm[i] == pytest.approx(expected.total)
+        assert result.raw_obpm[i] == pytest.approx(expected.offensive)
+
+    @pytest.mark.parametrize("scale", [1.0, 1.2])
+    def test_roster_sums_to_team_rating(self, league, scale):
+        players, teams = league
+        result = compute_league_bpm(players, teams, team_rating_scale=scale)
+
+        lg_ortg = 100 * sum(t.pts for t in teams) / sum(_team_poss(t) for t in teams)
+        for team in teams:
+            on = result.team_id == team.team_id
+            weight = result.minutes[on] / team.min
+            poss = _team_poss(team)
+            assert (weight * result.bpm[on]).sum() == pytest.approx(
+                scale * 100 * team.plus_minus / poss
+            )
+            assert (weight * result.obpm[on]).sum() == pytest.approx(
+                scale * (100 * team.pts / poss - lg_ortg)
+            )
+        np.testing.assert_allclose(result.dbpm, result.bpm - result.obpm)
+
+    def test_adjustment_is_constant_per_team(self, league):
+        players, teams = league
+        result = compute_league_bpm(players, teams)
+
+        for team in teams:
+            on = result.team_id == team.team_id
+            np.testing.assert_allclose(
+                result.bpm[on] - result.raw_bpm[on], result.team_adjustment[on]
+            )
+            assert np.ptp(result.team_adjustment[on]) == 0.0
+
+    def test_vorp_matches_scalar(self, league):
+        players, teams = league
+        result = compute_league_bpm(players, teams, season_games=40)
+
+        for row in result.to_player_bpm():
+            team = next(t for t in teams if t.team_id == row.team_id)
+            assert row.vorp == pytest.approx(
+                metrics.vorp(
+                    row.bpm.total, row.minutes / team.min, team.gp, season_games=40
+                )
+            )
+
+    def test_zero_minute_player_is_nan_and_ignored(self, league):
+        players, teams = league
+        base = compute_league_bpm(players, teams)
+        idle = _player(999, 1, 0.0)
+
+        result = compute_league_bpm([*players, idle], teams)
+
+        row = result.player(999)
+        assert row is not None
+        assert math.isnan(row.bpm.total)
+        assert math.isnan(row.vorp)
+        np.testing.assert_allclose(
+            result.bpm[result.player_id != 999], base.bpm, rtol=1e-12
+        )
+
+    def test_rows_are_sorted_and_looked_up_by_id(self, league):
+        players, teams = league
+        result = compute_league_bpm(players[::-1], teams)
+
+        assert isinstance(result, LeagueBPM)
+        assert len(result) == len(players)
+        assert result.player_id.tolist() == sorted(p.player_id for p in players)
+        row = result.player(205)
+        assert row is not None
+        assert row.player_name == "Player 205"
+        assert row.team_id == 2
+        assert result.player(12345) is None
+
+    def test_team_player_minutes_are_rescaled(self, league):
+        players, teams = league
+        as_player_minutes = [
+            SimpleNamespace(**{**vars(t), "min": 5 * t.min}) for t in teams
+        ]
+
+        base = compute_league_bpm(players, teams)
+        result = compute_league_bpm(players, as_player_minutes)
+
+        np.testing.assert_allclose(result.bpm, base.bpm)
+        np.testing.assert_allclose(result.vorp, base.vorp)
+
+    def test_rejects_player_without_team_totals(self, league):
+        players, teams = league
+        with pytest.raises(ValueError, match="no team totals"):
+            compute_league_bpm(players, teams[:2])
+
+    def test_rejects_bad_season_games(self, league):
+        players, teams = league
+        with pytest.raises(ValueError, match="season_games"):
+            compute_league_bpm(players, teams, season_games=0)
+
+
+def test_get_league_bpm_fetches_totals(mocker, league):
+    players, teams = league
+    seen = []
+
+    async def fake_get_many(self, endpoints, **kwargs):
+        from fastbreak.endpoints import LeagueDashPlayerStats, LeagueDashTeamStats
+
+        seen.extend(endpoints)
+        out = []
+        for ep in endpoints:
+            if isinstance(ep, LeagueDashPlayerStats):
+                out.append(SimpleNamespace(players=players))
+            elif isinstance(ep, LeagueDashTeamStats):
+                out.append(SimpleNamespace(teams=teams))
+            else:
+                raise RuntimeError(f"Unexpected endpoint: {type(ep).__name__}")
+        return out
+
+    mocker.patch("fastbreak.clients.nba.NBAClient.get_many", fake_get_many)
+
+    async def run():
+        async with NBAClient() as client:
+            return await get_league_bpm(client, season="2024-25")
+
+    result = anyio.run(run)
+
+    assert [ep.per_mode for ep in seen] == ["Totals", "Totals"]
+    assert {ep.season for ep in seen} == {"2024-25"}
+    np.testing.assert_allclose(result.bpm, compute_league_bpm(players, teams).bpm)
@@ -0,0 +1,288 @@
+"""Tests for fastbreak.league_win_shares (league-wide Win Shares)."""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import anyio
+import numpy as np
+import pytest
+
+from fastbreak import metrics
+from fastbreak.clients.nba import NBAClient
+from fastbreak.league_win_shares import (
+    LeagueWinShares,
+    compute_league_win_shares,
+    get_league_win_shares,
+)
+
+LG = metrics.LeagueAverages(
+    lg_pts=114.0,
+    lg_fga=88.5,
+    lg_fta=22.0,
+    lg_ftm=17.5,
+    lg_oreb=10.5,
+    lg_treb=44.0,
+    lg_ast=26.0,
+    lg_fgm=42.0,
+    lg_fg3m=13.0,
+    lg_tov=13.5,
+    lg_pf=19.5,
+)
+
+_BOX = ("fga", "fgm", "fta", "ftm", "tov", "oreb", "dreb", "stl", "blk", "pf", "pts")
+TEAMS = (1, 2, 3)
+
+
+def _team_games(seed, *, minutes=240):
+    """A round robin of team game-log rows (two per game)."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    game = 0
+    for _ in range(4):
+        for home in TEAMS:
+            for away in TEAMS:
+                if home == away:
+                    continue
+                game += 1
+                for team_id in (home, away):
+                    fga = int(rng.integers(80, 95))
+                    fta = int(rng.integers(15, 30))
+                    box = {
+                        "fga": fga,
+                        "fgm": int(rng.integers(36, 48)),
+                        "fta": fta,
+                        "ftm": int(fta * 0.78),
+                        "tov": int(rng.integers(10, 17)),
+                        "oreb": int(rng.integers(7, 14)),
+                        "dreb": int(rng.integers(30, 38)),
+                        "stl": int(rng.integers(5, 10)),
+                        "blk": int(rng.integers(3, 8)),
+                        "pf": int(rng.integers(16, 23)),
+                        "pts": int(rng.integers(100, 125)),
+                    }
+                    rows.append(
+                        SimpleNamespace(
+                            game_id=f"{game:010d}", team_id=team_id, min=minutes, **box
+                        )
+                    )
+    return rows
+
+
+def _players(seed):
+    rng = np.random.default_rng(seed)
+    players = []
+    for team_id in TEAMS:
+        for k in range(6):
+            players.append(
+                SimpleNamespace(
+                    player_id=team_id * 100 + k,
+                    player_name=f"Player {team_id * 100 + k}",
+                    team_id=team_id,
+                    min=float(rng.integers(100, 400)),
+                    **{s: float(rng.integers(0, 60)) for s in _BOX},
+                )
+            )
+    return players
+
+
+def _totals(rows, team_id):
+    own = {s: sum(getattr(r, s) for r in rows if r.team_id == team_id) for s in _BOX}
+    games = {r.game_id for r in rows if r.team_id == team_id}
+    opp = {
+        s: sum(
+            getattr(r, s) for r in rows if r.game_id in games and r.team_id != team_id
+        )
+        for s in _BOX
+    }
+    return own, opp, len(games)
+
+
+def _scalar(p, rows, *, game_minutes=48):
+    own, opp, gp = _totals(rows, p.team_id)
+    ows = metrics.offensive_win_shares(p.pts, p.fga, p.fta, p.tov, LG)
+    dws = metrics.defensive_win_shares(
+        p.stl,
+        p.blk,
+        p.dreb,
+        p.min,
+        p.pf,
+        5 * 48 * gp,
+        own["blk"],
+        own["stl"],
+        own["dreb"],
+        own["pf"],
+        opp["fga"],
+        opp["fgm"],
+        opp["fta"],
+        opp["ftm"],
+        opp["tov"],
+        opp["oreb"],
+        opp["pts"],
+        LG,
+    )
+    ws = metrics.win_shares(ows, dws)
+    return ows, dws, ws, metrics.win_shares_per_48(ws, p.min, game_minutes=game_minutes)
+
+
+class TestComputeLeagueWinShares:
+    @pytest.mark.parametrize("minutes", [240, 48])
+    def test_matches_scalar_functions(self, minutes):
+        rows = _team_games(0, minutes=minutes)
+        players = _players(1)
+
+        result = compute_league_win_shares(players, rows, LG)
+
+        assert isinstance(result, LeagueWinShares)
+        for p in players:
+            row = result.player(p.player_id)
+            assert row is not None
+            ows, dws, ws, ws48 = _scalar(p, rows)
+            assert row.ows == pytest.approx(ows)
+            assert row.dws == pytest.approx(dws)
+            assert row.ws == pytest.approx(ws)
+            assert row.ws_per_48 == pytest.approx(ws48)
+
+    def test_unpaired_game_rows_are_skipped(self):
+        rows = _team_games(0)
+        players = _players(1)
+        extra = SimpleNamespace(**{**vars(rows[0]), "game_id": "9999999999"})
+
+        base = compute_league_win_shares(players, rows, LG)
+        result = compute_league_win_shares(players, [*rows, extra], LG)
+
+        np.testing.assert_allclose(result.ws, base.ws)
+
+    def test_game_minutes_scales_ws_per_48(self):
+        rows = _team_games(0)
+        players = _players(1)
+
+        result = compute_league_win_shares(players, rows, LG, game_minutes=40)
+
+        np.testing.assert_allclose(
+            result.ws_per_48, result.ws * 40 / result.minutes, rtol=1e-12
+        )
+
+    def test_player_without_minutes(self):
+        rows = _team_games(0)
+        idle = SimpleNamespace(
+            player_id=999,
+            player_name="Idle",
+            team_id=1,
+            min=0.0,
+            **dict.fromkeys(_BOX, 0.0),
+        )
+
+        result = compute_league_win_shares([idle], rows, LG)
+
+        row = result.player(999)
+        assert row is not None
+        assert row.ows == 0.0
+        assert math.isnan(row.dws)
+        assert math.isnan(row.ws)
+        assert math.isnan(row.ws_per_48)
+
+    def test_rows_are_sorted_by_player_id(self):
+        players = _players(1)
+        result = compute_league_win_shares(players[::-1], _team_games(0), LG)
+
+        assert len(result) == len(players)
+        assert result.player_id.tolist() == sorted(p.player_id for p in players)
+        assert result.player(12345) is None
+        assert [r.player_id for r in result.to_player_win_shares()] == sorted(
+            p.player_id for p in players
+        )
+
+    def test_rejects_player_without_team_games(self):
+        rows = [r for r in _team_games(0) if r.team_id != 3]
+        with pytest.raises(ValueError, match="no team games"):
+            compute_league_win_shares(_players(1), rows, LG)
+
+
+def test_get_league_win_shares_requests(mocker):
+    rows = _team_games(0)
+    players = _players(1)
+    seen = []
+
+    async def fake_get_many(self, endpoints, **kwargs):
+        from fastbreak.endpoints import LeagueDashPlayerStats, LeagueGameLog
+
+        seen.extend(endpoints)
+        out = []
+        for ep in endpoints:
+            if isinstance(ep, LeagueDashPlayerStats):
+                out.append(SimpleNamespace(players=players))
+            elif isinstance(ep, LeagueGameLog):
+                out.append(SimpleNamespace(games=rows))
+            else:
+                raise RuntimeError(f"Unexpected endpoint: {type(ep).__name__}")
+        return out
+
+    averages = mocker.patch(
+        "fastbreak.teams.get_league_averages", mocker.AsyncMock(return_value=LG)
+    )
+    mocker.patch("fastbreak.clients.nba.NBAClient.get_many", fake_get_many)
+
+    async def run():
+        async with NBAClient() as client:
+            fetched = await get_league_win_shares(client, season="2024-25")
+            given = await get_league_win_shares(client, season="2024-25", lg=LG)
+            return fetched, given
+
+    fetched, given = anyio.run(run)
+
+    assert averages.await_count == 1
+    assert averages.await_args.args[1] == "2024-25"
+    assert averages.await_args.kwargs == {"season_type": "Regular Season"}
+    assert seen[0].per_mode == "Totals"
+    assert seen[1].player_or_team == "T"
+    expected = compute_league_win_shares(players, rows, LG)
+    np.testing.assert_allclose(fetched.ws, expected.ws)
+    np.testing.assert_allclose(given.ws, expected.ws)
+
+
+def test_get_league_win_shares_fetches_concurrently(mocker):
+    """Averages and season tables are in flight at once, for one season type."""
+    rows = _team_games(0)
+    players = _players(1)
+    tables_started = anyio.Event()
+    seen = []
+
+    async def fake_get_many(self, endpoints, **kwargs):
+        from fastbreak.endpoints import LeagueDashPlayerStats
+
+        seen.extend(endpoints)
+        tables_started.set()
+        return [
+            SimpleNamespace(players=players)
+            if isinstance(ep, LeagueDashPlayerStats)
+            else SimpleNamespace(games=rows)
+            for ep in endpoints
+        ]
+
+    async def fake_averages(client, season, *, season_type):
+        # Deadlocks (and times out) if the tables are only requested after
+        # the averages return.
+        await tables_started.wait()
+        return LG
+
+    averages = mocker.patch(
+        "fastbreak.teams.get_league_averages", side_effect=fake_averages
+    )
+    mocker.patch("fastbreak.clients.nba.NBAClient.get_many", fake_get_many)
+
+    async def run():
+        with anyio.fail_after(5):
+            async with NBAClient() as client:
+                return await get_league_win_shares(
+                    client, season="2024-25", season_type="Playoffs"
+                )
+
+    result = anyio.run(run)
+
+    assert averages.call_args.kwargs == {"season_type": "Playoffs"}
+    assert [ep.season_type for ep in seen] == ["Playoffs", "Playoffs"]
+    np.testing.assert_allclose(
+        result.ws, compute_league_win_shares(players, rows, LG).ws
+    )
@@ -1,5 +1,6 @@
 """Tests for derived basketball metrics."""
 
+import numpy as np
 import pytest
 from hypothesis import assume, given, settings, strategies as st
 
@@ -7,6 +8,7 @@ from fastbreak.metrics import (
     BPMResult,
     FourFactors,
     LeagueAverages,
+    ReferenceDistribution,
     ast_pct,
     ast_to_tov,
     bell_curve_win_pct,
@@ -3668,3 +3670,79 @@ class TestBellCurveWinPct:
         loss = bell_curve_win_pct(ppg=100 - margin, opp_ppg=100.0, std_net_pts=std)
         assert win is not None and loss is not None
         assert win + loss == pytest.approx(1.0, abs=1e-9)
+
+
+_sample = st.lists(
+    st.one_of(
+        st.none(),
+        st.integers(min_value=0, max_value=40).map(float),
+        st.floats(min_value=-50.0, max_value=50.0, allow_subnormal=False),
+    ),
+    max_size=30,
+)
+_query = st.one_of(
+    st.integers(min_value=-5, max_value=45).map(float),
+    st.floats(min_value=-60.0, max_value=60.0, allow_subnormal=False),
+)
+
+
+class TestReferenceDistribution:
+    @settings(suppress_health_check=_XDIST)
+    @given(values=_sample, queries=st.lists(_query, min_size=1, max_size=10))
+    def test_percentile_rank_matches_function(
+        self, values: list[float | None], queries: list[float]
+    ) -> None:
+        dist = ReferenceDistribution(values)
+        expected = [percentile_rank(q, values) for q in queries]
+        for q, e in zip(queries, expected, strict=True):
+            got = dist.percentile_rank(q)
+            assert got == (None if e is None else pytest.approx(e))
+        ranks = dist.percentile_ranks(queries)
+        np.testing.assert_allclose(
+            ranks, [np.nan if e is None else e for e in expected]
+        )
+
+    @settings(suppress_health_check=_XDIST)
+    @given(
+        values=_sample,
+        p=st.floats(min_value=0.0, max_value=100.0),
+        line=_query,
+    )
+    def test_summaries_match_functions(
+        self, values: list[float | None], p: float, line: float
+    ) -> None:
+        dist = ReferenceDistribution(values)
+        assert dist.floor(p) == stat_floor(values, p)
+        assert dist.ceiling(p) == stat_ceiling(values, p)
+        assert dist.median() == stat_median(values)
+        assert dist.expected() == expected_stat(values)
+        assert dist.hit_rate(line) == prop_hit_rate(values, line)
+
+    def test_excludes_none_and_nan(self) -> None:
+        dist = ReferenceDistribution(np.array([30.0, np.nan, 10.0, 20.0]))
+        assert len(dist) == 3
+        assert dist.values.tolist() == [10.0, 20.0, 30.0]
+        assert len(ReferenceDistribution([None, 5.0])) == 1
+
+    def test_values_are_read_only(self) -> None:
+        dist = ReferenceDistribution([3.0, 1.0, 2.0])
+        with pytest.raises(ValueError, match="read-only"):
+            dist.values[0] = 99.0
+
+    def test_empty(self) -> None:
+        dist = ReferenceDistribution([])
+        assert dist.percentile_rank(1.0) is None
+        assert dist.median() is None
+        assert dist.hit_rate(1.0) is None
+        assert np.isnan(dist.percentile_ranks([1.0, 2.0])).all()
+
+    def test_nan_query_ranks_nan(self) -> None:
+        ranks = ReferenceDistribution([10.0, 20.0, 30.0]).percentile_ranks(
+            [np.nan, 20.0]
+        )
+        assert np.isnan(ranks[0])
+        assert ranks[1] == 50.0
+
+    def test_rejects_out_of_range_percentile(self) -> None:
+        with pytest.raises(ValueError, match="percentile must be in"):
+            ReferenceDistribution([1.0]).floor(101.0)
@@ -0,0 +1,435 @@
+"""Property tests: fastbreak.metrics_array agrees with the scalar fastbreak.metrics.
+
+Each array function is fed random columns (with plenty of exact zeros to hit
+the division guards) and must match the scalar function applied row by row,
+with ``None`` mapped to ``NaN``.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from hypothesis import HealthCheck, given, settings, strategies as st
+
+from fastbreak import metrics, metrics_array
+from tests.strategies import XDIST_SUPPRESS as _XDIST
+
+LG = metrics.LeagueAverages(
+    lg_pts=114.0,
+    lg_fga=88.5,
+    lg_fta=22.0,
+    lg_ftm=17.5,
+    lg_oreb=10.5,
+    lg_treb=44.0,
+    lg_ast=26.0,
+    lg_fgm=42.0,
+    lg_fg3m=13.0,
+    lg_tov=13.5,
+    lg_pf=19.5,
+)
+
+# Counting stats: non-negative, with exact zeros drawn often.  Non-zero floats
+# stay above 1e-3: near-underflow inputs make the scalar formulas overflow or
+# divide by an underflowed zero, which says nothing about the array versions.
+stat = st.one_of(
+    st.just(0.0),
+    st.integers(min_value=0, max_value=60).map(float),
+    st.floats(min_value=1e-3, max_value=200.0),
+)
+# Signed inputs for functions defined on negative values too.
+signed = st.floats(min_value=-50.0, max_value=50.0, allow_subnormal=False)
+
+
+def _bpm_total(*row):
+    result = metrics.bpm(*row[:11], **dict(zip(_BPM_KW, row[11:], strict=True)))
+    return None if result is None else result.total
+
+
+def _bpm_offensive(*row):
+    result = metrics.bpm(*row[:11], **dict(zip(_BPM_KW, row[11:], strict=True)))
+    return None if result is None else result.offensive
+
+
+_BPM_KW = (
+    "pct_team_trb",
+    "pct_team_stl",
+    "pct_team_pf",
+    "pct_team_ast",
+    "pct_team_blk",
+    "pct_team_pts",
+    "listed_position",
+    "mp",
+)
+
+
+def _array_bpm(attr):
+    def run(*cols):
+        kw = dict(zip(_BPM_KW, cols[11:], strict=True))
+        return getattr(metrics_array.bpm(*cols[:11], **kw), attr)
+
+    return run
+
+
+def _with_lg(fn):
+    return lambda *cols: fn(*cols, LG)
+
+
+# (name, scalar, array, argument strategy, arity)
+CASES = [
+    ("true_shooting", metrics.true_shooting, metrics_array.true_shooting, stat, 3),
+    (
+        "effective_fg_pct",
+        metrics.effective_fg_pct,
+        metrics_array.effective_fg_pct,
+        stat,
+        3,
+    ),
+    (
+        "free_throw_rate",
+        metrics.free_throw_rate,
+        metrics_array.free_throw_rate,
+        stat,
+        2,
+    ),
+    (
+        "three_point_rate",
+        metrics.three_point_rate,
+        metrics_array.three_point_rate,
+        stat,
+        2,
+    ),
+    ("tov_pct", metrics.tov_pct, metrics_array.tov_pct, stat, 3),
+    ("ast_to_tov", metrics.ast_to_tov, metrics_array.ast_to_tov, stat, 2),
+    ("assist_ratio", metrics.assist_ratio, metrics_array.assist_ratio, stat, 4),
+    ("game_score", metrics.game_score, metrics_array.game_score, stat, 12),
+    ("nba_efficiency", metrics.nba_efficiency, metrics_array.nba_efficiency, stat, 10),
+    ("per_36", metrics.per_36, metrics_array.per_36, stat, 2),
+    ("per_40", metrics.per_40, metrics_array.per_40, stat, 2),
+    ("per_48", metrics.per_48, metrics_array.per_48, stat, 2),
+    ("per_100", metrics.per_100, metrics_array.per_100, stat, 2),
+    ("usage_pct", metrics.usage_pct, metrics_array.usage_pct, stat, 8),
+    ("ast_pct", metrics.ast_pct, metrics_array.ast_pct, stat, 5),
+    ("oreb_pct", metrics.oreb_pct, metrics_array.oreb_pct, stat, 5),
+    ("dreb_pct", metrics.dreb_pct, metrics_array.dreb_pct, stat, 5),
+    ("stl_pct", metrics.stl_pct, metrics_array.stl_pct, stat, 4),
+    ("blk_pct", metrics.blk_pct, metrics_array.blk_pct, stat, 4),
+    (
+        "pace_adjusted_per",
+        _with_lg(metrics.pace_adjusted_per),
+        _with_lg(metrics_array.pace_adjusted_per),
+        stat,
+        16,
+    ),
+    ("per", metrics.per, metrics_array.per, signed, 2),
+    ("bpm.total", _bpm_total, _array_bpm("total"), signed, 19),
+    ("bpm.offensive", _bpm_offensive, _array_bpm("offensive"), signed, 19),
+    ("vorp", metrics.vorp, metrics_array.vorp, signed, 3),
+    ("stat_delta", metrics.stat_delta, metrics_array.stat_delta, signed, 2),
+    (
+        "relative_ts",
+        _with_lg(metrics.relative_ts),
+        _with_lg(metrics_array.relative_ts),
+        stat,
+        1,
+    ),
+    (
+        "relative_efg",
+        _with_lg(metrics.relative_efg),
+        _with_lg(metrics_array.relative_efg),
+        stat,
+        1,
+    ),
+    ("possessions", metrics.possessions, metrics_array.possessions, stat, 4),
+    (
+        "possessions_general",
+        metrics.possessions_general,
+        metrics_array.possessions_general,
+        stat,
+        9,
+    ),
+    ("plays", metrics.plays, metrics_array.plays, stat, 3),
+    ("ortg", metrics.ortg, metrics_array.ortg, stat, 5),
+    ("drtg", metrics.drtg, metrics_array.drtg, stat, 5),
+    ("net_rtg", metrics.net_rtg, metrics_array.net_rtg, signed, 2),
+    ("floor_pct", metrics.floor_pct, metrics_array.floor_pct, stat, 2),
+    ("play_pct", metrics.play_pct, metrics_array.play_pct, stat, 2),
+    (
+        "offensive_win_shares",
+        _with_lg(metrics.offensive_win_shares),
+        _with_lg(metrics_array.offensive_win_shares),
+        stat,
+        4,
+    ),
+    (
+        "defensive_win_shares",
+        _with_lg(metrics.defensive_win_shares),
+        _with_lg(metrics_array.defensive_win_shares),
+        stat,
+        17,
+    ),
+    (
+        "pythagorean_win_pct",
+        metrics.pythagorean_win_pct,
+        metrics_array.pythagorean_win_pct,
+        signed,
+        2,
+    ),
+    (
+        "bell_curve_win_pct",
+        metrics.bell_curve_win_pct,
+        metrics_array.bell_curve_win_pct,
+        signed,
+        3,
+    ),
+    ("win_shares", metrics.win_shares, metrics_array.win_shares, signed, 2),
+    (
+        "win_shares_per_48",
+        metrics.win_shares_per_48,
+        metrics_array.win_shares_per_48,
+        stat,
+        2,
+    ),
+]
+
+
+def _expected(scalar, rows):
+    out = []
+    for row in rows:
+        value = scalar(*row)
+        out.append(math.nan if value is None else value)
+    return np.array(out, dtype=np.float64)
+
+
+@pytest.mark.parametrize(
+    ("scalar", "array", "strategy", "arity"),
+    [pytest.param(*case[1:], id=case[0]) for case in CASES],
+)
+@given(data=st.data())
+# Rows up to 17 wide (DWS) draw slowly when xdist workers share the CPU.
+@settings(max_examples=40, suppress_health_check=[*_XDIST, HealthCheck.too_slow])
+def test_matches_scalar(scalar, array, strategy, arity, data):
+    rows = data.draw(st.lists(st.tuples(*[strategy] * arity), min_size=1, max_size=12))
+    columns = [np.array(col) for col in zip(*rows, strict=True)]
+
+    got = array(*columns)
+
+    assert got.shape == (len(rows),)
+    np.testing.assert_allclose(got, _expected(scalar, rows), rtol=1e-9, atol=1e-12)
+
+
+@given(
+    rows=st.lists(st.tuples(*[stat] * 5), min_size=1, max_size=12),
+)
+@settings(suppress_health_check=_XDIST)
+def test_double_and_triple_double_match_scalar(rows):
+    columns = [np.array(col) for col in zip(*rows, strict=True)]
+    assert metrics_array.is_double_double(*columns).tolist() == [
+        metrics.is_double_double(*row) for row in rows
+    ]
+    assert metrics_array.is_triple_double(*columns).tolist() == [
+        metrics.is_triple_double(*row) for row in rows
+    ]
+
+
+@given(rows=st.lists(st.tuples(*[stat] * 7), min_size=1, max_size=12))
+@settings(suppress_health_check=_XDIST)
+def test_four_factors_match_scalar(rows):
+    columns = [np.array(col) for col in zip(*rows, strict=True)]
+    got = metrics_array.four_factors(*columns)
+    for name in ("efg_pct", "tov_pct", "oreb_pct", "ftr"):
+        expected = [getattr(metrics.four_factors(*row), name) for row in rows]
+        np.testing.assert_allclose(
+            getattr(got, name),
+            [math.nan if v is None else v for v in expected],
+            rtol=1e-12,
+        )
+
+
+class TestMetricsArray:
+    def test_broadcasts_scalars_against_columns(self):
+        got = metrics_array.per_36([10, 20, 0], 30)
+        np.testing.assert_allclose(got, [12.0, 24.0, 0.0])
+        assert metrics_array.per_36(10, [0, 30]).tolist()[1] == 12.0
+
+    def test_zero_denominator_is_nan_without_warning(self):
+        with np.errstate(all="raise"):
+            got = metrics_array.true_shooting([10, 0], [0, 0], [0, 0])
+            dws = metrics_array.defensive_win_shares(*([0.0] * 17), LG)
+        assert np.isnan(got).all()
+        assert np.isnan(dws)
+
+    def test_accepts_dataframe_columns(self):
+        df = pd.DataFrame({"pts": [28, 0], "fga": [18, 0], "fta": [6, 0]})
+        got = metrics_array.true_shooting(df["pts"], df["fga"], df["fta"])
+        assert isinstance(got, np.ndarray)
+        assert got[0] == pytest.approx(metrics.true_shooting(28, 18, 6))
+        assert np.isnan(got[1])
+
+    def test_bpm_defensive_is_total_minus_offensive(self):
+        result = metrics_array.bpm(
+            [30, 20],
+            [3, 1],
+            [8, 2],
+            [4, 1],
+            [2, 4],
+            [7, 9],
+            [2, 1],
+            [1, 2],
+            [3, 4],
+            [20, 12],
+            [8, 3],
+            pct_team_trb=[0.12, 0.2],
+            pct_team_stl=[0.2, 0.1],
+            pct_team_pf=[0.15, 0.2],
+            pct_team_ast=[0.35, 0.08],
+            pct_team_blk=[0.1, 0.3],
+            pct_team_pts=[0.3, 0.15],
+            mp=[2000, 0],
+        )
+        scalar = metrics.bpm(
+            30,
+            3,
+            8,
+            4,
+            2,
+            7,
+            2,
+            1,
+            3,
+            20,
+            8,
+            pct_team_trb=0.12,
+            pct_team_stl=0.2,
+            pct_team_pf=0.15,
+            pct_team_ast=0.35,
+            pct_team_blk=0.1,
+            pct_team_pts=0.3,
+            mp=2000,
+        )
+        assert result.total[0] == pytest.approx(scalar.total)
+        assert result.defensive[0] == pytest.approx(scalar.defensive)
+        assert np.isnan(result.total[1])
+
+    def test_vorp_rejects_non_positive_season_games(self):
+        with pytest.raises(ValueError, match="season_games must be > 0"):
+            metrics_array.vorp([1.0], [0.5], [82], season_games=0)
+
+
+# ─── Rolling windows ─────────────────────────────────────────────────────────
+
+series = st.lists(st.one_of(st.none(), stat), max_size=40)
+window = st.integers(min_value=1, max_value=8)
+
+
+def _nan(values):
+    return [math.nan if v is None else v for v in values]
+
+
+def _windows(values, w):
+    """Scalar reference: each full trailing window, or None if incomplete."""
+    out = []
+    for i in range(len(values)):
+        chunk = values[max(0, i - w + 1) : i + 1]
+        out.append(chunk if len(chunk) == w and None not in chunk else None)
+    return out
+
+
+class TestRolling:
+    @given(values=series, w=window)
+    @settings(suppress_health_check=_XDIST)
+    def test_avg_and_consistency_match_scalar(self, values, w):
+        np.testing.assert_allclose(
+            metrics_array.rolling_avg(values, w),
+            _nan(metrics.rolling_avg(values, w)),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            metrics_array.rolling_consistency(values, w),
+            _nan(metrics.rolling_consistency(values, w)),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+    @given(
+        values=series,
+        w=window,
+        p=st.floats(min_value=0.0, max_value=100.0),
+        line=stat,
+    )
+    @settings(suppress_health_check=_XDIST)
+    def test_percentile_and_hit_rate_match_scalar(self, values, w, p, line):
+        chunks = _windows(values, w)
+        np.testing.assert_array_equal(
+            metrics_array.rolling_percentile(values, w, p),
+            _nan([c and metrics.stat_floor(c, p) for c in chunks]),
+        )
+        np.testing.assert_allclose(
+            metrics_array.rolling_hit_rate(values, w, line),
+            _nan([c and metrics.prop_hit_rate(c, line) for c in chunks]),
+        )
+
+    @given(values=st.lists(st.one_of(st.none(), stat), min_size=6, max_size=6))
+    @settings(suppress_health_check=_XDIST)
+    def test_matrix_rolls_each_row(self, values):
+        matrix = np.array([_nan(values), _nan(values[::-1])])
+        for fn in (
+            metrics_array.rolling_avg,
+            metrics_array.rolling_var,
+            metrics_array.rolling_median,
+        ):
+            got = fn(matrix, 3)
+            np.testing.assert_array_equal(got[0], fn(matrix[0], 3))
+            np.testing.assert_array_equal(got[1], fn(matrix[1], 3))
+
+    def test_known_values(self):
+        pts = [22.0, 18.0, 30.0, None, 25.0, 20.0, 28.0]
+        np.testing.assert_allclose(
+            metrics_array.rolling_floor(pts, 3, 0.0),
+            [np.nan, np.nan, 18.0, np.nan, np.nan, np.nan, 20.0],
+        )
+        np.testing.assert_allclose(
+            metrics_array.rolling_ceiling(pts, 3, 100.0),
+            [np.nan, np.nan, 30.0, np.nan, np.nan, np.nan, 28.0],
+        )
+        np.testing.assert_allclose(
+            metrics_array.rolling_hit_rate(pts, 2, 25.0),
+            [np.nan, 0.0, 0.5, np.nan, np.nan, 0.5, 0.5],
+        )
+
+    def test_shorter_than_window(self):
+        assert np.isnan(metrics_array.rolling_var([1.0, 2.0], 3)).all()
+        assert metrics_array.rolling_avg([], 3).shape == (0,)
+
+    def test_variance_is_stable_for_large_offsets(self):
+        values = 1e9 + np.array([1.0, 2.0, 3.0, 4.0] * 5000)
+        for w in (3, 4, 7):
+            expected = [
+                np.var(values[i - w + 1 : i + 1]) for i in range(w - 1, len(values))
+            ]
+            got = metrics_array.rolling_var(values, w)[w - 1 :]
+            np.testing.assert_allclose(got, expected, rtol=1e-9)
+
+    def test_constant_window_has_zero_spread(self):
+        got = metrics_array.rolling_consistency([0.1] * 7 + [5.3, 2.0] + [0.1] * 9, 4)
+        assert got[3:7].max() < 1e-15
+        assert got[-1] < 1e-15
+
+    @pytest.mark.parametrize(
+        "fn",
+        [
+            metrics_array.rolling_avg,
+            metrics_array.rolling_var,
+            metrics_array.rolling_median,
+        ],
+    )
+    def test_rejects_bad_window(self, fn):
+        with pytest.raises(ValueError, match="window must be >= 1"):
+            fn([1.0], 0)
+
+    def test_rejects_bad_percentile(self):
+        with pytest.raises(ValueError, match="percentile must be in"):
+            metrics_array.rolling_percentile([1.0], 1, 120.0)
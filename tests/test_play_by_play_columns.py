@@ -0,0 +1,287 @@
+"""Tests for fastbreak.play_by_play_columns (columnar play-by-play)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from fastbreak.clients.nba import NBAClient
+from fastbreak.games import action_elapsed_seconds, elapsed_game_seconds, game_flow
+from fastbreak.hot_hand import extract_shot_sequences
+from fastbreak.league import League
+from fastbreak.models.play_by_play import PlayByPlayAction
+from fastbreak.play_by_play_columns import (
+    PlayByPlayColumns,
+    elapsed_seconds_array,
+    get_play_by_play_columns,
+)
+from fastbreak.transition import classify_possessions
+
+_PLAYERS = {
+    100: [(1, "Alpha"), (2, "Bravo"), (3, "Charlie")],
+    200: [(4, "Delta"), (5, "Echo"), (6, "Foxtrot")],
+}
+
+
+def _action(n: int, **fields) -> PlayByPlayAction:
+    base = {
+        "actionNumber": n,
+        "clock": "PT12M00.00S",
+        "period": 1,
+        "teamId": 0,
+        "teamTricode": "",
+        "personId": 0,
+        "playerName": "",
+        "playerNameI": "",
+        "xLegacy": 0,
+        "yLegacy": 0,
+        "shotDistance": 0,
+        "shotResult": "",
+        "isFieldGoal": 0,
+        "scoreHome": "",
+        "scoreAway": "",
+        "pointsTotal": 0,
+        "location": "",
+        "description": "",
+        "actionType": "period",
+        "subType": "start",
+        "videoAvailable": 0,
+        "shotValue": 0,
+        "actionId": n,
+    }
+    base.update(fields)
+    return PlayByPlayAction(**base)
+
+
+def _random_game(seed: int, periods: int = 5) -> list[PlayByPlayAction]:
+    """A plausible game: shots, free throws, rebounds and turnovers."""
+    rng = np.random.default_rng(seed)
+    actions = []
+    score = {100: 0, 200: 0}
+    n = 0
+    for period in range(1, periods + 1):
+        length = 720 if period <= 4 else 300
+        n += 1
+        actions.append(_action(n, period=period, clock=f"PT{length // 60:02d}M00.00S"))
+        for remaining in sorted(rng.uniform(1, length, size=25), reverse=True):
+            n += 1
+            team = int(rng.choice([100, 200]))
+            pid, name = _PLAYERS[team][int(rng.integers(3))]
+            kind = rng.choice(["2pt", "3pt", "ft", "rebound", "turnover"])
+            fields = {
+                "period": period,
+                "clock": f"PT{int(remaining // 60):02d}M{remaining % 60:05.2f}S",
+                "teamId": team,
+                "teamTricode": "HOM" if team == 100 else "AWY",
+                "personId": pid,
+                "playerName": name,
+                "playerNameI": f"{name[0]}. {name}",
+                "location": "h" if team == 100 else "v",
+                "description": f"{name} {kind} #{n}",
+                "actionType": str(kind),
+                "subType": "",
+            }
+            if kind in {"2pt", "3pt"}:
+                made = bool(rng.integers(2))
+                value = 2 if kind == "2pt" else 3
+                fields |= {
+                    "isFieldGoal": 1,
+                    "shotResult": "Made" if made else "Missed",
+                    "shotValue": value,
+                    "shotDistance": int(rng.integers(1, 28)),
+                }
+                score[team] += value if made else 0
+            elif kind == "ft":
+                fields |= {
+                    "actionType": "Free Throw",
+                    "subType": "Free Throw 1 of 1",
+                    "shotResult": "Made",
+                }
+                score[team] += 1
+            elif kind == "rebound":
+                fields["subType"] = str(rng.choice(["offensive", "defensive"]))
+            if kind in {"2pt", "3pt", "ft"} and fields["shotResult"] == "Made":
+                fields |= {
+                    "scoreHome": str(score[100]),
+                    "scoreAway": str(score[200]),
+                    "pointsTotal": score[100] + score[200],
+                }
+            actions.append(_action(n, **fields))
+    return actions
+
+
+def _payload(game_id: str, actions: list[PlayByPlayAction]) -> dict:
+    return {
+        "meta": {"version": 1},
+        "game": {
+            "gameId": game_id,
+            "videoAvailable": 0,
+            "actions": [a.model_dump() for a in actions],
+        },
+    }
+
+
+@pytest.fixture
+def games() -> dict[str, list[PlayByPlayAction]]:
+    return {f"00225000{g:02d}": _random_game(g, periods=4 + g % 2) for g in range(3)}
+
+
+class TestBuild:
+    def test_round_trips_actions(self, games):
+        for game_id, actions in games.items():
+            cols = PlayByPlayColumns.from_actions(game_id, actions)
+            assert len(cols) == len(actions)
+            assert cols.to_actions() == actions
+
+    def test_from_json_matches_from_actions(self, games):
+        cols = PlayByPlayColumns.from_json(
+            _payload(game_id, actions) for game_id, actions in games.items()
+        )
+
+        assert cols.game_ids == tuple(games)
+        assert cols.offsets.tolist() == [
+            0,
+            *np.cumsum([len(a) for a in games.values()]),
+        ]
+        for game_id, actions in games.items():
+            single = PlayByPlayColumns.from_actions(game_id, actions)
+            assert cols.game(game_id).to_actions() == single.to_actions()
+
+    def test_strings_are_interned(self, games):
+        actions = [a for game in games.values() for a in game]
+        cols = PlayByPlayColumns.from_actions("0022500000", actions)
+
+        assert len(set(cols.strings)) == len(cols.strings)
+        assert cols.text(cols.action_type) == [a.actionType for a in actions]
+        assert cols.code("Made") == cols.strings.index("Made")
+        assert cols.code("not a value") == -1
+        assert cols.action_type.dtype == np.int32
+
+    def test_codes_where(self, games):
+        cols = PlayByPlayColumns.from_actions("0022500000", games["0022500000"])
+        rebound = np.isin(cols.action_type, cols.codes_where(lambda s: s == "rebound"))
+        assert rebound.tolist() == [
+            a.actionType == "rebound" for a in games["0022500000"]
+        ]
+
+    def test_empty(self):
+        cols = PlayByPlayColumns.from_json([])
+        assert len(cols) == 0
+        assert cols.n_games == 0
+        assert cols.offsets.tolist() == [0]
+        assert game_flow(cols) == []
+        assert extract_shot_sequences(cols) == []
+        assert classify_possessions(cols) == []
+
+
+class TestGameViews:
+    def test_game_arrays_are_views(self, games):
+        cols = PlayByPlayColumns.from_json(
+            _payload(game_id, actions) for game_id, actions in games.items()
+        )
+        game = cols.game(1)
+
+        assert game.game_ids == ("0022500001",)
+        assert np.shares_memory(game.team_id, cols.team_id)
+        assert np.shares_memory(game.elapsed, cols.elapsed)
+        assert game.strings is cols.strings
+        assert [g.game_ids[0] for g in cols.games()] == list(games)
+        assert cols.game(-1).game_ids == ("0022500002",)
+
+    def test_unknown_game(self, games):
+        cols = PlayByPlayColumns.from_actions("0022500000", games["0022500000"])
+        with pytest.raises(KeyError):
+            cols.game("0022599999")
+        with pytest.raises(IndexError):
+            cols.game(3)
+
+
+class TestElapsed:
+    @pytest.mark.parametrize("league", [League.NBA, League.WNBA])
+    def test_matches_action_elapsed_seconds(self, games, league):
+        actions = games["0022500001"]
+        cols = PlayByPlayColumns.from_actions("0022500001", actions, league=league)
+
+        assert cols.clock_seconds.tolist() == [a.clock_seconds for a in actions]
+        np.testing.assert_array_equal(
+            cols.elapsed, [action_elapsed_seconds(a, league=league) for a in actions]
+        )
+
+    def test_other_league_is_recomputed(self, games):
+        actions = games["0022500001"]
+        cols = PlayByPlayColumns.from_actions("0022500001", actions)
+
+        assert cols.elapsed_seconds() is cols.elapsed
+        np.testing.assert_array_equal(
+            cols.elapsed_seconds(League.WNBA),
+            [action_elapsed_seconds(a, league=League.WNBA) for a in actions],
+        )
+
+    def test_elapsed_seconds_array_non_positive_period(self):
+        got = elapsed_seconds_array(np.array([0, -1, 1]), np.array([720.0, 0.0, 0.0]))
+        assert got.tolist() == [0.0, 0.0, 720.0]
+
+    @pytest.mark.parametrize("league", [League.NBA, League.WNBA])
+    def test_elapsed_seconds_array_matches_scalar_through_overtime(self, league):
+        periods = np.arange(1, 8)
+        got = elapsed_seconds_array(periods, np.full(7, 90.0), league=league)
+        assert got.tolist() == [
+            elapsed_game_seconds("PT01M30.00S", int(p), league=league) for p in periods
+        ]
+
+
+class TestAnalysesAcceptColumns:
+    def test_game_flow(self, games):
+        for game_id, actions in games.items():
+            cols = PlayByPlayColumns.from_actions(game_id, actions)
+            assert game_flow(cols) == game_flow(actions)
+
+    def test_game_flow_skips_unparseable_scores(self):
+        actions = [
+            _action(1, scoreHome="2", scoreAway="0"),
+            _action(2, scoreHome="x", scoreAway="0"),
+            _action(3, scoreHome="2", scoreAway=""),
+        ]
+        cols = PlayByPlayColumns.from_actions("0022500000", actions)
+        assert game_flow(cols) == game_flow(actions)
+        assert len(game_flow(cols)) == 1
+
+    def test_extract_shot_sequences(self, games):
+        for game_id, actions in games.items():
+            cols = PlayByPlayColumns.from_actions(game_id, actions)
+            assert extract_shot_sequences(cols) == extract_shot_sequences(actions)
+
+    def test_classify_possessions(self, games):
+        for game_id, actions in games.items():
+            cols = PlayByPlayColumns.from_actions(game_id, actions)
+            assert classify_possessions(cols) == classify_possessions(actions)
+
+
+class TestGetPlayByPlayColumns:
+    async def test_fetches_in_batches(self, mocker: MockerFixture, games):
+        batches: list[list[str]] = []
+
+        async def fake_get_many(endpoints, **kwargs):
+            batches.append([ep.game_id for ep in endpoints])
+            return [
+                SimpleNamespace(game=SimpleNamespace(actions=games[ep.game_id]))
+                for ep in endpoints
+            ]
+
+        client = NBAClient(session=mocker.MagicMock())
+        client.get_many = fake_get_many  # type: ignore[method-assign]
+        cols = await get_play_by_play_columns(client, list(games), batch_size=2)
+
+        assert batches == [list(games)[:2], list(games)[2:]]
+        assert cols.game_ids == tuple(games)
+        assert cols.league is League.NBA
+        for game_id, actions in games.items():
+            assert cols.game(game_id).to_actions() == actions
+
+    async def test_rejects_bad_batch_size(self, mocker: MockerFixture):
+        client = NBAClient(session=mocker.MagicMock())
+        with pytest.raises(ValueError, match="batch_size"):
+            await get_play_by_play_columns(client, ["0022500000"], batch_size=0)
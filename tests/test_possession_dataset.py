@@ -0,0 +1,200 @@
+"""Tests for fastbreak.possession_dataset (on-disk possession tables)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from fastbreak.clients.nba import NBAClient
+from fastbreak.models.play_by_play import PlayByPlayAction
+from fastbreak.play_by_play_columns import PlayByPlayColumns
+from fastbreak.possession_dataset import (
+    POSSESSION_COLUMNS,
+    PossessionTable,
+    build_possession_dataset,
+    completed_game_ids,
+    load_possession_dataset,
+)
+from fastbreak.transition import (
+    classify_possession_arrays,
+    classify_possessions,
+    transition_efficiency,
+    transition_frequency,
+)
+
+
+def _game(seed: int) -> list[PlayByPlayAction]:
+    """Shots, free throws, rebounds and turnovers over four periods."""
+    rng = np.random.default_rng(seed)
+    actions = []
+    for period in range(1, 5):
+        for n, remaining in enumerate(sorted(rng.uniform(1, 720, 30), reverse=True)):
+            team = int(rng.choice([100, 200]))
+            kind = str(rng.choice(["2pt", "3pt", "Free Throw", "rebound", "turnover"]))
+            shot = kind in {"2pt", "3pt"}
+            made = bool(rng.integers(2))
+            actions.append(
+                PlayByPlayAction(
+                    actionNumber=n,
+                    clock=f"PT{int(remaining // 60):02d}M{remaining % 60:05.2f}S",
+                    period=period,
+                    teamId=team,
+                    teamTricode="",
+                    personId=0,
+                    playerName="",
+                    playerNameI="",
+                    xLegacy=0,
+                    yLegacy=0,
+                    shotDistance=0,
+                    shotResult=("Made" if made else "Missed") if shot else "",
+                    isFieldGoal=int(shot),
+                    scoreHome="",
+                    scoreAway="",
+                    pointsTotal=0,
+                    location="",
+                    description="P Free Throw 1 of 1 (1 PTS)" if made else "",
+                    actionType=kind,
+                    subType="Free Throw 1 of 1"
+                    if kind == "Free Throw"
+                    else str(rng.choice(["offensive", "defensive"])),
+                    videoAvailable=0,
+                    shotValue=3 if kind == "3pt" else 2,
+                    actionId=n,
+                )
+            )
+    return actions
+
+
+@pytest.fixture
+def games() -> dict[str, list[PlayByPlayAction]]:
+    return {f"00225000{g:02d}": _game(g) for g in range(5)}
+
+
+def _client(mocker: MockerFixture, games, fetched: list[str], *, fail_on=None):
+    async def fake_get_many(endpoints, **kwargs):
+        ids = [ep.game_id for ep in endpoints]
+        if fail_on in ids:
+            raise RuntimeError("connection reset")
+        fetched.extend(ids)
+        return [SimpleNamespace(game=SimpleNamespace(actions=games[g])) for g in ids]
+
+    client = NBAClient(session=mocker.MagicMock())
+    client.get_many = fake_get_many  # type: ignore[method-assign]
+    return client
+
+
+def _expected(games) -> PossessionTable:
+    tables = []
+    for game_id, actions in games.items():
+        cols = PlayByPlayColumns.from_actions(game_id, actions)
+        tables.append(
+            PossessionTable.from_arrays(cols, classify_possession_arrays(cols))
+        )
+    return PossessionTable.concat(tables)
+
+
+def _assert_tables_equal(got: PossessionTable, want: PossessionTable) -> None:
+    for name in POSSESSION_COLUMNS:
+        np.testing.assert_array_equal(getattr(got, name), getattr(want, name))
+
+
+class TestBuildPossessionDataset:
+    async def test_writes_one_part_per_batch(self, mocker, games, tmp_path):
+        fetched: list[str] = []
+        client = _client(mocker, games, fetched)
+
+        written = await build_possession_dataset(
+            client, tmp_path, game_ids=list(games), batch_size=2
+        )
+
+        assert written == list(games)
+        assert fetched == list(games)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "part-00000.npz",
+            "part-00001.npz",
+            "part-00002.npz",
+        ]
+        assert completed_game_ids(tmp_path) == set(games)
+        table = load_possession_dataset(tmp_path)
+        _assert_tables_equal(table, _expected(games))
+        assert table.game_id.tolist()[0] == "0022500000"
+
+    async def test_resumes_after_interruption(self, mocker, games, tmp_path):
+        ids = list(games)
+        first: list[str] = []
+        client = _client(mocker, games, first, fail_on=ids[2])
+        with pytest.raises(RuntimeError, match="connection reset"):
+            await build_possession_dataset(client, tmp_path, game_ids=ids, batch_size=2)
+        assert completed_game_ids(tmp_path) == set(ids[:2])
+        assert not list(tmp_path.glob(".*"))
+
+        second: list[str] = []
+        client = _client(mocker, games, second)
+        written = await build_possession_dataset(
+            client, tmp_path, game_ids=ids, batch_size=2
+        )
+
+        assert written == second == ids[2:]
+        _assert_tables_equal(load_possession_dataset(tmp_path), _expected(games))
+        assert await build_possession_dataset(client, tmp_path, game_ids=ids) == []
+
+    async def test_defaults_to_season_game_ids(self, mocker, games, tmp_path):
+        get_game_ids = mocker.patch(
+            "fastbreak.possession_dataset.get_game_ids",
+            mocker.AsyncMock(return_value=list(games)),
+        )
+        client = _client(mocker, games, [])
+
+        await build_possession_dataset(
+            client, tmp_path / "nested", "2025-26", season_type="Playoffs"
+        )
+
+        get_game_ids.assert_awaited_once_with(client, "2025-26", season_type="Playoffs")
+        assert len(load_possession_dataset(tmp_path / "nested")) == len(
+            _expected(games)
+        )
+
+    async def test_rejects_bad_batch_size(self, mocker, tmp_path):
+        client = NBAClient(session=mocker.MagicMock())
+        with pytest.raises(ValueError, match="batch_size"):
+            await build_possession_dataset(
+                client, tmp_path, game_ids=["0022500000"], batch_size=0
+            )
+
+
+class TestPossessionTable:
+    def test_team_aggregates_match_scalar_helpers(self, games):
+        table = _expected(games)
+        possessions = [
+            p for actions in games.values() for p in classify_possessions(actions)
+        ]
+
+        frequency = table.team_frequency()
+        efficiency = table.team_efficiency()
+
+        assert sorted(frequency) == sorted(efficiency) == [100, 200]
+        for team_id in (100, 200):
+            own = [p for p in possessions if p.team_id == team_id]
+            assert frequency[team_id] == transition_frequency(own)
+            assert efficiency[team_id] == transition_efficiency(own)
+
+    def test_trigger_codes(self, games):
+        table = _expected(games)
+        possessions = [
+            p for actions in games.values() for p in classify_possessions(actions)
+        ]
+        assert [table.TRIGGERS[t] for t in table.trigger.tolist()] == [
+            p.trigger for p in possessions
+        ]
+
+    def test_empty(self, tmp_path):
+        table = load_possession_dataset(tmp_path / "missing")
+        assert len(table) == 0
+        assert completed_game_ids(tmp_path / "missing") == set()
+        assert {
+            name: getattr(table, name).dtype.type for name in POSSESSION_COLUMNS
+        } == POSSESSION_COLUMNS
+        assert table.team_frequency() == {}
@@ -176,15 +176,15 @@ def test_player_projection_rejects_stat_key_mismatch() -> None:
 
 
 def test_internal_mappings_are_immutable() -> None:
-    """_STAT_DISTRIBUTION and _STDEV_FLOORS are MappingProxyType so a stray
-    `module._STAT_DISTRIBUTION["pts"] = "poisson"` cannot poison the math
+    """STAT_DISTRIBUTION and STDEV_FLOORS are MappingProxyType so a stray
+    `module.STAT_DISTRIBUTION["pts"] = "poisson"` cannot poison the math
     for every subsequent projection in the same process."""
-    import fastbreak.projections as p
+    import fastbreak._projection_core as core
 
     with pytest.raises(TypeError):
-        p._STAT_DISTRIBUTION["pts"] = "poisson"  # type: ignore[index]
+        core.STAT_DISTRIBUTION["pts"] = "poisson"  # type: ignore[index]
     with pytest.raises(TypeError):
-        p._STDEV_FLOORS["pts"] = 999.0  # type: ignore[index]
+        core.STDEV_FLOORS["pts"] = 999.0  # type: ignore[index]
 
 
 def test_priors_writer_rejects_degenerate_variance(monkeypatch) -> None:  # type: ignore[no-untyped-def]
@@ -2009,13 +2009,8 @@ def test_project_player_uses_provided_priors(mocker) -> None:  # type: ignore[no
 
 
 def test_compute_priors_for_season_rejects_invalid_thresholds() -> None:
-    """min_games < 1, min_minutes < 0, and max_concurrency < 1 each fail
-    before any API call.
-
-    The max_concurrency case is especially important: BaseClient.get_many
-    does `concurrency = max_concurrency or 3`, so passing 0 silently falls
-    back to 3 without the explicit guard at this layer.
-    """
+    """min_games < 1, min_minutes < 0 and an empty season each fail before
+    any API call."""
     import anyio
 
     from fastbreak.clients.nba import NBAClient
@@ -2045,10 +2040,6 @@ def test_compute_priors_for_season_rejects_invalid_thresholds() -> None:
                 await compute_priors_for_season(
                     client, season="2025-26", min_minutes=float("inf")
                 )
-            with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
-                await compute_priors_for_season(
-                    client, season="2025-26", max_concurrency=0
-                )
             # Empty season string must not silently fall back to the
             # current season — distinguishes `None` (use default) from `""`
             # (invalid input).
@@ -2142,3 +2133,437 @@ def test_compute_priors_for_season_returns_immutable_mapping() -> None:
     priors = _compute_priors_from_logs(logs, season="2025-26")  # type: ignore[arg-type]
     with pytest.raises(TypeError):
         priors["pts"] = priors["reb"]  # type: ignore[index]
+
+
+# ---------- slate projections ----------
+
+
+def _slate_logs(seed: int = 0):  # type: ignore[no-untyped-def]
+    """League-wide P-mode log rows for 12 players on 4 teams, oldest-first."""
+    import random
+    from datetime import date, timedelta
+    from types import SimpleNamespace
+
+    rng = random.Random(seed)
+    rows = []
+    for pid in range(1, 13):
+        team = 1610612700 + (pid - 1) % 4
+        n_games = rng.randint(1, 15)
+        day = date(2025, 11, 1)
+        for _ in range(n_games):
+            day += timedelta(days=rng.randint(1, 4))
+            rows.append(
+                SimpleNamespace(
+                    player_id=pid,
+                    player_name=f"Player {pid}",
+                    team_id=team,
+                    game_date=f"{day.isoformat()}T00:00:00",
+                    pts=rng.randint(0, 40),
+                    reb=rng.randint(0, 15),
+                    ast=rng.randint(0, 12),
+                    fg3m=rng.randint(0, 8),
+                )
+            )
+    rng.shuffle(rows)
+    return rows
+
+
+def _slate_teams(**overrides: float | None):  # type: ignore[no-untyped-def]
+    from types import SimpleNamespace
+
+    ratings = {1610612700: 108.0, 1610612701: 118.0, 1610612702: 112.0}
+    ratings |= {1610612703: 114.0, 1610612704: 111.0}
+    ratings |= {int(k.removeprefix("t")): v for k, v in overrides.items()}
+    return SimpleNamespace(
+        teams=[SimpleNamespace(team_id=t, e_def_rating=r) for t, r in ratings.items()]
+    )
+
+
+def _slate_games():  # type: ignore[no-untyped-def]
+    from datetime import date
+
+    from fastbreak.projections import SlateGame
+
+    return [
+        SlateGame(1610612700, 1610612701, date(2026, 1, 10)),
+        SlateGame(1610612703, 1610612702, date(2026, 1, 10)),
+    ]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_slate_matches_per_player_projection(seed: int) -> None:
+    """Every slate row equals ``_build_stat_projection`` on that player's games."""
+    from datetime import date
+
+    from fastbreak._projection_core import resolve_opponent_def_ratings
+    from fastbreak.projections import (
+        STATS,
+        _build_stat_projection,
+        _project_slate_from_logs,
+    )
+    from fastbreak.projections_priors import STAT_PRIORS
+
+    logs = _slate_logs(seed)
+    teams = _slate_teams()
+    games = _slate_games()
+    slate = _project_slate_from_logs(
+        logs, teams, games, rolling_n=5, stats=STATS, priors=STAT_PRIORS
+    )
+
+    assert len(slate) == 12
+    assert slate.player_id.tolist() == sorted(slate.player_id.tolist())
+    for proj in slate.to_player_projections():
+        games_played = sorted(
+            (r for r in logs if r.player_id == proj.player_id),
+            key=lambda r: r.game_date,
+            reverse=True,
+        )
+        last = date.fromisoformat(games_played[0].game_date[:10])
+        opp, league_avg = resolve_opponent_def_ratings(teams, proj.opponent_team_id)
+        assert proj.game_date == date(2026, 1, 10)
+        for stat in STATS:
+            expected = _build_stat_projection(
+                stat,
+                games_played,
+                rolling_n=5,
+                opp_def_rating=opp,
+                league_avg_def_rating=league_avg,
+                days_rest=(proj.game_date - last).days - 1,
+                is_home=proj.is_home,
+                priors=STAT_PRIORS,
+            )
+            got = proj.stats[stat]
+            assert got.mean == pytest.approx(expected.mean)
+            assert got.stdev == pytest.approx(expected.stdev)
+            assert got.rolling_n == expected.rolling_n
+            assert got.season_mean == pytest.approx(expected.season_mean)
+            assert got.rolling_mean == pytest.approx(expected.rolling_mean)
+            for key, value in expected.adjustments.items():
+                assert got.adjustments[key] == pytest.approx(value), (stat, key)
+
+
+def test_slate_assigns_opponents_and_home() -> None:
+    from fastbreak.projections import STATS, _project_slate_from_logs
+    from fastbreak.projections_priors import STAT_PRIORS
+
+    slate = _project_slate_from_logs(
+        _slate_logs(),
+        _slate_teams(),
+        _slate_games(),
+        rolling_n=5,
+        stats=STATS,
+        priors=STAT_PRIORS,
+    )
+    opponents = {1610612700: 1610612701, 1610612701: 1610612700}
+    opponents |= {1610612702: 1610612703, 1610612703: 1610612702}
+    for team, opp, home in zip(
+        slate.team_id.tolist(), slate.opponent_team_id.tolist(), slate.is_home.tolist()
+    ):
+        assert opponents[team] == opp
+        assert home == (team in (1610612700, 1610612703))
+
+
+def test_slate_days_rest_from_last_game() -> None:
+    from types import SimpleNamespace
+
+    from fastbreak.projections import _project_slate_from_logs
+    from fastbreak.projections_priors import STAT_PRIORS
+
+    def row(pid: int, day: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            player_id=pid,
+            player_name=None,
+            team_id=1610612700,
+            game_date=day,
+            pts=10,
+            reb=5,
+            ast=3,
+            fg3m=1,
+        )
+
+    logs = [
+        row(1, "2026-01-09T00:00:00"),  # back-to-back
+        row(2, "2026-01-08T00:00:00"),
+        row(3, "2026-01-06T00:00:00"),
+        row(3, "2026-01-10T00:00:00"),  # on the slate date: excluded
+        row(4, "2026-01-01T00:00:00"),  # 3+ days
+    ]
+    slate = _project_slate_from_logs(
+        logs,
+        _slate_teams(),
+        _slate_games(),
+        rolling_n=5,
+        stats=("pts", "ast"),
+        priors=STAT_PRIORS,
+    )
+
+    assert slate.days_rest.tolist() == [0, 1, 3, 8]
+    assert slate.rolling_n.tolist() == [1, 1, 1, 1]
+    # One game each, so blended == the logged value; assists get half the delta.
+    assert slate.rest_adjustment[:, 0].tolist() == pytest.approx([-0.4, 0, 0.15, 0.15])
+    assert slate.rest_adjustment[:, 1].tolist() == pytest.approx(
+        [-0.06, 0, 0.0225, 0.0225]
+    )
+    assert slate.player(1).player_name == "1"  # falls back to the ID
+    assert slate.player(99) is None
+
+
+def test_slate_filters_teams_and_players() -> None:
+    from datetime import date
+
+    from fastbreak.projections import STATS, SlateGame, _project_slate_from_logs
+    from fastbreak.projections_priors import STAT_PRIORS
+
+    games = [SlateGame(1610612700, 1610612701, date(2026, 1, 10))]
+    slate = _project_slate_from_logs(
+        _slate_logs(),
+        _slate_teams(),
+        games,
+        rolling_n=5,
+        stats=STATS,
+        priors=STAT_PRIORS,
+    )
+    assert set(slate.team_id.tolist()) == {1610612700, 1610612701}
+
+    only = _project_slate_from_logs(
+        _slate_logs(),
+        _slate_teams(),
+        games,
+        rolling_n=5,
+        stats=STATS,
+        priors=STAT_PRIORS,
+        player_ids=[1, 3, 5],
+    )
+    assert only.player_id.tolist() == [1, 5]  # player 3 is not on the slate
+    assert only.mean.shape == (2, 4)
+
+
+def test_slate_rejects_invalid_opponent_rating() -> None:
+    from fastbreak.projections import STATS, _project_slate_from_logs
+    from fastbreak.projections_priors import STAT_PRIORS
+
+    with pytest.raises(ValueError, match="invalid e_def_rating"):
+        _project_slate_from_logs(
+            _slate_logs(),
+            _slate_teams(t1610612701=None),
+            _slate_games(),
+            rolling_n=5,
+            stats=STATS,
+            priors=STAT_PRIORS,
+        )
+
+
+def test_slate_rejects_team_in_two_games() -> None:
+    from datetime import date
+
+    from fastbreak.projections import STATS, SlateGame, _project_slate_from_logs
+    from fastbreak.projections_priors import STAT_PRIORS
+
+    games = [
+        SlateGame(1610612700, 1610612701, date(2026, 1, 10)),
+        SlateGame(1610612702, 1610612700, date(2026, 1, 10)),
+    ]
+    with pytest.raises(ValueError, match="more than one slate game"):
+        _project_slate_from_logs(
+            _slate_logs(),
+            _slate_teams(),
+            games,
+            rolling_n=5,
+            stats=STATS,
+            priors=STAT_PRIORS,
+        )
+
+
+def test_project_slate_fetches_two_endpoints(mocker) -> None:  # type: ignore[no-untyped-def]
+    import anyio
+
+    from fastbreak.clients.nba import NBAClient
+    from fastbreak.endpoints import LeagueGameLog, TeamEstimatedMetrics
+    from fastbreak.projections import SlateProjections, project_slate
+
+    client = NBAClient(session=mocker.MagicMock())
+    log_resp = mocker.MagicMock()
+    log_resp.games = _slate_logs()
+    client.get_many = mocker.AsyncMock(return_value=[log_resp, _slate_teams()])
+
+    slate = anyio.run(lambda: project_slate(client, _slate_games(), rolling_n=5))
+
+    assert isinstance(slate, SlateProjections)
+    assert len(slate) == 12
+    (endpoints,) = client.get_many.call_args.args
+    assert [type(e) for e in endpoints] == [LeagueGameLog, TeamEstimatedMetrics]
+    assert endpoints[0].player_or_team == "P"
+    assert endpoints[0].season == endpoints[1].season == "2025-26"
+
+
+@pytest.mark.parametrize(
+    ("games", "kwargs", "match"),
+    [
+        ([], {}, "games must be non-empty"),
+        (None, {"rolling_n": 0}, "rolling_n must be"),
+        (None, {"stats": ("blk",)}, "unsupported stat"),
+    ],
+)
+def test_project_slate_validates_before_fetching(mocker, games, kwargs, match) -> None:  # type: ignore[no-untyped-def]
+    import anyio
+
+    from fastbreak.clients.nba import NBAClient
+    from fastbreak.projections import project_slate
+
+    client = NBAClient(session=mocker.MagicMock())
+    client.get_many = mocker.AsyncMock()
+    slate_games = _slate_games() if games is None else games
+
+    with pytest.raises(ValueError, match=match):
+        anyio.run(lambda: project_slate(client, slate_games, **kwargs))
+    client.get_many.assert_not_called()
+
+
+# ---------- vectorized priors ----------
+
+
+def _reference_priors(logs, season):  # type: ignore[no-untyped-def]
+    """The original per-player ``statistics`` loop, kept as an oracle."""
+    import statistics
+
+    from fastbreak.projections import STATS
+
+    result = {}
+    for stat in STATS:
+        means, variances, total = [], [], 0
+        for games in logs.values():
+            if len(games) < 2:
+                continue
+            values = [float(getattr(g, stat)) for g in games]
+            means.append(statistics.fmean(values))
+            variances.append(statistics.variance(values))
+            total += len(values)
+        result[stat] = (statistics.variance(means), statistics.fmean(variances), total)
+    return result
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_compute_priors_from_logs_matches_scalar_reference(seed: int) -> None:
+    import random
+    from types import SimpleNamespace
+
+    from fastbreak.projections import _compute_priors_from_logs
+
+    rng = random.Random(seed)
+    logs = {
+        pid: [
+            SimpleNamespace(
+                pts=rng.randint(0, 40),
+                reb=rng.randint(0, 15),
+                ast=rng.randint(0, 12),
+                fg3m=rng.randint(0, 8),
+            )
+            for _ in range(rng.randint(0, 20))  # includes 0- and 1-game players
+        ]
+        for pid in range(40)
+    }
+    priors = _compute_priors_from_logs(logs, season="2025-26")  # type: ignore[arg-type]
+    n_players = sum(len(games) >= 2 for games in logs.values())
+    for stat, (tau_sq, sigma_sq, n_games) in _reference_priors(logs, "").items():
+        assert priors[stat].tau_sq == pytest.approx(tau_sq)
+        assert priors[stat].sigma_sq == pytest.approx(sigma_sq)
+        assert priors[stat].n_games == n_games
+        assert priors[stat].n_players == n_players
+
+
+def _league_log(n_players: int = 14):  # type: ignore[no-untyped-def]
+    """P-mode rows: player ``p`` plays ``p + 25`` games of ``12 + p`` minutes."""
+    from datetime import date, timedelta
+    from types import SimpleNamespace
+
+    return [
+        SimpleNamespace(
+            player_id=p,
+            game_date=(date(2025, 10, 21) + timedelta(days=g)).isoformat(),
+            min=12 + p,
+            pts=10 + p + g % 7,
+            reb=3 + p % 5 + g % 3,
+            ast=2 + p % 4 + g % 4,
+            fg3m=p % 3 + g % 2,
+        )
+        for p in range(1, n_players + 1)
+        for g in range(p + 25)
+    ]
+
+
+def test_compute_priors_from_league_log_applies_thresholds() -> None:
+    from collections import defaultdict
+
+    from fastbreak.projections import (
+        _compute_priors_from_league_log,
+        _compute_priors_from_logs,
+    )
+
+    rows = _league_log()
+    priors = _compute_priors_from_league_log(
+        rows, season="2025-26", min_games=30, min_minutes=15.0
+    )
+    # Players 5+ have >= 30 games; players 3+ average >= 15 minutes.
+    logs = defaultdict(list)
+    for row in rows:
+        if row.player_id >= 5:
+            logs[row.player_id].append(row)
+    expected = _compute_priors_from_logs(logs, season="2025-26")  # type: ignore[arg-type]
+    assert priors == expected
+    assert priors["pts"].n_players == 10
+
+
+def test_compute_priors_from_league_log_rejects_small_pool() -> None:
+    from fastbreak.projections import _compute_priors_from_league_log
+
+    with pytest.raises(ValueError, match="insufficient eligible players"):
+        _compute_priors_from_league_log(
+            _league_log(), season="2025-26", min_games=31, min_minutes=15.0
+        )
+
+
+def test_compute_priors_for_season_single_request(mocker) -> None:  # type: ignore[no-untyped-def]
+    import anyio
+
+    from fastbreak.clients.nba import NBAClient
+    from fastbreak.endpoints import LeagueGameLog
+    from fastbreak.projections import compute_priors_for_season
+
+    client = NBAClient(session=mocker.MagicMock())
+    response = mocker.MagicMock()
+    response.games = _league_log()
+    client.get = mocker.AsyncMock(return_value=response)
+    client.get_many = mocker.AsyncMock()
+
+    priors = anyio.run(
+        lambda: compute_priors_for_season(client, season="2025-26", min_games=30)
+    )
+
+    assert priors["pts"].n_players == 10
+    (endpoint,) = client.get.call_args.args
+    assert isinstance(endpoint, LeagueGameLog)
+    assert endpoint.player_or_team == "P"
+    assert endpoint.season == "2025-26"
+    client.get_many.assert_not_called()
+
+
+def test_compute_priors_for_season_max_concurrency_is_deprecated(mocker) -> None:  # type: ignore[no-untyped-def]
+    import anyio
+
+    from fastbreak.clients.nba import NBAClient
+    from fastbreak.projections import compute_priors_for_season
+
+    client = NBAClient(session=mocker.MagicMock())
+    response = mocker.MagicMock()
+    response.games = _league_log()
+    client.get = mocker.AsyncMock(return_value=response)
+
+    with pytest.warns(DeprecationWarning, match="max_concurrency"):
+        priors = anyio.run(
+            lambda: compute_priors_for_season(
+                client, season="2025-26", max_concurrency=0
+            )
+        )
+
+    assert priors["pts"].n_players == 10
+    client.get.assert_awaited_once()
@@ -3,8 +3,19 @@
 import numpy as np
 import pytest
 
+from scipy.sparse import csr_matrix
+
+import fastbreak.rapm as rapm_module
+
 from fastbreak.rapm import (
+    ODRAPMResult,
+    OffenseStint,
+    compute_od_rapm,
+    IncrementalRAPM,
+    PAD_PLAYER_ID,
     Stint,
+    StintArrays,
+    build_design_arrays,
     build_design_matrix,
     RAPMRating,
     RAPMResult,
@@ -227,3 +238,435 @@ def test_rapm_leaders_negative_top_n_returns_empty():
     result = compute_rapm(_balanced_stints(), lambda_=100.0)
     leaders = rapm_leaders(result, top_n=-1)
     assert leaders == []
+
+
+def _loop_design_matrix(stints):
+    """The original per-stint loop, kept as the exactness reference."""
+    player_ids = sorted(
+        {pid for s in stints for pid in (*s.home_player_ids, *s.away_player_ids)}
+    )
+    col = {pid: i for i, pid in enumerate(player_ids)}
+    rows, cols, vals = [], [], []
+    y = np.empty(len(stints))
+    w = np.empty(len(stints))
+    counts = dict.fromkeys(player_ids, 0)
+    poss = dict.fromkeys(player_ids, 0.0)
+    for r, s in enumerate(stints):
+        for pid in s.home_player_ids:
+            rows.append(r)
+            cols.append(col[pid])
+            vals.append(1.0)
+        for pid in s.away_player_ids:
+            rows.append(r)
+            cols.append(col[pid])
+            vals.append(-1.0)
+        for pid in (*s.home_player_ids, *s.away_player_ids):
+            counts[pid] += 1
+            poss[pid] += s.possessions
+        y[r] = s.point_diff / s.possessions * 100.0
+        w[r] = s.possessions
+    x = csr_matrix((vals, (rows, cols)), shape=(len(stints), len(player_ids)))
+    return x, y, w, player_ids, counts, poss
+
+
+def _random_stints(seed, n=400, pool=60):
+    rng = np.random.default_rng(seed)
+    stints = []
+    for _ in range(n):
+        # Variable lineup sizes exercise padding; sampling with replacement
+        # exercises duplicate entries within a row.
+        home = tuple(int(p) for p in rng.integers(1, pool, rng.integers(3, 6)))
+        away = tuple(int(p) for p in rng.integers(1, pool, rng.integers(3, 6)))
+        stints.append(
+            Stint(
+                home_player_ids=home,
+                away_player_ids=away,
+                possessions=float(rng.uniform(0.5, 30.0)),
+                point_diff=int(rng.integers(-12, 13)),
+            )
+        )
+    return stints
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_build_design_arrays_matches_loop_exactly(seed):
+    stints = _random_stints(seed)
+    x_ref, y_ref, w_ref, ids_ref, counts_ref, poss_ref = _loop_design_matrix(stints)
+
+    design = build_design_arrays(StintArrays.from_stints(stints))
+
+    assert design.player_ids == ids_ref
+    assert np.array_equal(design.x.indptr, x_ref.indptr)
+    assert np.array_equal(design.x.indices, x_ref.indices)
+    assert np.array_equal(design.x.data, x_ref.data)
+    assert np.array_equal(design.y, y_ref)
+    assert np.array_equal(design.sample_weight, w_ref)
+    assert design.stint_counts.tolist() == [counts_ref[p] for p in ids_ref]
+    assert design.player_possessions.tolist() == [poss_ref[p] for p in ids_ref]
+
+
+def test_compute_rapm_arrays_matches_stints():
+    stints = _random_stints(7)
+    from_objects = compute_rapm(stints, lambda_=50.0)
+    from_arrays = compute_rapm(StintArrays.from_stints(stints), lambda_=50.0)
+    assert from_arrays == from_objects
+
+
+def test_stint_arrays_from_stints_pads():
+    arrays = StintArrays.from_stints(
+        [
+            Stint((1, 2, 3), (4, 5), possessions=2.0, point_diff=1),
+            Stint((1, 2), (4, 5, 6), possessions=3.0, point_diff=-2),
+        ]
+    )
+    assert arrays.home_player_ids.tolist() == [[1, 2, 3], [1, 2, PAD_PLAYER_ID]]
+    assert arrays.away_player_ids.tolist() == [[4, 5, PAD_PLAYER_ID], [4, 5, 6]]
+    assert len(arrays) == 2
+
+
+def test_stint_arrays_rejects_mismatched_rows():
+    with pytest.raises(ValueError, match="home_player_ids"):
+        StintArrays(
+            home_player_ids=np.ones((3, 5), dtype=int),
+            away_player_ids=np.ones((2, 5), dtype=int),
+            possessions=np.ones(2),
+            point_diff=np.zeros(2),
+        )
+
+
+def test_compute_rapm_arrays_reports_bad_stint_index():
+    arrays = StintArrays.from_stints(_random_stints(3, n=5))
+    arrays.possessions[3] = 0.0
+    with pytest.raises(ValueError, match="stint 3 has non-positive possessions"):
+        compute_rapm(arrays)
+
+
+def _exact_ridge(stints, lambda_, priors=None):
+    design = build_design_arrays(StintArrays.from_stints(stints))
+    x = design.x.toarray()
+    w = design.sample_weight
+    prior = np.array([(priors or {}).get(p, 0.0) for p in design.player_ids])
+    a = x.T @ (w[:, None] * x) + lambda_ * np.eye(x.shape[1])
+    coef = np.linalg.solve(a, x.T @ (w * design.y) + lambda_ * prior)
+    return dict(zip(design.player_ids, coef, strict=True))
+
+
+def _by_id(result):
+    return {r.player_id: r.rapm for r in result.ratings}
+
+
+def test_incremental_rapm_solves_ridge_exactly():
+    stints = _random_stints(0)
+    engine = IncrementalRAPM(lambda_=50.0)
+    engine.add_stints(stints)
+    got = _by_id(engine.solve())
+    want = _exact_ridge(stints, 50.0)
+    assert got.keys() == want.keys()
+    for pid, value in want.items():
+        assert got[pid] == pytest.approx(value, abs=1e-8)
+
+
+def test_incremental_rapm_agrees_with_compute_rapm():
+    stints = _random_stints(1)
+    engine = IncrementalRAPM(lambda_=50.0)
+    engine.add_stints(StintArrays.from_stints(stints))
+    got = engine.solve()
+    want = compute_rapm(stints, lambda_=50.0)
+    assert got.n_stints == want.n_stints
+    assert got.n_players == want.n_players
+    expected = {r.player_id: r for r in want.ratings}
+    for r in got.ratings:
+        # sklearn's sparse solver stops at its own (looser) tolerance.
+        assert r.rapm == pytest.approx(expected[r.player_id].rapm, abs=1e-2)
+        assert r.stint_count == expected[r.player_id].stint_count
+        assert r.possessions == pytest.approx(expected[r.player_id].possessions)
+
+
+def test_incremental_rapm_batches_equal_single_fit():
+    stints = _random_stints(2)
+    whole = IncrementalRAPM(lambda_=10.0)
+    whole.add_stints(stints)
+    parts = IncrementalRAPM(lambda_=10.0)
+    for lo in range(0, len(stints), 97):
+        parts.add_stints(stints[lo : lo + 97])
+        parts.solve()
+    assert parts.n_stints == len(stints)
+    want = _by_id(whole.solve())
+    for pid, value in _by_id(parts.solve()).items():
+        assert value == pytest.approx(want[pid], abs=1e-8)
+
+
+def test_incremental_rapm_new_players_join_later():
+    engine = IncrementalRAPM(lambda_=1.0)
+    engine.add_stints([Stint((1, 2), (3, 4), possessions=10.0, point_diff=5)])
+    engine.solve()
+    engine.add_stints([Stint((1, 5), (3, 6), possessions=10.0, point_diff=-3)])
+    result = engine.solve()
+    assert result.n_players == 6
+    assert result.rating_for(5).stint_count == 1
+    assert result.rating_for(1).stint_count == 2
+
+
+def test_incremental_rapm_warm_starts_from_previous_solution(mocker):
+    engine = IncrementalRAPM(lambda_=10.0)
+    engine.add_stints(_random_stints(3, n=50))
+    first = engine.solve()
+    spy = mocker.spy(rapm_module, "cg")
+    engine.add_stints([Stint((1_000,), (1_001,), possessions=5.0, point_diff=2)])
+    engine.set_priors({1_000: 4.0})
+    engine.solve()
+    x0 = spy.call_args.kwargs["x0"]
+    known = _by_id(first)
+    assert x0[: len(known)].tolist() == pytest.approx(
+        [known[pid] for pid in engine._player_ids[: len(known)]]
+    )
+    assert x0[-2:].tolist() == [4.0, 0.0]
+
+
+def test_incremental_rapm_priors_anchor_shrinkage():
+    stints = _random_stints(4, n=100)
+    priors = {1: 6.0, 2: -4.0}
+    engine = IncrementalRAPM(lambda_=500.0, priors=priors)
+    engine.add_stints(stints)
+    got = _by_id(engine.solve())
+    want = _exact_ridge(stints, 500.0, priors)
+    for pid, value in want.items():
+        assert got[pid] == pytest.approx(value, abs=1e-8)
+    # A huge penalty pins everyone to their prior.
+    stiff = IncrementalRAPM(lambda_=1e12, priors=priors)
+    stiff.add_stints(stints)
+    result = stiff.solve()
+    assert result.rating_for(1).rapm == pytest.approx(6.0, abs=1e-6)
+    assert result.rating_for(3).rapm == pytest.approx(0.0, abs=1e-6)
+
+
+def test_incremental_rapm_decay_equals_larger_lambda():
+    stints = _random_stints(5, n=100)
+    decayed = IncrementalRAPM(lambda_=20.0)
+    decayed.add_stints(stints)
+    decayed.decay(0.5)
+    fresh = IncrementalRAPM(lambda_=40.0)
+    fresh.add_stints(stints)
+    want = _by_id(fresh.solve())
+    for pid, value in _by_id(decayed.solve()).items():
+        assert value == pytest.approx(want[pid], abs=1e-8)
+
+
+@pytest.mark.parametrize("factor", [0.0, -0.5, 1.5])
+def test_incremental_rapm_rejects_bad_decay(factor):
+    with pytest.raises(ValueError, match="factor must be"):
+        IncrementalRAPM().decay(factor)
+
+
+def test_incremental_rapm_rejects_bad_lambda():
+    with pytest.raises(ValueError, match="lambda_ must be"):
+        IncrementalRAPM(lambda_=-1.0)
+
+
+def test_incremental_rapm_empty():
+    engine = IncrementalRAPM()
+    engine.add_stints([])
+    result = engine.solve()
+    assert result.ratings == ()
+    assert result.n_stints == 0
+
+
+def test_incremental_rapm_validates_stints():
+    engine = IncrementalRAPM()
+    with pytest.raises(ValueError, match="non-positive possessions"):
+        engine.add_stints([Stint((1,), (2,), possessions=0.0, point_diff=1)])
+
+
+def test_incremental_rapm_warns_when_not_converged():
+    engine = IncrementalRAPM(lambda_=0.01)
+    engine.add_stints(_random_stints(6))
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        engine.solve(maxiter=1)
+
+
+def _offense_stints(seed=0, n=1500, pool=30):
+    """Simulated sides whose scoring follows known per-player O and D effects."""
+    rng = np.random.default_rng(seed)
+    offense = rng.normal(0.0, 3.0, pool)
+    defense = rng.normal(0.0, 3.0, pool)  # points prevented
+    stints = []
+    for _ in range(n):
+        players = rng.choice(pool, 10, replace=False)
+        off, dfn = players[:5], players[5:]
+        poss = float(rng.integers(5, 20))
+        rate = 110.0 + offense[off].sum() - defense[dfn].sum()
+        stints.append(
+            OffenseStint(
+                offense_player_ids=tuple(int(p) for p in off),
+                defense_player_ids=tuple(int(p) for p in dfn),
+                possessions=poss,
+                points=round(rate * poss / 100),
+            )
+        )
+    return stints, offense, defense
+
+
+def test_compute_od_rapm_recovers_offense_and_defense():
+    stints, offense, defense = _offense_stints()
+    result = compute_od_rapm(stints, lambda_=10.0)
+    est_o = [result.rating_for(i).orapm for i in range(len(offense))]
+    est_d = [result.rating_for(i).drapm for i in range(len(defense))]
+    assert np.corrcoef(est_o, offense)[0, 1] > 0.95
+    assert np.corrcoef(est_d, defense)[0, 1] > 0.95
+    assert 100.0 < result.intercept < 120.0
+
+
+def test_compute_od_rapm_net_is_sum_and_sorted():
+    stints, _, _ = _offense_stints(1, n=300)
+    result = compute_od_rapm(stints, lambda_=50.0)
+    for r in result.ratings:
+        assert r.rapm == pytest.approx(r.orapm + r.drapm)
+        assert r.orapm_ci is None
+    assert [r.rapm for r in result.ratings] == sorted(
+        (r.rapm for r in result.ratings), reverse=True
+    )
+    assert result.n_bootstrap == 0
+    assert result.confidence is None
+
+
+def test_compute_od_rapm_possessions_by_side():
+    stints = [
+        OffenseStint((1, 2), (3, 4), possessions=10.0, points=12),
+        OffenseStint((3, 4), (1, 2), possessions=8.0, points=7),
+        OffenseStint((1, 5), (3, 6), possessions=4.0, points=5),
+    ]
+    result = compute_od_rapm(stints, lambda_=1.0)
+    one = result.rating_for(1)
+    assert one.offensive_possessions == 14.0
+    assert one.defensive_possessions == 8.0
+    assert result.n_players == 6
+    assert result.n_stints == 3
+
+
+def test_compute_od_rapm_bootstrap_intervals():
+    stints, _, _ = _offense_stints(2, n=400)
+    result = compute_od_rapm(
+        stints, lambda_=20.0, n_bootstrap=20, confidence=0.9, n_jobs=1, seed=7
+    )
+    assert isinstance(result, ODRAPMResult)
+    assert result.n_bootstrap == 20
+    assert result.confidence == 0.9
+    for r in result.ratings:
+        for ci in (r.orapm_ci, r.drapm_ci, r.rapm_ci):
+            assert ci is not None
+            assert ci[0] <= ci[1]
+        assert r.rapm_ci[0] - 5 < r.rapm < r.rapm_ci[1] + 5
+    again = compute_od_rapm(
+        stints, lambda_=20.0, n_bootstrap=20, confidence=0.9, n_jobs=1, seed=7
+    )
+    assert again.ratings == result.ratings
+
+
+def test_compute_od_rapm_process_pool_matches_serial():
+    """Workers reading the shared-memory matrix reproduce the serial fits."""
+    stints, _, _ = _offense_stints(3, n=200)
+    kwargs = {"lambda_": 20.0, "n_bootstrap": 6, "seed": 11}
+    serial = compute_od_rapm(stints, n_jobs=1, **kwargs)
+    pooled = compute_od_rapm(stints, n_jobs=2, **kwargs)
+    assert pooled.ratings == serial.ratings
+
+
+def test_compute_od_rapm_empty():
+    result = compute_od_rapm([])
+    assert result.ratings == ()
+    assert result.n_stints == 0
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"lambda_": -1.0}, "lambda_ must be"),
+        ({"n_bootstrap": -1}, "n_bootstrap must be"),
+        ({"confidence": 1.0}, "confidence must be"),
+        ({"n_jobs": 0}, "n_jobs must be"),
+    ],
+)
+def test_compute_od_rapm_rejects_bad_arguments(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        compute_od_rapm([], **kwargs)
+
+
+def test_compute_od_rapm_rejects_bad_possessions():
+    stints = [
+        OffenseStint((1,), (2,), possessions=5.0, points=3),
+        OffenseStint((2,), (1,), possessions=0.0, points=0),
+    ]
+    with pytest.raises(ValueError, match="stint 1 has non-positive possessions"):
+        compute_od_rapm(stints)
+
+
+def _naive_leaders(result, top_n, min_possessions):
+    """The original filter-and-sort implementation, kept as a reference."""
+    eligible = [r for r in result.ratings if r.possessions >= min_possessions]
+    eligible.sort(key=lambda r: r.rapm, reverse=True)
+    return eligible[: max(top_n, 0)]
+
+
+def _unsorted_result(seed, n=200):
+    """A result whose ratings are in arbitrary order, with tied values."""
+    rng = np.random.default_rng(seed)
+    ratings = tuple(
+        RAPMRating(
+            player_id=int(pid),
+            rapm=float(rng.integers(-5, 6)),
+            stint_count=1,
+            possessions=float(rng.integers(0, 50)),
+        )
+        for pid in rng.permutation(n)
+    )
+    return RAPMResult(
+        ratings=ratings, alpha=1.0, intercept=0.0, n_stints=n, n_players=n
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("top_n", [0, 1, 7, 50, 500])
+@pytest.mark.parametrize("min_possessions", [0.0, 10.0, 25.5, 49.0, 100.0])
+def test_rapm_leaders_matches_filter_and_sort(seed, top_n, min_possessions):
+    result = _unsorted_result(seed)
+    assert rapm_leaders(
+        result, top_n=top_n, min_possessions=min_possessions
+    ) == _naive_leaders(result, top_n, min_possessions)
+
+
+def test_result_leaders_method_matches_function():
+    result = compute_rapm(_balanced_stints(), lambda_=100.0)
+    assert result.leaders(3, 0.0) == rapm_leaders(result, top_n=3)
+
+
+def test_rating_for_uses_index():
+    result = _unsorted_result(3)
+    for r in result.ratings:
+        assert result.rating_for(r.player_id) is r
+
+
+def test_ratings_for_returns_array_with_nan_for_unknown():
+    result = compute_rapm(_balanced_stints(), lambda_=100.0)
+    got = result.ratings_for([1, 999, 2])
+    assert isinstance(got, np.ndarray)
+    assert got[0] == result.rating_for(1).rapm
+    assert np.isnan(got[1])
+    assert got[2] == result.rating_for(2).rapm
+    assert result.ratings_for([]).shape == (0,)
+
+
+def test_result_equality_ignores_lookup_indexes():
+    a = _unsorted_result(4)
+    b = RAPMResult(
+        ratings=a.ratings, alpha=1.0, intercept=0.0, n_stints=200, n_players=200
+    )
+    assert a == b
+    assert "_index" not in repr(a)
+
+
+def test_od_result_rating_for():
+    stints, _, _ = _offense_stints(5, n=100)
+    result = compute_od_rapm(stints, lambda_=10.0)
+    for r in result.ratings:
+        assert result.rating_for(r.player_id) is r
+    assert result.rating_for(-5) is None
@@ -0,0 +1,292 @@
+"""Tests for fastbreak.rapm_stints (stint extraction for RAPM)."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+from pytest_mock import MockerFixture
+
+from fastbreak.clients.nba import NBAClient
+from fastbreak.models.game_rotation import GameRotationResponse, RotationEntry
+from fastbreak.models.play_by_play import PlayByPlayAction
+from fastbreak.rapm import OffenseStint, StintArrays, compute_rapm
+from fastbreak.rapm_stints import (
+    GameStint,
+    game_stints,
+    get_rapm_stints,
+    iter_game_stints,
+)
+
+HOME, AWAY = 100, 200
+
+
+def _entry(
+    person_id: int, in_time: float, out_time: float, *, team_id: int, game_id: str
+) -> RotationEntry:
+    return RotationEntry.model_validate(
+        {
+            "GAME_ID": game_id,
+            "TEAM_ID": team_id,
+            "TEAM_CITY": "Test",
+            "TEAM_NAME": "Team",
+            "PERSON_ID": person_id,
+            "PLAYER_FIRST": "P",
+            "PLAYER_LAST": str(person_id),
+            "IN_TIME_REAL": in_time,
+            "OUT_TIME_REAL": out_time,
+            "PLAYER_PTS": None,
+            "PT_DIFF": None,
+            "USG_PCT": None,
+        }
+    )
+
+
+def _rotation(game_id: str = "0022500571", end: float = 7200.0) -> GameRotationResponse:
+    """Home subs player 5 -> 6 at 6:00 of Q1 (3600 tenths); away plays straight."""
+    home = [
+        _entry(pid, 0.0, end, team_id=HOME, game_id=game_id) for pid in (1, 2, 3, 4)
+    ]
+    home += [
+        _entry(5, 0.0, 3600.0, team_id=HOME, game_id=game_id),
+        _entry(6, 3600.0, end, team_id=HOME, game_id=game_id),
+    ]
+    away = [
+        _entry(pid, 0.0, end, team_id=AWAY, game_id=game_id)
+        for pid in (11, 12, 13, 14, 15)
+    ]
+    return GameRotationResponse(home_team=home, away_team=away)
+
+
+def _action(
+    team_id: int,
+    clock: str,
+    *,
+    action_type: str = "2pt",
+    made: bool = False,
+    shot_value: int = 2,
+    period: int = 1,
+    n: int = 1,
+) -> PlayByPlayAction:
+    is_shot = action_type in {"2pt", "3pt"}
+    return PlayByPlayAction(
+        actionNumber=n,
+        clock=clock,
+        period=period,
+        teamId=team_id,
+        teamTricode="TST",
+        personId=0,
+        playerName="Test Player",
+        playerNameI="T. Player",
+        xLegacy=0,
+        yLegacy=0,
+        shotDistance=0,
+        shotResult="Made" if made else "",
+        isFieldGoal=1 if is_shot else 0,
+        scoreHome="0",
+        scoreAway="0",
+        pointsTotal=0,
+        location="h",
+        description="",
+        actionType=action_type,
+        subType="",
+        videoAvailable=0,
+        shotValue=shot_value if is_shot else 0,
+        actionId=n,
+    )
+
+
+def _actions() -> list[PlayByPlayAction]:
+    return [
+        _action(HOME, "PT11M40.00S", made=True, n=1),  # t=20, span 0
+        # Made at the substitution clock: credited to the lineup that scored.
+        _action(AWAY, "PT06M00.00S", action_type="3pt", made=True, shot_value=3, n=2),
+        _action(HOME, "PT05M00.00S", action_type="Turnover", n=3),  # span 1
+        _action(AWAY, "PT04M00.00S", made=True, n=4),  # span 1
+    ]
+
+
+class TestGameStint:
+    def test_frozen_slots(self):
+        assert hasattr(GameStint, "__slots__")
+        stint = game_stints(_rotation(), _actions())[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            stint.home_points = 0  # type: ignore[misc]
+
+    def test_to_stint(self):
+        stint = GameStint(
+            game_id="g",
+            home_team_id=HOME,
+            away_team_id=AWAY,
+            home_player_ids=(1, 2),
+            away_player_ids=(3, 4),
+            start=0.0,
+            end=60.0,
+            home_possessions=3,
+            away_possessions=2,
+            home_points=4,
+            away_points=1,
+        )
+        converted = stint.to_stint()
+        assert converted.possessions == 2.5
+        assert converted.point_diff == 3
+        assert converted.home_player_ids == (1, 2)
+        assert converted.away_player_ids == (3, 4)
+
+    def test_offense_stints(self):
+        stint = dataclasses.replace(
+            game_stints(_rotation(), _actions())[0], home_points=7, away_points=3
+        )
+        home, away = stint.offense_stints()
+        assert home == OffenseStint(
+            offense_player_ids=(1, 2, 3, 4, 5),
+            defense_player_ids=(11, 12, 13, 14, 15),
+            possessions=1.0,
+            points=7,
+        )
+        assert away.offense_player_ids == (11, 12, 13, 14, 15)
+        assert away.points == 3
+
+    def test_offense_stints_skip_sides_without_possessions(self):
+        stint = dataclasses.replace(
+            game_stints(_rotation(), _actions())[0], away_possessions=0
+        )
+        (home,) = stint.offense_stints()
+        assert home.offense_player_ids == (1, 2, 3, 4, 5)
+
+
+class TestGameStints:
+    def test_splits_on_substitution(self):
+        stints = game_stints(_rotation(), _actions())
+        assert [(s.start, s.end) for s in stints] == [(0.0, 360.0), (360.0, 720.0)]
+        assert stints[0].home_player_ids == (1, 2, 3, 4, 5)
+        assert stints[1].home_player_ids == (1, 2, 3, 4, 6)
+        assert all(s.away_player_ids == (11, 12, 13, 14, 15) for s in stints)
+        assert stints[0].game_id == "0022500571"
+        assert (stints[0].home_team_id, stints[0].away_team_id) == (HOME, AWAY)
+
+    def test_possessions_and_points(self):
+        first, second = game_stints(_rotation(), _actions())
+        assert (first.home_possessions, first.away_possessions) == (1, 1)
+        assert (first.home_points, first.away_points) == (2, 3)
+        assert (second.home_possessions, second.away_possessions) == (1, 1)
+        assert (second.home_points, second.away_points) == (0, 2)
+
+    def test_points_match_box_score_total(self):
+        stints = game_stints(_rotation(), _actions())
+        assert sum(s.home_points for s in stints) == 2
+        assert sum(s.away_points for s in stints) == 5
+
+    def test_period_start_belongs_to_next_interval(self):
+        """A period-opening event at the boundary goes to the new interval."""
+        rotation = _rotation(end=14400.0)
+        home = [e for e in rotation.home_team if e.person_id != 6]
+        home.append(_entry(6, 3600.0, 7200.0, team_id=HOME, game_id="0022500571"))
+        home.append(_entry(7, 7200.0, 14400.0, team_id=HOME, game_id="0022500571"))
+        rotation = GameRotationResponse(home_team=home, away_team=rotation.away_team)
+        actions = [
+            # Buzzer-beater ending Q1 stays with the Q1 lineup.
+            _action(HOME, "PT00M00.00S", made=True, n=1),
+            # Q2 opens at the same elapsed time with a different lineup.
+            _action(AWAY, "PT12M00.00S", made=True, period=2, n=2),
+        ]
+        stints = game_stints(rotation, actions)
+        assert stints[1].end == 720.0
+        assert stints[1].home_points == 2
+        assert stints[2].start == 720.0
+        assert 7 in stints[2].home_player_ids
+        assert stints[2].away_points == 2
+
+    def test_actions_outside_rotation_coverage_are_dropped(self):
+        actions = [_action(HOME, "PT05M00.00S", made=True, period=2)]
+        stints = game_stints(_rotation(), actions)
+        assert sum(s.home_points for s in stints) == 0
+
+    def test_missing_team_returns_empty(self):
+        rotation = GameRotationResponse(home_team=_rotation().home_team, away_team=[])
+        assert game_stints(rotation, _actions()) == []
+
+    def test_feeds_compute_rapm(self):
+        stints = [s.to_stint() for s in game_stints(_rotation(), _actions())]
+        result = compute_rapm(stints, lambda_=1.0)
+        assert result.n_stints == 2
+        assert result.n_players == 11
+
+
+def _pbp(mocker: MockerFixture, actions: list[PlayByPlayAction]):
+    response = mocker.MagicMock()
+    response.game.actions = actions
+    return response
+
+
+def _mock_client(mocker: MockerFixture) -> NBAClient:
+    client = NBAClient(session=mocker.MagicMock())
+
+    async def get_many(endpoints, *, max_concurrency=None):
+        half = len(endpoints) // 2
+        rotations = [_rotation(game_id=e.game_id) for e in endpoints[:half]]
+        return rotations + [_pbp(mocker, _actions()) for _ in endpoints[half:]]
+
+    client.get_many = mocker.AsyncMock(side_effect=get_many)
+    return client
+
+
+class TestIterGameStints:
+    async def test_streams_games_in_order(self, mocker: MockerFixture):
+        client = _mock_client(mocker)
+        ids = ["0022500001", "0022500002", "0022500003"]
+
+        stints = [s async for s in iter_game_stints(client, ids, batch_size=2)]
+
+        assert [s.game_id for s in stints] == [g for g in ids for _ in range(2)]
+
+    async def test_fetches_in_batches(self, mocker: MockerFixture):
+        from fastbreak.endpoints import GameRotation, PlayByPlay
+
+        client = _mock_client(mocker)
+        ids = ["0022500001", "0022500002", "0022500003"]
+
+        _ = [s async for s in iter_game_stints(client, ids, batch_size=2)]
+
+        calls = client.get_many.call_args_list
+        assert [len(c.args[0]) for c in calls] == [4, 2]
+        first = calls[0].args[0]
+        assert [type(e) for e in first] == [
+            GameRotation,
+            GameRotation,
+            PlayByPlay,
+            PlayByPlay,
+        ]
+
+    async def test_rejects_zero_batch_size(self, mocker: MockerFixture):
+        client = _mock_client(mocker)
+        with pytest.raises(ValueError, match="batch_size must be"):
+            _ = [s async for s in iter_game_stints(client, ["g"], batch_size=0)]
+
+
+class TestGetRapmStints:
+    async def test_returns_stint_arrays(self, mocker: MockerFixture):
+        client = _mock_client(mocker)
+
+        stints = await get_rapm_stints(client, ["0022500001", "0022500002"])
+
+        assert isinstance(stints, StintArrays)
+        assert len(stints) == 4
+        assert stints.point_diff.tolist() == [-1, -2, -1, -2]
+        assert stints.possessions.tolist() == [1.0, 1.0, 1.0, 1.0]
+
+    async def test_drops_intervals_without_possessions(self, mocker: MockerFixture):
+        client = NBAClient(session=mocker.MagicMock())
+        client.get_many = mocker.AsyncMock(
+            return_value=[_rotation(), _pbp(mocker, _actions()[:1])]
+        )
+
+        stints = await get_rapm_stints(client, ["0022500571"])
+
+        assert len(stints) == 1
+
+    async def test_empty_game_ids(self, mocker: MockerFixture):
+        client = _mock_client(mocker)
+        stints = await get_rapm_stints(client, [])
+        assert len(stints) == 0
+        client.get_many.assert_not_called()
@@ -15,14 +15,19 @@ from fastbreak.rotations import (
     PlayerMinutes,
     PlayerStint,
     RotationSummary,
+    SeasonLineup,
+    SeasonRotations,
     SubstitutionEvent,
+    SubstitutionPattern,
     _period_from_seconds,
     get_game_rotations,
     get_rotation_summary,
+    get_season_rotations,
     lineup_stints,
     player_stints,
     player_total_minutes,
     rotation_timeline,
+    season_rotations,
     stint_plus_minus,
 )
 from tests.strategies import XDIST_SUPPRESS as _XDIST
@@ -713,6 +718,159 @@ class TestGetRotationSummary:
             await get_rotation_summary(client, "0022500571", team_id=100)
 
 
+# ---------------------------------------------------------------------------
+# TestSeasonRotations
+# ---------------------------------------------------------------------------
+
+
+def _game(game_id: str, *, sub_at: float = 3600.0) -> GameRotationResponse:
+    """Team 100 starts players 1-5; player 6 replaces player 5 at *sub_at*."""
+    home = [
+        _make_rotation_entry(
+            person_id=i,
+            player_first=f"P{i}",
+            player_last="X",
+            out_time_real=sub_at if i == 5 else 7200.0,
+            game_id=game_id,
+        )
+        for i in range(1, 6)
+    ]
+    home.append(
+        _make_rotation_entry(
+            person_id=6,
+            player_first="P6",
+            player_last="X",
+            in_time_real=sub_at,
+            game_id=game_id,
+        )
+    )
+    away = [
+        _make_rotation_entry(person_id=i, team_id=200, game_id=game_id)
+        for i in range(11, 16)
+    ]
+    return _make_mock_response(home_entries=home, away_entries=away)
+
+
+class TestSeasonRotations:
+    def test_dataclasses_frozen_and_slotted(self):
+        for cls in (SeasonLineup, SubstitutionPattern, SeasonRotations):
+            assert dataclasses.fields(cls)
+            assert cls.__dataclass_params__.frozen  # type: ignore[attr-defined]
+            assert hasattr(cls, "__slots__")
+
+    def test_empty(self):
+        result = season_rotations([], team_id=100)
+        assert result == SeasonRotations(
+            team_id=100, game_ids=(), lineups=(), player_minutes=(), substitutions=()
+        )
+
+    def test_matches_per_game_sums(self):
+        games = [_game("0022500001", sub_at=2400.0), _game("0022500002")]
+        result = season_rotations(games, team_id=100)
+
+        assert result.game_ids == ("0022500001", "0022500002")
+        expected: dict[frozenset[int], float] = {}
+        for game in games:
+            for stint in lineup_stints(game.home_team):
+                key = stint.player_ids
+                expected[key] = expected.get(key, 0.0) + stint.duration_minutes
+        assert {lu.player_ids: lu.minutes for lu in result.lineups} == pytest.approx(
+            expected
+        )
+        plus_minus = stint_plus_minus(games[0].home_team)
+        for pid, value in stint_plus_minus(games[1].home_team).items():
+            plus_minus[pid] = plus_minus.get(pid, 0.0) + value
+        assert {m.player_id: m.total_pt_diff for m in result.player_minutes} == (
+            plus_minus
+        )
+
+    def test_lineup_games_and_stints(self):
+        result = season_rotations(
+            [_game("0022500001"), _game("0022500002")], team_id=100
+        )
+        starters = result.lineups[0]
+        assert starters.player_ids == frozenset({1, 2, 3, 4, 5})
+        assert starters.player_names == ("P1 X", "P2 X", "P3 X", "P4 X", "P5 X")
+        assert starters.stint_count == 2
+        assert starters.games == 2
+        assert starters.minutes == pytest.approx(12.0)
+
+    def test_player_minutes_aggregated(self):
+        result = season_rotations(
+            [_game("0022500001"), _game("0022500002")], team_id=100
+        )
+        by_id = {m.player_id: m for m in result.player_minutes}
+        assert by_id[1].total_minutes == pytest.approx(24.0)
+        assert by_id[1].stint_count == 2
+        assert by_id[1].total_points == 20
+        assert by_id[6].avg_stint_minutes == pytest.approx(6.0)
+        assert result.player_minutes[0].total_minutes >= (
+            result.player_minutes[-1].total_minutes
+        )
+
+    def test_substitution_patterns_counted(self):
+        result = season_rotations(
+            [_game("0022500001"), _game("0022500002")], team_id=100
+        )
+        assert result.substitutions == (
+            SubstitutionPattern(
+                player_in_id=6,
+                player_in_name="P6 X",
+                player_out_id=5,
+                player_out_name="P5 X",
+                count=2,
+            ),
+        )
+
+    def test_games_without_team_skipped(self):
+        result = season_rotations(
+            [_game("0022500001"), _make_mock_response()], team_id=100
+        )
+        assert result.game_ids == ("0022500001",)
+
+    def test_selects_away_team(self):
+        result = season_rotations([_game("0022500001")], team_id=200)
+        assert {lu.player_ids for lu in result.lineups} == {
+            frozenset({11, 12, 13, 14, 15})
+        }
+        assert result.substitutions == ()
+
+
+class TestGetSeasonRotations:
+    async def test_fetches_games_in_batches(self, mocker: MockerFixture):
+        game_ids = [f"00225000{i:02d}" for i in range(5)]
+        mocker.patch("fastbreak.games.get_game_ids", return_value=game_ids)
+        batches: list[list[str]] = []
+
+        async def fake_get_many(endpoints, **kwargs):
+            batches.append([ep.game_id for ep in endpoints])
+            return [_game(ep.game_id) for ep in endpoints]
+
+        client = NBAClient(session=mocker.MagicMock())
+        client.get_many = fake_get_many  # type: ignore[method-assign]
+        result = await get_season_rotations(client, 100, "2024-25", batch_size=2)
+
+        assert batches == [game_ids[:2], game_ids[2:4], game_ids[4:]]
+        assert result.game_ids == tuple(game_ids)
+        assert result.lineups[0].games == 5
+
+    async def test_passes_team_and_season(self, mocker: MockerFixture):
+        get_ids = mocker.patch("fastbreak.games.get_game_ids", return_value=[])
+        client = NBAClient(session=mocker.MagicMock())
+        result = await get_season_rotations(
+            client, 100, "2024-25", season_type="Playoffs"
+        )
+        get_ids.assert_awaited_once_with(
+            client, "2024-25", season_type="Playoffs", team_id=100
+        )
+        assert result.game_ids == ()
+
+    async def test_rejects_bad_batch_size(self, mocker: MockerFixture):
+        client = NBAClient(session=mocker.MagicMock())
+        with pytest.raises(ValueError, match="batch_size"):
+            await get_season_rotations(client, 100, batch_size=0)
+
+
 # ---------------------------------------------------------------------------
 # TestRotationsProperties (Hypothesis)
 # ---------------------------------------------------------------------------
@@ -757,6 +915,36 @@ def _entry_strategy(draw):
     )
 
 
+def _quadratic_lineup_stints(entries):
+    """The original boundary-by-entry scan that ``lineup_stints`` replaced."""
+    boundaries = sorted({t for e in entries for t in (e.in_time_real, e.out_time_real)})
+    raw = []
+    for t_start, t_end in zip(boundaries, boundaries[1:], strict=False):
+        names = {
+            e.person_id: f"{e.player_first} {e.player_last}"
+            for e in entries
+            if e.in_time_real <= t_start and e.out_time_real >= t_end
+        }
+        if names:
+            raw.append((frozenset(names), names, t_start, t_end))
+    merged = []
+    for ids, names, t_start, t_end in raw:
+        if merged and merged[-1][0] == ids:
+            merged[-1][3] = t_end
+        else:
+            merged.append([ids, names, t_start, t_end])
+    return [
+        LineupStint(
+            player_ids=ids,
+            player_names=tuple(sorted(names[pid] for pid in ids)),
+            in_time=t_start / 10,
+            out_time=t_end / 10,
+            duration_minutes=(t_end - t_start) / 600,
+        )
+        for ids, names, t_start, t_end in merged
+    ]
+
+
 class TestRotationsProperties:
     @given(entries=st.lists(_entry_strategy(), min_size=1, max_size=10))
     @settings(max_examples=50, suppress_health_check=_XDIST)
@@ -783,6 +971,24 @@ class TestRotationsProperties:
         total_stints = sum(m.stint_count for m in minutes_list)
         assert total_stints == len(entries)
 
+    @given(
+        entries=st.lists(_entry_strategy(), min_size=1, max_size=30),
+        snap=st.sampled_from([1.0, 600.0]),
+    )
+    @settings(max_examples=100, suppress_health_check=_XDIST)
+    def test_lineup_stints_match_quadratic_sweep(self, entries, snap):
+        # Snapping times makes shared boundaries (same-time subs) common.
+        entries = [
+            _make_rotation_entry(
+                person_id=e.person_id,
+                player_first=f"P{e.person_id}",
+                in_time_real=e.in_time_real // snap * snap,
+                out_time_real=e.out_time_real // snap * snap,
+            )
+            for e in entries
+        ]
+        assert lineup_stints(entries) == _quadratic_lineup_stints(entries)
+
     @given(entries=st.lists(_entry_strategy(), min_size=1, max_size=10))
     @settings(max_examples=50, suppress_health_check=_XDIST)
     def test_lineup_stints_chronological(self, entries):
@@ -200,6 +200,19 @@ class TestGetTeamStats:
 
         endpoint = client.get.call_args[0][0]
         assert endpoint.per_mode == "PerGame"
+        assert endpoint.season_type == "Regular Season"
+
+    async def test_passes_season_type(self, mocker: MockerFixture):
+        response = mocker.MagicMock()
+        response.teams = [_make_team_row()]
+        client = NBAClient(session=mocker.MagicMock())
+        client.get = mocker.AsyncMock(return_value=response)
+
+        await get_league_averages(client, "2024-25", season_type="Playoffs")
+
+        endpoint = client.get.call_args[0][0]
+        assert endpoint.season_type == "Playoffs"
+        assert endpoint.season == "2024-25"
 
     async def test_passes_per_mode_to_endpoint(self, mocker: MockerFixture):
         """get_team_stats passes per_mode to LeagueDashTeamStats."""
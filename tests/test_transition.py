@@ -6,12 +6,17 @@ import pytest
 from hypothesis import HealthCheck, assume, given, settings, strategies as st
 from pytest_mock import MockerFixture
 
+from fastbreak.league import League
 from fastbreak.models.play_by_play import PlayByPlayAction
+from fastbreak.play_by_play_columns import PlayByPlayColumns
 from fastbreak.transition import (
     Classification,
+    PossessionArrays,
     TransitionAnalysis,
     TransitionPossession,
     Trigger,
+    action_points,
+    classify_possession_arrays,
     classify_possessions,
     get_transition_stats,
     transition_efficiency,
@@ -1064,6 +1069,30 @@ class TestClassifyPossessions:
 # ---------------------------------------------------------------------------
 
 
+class TestActionPoints:
+    @pytest.mark.parametrize(
+        ("fields", "expected"),
+        [
+            ({"shot_result": "Made", "shot_value": 3}, 3),
+            ({"shot_result": "Missed", "shot_value": 2}, 0),
+            (
+                {
+                    "action_type": "Free Throw",
+                    "description": "Smith Free Throw 1 of 2 (4 PTS)",
+                },
+                1,
+            ),
+            (
+                {"action_type": "Free Throw", "description": "MISS Smith Free Throw"},
+                0,
+            ),
+            ({"action_type": "turnover"}, 0),
+        ],
+    )
+    def test_points(self, fields, expected):
+        assert action_points(_make_action(**fields)) == expected
+
+
 class TestTransitionFrequency:
     """Tests for transition_frequency()."""
 
@@ -1305,3 +1334,117 @@ class TestClassifyPossessionsProperties:
             # elapsed <= 0 can occur when the FGA coincides with (or, in
             # non-chronological hypothesis data, precedes) possession start.
             assert poss.classification == "halfcourt" or poss.elapsed <= 0.0
+
+
+# ---------------------------------------------------------------------------
+# Vectorized classification over columnar play-by-play
+# ---------------------------------------------------------------------------
+
+
+_column_action_st = st.builds(
+    _make_action,
+    action_type=st.sampled_from(
+        [
+            "2pt",
+            "3pt",
+            "Turnover",
+            "turnover",
+            "rebound",
+            "Rebound",
+            "foul",
+            "Free Throw",
+            "free throw",
+        ]
+    ),
+    sub_type=st.sampled_from(
+        [
+            "",
+            "offensive",
+            "Offensive",
+            "defensive",
+            "Free Throw 1 of 2",
+            "Free Throw 2 of 2",
+            "Free Throw Technical 1 of 1",
+        ]
+    ),
+    shot_result=st.sampled_from(["", "Made", "Missed"]),
+    team_id=st.sampled_from([0, 100, 200]),
+    period=st.integers(min_value=0, max_value=6),
+    clock=st.integers(min_value=0, max_value=720).map(
+        lambda s: f"PT{s // 60:02d}M{s % 60:02d}.00S"
+    ),
+    shot_value=st.sampled_from([0, 2, 3]),
+    description=st.sampled_from(
+        ["", "Smith Free Throw 2 of 2 (10 PTS)", "MISS Smith Free Throw 1 of 2"]
+    ),
+)
+
+
+class TestClassifyPossessionArrays:
+    @given(
+        st.lists(_column_action_st, max_size=40),
+        st.sampled_from([League.NBA, League.WNBA]),
+        st.sampled_from([0.0, 8.0, 30.0]),
+    )
+    @settings(suppress_health_check=[HealthCheck.too_slow, *_XDIST], max_examples=200)
+    def test_matches_state_machine(self, actions, league, window):
+        cols = PlayByPlayColumns.from_actions("0022500001", actions, league=league)
+        assert classify_possessions(
+            cols, transition_window=window, league=league
+        ) == classify_possessions(actions, transition_window=window, league=league)
+
+    def test_games_are_classified_independently(self):
+        first = [
+            _make_action(period=4, clock="PT00M30.00S", team_id=100),
+            _make_action(period=4, clock="PT00M20.00S", team_id=100),
+        ]
+        second = [
+            _make_action(period=4, clock="PT11M00.00S", team_id=200),
+            _make_action(
+                period=4, clock="PT10M58.00S", team_id=200, shot_result="Made"
+            ),
+        ]
+        cols = PlayByPlayColumns.from_json(
+            {"game": {"gameId": g, "actions": [a.model_dump() for a in acts]}}
+            for g, acts in (("0022500001", first), ("0022500002", second))
+        )
+
+        arrays = classify_possession_arrays(cols)
+
+        assert arrays.game_index.tolist() == [0, 1]
+        assert arrays.to_possessions(cols) == [
+            *classify_possessions(first),
+            *classify_possessions(second),
+        ]
+
+    def test_row_ranges_and_triggers(self):
+        actions = [
+            _make_action(team_id=0, action_type="period", period=1),
+            _make_action(
+                team_id=100, clock="PT11M50.00S", shot_result="Made", shot_value=2
+            ),
+            _make_action(team_id=200, clock="PT11M45.00S", action_type="turnover"),
+            _make_action(team_id=100, clock="PT11M40.00S", action_type="foul"),
+        ]
+        cols = PlayByPlayColumns.from_actions("0022500001", actions)
+
+        arrays = classify_possession_arrays(cols)
+
+        assert isinstance(arrays, PossessionArrays)
+        assert len(arrays) == 3
+        assert arrays.start_row.tolist() == [1, 2, 3]
+        assert arrays.stop_row.tolist() == [2, 3, 4]
+        assert [PossessionArrays.TRIGGERS[t] for t in arrays.trigger.tolist()] == [
+            "start_of_period",
+            "made_fg",
+            "turnover",
+        ]
+        assert arrays.points_scored.tolist() == [2, 0, 0]
+        assert arrays.is_transition.tolist() == [True, False, False]
+
+    def test_no_live_actions(self):
+        cols = PlayByPlayColumns.from_actions(
+            "0022500001", [_make_action(team_id=0, action_type="period")]
+        )
+        assert len(classify_possession_arrays(cols)) == 0
+        assert classify_possessions(cols) == []